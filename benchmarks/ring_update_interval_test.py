@@ -0,0 +1,112 @@
+"""
+다중 속도 (multi-rate) Ring 안정화 벤치마크
+
+ring_update_interval k에 따른 정확도/비용 트레이드오프를 측정합니다.
+적분은 매 step (dt_ms = 0.1 ms, 10 kHz), Ring 안정화는 k step마다 실행합니다.
+
+측정 항목:
+    - step당 실행 시간 [us]
+    - k = 1 (매 step Ring) 궤적 대비 좌표 오차 (RMS / 최대)
+        - 위치 축 [m], 회전 축 [deg]
+
+실행:
+    python benchmarks/ring_update_interval_test.py [--steps N] [--backend bank|external]
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha
+License: MIT License
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+from typing import Dict
+from grid_engine.dimensions.dim5d import Grid5DEngine, Grid5DConfig
+
+
+def make_inputs(n_steps: int) -> np.ndarray:
+    """
+    5축 가공 입력 블록 (속도 + 가속도 열, shape (n_steps, 10))
+
+    X/Y/Z: 사인 가속 프로파일, A/B: 저속 회전 (일정 구간 정지)
+    """
+    t_s = np.arange(n_steps) * 1e-4
+    inputs = np.zeros((n_steps, 10))
+    inputs[:, 3] = np.where((t_s % 0.4) < 0.2, 20.0, 0.0)  # v_a [deg/s]
+    inputs[:, 4] = -5.0  # v_b [deg/s]
+    inputs[:, 5] = 0.5 * np.sin(2.0 * np.pi * 2.0 * t_s)  # a_x [m/s²]
+    inputs[:, 6] = 0.5 * np.cos(2.0 * np.pi * 2.0 * t_s)  # a_y [m/s²]
+    inputs[:, 7] = 0.1  # a_z [m/s²]
+    inputs[:, 8:] = np.nan  # 회전 축 가속도 없음
+    return inputs
+
+
+def run_interval(interval: int, inputs: np.ndarray, backend: str) -> Dict:
+    """
+    ring_update_interval 하나로 궤적 실행
+
+    Returns:
+        {'interval', 'us_per_step', 'trajectory'}
+    """
+    config = Grid5DConfig(ring_backend=backend, ring_update_interval=interval)
+    engine = Grid5DEngine(config=config)
+
+    start = time.perf_counter()
+    trajectory = engine.run(inputs)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'interval': interval,
+        'us_per_step': elapsed / len(inputs) * 1e6,
+        'trajectory': trajectory,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ring_update_interval 정확도/비용 벤치마크")
+    parser.add_argument("--steps", type=int, default=20000, help="step 수 (dt = 0.1 ms)")
+    parser.add_argument("--backend", default="auto", help="Ring 백엔드 (auto, external, bank)")
+    args = parser.parse_args()
+
+    inputs = make_inputs(args.steps)
+    intervals = [1, 2, 5, 10, 20, 50]
+    results = [run_interval(k, inputs, args.backend) for k in intervals]
+    reference = results[0]['trajectory']
+
+    print(f"\n{'='*80}")
+    print(f"다중 속도 Ring 안정화 (Grid 5D, {args.steps} steps, backend={args.backend})")
+    print(f"{'='*80}")
+    print(f"{'k':>4} {'us/step':>10} {'speedup':>8} "
+          f"{'XYZ RMS [m]':>13} {'XYZ max [m]':>13} {'AB RMS [deg]':>13} {'AB max [deg]':>13}")
+
+    # 좌표 차이는 도메인 주기로 감쌈 (위치: spatial_scale [m], 회전: 360°)
+    config = Grid5DConfig()
+    period = np.array([
+        config.spatial_scale_x, config.spatial_scale_y, config.spatial_scale_z, 360.0, 360.0
+    ])
+
+    base_cost = results[0]['us_per_step']
+    for result in results:
+        error = result['trajectory'][:, :5] - reference[:, :5]
+        error = (error + 0.5 * period) % period - 0.5 * period
+        xyz = error[:, :3]
+        ab = error[:, 3:]
+        print(
+            f"{result['interval']:>4} {result['us_per_step']:>10.2f} "
+            f"{base_cost / result['us_per_step']:>7.2f}x "
+            f"{np.sqrt(np.mean(xyz ** 2)):>13.3e} {np.abs(xyz).max():>13.3e} "
+            f"{np.sqrt(np.mean(ab ** 2)):>13.3e} {np.abs(ab).max():>13.3e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
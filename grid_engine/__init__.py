@@ -16,6 +16,7 @@ from .dimensions.dim2d import (
 )
 from .dimensions.dim3d import Grid3DEngine, Grid3DConfig
 from .dimensions.dim4d import Grid4DEngine, Grid4DConfig
+from .dimensions.dimnd import GridNDEngine, GridBatchEngine, GridNDConfig, AxisSpec
 
 # 공통 모듈 import
 from .common.coupling import normalize_phase
@@ -46,6 +47,11 @@ __all__ = [
     # 4D
     'Grid4DEngine',
     'Grid4DConfig',
+    # ND (차원 일반화)
+    'GridNDEngine',
+    'GridBatchEngine',
+    'GridNDConfig',
+    'AxisSpec',
     # 공통
     'normalize_phase',
     'calculate_energy',
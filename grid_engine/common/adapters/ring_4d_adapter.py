@@ -52,10 +52,10 @@ except ImportError:
                     f"release/ring-attractor-engine 디렉토리에 있어야 합니다."
                 )
         except ImportError:
-            raise ImportError(
-                "RingAttractorEngine을 찾을 수 없습니다. "
-                "ring-attractor-engine 패키지를 설치하세요: pip install ring-attractor-engine"
-            )
+            # 외부 Ring Engine 없음: Ring Bank Adapter (in-tree)로 대체 가능
+            # (RingAttractorEngine을 직접 생성하는 어댑터만 사용 불가)
+            RingAttractorEngine = None
+            RingState = None
 
 
 class Ring4DAdapter:
@@ -0,0 +1,297 @@
+"""
+Ring Bank Adapter
+축별 Ring Attractor를 하나의 활동 행렬로 시뮬레이션 (in-tree, 벡터화)
+
+이 모듈은 Ring ND Adapter와 같은 인터페이스(step/reset)를 가진 Ring 어댑터입니다.
+외부 RingAttractorEngine을 축마다 하나씩 만들어 inject()/run()을 순서대로 호출하는 대신,
+모든 축의 Ring을 (축 수 × ring_size) 활동 행렬 하나로 유지하고
+같은 NumPy 커널로 한 번에 진행합니다.
+
+Ring 모델 (축마다 독립, 노이즈 없음):
+    뉴런 j의 선호 방향: θ_j = 2π · j / S  (S = ring_size)
+    연결 (Mexican-hat, cosine): W_ij = (J0 + J1 · cos(θ_i - θ_j)) / S
+        - J0 < 0: 전역 억제, J1 > 0: 국소 흥분
+    동역학: τ · du/dt = -u + W · r + I,  r = max(u, 0)
+    주입: I_j = strength · exp(κ · (cos(θ_j - θ_idx) - 1))  (다음 step 동안 유지)
+    중심: 집단 벡터 각도 arg(Σ r_j · e^{iθ_j}) → Ring 위상 [rad]
+    에너지: E = -½ · rᵀWr - Iᵀr
+
+안정화 규칙 (Ring ND Adapter와 같음):
+    stabilized = 0.9 · φ_norm + 0.1 · φ_ring
+
+⚠️ 외부 ring-attractor-engine과 비트 단위로 같은 결과를 내지 않습니다.
+    같은 규칙(인덱스 주입 → 실행 → 0.9/0.1 가중 평균)을 따르는 in-tree 모델입니다.
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+import math
+import numpy as np
+from .ring_adapter import RingAdapterConfig
+
+
+@dataclass(frozen=True)
+class RingBankConfig:
+    """
+    Ring Bank 모델 파라미터 (Ring 하나)
+
+    J1 / 2 < 1 이면 선형 안정 (주입이 없으면 활동이 감쇠).
+    """
+    tau_ms: float = 10.0  # 뉴런 시간 상수 [ms]
+    inhibition: float = -1.0  # J0: 전역 억제 (음수)
+    excitation: float = 1.6  # J1: 국소 흥분
+    input_width: float = 4.0  # κ: 주입 bump 집중도 (von Mises)
+    max_substep_ms: float = 1.0  # 내부 적분 최대 간격 [ms] (긴 dt는 나누어 적분)
+
+    def __post_init__(self):
+        """파라미터 검증"""
+        assert self.tau_ms > 0, f"tau_ms ({self.tau_ms}) must be > 0"
+        assert self.inhibition <= 0, f"inhibition ({self.inhibition}) must be <= 0"
+        assert 0 <= self.excitation < 2.0, \
+            f"excitation ({self.excitation}) must be in [0, 2) for a stable ring"
+        assert self.input_width >= 0, f"input_width ({self.input_width}) must be >= 0"
+        assert self.max_substep_ms > 0, f"max_substep_ms ({self.max_substep_ms}) must be > 0"
+
+
+# 이름 있는 Ring 설정 (RingAdapterConfig.config 문자열)
+RING_BANK_PRESETS = {
+    "case2": RingBankConfig(),
+}
+
+
+def resolve_ring_bank_config(config) -> RingBankConfig:
+    """
+    축별 Ring 설정 → RingBankConfig
+
+    Args:
+        config: RingBankConfig, 프리셋 이름 (예: "case2"), 또는 그 외 (외부 RingEngineConfig 등)
+
+    Returns:
+        RingBankConfig (해석할 수 없는 설정은 기본값)
+    """
+    if isinstance(config, RingBankConfig):
+        return config
+    if isinstance(config, str) and config in RING_BANK_PRESETS:
+        return RING_BANK_PRESETS[config]
+    return RingBankConfig()
+
+
+class RingBankAdapter:
+    """
+    Ring Bank Adapter
+
+    D개 Ring의 활동을 (D, S) 행렬 하나로 유지합니다.
+    Ring ND Adapter와 같은 step()/reset() 인터페이스를 가집니다.
+    """
+
+    def __init__(
+        self,
+        configs: Sequence[RingAdapterConfig],
+        strength: float = 0.8,
+        converge_tol: float = 0.0
+    ):
+        """
+        Args:
+            configs: 축별 Ring 설정 (축 순서대로, size는 모두 같아야 함)
+            strength: 주입 강도 (Ring ND Adapter의 inject strength와 같음)
+            converge_tol: 수렴 판정 임계값 (Ring 위상 변화 [rad] 및 step당 활동 변화)
+                (> 0이면 수렴한 Ring의 적분 생략, 0이면 항상 적분)
+        """
+        self.configs = list(configs)
+        assert len(self.configs) > 0, "configs must not be empty"
+        self.size = self.configs[0].size
+        assert all(cfg.size == self.size for cfg in self.configs), \
+            "all rings in a bank must have the same size"
+        assert converge_tol >= 0, f"converge_tol ({converge_tol}) must be >= 0"
+        self.phase_wrap = 2.0 * 3.141592653589793
+        self.strength = strength
+        self.converge_tol = converge_tol
+
+        num_rings = len(self.configs)
+        size = self.size
+        params = [resolve_ring_bank_config(cfg.config) for cfg in self.configs]
+        self.params = params
+
+        # 선호 방향 및 집단 벡터 기저
+        theta = np.arange(size, dtype=np.float64) * (self.phase_wrap / size)
+        self.cos_theta = np.cos(theta)
+        self.sin_theta = np.sin(theta)
+
+        # 연결 파라미터 (Ring별, shape (D, 1))
+        # W는 cosine 순환 행렬이므로 W · r = (J0 · Σr + J1 · (C · cos θ + S · sin θ)) / S
+        # (C = Σ r cos θ, S = Σ r sin θ) → 행렬 곱 없이 행별 합산만으로 계산
+        self.inhibition = np.array([p.inhibition for p in params], dtype=np.float64)[:, None] / size
+        self.excitation = np.array([p.excitation for p in params], dtype=np.float64)[:, None] / size
+        self.tau_ms = np.array([p.tau_ms for p in params], dtype=np.float64)[:, None]
+        self.max_substep_ms = min(p.max_substep_ms for p in params)
+
+        # 주입 bump 테이블: 모든 Ring 파라미터가 같으면 공유 (S, S), 다르면 Ring별 (D, S, S)
+        cos_delta = np.cos(theta[:, None] - theta[None, :])
+        self.shared = all(p == params[0] for p in params)
+        if self.shared:
+            self.input_table = strength * np.exp(params[0].input_width * (cos_delta - 1.0))
+        else:
+            self.input_table = np.stack([
+                strength * np.exp(p.input_width * (cos_delta - 1.0)) for p in params
+            ])
+
+        # 활동 행렬 (막전위 u, shape (D, S))
+        self.activity = np.zeros((num_rings, size), dtype=np.float64)
+
+        # 수렴 추적 (Ring별): 마지막 주입 인덱스, Ring 위상, 에너지, 수렴 여부
+        self.last_idx = np.full(num_rings, -1, dtype=np.intp)
+        self.last_ring_phi = np.zeros(num_rings, dtype=np.float64)
+        self.last_energies = np.zeros(num_rings, dtype=np.float64)
+        self.converged = np.zeros(num_rings, dtype=bool)
+
+        # 생략 카운터 (진단용, converge_tol > 0일 때만 집계)
+        self.skip_counts = np.zeros(num_rings, dtype=np.int64)
+        self.step_count: int = 0
+
+    def _integrate(
+        self,
+        idx: np.ndarray,
+        dt_ms: float,
+        rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """
+        인덱스 bump 주입 + 활동 적분 (Euler)
+
+        Args:
+            idx: Ring별 주입 인덱스, shape (D,)
+            dt_ms: 시간 간격 [ms]
+            rows: 적분할 Ring 행 (None이면 전체)
+
+        Returns:
+            (ring_phi, energies, activity_change): 적분한 Ring들의 Ring 위상 [rad], 에너지,
+            행별 최대 활동 변화 |Δu| (converge_tol > 0일 때만, 아니면 None)
+        """
+        if rows is None:
+            u = self.activity
+            inhibition, excitation, tau_ms = self.inhibition, self.excitation, self.tau_ms
+            drive = self.input_table[idx] if self.shared else self.input_table[np.arange(len(idx)), idx]
+        else:
+            u = self.activity[rows]
+            inhibition, excitation, tau_ms = self.inhibition[rows], self.excitation[rows], self.tau_ms[rows]
+            drive = self.input_table[idx[rows]] if self.shared else self.input_table[rows, idx[rows]]
+
+        u_prev = u.copy() if self.converge_tol > 0 else None
+
+        # 긴 dt는 max_substep_ms 이하로 나눔
+        num_sub = max(1, math.ceil(dt_ms / self.max_substep_ms))
+        gain = (dt_ms / num_sub) / tau_ms
+        for _ in range(num_sub):
+            total, cos_m, sin_m = self._moments(np.maximum(u, 0.0))
+            recurrent = inhibition * total + excitation * (cos_m * self.cos_theta + sin_m * self.sin_theta)
+            u += gain * (recurrent + drive - u)
+        rates = np.maximum(u, 0.0)
+        total, cos_m, sin_m = self._moments(rates)
+
+        if rows is not None:
+            self.activity[rows] = u
+
+        # 집단 벡터 → Ring 위상
+        ring_phi = np.mod(np.arctan2(sin_m[:, 0], cos_m[:, 0]), self.phase_wrap)
+
+        # 에너지 (진단용): E = -½ · rᵀWr - Iᵀr
+        quad = inhibition * total * total + excitation * (cos_m * cos_m + sin_m * sin_m)
+        energies = -0.5 * quad[:, 0] - (drive * rates).sum(axis=1)
+
+        activity_change = None if u_prev is None else np.abs(u - u_prev).max(axis=1)
+
+        return ring_phi, energies, activity_change
+
+    def _moments(self, rates: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        활동의 행별 모멘트 (Σr, Σr cos θ, Σr sin θ), 각 shape (D, 1)
+
+        행별 축소(sum)만 사용하므로 결과가 행 수(Ring 수)에 무관합니다.
+        """
+        total = rates.sum(axis=1, keepdims=True)
+        cos_m = (rates * self.cos_theta).sum(axis=1, keepdims=True)
+        sin_m = (rates * self.sin_theta).sum(axis=1, keepdims=True)
+        return total, cos_m, sin_m
+
+    def step(
+        self,
+        phases: np.ndarray,
+        dt_ms: float
+    ) -> Tuple[np.ndarray, List[Optional[float]]]:
+        """
+        Ring Bank step (모든 축 한 번에)
+
+        Args:
+            phases: 축별 위상 (새로운 위상 값) [rad], shape (D,)
+            dt_ms: 시간 간격 [ms]
+
+        Returns:
+            (stabilized_phases, energies)
+                - stabilized_phases: 안정화된 위상 [rad], shape (D,)
+                - energies: 축별 Ring 에너지
+
+        알고리즘:
+            1. 위상 정규화 후 Ring 인덱스로 변환 (벡터)
+            2. 인덱스 bump 주입 + 활동 행렬 적분 (Euler, 모든 Ring 한 번에)
+               - converge_tol > 0: 인덱스가 그대로이고 이미 수렴한 Ring은 적분 생략
+                 (Ring 위상과 활동 모두 변화 < converge_tol, 마지막 Ring 위상/에너지 재사용)
+            3. 집단 벡터로 Ring 위상을 읽고 원래 위상과 가중 평균 (0.9 / 0.1)
+        """
+        size = self.size
+        phase_wrap = self.phase_wrap
+
+        # 1. 위상 정규화 및 Ring 인덱스 (Ring ND Adapter와 같은 양자화)
+        # NaN/inf는 Ring 인덱스로 바꿀 수 없음 (Ring ND Adapter의 int() 변환과 같은 ValueError)
+        if not np.isfinite(phases).all():
+            raise ValueError("phases must be finite to map onto ring indices")
+        phases_norm = np.mod(phases, phase_wrap)
+        idx = ((phases_norm / phase_wrap) * size).astype(np.intp) % size
+
+        # 2. 활동 행렬 적분
+        if self.converge_tol <= 0:
+            ring_phi, energies, _ = self._integrate(idx, dt_ms)
+        else:
+            same = idx == self.last_idx
+            skip = same & self.converged
+            self.step_count += 1
+            if skip.any():
+                self.skip_counts += skip
+                rows = np.flatnonzero(~skip)
+                ring_phi = self.last_ring_phi.copy()
+                energies = self.last_energies.copy()
+                activity_change = np.zeros(0)
+                if len(rows):
+                    ring_phi[rows], energies[rows], activity_change = self._integrate(idx, dt_ms, rows)
+            else:
+                rows = slice(None)
+                ring_phi, energies, activity_change = self._integrate(idx, dt_ms)
+
+            # 수렴 판정 (적분한 Ring만): 같은 인덱스에서
+            # Ring 위상 변화 (원형 차이) < converge_tol 이고 bump 자체도 멈춤 (max |Δu| < converge_tol)
+            change = np.abs(np.mod(ring_phi[rows] - self.last_ring_phi[rows] + np.pi, phase_wrap) - np.pi)
+            self.converged[rows] = (
+                same[rows] & (change < self.converge_tol) & (activity_change < self.converge_tol)
+            )
+            self.last_idx = idx
+            self.last_ring_phi = ring_phi
+            self.last_energies = energies
+
+        # 3. 원래 위상과 Ring 위상을 가중 평균
+        stabilized = 0.9 * phases_norm + 0.1 * ring_phi
+
+        return stabilized, energies.tolist()
+
+    def reset(self):
+        """Ring Bank 리셋 (모든 활동 0, 수렴 추적/생략 카운터 초기화)"""
+        self.activity[:] = 0.0
+        self.last_idx[:] = -1
+        self.last_ring_phi[:] = 0.0
+        self.last_energies[:] = 0.0
+        self.converged[:] = False
+        self.skip_counts[:] = 0
+        self.step_count = 0
@@ -0,0 +1,275 @@
+"""
+Ring LUT Adapter
+Ring 안정화 응답을 미리 계산한 룩업 테이블 (LUT)로 대체
+
+Ring 어댑터는 위상을 정수 인덱스 [0, ring_size)로 양자화해 주입하고,
+Ring 중심과 0.9 / 0.1로 가중 평균합니다. ring_size가 작고 dt_ms가 설정마다 고정이므로
+인덱스별 "수렴한 Ring 위상"을 표로 만들어 두면, 정상 상태에서는 Ring 시뮬레이션이
+배열 인덱싱 한 번으로 바뀝니다.
+
+LUT 생성 (Ring 설정, ring_size, dt_ms 조합마다 한 번):
+    1. 인덱스 i마다 정지 상태의 Ring에 bin 중심 위상을 settle_ms 동안 주입
+    2. 그 뒤의 Ring 위상을 LUT[i]로 기록
+    3. 검증: 같은 Ring들을 다른 인덱스로 옮겨 다시 settle_ms 동안 유지하고 LUT와 비교
+       (이전 bump의 이력이 남는지 확인, 최대 오차 > tolerance 이면 ValueError)
+    4. 디스크 캐시 (GRID_ENGINE_CACHE_DIR 또는 ~/.cache/grid_engine)에 저장
+
+안정화 규칙 (Ring ND Adapter와 같음):
+    stabilized = 0.9 · φ_norm + 0.1 · LUT[idx(φ_norm)]
+
+⚠️ LUT는 정상 상태(수렴한) 응답입니다. 인덱스가 바뀐 직후 Ring이 따라가는 과도 구간은
+    재현하지 않습니다. Ring 상태를 갖지 않으므로 reset()은 아무것도 하지 않습니다.
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+from dataclasses import is_dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+import hashlib
+import math
+import os
+import numpy as np
+from .ring_adapter import RingAdapterConfig, RingAttractorEngine
+
+# LUT 캐시 형식 버전 (형식이나 생성 규칙이 바뀌면 올림)
+RING_LUT_VERSION = 1
+
+
+def resolve_ring_backend(backend: str) -> str:
+    """ "auto" → 실제 Ring 백엔드 ("external" 또는 "bank") """
+    if backend == "auto":
+        return "bank" if RingAttractorEngine is None else "external"
+    return backend
+
+
+def default_ring_lut_cache_dir() -> str:
+    """LUT 캐시 디렉토리 (GRID_ENGINE_CACHE_DIR 환경 변수 또는 ~/.cache/grid_engine)"""
+    base = os.environ.get("GRID_ENGINE_CACHE_DIR")
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".cache", "grid_engine")
+    return os.path.join(base, "ring_lut")
+
+
+def ring_lut_key(cfg: RingAdapterConfig, backend: str, dt_ms: float) -> Optional[str]:
+    """
+    LUT 캐시 키
+
+    Returns:
+        키 문자열 (Ring 설정이 문자열/None/dataclass가 아니면 None: 디스크 캐시 불가)
+    """
+    ring_cfg = cfg.config
+    if not (ring_cfg is None or isinstance(ring_cfg, str) or is_dataclass(ring_cfg)):
+        return None
+    text = (
+        f"v{RING_LUT_VERSION}|{resolve_ring_backend(backend)}|{ring_cfg!r}|"
+        f"{cfg.size}|{cfg.seed!r}|{float(dt_ms)!r}"
+    )
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _circular_error(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """원형 위상 차이의 절댓값 [rad]"""
+    return np.abs(np.mod(a - b + math.pi, 2.0 * math.pi) - math.pi)
+
+
+def build_ring_lut(
+    cfg: RingAdapterConfig,
+    backend: str,
+    dt_ms: float,
+    settle_ms: float = 300.0,
+    tolerance: float = 1e-3
+) -> Tuple[np.ndarray, float]:
+    """
+    Ring 하나의 LUT 생성 및 검증
+
+    ring_size개의 같은 Ring을 한 어댑터에 묶어 모든 인덱스를 동시에 진행합니다.
+
+    Args:
+        cfg: Ring 설정
+        backend: Ring 백엔드 ("auto", "external", "bank")
+        dt_ms: 시간 간격 [ms]
+        settle_ms: 인덱스 하나를 유지하는 시간 [ms] (이 시간 뒤의 Ring 위상을 수렴값으로 봄)
+        tolerance: 검증 허용 오차 [rad]
+
+    Returns:
+        (lut, validation_error)
+            - lut: 인덱스별 수렴 Ring 위상 [rad], shape (ring_size,)
+            - validation_error: 살아 있는 Ring과의 최대 오차 [rad]
+
+    Raises:
+        ValueError: 검증 오차가 tolerance를 넘는 경우 (Ring 응답이 이력에 의존)
+    """
+    from .ring_nd_adapter import create_ring_nd_adapter
+
+    size = cfg.size
+    two_pi = 2.0 * math.pi
+    centers = (np.arange(size, dtype=np.float64) + 0.5) * (two_pi / size)
+    num_steps = max(1, math.ceil(settle_ms / dt_ms))
+    adapter = create_ring_nd_adapter([cfg] * size, backend=backend)
+
+    def hold(indices: np.ndarray) -> np.ndarray:
+        """Ring r에 인덱스 indices[r]의 bin 중심 위상을 settle_ms 동안 주입하고 Ring 위상을 읽음"""
+        phases = centers[indices]
+        for _ in range(num_steps):
+            stabilized, _ = adapter.step(phases, dt_ms)
+        return np.mod((stabilized - 0.9 * phases) / 0.1, two_pi)
+
+    # 1~2. Ring r: 정지 상태에서 인덱스 r 유지 → LUT[r]
+    rows = np.arange(size)
+    lut = hold(rows)
+
+    # 3. 검증: 각 Ring을 다른 인덱스로 옮겨 유지 (모든 이동 거리, 무작위 순서)
+    validation_error = 0.0
+    for offset in np.random.default_rng(0).permutation(np.arange(1, size)).tolist():
+        indices = (rows + offset) % size
+        error = _circular_error(hold(indices), lut[indices])
+        validation_error = max(validation_error, float(error.max()))
+
+    if validation_error > tolerance:
+        raise ValueError(
+            f"ring LUT validation failed: max error {validation_error:.3e} rad "
+            f"> tolerance {tolerance:.3e} rad (config={cfg.config!r}, dt_ms={dt_ms})"
+        )
+    return lut, validation_error
+
+
+def load_or_build_ring_lut(
+    cfg: RingAdapterConfig,
+    backend: str,
+    dt_ms: float,
+    cache_dir: Optional[str] = None,
+    **build_kwargs
+) -> np.ndarray:
+    """
+    디스크 캐시에서 LUT를 읽고, 없으면 생성 후 저장
+
+    Args:
+        cfg: Ring 설정
+        backend: Ring 백엔드
+        dt_ms: 시간 간격 [ms]
+        cache_dir: 캐시 디렉토리 (None이면 default_ring_lut_cache_dir())
+        **build_kwargs: build_ring_lut() 인자
+
+    Returns:
+        lut, shape (ring_size,)
+    """
+    key = ring_lut_key(cfg, backend, dt_ms)
+    path = None
+    if key is not None:
+        path = os.path.join(cache_dir or default_ring_lut_cache_dir(), f"ring_lut_{key}.npy")
+        if os.path.exists(path):
+            lut = np.load(path)
+            if lut.shape == (cfg.size,):
+                return lut
+
+    lut, _ = build_ring_lut(cfg, backend, dt_ms, **build_kwargs)
+
+    if path is not None:
+        # 캐시 저장 실패(읽기 전용 등)는 무시 (다음 생성 때 다시 계산)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, lut)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+    return lut
+
+
+class RingLUTAdapter:
+    """
+    Ring LUT Adapter
+
+    축별 LUT를 (D, S) 행렬로 유지하고, step은 인덱싱 + 가중 평균만 수행합니다.
+    Ring ND Adapter와 같은 step()/reset() 인터페이스를 가집니다.
+    """
+
+    def __init__(
+        self,
+        configs: Sequence[RingAdapterConfig],
+        backend: str = "auto",
+        cache_dir: Optional[str] = None,
+        dt_ms: Optional[float] = None
+    ):
+        """
+        Args:
+            configs: 축별 Ring 설정 (축 순서대로, size는 모두 같아야 함)
+            backend: LUT를 만들 살아 있는 Ring 백엔드 ("auto", "external", "bank")
+            cache_dir: LUT 디스크 캐시 디렉토리 (None이면 기본 위치)
+            dt_ms: 미리 만들 LUT의 시간 간격 [ms] (None이면 첫 step에서 생성)
+        """
+        self.configs = list(configs)
+        assert len(self.configs) > 0, "configs must not be empty"
+        self.size = self.configs[0].size
+        assert all(cfg.size == self.size for cfg in self.configs), \
+            "all rings must have the same size"
+        self.phase_wrap = 2.0 * 3.141592653589793
+        self.backend = backend
+        self.cache_dir = cache_dir
+
+        # dt_ms별 LUT 행렬, shape (D, S)
+        self.tables: Dict[float, np.ndarray] = {}
+        self._rows = np.arange(len(self.configs))
+
+        if dt_ms is not None:
+            self.table(dt_ms)
+
+    def table(self, dt_ms: float) -> np.ndarray:
+        """
+        dt_ms에 해당하는 LUT 행렬 (없으면 생성)
+
+        같은 Ring 설정을 공유하는 축은 LUT를 한 번만 만듭니다.
+        """
+        lut = self.tables.get(dt_ms)
+        if lut is None:
+            rows: Dict[object, np.ndarray] = {}
+            lut = np.empty((len(self.configs), self.size), dtype=np.float64)
+            for d, cfg in enumerate(self.configs):
+                shared_key = ring_lut_key(cfg, self.backend, dt_ms) or id(cfg.config)
+                if shared_key not in rows:
+                    rows[shared_key] = load_or_build_ring_lut(
+                        cfg, self.backend, dt_ms, cache_dir=self.cache_dir
+                    )
+                lut[d] = rows[shared_key]
+            self.tables[dt_ms] = lut
+        return lut
+
+    def step(
+        self,
+        phases: np.ndarray,
+        dt_ms: float
+    ) -> Tuple[np.ndarray, List[Optional[float]]]:
+        """
+        Ring LUT step (모든 축 한 번에)
+
+        Args:
+            phases: 축별 위상 (새로운 위상 값) [rad], shape (D,)
+            dt_ms: 시간 간격 [ms]
+
+        Returns:
+            (stabilized_phases, energies)
+                - stabilized_phases: 안정화된 위상 [rad], shape (D,)
+                - energies: 축별 에너지 (LUT 모드에서는 None)
+        """
+        lut = self.tables.get(dt_ms)
+        if lut is None:
+            lut = self.table(dt_ms)
+
+        if not np.isfinite(phases).all():
+            raise ValueError("phases must be finite to map onto ring indices")
+        phases_norm = np.mod(phases, self.phase_wrap)
+        idx = ((phases_norm / self.phase_wrap) * self.size).astype(np.intp) % self.size
+
+        stabilized = 0.9 * phases_norm + 0.1 * lut[self._rows, idx]
+
+        energies: List[Optional[float]] = [None] * len(self.configs)
+        return stabilized, energies
+
+    def reset(self):
+        """Ring LUT 리셋 (상태 없음)"""
+        pass
@@ -0,0 +1,203 @@
+"""
+Ring ND Adapter
+축 수에 무관한 Ring 어댑터 (N개 Ring)
+
+이 모듈은 Grid ND Engine과 Ring Attractor Engine 간의 어댑터입니다.
+Ring 2D~7D Adapter가 축마다 반복하던 위상 정규화, 인덱스 계산, 가중 평균을
+배열 연산으로 처리하고, Ring 호출(inject/run)만 축별로 수행합니다.
+
+역할:
+    - Grid ND Engine은 Ring 내부 구현을 몰라야 함 (호출만)
+    - 각 축마다 독립적인 Ring Attractor 사용
+
+Ring 백엔드 선택 (create_ring_nd_adapter):
+    - "external": Ring ND Adapter (외부 RingAttractorEngine, 축별 호출)
+    - "bank": Ring Bank Adapter (in-tree, 활동 행렬 하나로 벡터화)
+    - "auto": 외부 패키지가 있으면 "external", 없으면 "bank"
+    - lut=True: 위 백엔드의 수렴 응답을 LUT로 만들어 사용 (RingLUTAdapter)
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from .ring_adapter import RingAdapterConfig, RingAttractorEngine
+from .ring_bank_adapter import RingBankAdapter
+from .ring_lut_adapter import RingLUTAdapter
+
+# Ring 백엔드 종류
+RING_BACKENDS = ("auto", "external", "bank")
+
+
+class RingNDAdapter:
+    """
+    Ring ND Adapter
+
+    축별 Ring Engine을 리스트로 래핑합니다.
+    """
+
+    def __init__(self, configs: Sequence[RingAdapterConfig], converge_tol: float = 0.0):
+        """
+        Args:
+            configs: 축별 Ring 설정 (축 순서대로)
+            converge_tol: 수렴 판정 임계값 [rad] (> 0이면 수렴한 Ring의 run() 생략, 0이면 항상 실행)
+        """
+        assert converge_tol >= 0, f"converge_tol ({converge_tol}) must be >= 0"
+        if RingAttractorEngine is None:
+            raise ImportError(
+                "RingAttractorEngine을 찾을 수 없습니다. "
+                "ring-attractor-engine 패키지를 설치하거나, "
+                "ring_backend=\"bank\" (Ring Bank Adapter)를 사용하세요."
+            )
+        self.configs = list(configs)
+        self.rings = [
+            RingAttractorEngine(
+                size=cfg.size,
+                config=cfg.config,
+                seed=cfg.seed,
+                debug=cfg.debug
+            )
+            for cfg in self.configs
+        ]
+        self.size = self.configs[0].size
+        self.phase_wrap = 2.0 * 3.141592653589793
+        self.converge_tol = converge_tol
+
+        # 수렴 추적 (Ring별): 마지막 주입 인덱스, Ring 위상 기여분(0.1 · Ring 위상), 수렴 여부
+        num_rings = len(self.rings)
+        self.last_idx: List[int] = [-1] * num_rings
+        self.last_terms: List[float] = [0.0] * num_rings
+        self.converged: List[bool] = [False] * num_rings
+
+        # 생략 카운터 (진단용, converge_tol > 0일 때만 집계)
+        self._skip_counts: List[int] = [0] * num_rings
+        self.step_count: int = 0
+
+    def step(
+        self,
+        phases: np.ndarray,
+        dt_ms: float
+    ) -> Tuple[np.ndarray, List[Optional[float]]]:
+        """
+        Ring Engine step 호출 (ND)
+
+        Args:
+            phases: 축별 위상 (새로운 위상 값) [rad], shape (D,)
+            dt_ms: 시간 간격 [ms]
+
+        Returns:
+            (stabilized_phases, energies)
+                - stabilized_phases: 안정화된 위상 [rad], shape (D,)
+                - energies: 축별 에너지 (선택적, 진단용)
+
+        알고리즘:
+            1. 위상 정규화 (벡터) 후 Ring 인덱스로 변환
+            2. 각 Ring에 위상 주입 및 실행 (축별)
+            3. 원래 위상과 Ring 위상을 가중 평균 (원래 0.9 / Ring 0.1)
+        """
+        size = self.size
+        phase_wrap = self.phase_wrap
+
+        # 위상을 [0, 2π) 범위로 정규화 (벡터)
+        phases_norm = np.mod(phases, phase_wrap)
+
+        # 축별 Ring 주입 및 실행 (Ring 호출은 축별로만 가능)
+        # Ring 위상 기여분(0.1 · Ring 위상)도 같은 루프에서 계산
+        if self.converge_tol <= 0:
+            ring_terms = []
+            for ring, phi in zip(self.rings, phases_norm.tolist()):
+                idx = int((phi / phase_wrap) * size) % size
+                ring.inject(direction_idx=idx, strength=0.8)
+                ring_state = ring.run(duration_ms=dt_ms)
+                ring_terms.append(0.1 * ((ring_state.center / size) * phase_wrap))
+        else:
+            ring_terms = self._step_converge(phases_norm.tolist(), dt_ms)
+
+        # 원래 위상과 Ring 위상을 가중 평균 (벡터, Ring은 미세 조정만)
+        stabilized = 0.9 * phases_norm + ring_terms
+
+        # 에너지 (선택적, 진단용)
+        energies: List[Optional[float]] = [None] * len(self.rings)
+
+        return stabilized, energies
+
+    def _step_converge(self, phases_norm: List[float], dt_ms: float) -> List[float]:
+        """
+        수렴 인식 Ring 주입/실행 (converge_tol > 0)
+
+        인덱스가 그대로이고 지난 run()에서 Ring 위상 변화가 converge_tol 미만이었던 Ring은
+        inject()/run()을 생략하고 마지막 Ring 위상 기여분을 재사용합니다.
+
+        Returns:
+            축별 Ring 위상 기여분 (0.1 · Ring 위상) [rad]
+        """
+        size = self.size
+        phase_wrap = self.phase_wrap
+        # 기여분(0.1 · Ring 위상) 기준 임계값, 원형 차이
+        tol = 0.1 * self.converge_tol
+        half_wrap_term = 0.1 * phase_wrap
+
+        self.step_count += 1
+        ring_terms = self.last_terms
+        for d, (ring, phi) in enumerate(zip(self.rings, phases_norm)):
+            idx = int((phi / phase_wrap) * size) % size
+            same = idx == self.last_idx[d]
+            if same and self.converged[d]:
+                self._skip_counts[d] += 1
+                continue
+            ring.inject(direction_idx=idx, strength=0.8)
+            ring_state = ring.run(duration_ms=dt_ms)
+            term = 0.1 * ((ring_state.center / size) * phase_wrap)
+            change = abs(term - ring_terms[d])
+            self.converged[d] = same and min(change, half_wrap_term - change) < tol
+            self.last_idx[d] = idx
+            ring_terms[d] = term
+        return list(ring_terms)
+
+    @property
+    def skip_counts(self) -> np.ndarray:
+        """축별 run() 생략 횟수, shape (D,)"""
+        return np.array(self._skip_counts, dtype=np.int64)
+
+    def reset(self):
+        """Ring Engine 리셋 (ND)"""
+        # Ring Engine 리셋 (필요시 구현)
+        # 수렴 추적/생략 카운터 초기화 (리셋 후 첫 step은 항상 Ring 실행)
+        num_rings = len(self.rings)
+        self.last_idx = [-1] * num_rings
+        self.last_terms = [0.0] * num_rings
+        self.converged = [False] * num_rings
+        self._skip_counts = [0] * num_rings
+        self.step_count = 0
+
+
+def create_ring_nd_adapter(
+    configs: Sequence[RingAdapterConfig],
+    backend: str = "auto",
+    lut: bool = False,
+    dt_ms: Optional[float] = None,
+    converge_tol: float = 0.0
+):
+    """
+    Ring 백엔드에 맞는 ND Ring 어댑터 생성
+
+    Args:
+        configs: 축별 Ring 설정 (축 순서대로)
+        backend: "auto", "external", "bank"
+        lut: True이면 backend Ring의 수렴 응답 LUT 사용 (RingLUTAdapter)
+        dt_ms: LUT를 미리 만들 시간 간격 [ms] (lut=True일 때만 사용)
+        converge_tol: 수렴한 Ring의 실행 생략 임계값 [rad] (0이면 생략 없음, LUT에는 미사용)
+
+    Returns:
+        RingNDAdapter, RingBankAdapter 또는 RingLUTAdapter (같은 step()/reset() 인터페이스)
+    """
+    assert backend in RING_BACKENDS, f"backend ({backend}) must be one of {RING_BACKENDS}"
+    if lut:
+        return RingLUTAdapter(configs, backend=backend, dt_ms=dt_ms)
+    if backend == "bank" or (backend == "auto" and RingAttractorEngine is None):
+        return RingBankAdapter(configs, converge_tol=converge_tol)
+    return RingNDAdapter(configs, converge_tol=converge_tol)
@@ -0,0 +1,112 @@
+"""
+Event Log
+레벨/빈도 제한이 있는 구조화 이벤트 로그 (logging 기반)
+
+제어 루프 안의 print()는 로그가 필요 없을 때도 f-string 포맷팅 (np.linalg.norm 포함)과
+stdout 쓰기 비용을 냅니다. Event Log는 이를 logging 이벤트로 바꿉니다:
+
+    - 레벨: logger.isEnabledFor(level)가 False면 필드 계산/포맷팅 없음
+    - 빈도 제한: 이벤트 이름별 (최대 횟수, 시간 창 [s]), 버린 횟수는 다음 기록의 suppressed 필드로
+    - 구조화 필드: LogRecord.event / LogRecord.fields (딕셔너리), 메시지는 핸들러가 출력할 때만 포맷팅
+
+사용 예:
+    log = EventLog("grid_engine.replay", rate_limits={"replay.place": (5, 1.0)})
+    if log.enabled(logging.DEBUG, "replay.place"):  # 비싼 필드는 확인 후 계산
+        log.emit(logging.DEBUG, "replay.place", place_id=7, bias_norm=float(np.linalg.norm(b)))
+    log.event(logging.INFO, "replay.end", places_updated=3)  # 필드가 싸면 한 번에
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+import logging
+import time
+
+
+class EventFields:
+    """구조화 필드 (str()할 때만 "key=value, ..." 포맷팅)"""
+
+    __slots__ = ('fields',)
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{key}={value:.6f}" if isinstance(value, float) else f"{key}={value}"
+            for key, value in self.fields.items()
+        )
+
+
+class EventLog:
+    """
+    구조화 이벤트 로그 (logging.Logger + 이벤트별 빈도 제한)
+
+    이벤트 이름별 빈도 제한 (max_events, window_s): window_s 초마다 최대 max_events개 기록.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate_limits: Optional[Dict[str, Tuple[int, float]]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            name: logger 이름 (logging.getLogger)
+            rate_limits: 이벤트 이름 → (최대 횟수, 시간 창 [s]) (없는 이벤트는 제한 없음)
+            clock: 빈도 제한용 clock [s]
+        """
+        self.logger = logging.getLogger(name)
+        self.rate_limits: Dict[str, Tuple[int, float]] = dict(rate_limits or {})
+        for event, (max_events, window_s) in self.rate_limits.items():
+            assert max_events > 0 and window_s > 0, \
+                f"rate_limits[{event!r}] must have max_events > 0 and window_s > 0"
+        self.clock = clock
+        self._windows: Dict[str, list] = {}  # 이벤트 → [창 시작, 창 안 기록 수]
+        self.suppressed: Dict[str, int] = {}  # 이벤트 → 마지막 기록 이후 버린 수
+
+    def enabled(self, level: int, event: str) -> bool:
+        """
+        이 이벤트를 지금 기록할지 (레벨 + 빈도 제한)
+
+        True를 반환하면 기록 한 번으로 계산합니다 (이어서 emit() 호출).
+        """
+        if not self.logger.isEnabledFor(level):
+            return False
+        limit = self.rate_limits.get(event)
+        if limit is None:
+            return True
+        max_events, window_s = limit
+        now = self.clock()
+        window = self._windows.get(event)
+        if window is None or now - window[0] >= window_s:
+            self._windows[event] = [now, 1]
+            return True
+        if window[1] < max_events:
+            window[1] += 1
+            return True
+        self.suppressed[event] = self.suppressed.get(event, 0) + 1
+        return False
+
+    def emit(self, level: int, event: str, **fields: Any) -> None:
+        """이벤트 기록 (enabled() 확인 후 호출, 버린 횟수는 suppressed 필드로)"""
+        self._log(level, event, fields, stacklevel=3)
+
+    def event(self, level: int, event: str, **fields: Any) -> None:
+        """enabled()이면 emit() (필드 계산이 싼 경우)"""
+        if self.enabled(level, event):
+            self._log(level, event, fields, stacklevel=3)
+
+    def _log(self, level: int, event: str, fields: Dict[str, Any], stacklevel: int) -> None:
+        suppressed = self.suppressed.pop(event, 0)
+        if suppressed:
+            fields['suppressed'] = suppressed
+        self.logger.log(
+            level, "[%s] %s", event, EventFields(fields),
+            extra={'event': event, 'fields': fields}, stacklevel=stacklevel
+        )
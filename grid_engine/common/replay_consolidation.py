@@ -15,52 +15,8 @@ License: MIT License
 """
 
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
 import numpy as np
-from collections import deque
-
-
-@dataclass
-class PlaceMemoryWithHistory:
-    """
-    Place Memory with Bias History (Replay/Consolidation용)
-    
-    최근 N회차의 bias 이력을 저장하여 노이즈 필터링에 사용합니다.
-    """
-    place_id: int
-    bias_estimate: np.ndarray = field(default_factory=lambda: np.zeros(5))  # 장기 기억 (Consolidated)
-    bias_history: deque = field(default_factory=lambda: deque(maxlen=10))  # 최근 10회차 bias 이력
-    visit_count: int = 0
-    last_visit_time: float = 0.0
-    last_update_time: float = 0.0  # 마지막 업데이트 시간
-    consolidated_bias: Optional[np.ndarray] = None  # Consolidated bias (통계적 유의성 검증 통과)
-    consolidation_time: float = 0.0  # Consolidation 수행 시간
-    
-    def add_bias_to_history(self, bias: np.ndarray) -> None:
-        """
-        Bias 이력에 추가
-        
-        Args:
-            bias: 새로운 bias 추정값
-        """
-        self.bias_history.append(bias.copy())
-    
-    def get_recent_biases(self, n: int) -> List[np.ndarray]:
-        """
-        최근 N회차의 bias 이력 반환
-        
-        Args:
-            n: 반환할 회차 수
-        
-        Returns:
-            최근 N회차의 bias 리스트
-        """
-        if len(self.bias_history) == 0:
-            return []
-        
-        # 최근 N개 반환 (이력이 N개보다 적으면 모두 반환)
-        recent = list(self.bias_history)[-n:]
-        return recent
+from ..hippocampus.replay_consolidation import PlaceMemoryWithHistory  # 이력 ring + 이동 통계 (hippocampus와 같은 구현) ✨ NEW
 
 
 class ReplayConsolidation:
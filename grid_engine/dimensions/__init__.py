@@ -13,10 +13,12 @@ License: MIT License
 from .dim2d import Grid2DEngine, Grid2DConfig
 from .dim3d import Grid3DEngine, Grid3DConfig
 from .dim4d import Grid4DEngine, Grid4DConfig
+from .dimnd import GridNDEngine, GridBatchEngine, GridNDConfig, AxisSpec
 
 __all__ = [
     'Grid2DEngine', 'Grid2DConfig',
     'Grid3DEngine', 'Grid3DConfig',
     'Grid4DEngine', 'Grid4DConfig',
+    'GridNDEngine', 'GridBatchEngine', 'GridNDConfig', 'AxisSpec',
 ]
 
@@ -10,7 +10,8 @@ License: MIT License
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
+from ..dimnd.config_nd import AxisSpec, GridNDConfig
 
 
 @dataclass
@@ -32,6 +33,10 @@ class GridEngineConfig:
     ring_cfg_x: str = "case2"  # X 방향 Ring 설정
     ring_cfg_y: str = "case2"  # Y 방향 Ring 설정
     ring_size: int = 15  # Ring 크기 (뉴런 수)
+    ring_backend: str = "auto"  # "auto" | "external" (RingAttractorEngine) | "bank" (in-tree Ring Bank)
+    ring_lut: bool = False  # True: Ring 수렴 응답 LUT로 안정화 (Ring 시뮬레이션 대신 인덱싱)
+    ring_converge_tol: float = 0.0  # > 0: 인덱스가 그대로이고 수렴한 축은 Ring 실행 생략 [rad]
+    ring_update_interval: int = 1  # Ring 안정화 주기 [step] (k > 1: 적분은 매 step, Ring은 k step마다)
     
     # 위상 관련
     phase_wrap: float = 2.0 * 3.141592653589793  # 2π [rad]
@@ -88,4 +93,34 @@ class GridEngineConfig:
         assert self.phase_wrap > 0, "phase_wrap must be positive"
         assert self.spatial_scale_x > 0, "spatial_scale_x must be positive"
         assert self.spatial_scale_y > 0, "spatial_scale_y must be positive"
-
+    
+    def axis_specs(self) -> List[AxisSpec]:
+        """
+        축 명세 (Grid ND Engine용)
+        
+        Returns:
+            [X, Y] 위치 축 명세
+        """
+        return [
+            AxisSpec("x", scale=self.spatial_scale_x, ring_cfg=self.ring_cfg_x),
+            AxisSpec("y", scale=self.spatial_scale_y, ring_cfg=self.ring_cfg_y),
+        ]
+    
+    def to_nd_config(self) -> GridNDConfig:
+        """
+        Grid ND Engine 설정으로 변환
+        
+        축 명세는 axis_specs()로 만들고, 시간/위상/Ring 설정은 그대로 옮깁니다.
+        """
+        return GridNDConfig(
+            axes=self.axis_specs(),
+            phase_wrap=self.phase_wrap,
+            dt_ms=self.dt_ms,
+            tau_ms=self.tau_ms,
+            max_dt_ratio=self.max_dt_ratio,
+            ring_size=self.ring_size,
+            ring_backend=self.ring_backend,
+            ring_lut=self.ring_lut,
+            ring_converge_tol=self.ring_converge_tol,
+            ring_update_interval=self.ring_update_interval
+        )
@@ -62,12 +62,11 @@ License: MIT License
 """
 
 from typing import Optional
+import numpy as np
 from .config_2d import GridEngineConfig
 from .types_2d import GridState, GridInput, GridOutput, GridDiagnostics
-from .integrator_2d import semi_implicit_euler
-from ...common.coupling import update_state_from_phases, normalize_phase
 from ...common.energy import compute_diagnostics, calculate_energy
-from ...common.adapters.ring_adapter import RingAdapter, RingAdapterConfig
+from ..dimnd.grid_nd_engine import GridNDEngine
 from .projector_2d import CoordinateProjector
 
 
@@ -76,6 +75,9 @@ class GridEngine:
     Grid Engine
     
     Ring ⊗ Ring 구조로 2D 위치 상태 유지
+    
+    내부 계산은 GridNDEngine(self.core)이 위상/속도/가속도 배열로 수행하고,
+    이 클래스는 GridState/GridInput/GridOutput 인터페이스를 제공하는 facade입니다.
     """
     
     def __init__(
@@ -95,40 +97,35 @@ class GridEngine:
         self.config = config or GridEngineConfig()
         self.config.validate()
         
-        # Ring Adapter 생성
-        ring_cfg_x = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_x
-        )
-        ring_cfg_y = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_y
+        # Grid ND Engine 생성 (적분 → Ring 안정화 → 투영을 배열 연산으로 수행)
+        # 주의: Grid Engine은 위상만 유지, 좌표는 projector가 계산
+        self.core = GridNDEngine(
+            config=self.config.to_nd_config(),
+            initial=(initial_x, initial_y)  # 초기값 저장 (나중에는 projector로 계산)
         )
-        self.ring_adapter = RingAdapter(ring_cfg_x, ring_cfg_y)
+        self.ring_adapter = self.core.ring_adapter
         
         # Coordinate Projector 생성 (좌표 투영 담당)
         self.projector = CoordinateProjector(self.config)
         
-        # 초기 상태 설정
-        # 주의: Grid Engine은 위상만 유지, 좌표는 projector가 계산
-        phi_x, phi_y = self.projector.coordinate_to_phase(initial_x, initial_y)
-        phi_x = normalize_phase(phi_x, self.config.phase_wrap)
-        phi_y = normalize_phase(phi_y, self.config.phase_wrap)
-        
-        self.state = GridState(
-            phi_x=phi_x,
-            phi_y=phi_y,
-            x=initial_x,  # 초기값 저장 (나중에는 projector로 계산)
-            y=initial_y,  # 초기값 저장 (나중에는 projector로 계산)
-            v_x=0.0,
-            v_y=0.0,
-            a_x=0.0,
-            a_y=0.0,
-            t_ms=0.0
-        )
-        
+        # 상태 (core 상태 버퍼를 복사 없이 감싼 view, step마다 제자리 갱신)
+        self._state: GridState = GridState.from_buffer(self.core.buffer)
         self.state_prev: Optional[GridState] = None
     
+    @property
+    def state(self) -> GridState:
+        """
+        현재 상태 (GridState, core 상태 버퍼의 view)
+        
+        같은 객체가 step()/reset()마다 제자리에서 갱신되며, 필드 수정 (engine.state.t_ms += dt)은 엔진에 반영됩니다.
+        ⚠️ 특정 시점의 상태를 보관하려면 engine.state.copy() 또는 get_state()를 사용합니다.
+        """
+        return self._state
+    
+    @state.setter
+    def state(self, state: GridState):
+        self.core.load_flat(state.array)
+    
     def step(self, inp: GridInput) -> GridOutput:
         """
         Grid Engine step 함수
@@ -171,128 +168,23 @@ class GridEngine:
         Author: [작성자 시그니처]
         Created: 2026-01
         """
-        # ============================================================
-        # 0. 이전 상태 저장 (진단용)
-        # ============================================================
-        # 진단 모드가 활성화된 경우, 이전 상태를 저장하여
-        # 에너지 변화, 안정성 등을 계산할 수 있도록 합니다.
+        # 0. 이전 상태 저장 (진단용, state는 제자리 갱신되므로 버퍼 복사)
         if self.config.diagnostics_enabled:
-            self.state_prev = GridState(
-                phi_x=self.state.phi_x,
-                phi_y=self.state.phi_y,
-                x=self.state.x,
-                y=self.state.y,
-                v_x=self.state.v_x,
-                v_y=self.state.v_y,
-                a_x=self.state.a_x,
-                a_y=self.state.a_y,
-                t_ms=self.state.t_ms
-            )
-        
-        # ============================================================
-        # 1. 수치 적분 (Semi-implicit Euler)
-        # ============================================================
-        # 경로 통합(Path Integration): 속도와 가속도로부터 위상 업데이트
-        #
-        # 수식:
-        #   v(t+Δt) = v(t) + a·Δt          [속도 업데이트]
-        #   φ(t+Δt) = φ(t) + v·Δt + ½a·Δt²  [위상 업데이트]
-        #
-        # 물리 단위:
-        #   - 입력: v [m/s], a [m/s²], dt_ms [ms]
-        #   - 변환: dt_s = dt_ms / 1000.0 [s]
-        #   - 수식: dφ = v [m/s] * dt_s [s] + ½a [m/s²] * (dt_s [s])²
-        #
-        # 참고: integrator.py에서 물리 법칙 적용을 위해
-        #       ms를 s로 변환하여 단위 일관성을 확보합니다.
-        new_phi_x, new_phi_y, new_v_x, new_v_y = semi_implicit_euler(
-            self.state,
-            inp,
-            self.config.dt_ms,
-            self.config.tau_ms
-        )
-        
-        # ============================================================
-        # 2. Ring 안정화 (Attractor 동역학)
-        # ============================================================
-        # Ring Attractor가 위상을 안정적인 manifold로 끌어당깁니다.
-        #
-        # 동작 원리:
-        #   1. 위상을 Ring 인덱스로 변환
-        #      idx = (φ / 2π) * ring_size
-        #
-        #   2. Ring에 위상 주입
-        #      ring.inject(direction_idx=idx, strength=0.8)
-        #
-        #   3. Ring 동역학 실행 (안정화)
-        #      ring.run(duration_ms=dt_ms)
-        #
-        #   4. 안정화된 위상 추출
-        #      φ_stabilized = (ring.center / ring_size) * 2π
-        #
-        # 효과:
-        #   - 노이즈 억제: 위상이 Attractor에 붙잡혀 노이즈가 감쇠됩니다
-        #   - 외란 저항성: 외부 외란이 있어도 위상이 안정적으로 유지됩니다
-        #   - 가중 평균: 원래 위상 90% + Ring 조정 10%
-        stabilized_phi_x, stabilized_phi_y, energy_x, energy_y = \
-            self.ring_adapter.step(new_phi_x, new_phi_y, self.config.dt_ms)
-        
-        # ============================================================
-        # 3. 상태 업데이트 (위상 정규화 및 좌표 투영)
-        # ============================================================
-        # 위상 정규화: 주기적 경계 조건 적용
-        #
-        # 수식: φ_norm = φ mod 2π ∈ [0, 2π)
-        #
-        # 의미: 위상이 주기적 경계 조건을 만족하도록 [0, 2π) 범위로 감쌉니다.
-        #       토러스(Torus) 공간의 특성상 위상은 주기적입니다.
-        #
-        # 주의: Grid Engine은 내부 위상(φ)만 관리합니다.
-        #       좌표(x, y)는 projector(관측자)가 계산합니다.
-        phi_x_norm = normalize_phase(stabilized_phi_x, self.config.phase_wrap)
-        phi_y_norm = normalize_phase(stabilized_phi_y, self.config.phase_wrap)
+            self.state_prev = self.state.copy()
         
-        # 좌표 투영: 위상 → 좌표 변환 (관측자 책임)
-        #
-        # 수식: x = φx · (Lx / 2π)
-        #       y = φy · (Ly / 2π)
-        #
-        # 의미: 내부 위상 φ ∈ [0, 2π)를 외부 좌표 x ∈ [0, L)로 변환합니다.
-        #       이는 관측자 패턴(Observer Pattern)을 따릅니다.
-        #
-        # 책임 분리:
-        #   - Grid Engine: 위상 상태만 유지
-        #   - CoordinateProjector: 좌표 계산 (관측자)
-        x, y = self.projector.phase_to_coordinate(phi_x_norm, phi_y_norm)
-        
-        # 상태 업데이트 (좌표는 projector가 계산한 값으로)
-        self.state = GridState(
-            phi_x=phi_x_norm,
-            phi_y=phi_y_norm,
-            x=x,  # projector가 계산한 좌표
-            y=y,  # projector가 계산한 좌표
-            v_x=new_v_x,
-            v_y=new_v_y,
-            a_x=inp.a_x if inp.a_x is not None else self.state.a_x,
-            a_y=inp.a_y if inp.a_y is not None else self.state.a_y,
-            t_ms=self.state.t_ms + self.config.dt_ms
-        )
+        # 1~3. 수치 적분 → Ring 안정화 → 위상 정규화 및 좌표 투영 (Grid ND Engine)
+        self.core.step((inp.v_x, inp.v_y), (inp.a_x, inp.a_y))
         
         # 4. 출력 생성
-        # 출력도 projector를 통해 좌표 계산 (일관성 유지)
-        output_x, output_y = self.projector.phase_to_coordinate(
-            self.state.phi_x, self.state.phi_y
-        )
+        output = GridOutput(*self.core.output_tuple())
         
-        output = GridOutput(
-            x=output_x,
-            y=output_y,
-            phi_x=self.state.phi_x,
-            phi_y=self.state.phi_y
-        )
+        if self.state_prev is None:
+            return output
+        
+        energy_x, energy_y = self.core.last_energies
         
         # 진단 정보 추가 (선택적)
-        if self.config.diagnostics_enabled and self.state_prev is not None:
+        if self.config.diagnostics_enabled:
             diagnostics = compute_diagnostics(
                 self.state,
                 self.state_prev,
@@ -304,7 +196,7 @@ class GridEngine:
             output.energy = diagnostics.energy
         
         # 에너지 감소 검증
-        if self.config.energy_check_enabled and self.state_prev is not None:
+        if self.config.energy_check_enabled:
             energy_prev = calculate_energy(self.state_prev, self.config, energy_x, energy_y)
             energy_curr = calculate_energy(self.state, self.config, energy_x, energy_y)
             if energy_curr > energy_prev:
@@ -313,9 +205,30 @@ class GridEngine:
         
         return output
     
+    def run(self, inputs: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        궤적 롤아웃 (2D, T 스텝 연속 실행)
+        
+        step()을 T번 호출한 것과 같은 결과를 출력 배열 한 개에 기록합니다.
+        스텝마다 GridOutput / GridState 객체를 만들지 않습니다.
+        (진단용 state_prev는 갱신하지 않음)
+        
+        Args:
+            inputs: 입력 블록, shape (T, 2) 또는 (T, 4)
+                - 속도 열 [m/s]: v_x, v_y
+                - 가속도 열 [m/s²] (선택적, NaN은 가속도 없음): a_x, a_y
+            out: 출력 배열, shape (T, 4) (None이면 새로 할당)
+        
+        Returns:
+            출력 배열, shape (T, 4) — GridOutput 필드 순서
+                - 좌표 열 [m]: x, y
+                - 위상 열 [rad]: phi_x, phi_y
+        """
+        return self.core.run(inputs, out)
+    
     def get_state(self) -> GridState:
-        """현재 상태 반환"""
-        return self.state
+        """현재 상태 반환 (스냅샷, 이후 step()에도 바뀌지 않음)"""
+        return self.state.copy()
     
     def reset(self, x: float = 0.0, y: float = 0.0):
         """
@@ -325,21 +238,4 @@ class GridEngine:
             x: 초기 X 좌표 [m]
             y: 초기 Y 좌표 [m]
         """
-        # 좌표 → 위상 변환 (projector 사용)
-        phi_x, phi_y = self.projector.coordinate_to_phase(x, y)
-        phi_x = normalize_phase(phi_x, self.config.phase_wrap)
-        phi_y = normalize_phase(phi_y, self.config.phase_wrap)
-        
-        self.state = GridState(
-            phi_x=phi_x,
-            phi_y=phi_y,
-            x=x,
-            y=y,
-            v_x=0.0,
-            v_y=0.0,
-            a_x=0.0,
-            a_y=0.0,
-            t_ms=0.0
-        )
-        self.ring_adapter.reset()
-
+        self.core.reset((x, y))
@@ -11,16 +11,23 @@ License: MIT License
 
 from dataclasses import dataclass
 from typing import Optional, Tuple
+from ..dimnd.state_nd import GridNDState
 
 
-@dataclass
-class GridState:
+class GridState(GridNDState):
     """
     Grid Engine 내부 상태
     
     내부 상태: 위상 벡터 (φx, φy)
     외부 표현: 공간 좌표 (x, y)
+    
+    저장 방식 (GridNDState):
+        - 모든 필드는 float64 버퍼 하나에 있고, 필드 이름은 property입니다
+        - 생성 시 위상을 [0, 2π)로 정규화합니다
+        - 엔진의 state는 엔진 버퍼를 감싼 view로 step마다 제자리 갱신됩니다 (보관하려면 copy())
     """
+    __slots__ = ()
+    
     # 위상 (내부 상태)
     phi_x: float  # X 방향 위상 [0, 2π)
     phi_y: float  # Y 방향 위상 [0, 2π)
@@ -39,20 +46,6 @@ class GridState:
     
     # 시간
     t_ms: float  # 현재 시간 [ms]
-    
-    def __post_init__(self):
-        """
-        위상 범위 검증
-        
-        주의: config.phase_wrap을 사용해야 하지만,
-        dataclass 초기화 시점에는 config가 없으므로
-        기본값 2π를 사용합니다.
-        실제 정규화는 coupling.normalize_phase()에서 수행됩니다.
-        """
-        # 위상 주기적 경계 조건 (기본값 2π 사용)
-        phase_wrap_default = 2.0 * 3.141592653589793
-        self.phi_x = self.phi_x % phase_wrap_default
-        self.phi_y = self.phi_y % phase_wrap_default
 
 
 @dataclass
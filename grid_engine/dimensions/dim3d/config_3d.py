@@ -13,7 +13,9 @@ License: MIT License
 """
 
 from dataclasses import dataclass
+from typing import List
 from ..dim2d.config_2d import GridEngineConfig
+from ..dimnd.config_nd import AxisSpec
 
 
 @dataclass
@@ -61,4 +63,13 @@ class Grid3DConfig(GridEngineConfig):
         # Ring 설정 검증 (간단한 검증)
         assert isinstance(self.ring_cfg_z, str), "ring_cfg_z must be a string"
         assert len(self.ring_cfg_z) > 0, "ring_cfg_z must not be empty"
-
+    
+    def axis_specs(self) -> List[AxisSpec]:
+        """
+        축 명세 (Grid ND Engine용, 3D)
+        
+        2D 축 명세에 Z 위치 축 추가
+        """
+        return super().axis_specs() + [
+            AxisSpec("z", scale=self.spatial_scale_z, ring_cfg=self.ring_cfg_z),
+        ]
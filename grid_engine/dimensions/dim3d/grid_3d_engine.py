@@ -76,13 +76,11 @@ License: MIT License
 """
 
 from typing import Optional
+import numpy as np
 from .config_3d import Grid3DConfig
 from .types_3d import Grid3DState, Grid3DInput, Grid3DOutput, Grid3DDiagnostics
-from .integrator_3d import semi_implicit_euler_3d
-from ...common.coupling import normalize_phase
 from ...common.energy import compute_diagnostics, calculate_energy
-from ...common.adapters.ring_3d_adapter import Ring3DAdapter
-from ...common.adapters.ring_adapter import RingAdapterConfig
+from ..dimnd.grid_nd_engine import GridNDEngine
 from .projector_3d import Coordinate3DProjector
 
 
@@ -116,49 +114,35 @@ class Grid3DEngine:
         self.config = config or Grid3DConfig()
         self.config.validate()
         
-        # Ring 3D Adapter 생성
-        ring_cfg_x = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_x
-        )
-        ring_cfg_y = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_y
-        )
-        ring_cfg_z = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_z
+        # Grid ND Engine 생성 (적분 → Ring 안정화 → 투영을 배열 연산으로 수행)
+        # 주의: Grid 3D Engine은 위상만 유지, 좌표는 projector가 계산
+        self.core = GridNDEngine(
+            config=self.config.to_nd_config(),
+            initial=(initial_x, initial_y, initial_z)
         )
-        self.ring_adapter = Ring3DAdapter(ring_cfg_x, ring_cfg_y, ring_cfg_z)
+        self.ring_adapter = self.core.ring_adapter
         
         # Coordinate 3D Projector 생성 (좌표 투영 담당)
         self.projector = Coordinate3DProjector(self.config)
         
-        # 초기 상태 설정 (3D)
-        # 주의: Grid 3D Engine은 위상만 유지, 좌표는 projector가 계산
-        phi_x, phi_y, phi_z = self.projector.coordinate_to_phase(initial_x, initial_y, initial_z)
-        phi_x = normalize_phase(phi_x, self.config.phase_wrap)
-        phi_y = normalize_phase(phi_y, self.config.phase_wrap)
-        phi_z = normalize_phase(phi_z, self.config.phase_wrap)
-        
-        self.state = Grid3DState(
-            phi_x=phi_x,
-            phi_y=phi_y,
-            phi_z=phi_z,
-            x=initial_x,  # 초기값 저장 (나중에는 projector로 계산)
-            y=initial_y,  # 초기값 저장 (나중에는 projector로 계산)
-            z=initial_z,  # 초기값 저장 (나중에는 projector로 계산) (Z 방향 추가)
-            v_x=0.0,
-            v_y=0.0,
-            v_z=0.0,  # Z 방향 추가
-            a_x=0.0,
-            a_y=0.0,
-            a_z=0.0,  # Z 방향 추가
-            t_ms=0.0
-        )
-        
+        # 상태 (core 상태 버퍼를 복사 없이 감싼 view, step마다 제자리 갱신)
+        self._state: Grid3DState = Grid3DState.from_buffer(self.core.buffer)
         self.state_prev: Optional[Grid3DState] = None
     
+    @property
+    def state(self) -> Grid3DState:
+        """
+        현재 상태 (Grid3DState, core 상태 버퍼의 view)
+        
+        같은 객체가 step()/reset()마다 제자리에서 갱신되며, 필드 수정 (engine.state.t_ms += dt)은 엔진에 반영됩니다.
+        ⚠️ 특정 시점의 상태를 보관하려면 engine.state.copy() 또는 get_state()를 사용합니다.
+        """
+        return self._state
+    
+    @state.setter
+    def state(self, state: Grid3DState):
+        self.core.load_flat(state.array)
+    
     def step(self, inp: Grid3DInput) -> Grid3DOutput:
         """
         Grid 3D Engine step 함수
@@ -202,153 +186,18 @@ class Grid3DEngine:
         Created: 2026-01-20
         Made in GNJz
         """
-        # ============================================================
-        # 0. 이전 상태 저장 (진단용)
-        # ============================================================
-        # 진단 모드가 활성화된 경우, 이전 상태를 저장하여
-        # 에너지 변화, 안정성 등을 계산할 수 있도록 합니다.
+        # 진단 모드: 이전 상태 저장 (state는 제자리 갱신되므로 버퍼 복사)
         if self.config.diagnostics_enabled:
-            self.state_prev = Grid3DState(
-                phi_x=self.state.phi_x,
-                phi_y=self.state.phi_y,
-                phi_z=self.state.phi_z,
-                x=self.state.x,
-                y=self.state.y,
-                z=self.state.z,
-                v_x=self.state.v_x,
-                v_y=self.state.v_y,
-                v_z=self.state.v_z,
-                a_x=self.state.a_x,
-                a_y=self.state.a_y,
-                a_z=self.state.a_z,
-                t_ms=self.state.t_ms
-            )
-        
-        # ============================================================
-        # 1. 수치 적분 (Semi-implicit Euler, 3D)
-        # ============================================================
-        # 경로 통합(Path Integration): 속도와 가속도로부터 위상 업데이트 (3D)
-        #
-        # 수식 (3D):
-        #   v(t+Δt) = v(t) + a·Δt          [속도 업데이트]
-        #   φ(t+Δt) = φ(t) + v·Δt + ½a·Δt²  [위상 업데이트]
-        #
-        # 3D 확장:
-        #   - 2D: (vx, vy), (ax, ay) → (φx, φy)
-        #   - 3D: (vx, vy, vz), (ax, ay, az) → (φx, φy, φz)
-        #
-        # 물리 단위:
-        #   - 입력: v [m/s], a [m/s²], dt_ms [ms]
-        #   - 변환: dt_s = dt_ms / 1000.0 [s]
-        #   - 수식: dφ = v [m/s] * dt_s [s] + ½a [m/s²] * (dt_s [s])²
-        #
-        # 참고: integrator_3d.py에서 물리 법칙 적용을 위해
-        #       ms를 s로 변환하여 단위 일관성을 확보합니다.
-        new_phi_x, new_phi_y, new_phi_z, new_v_x, new_v_y, new_v_z = \
-            semi_implicit_euler_3d(
-                self.state,
-                inp,
-                self.config.dt_ms,
-                self.config.tau_ms
-            )
-        
-        # ============================================================
-        # 2. Ring 안정화 (Attractor 동역학, 3D)
-        # ============================================================
-        # Ring Attractor가 위상을 안정적인 manifold로 끌어당깁니다 (3개 Ring).
-        #
-        # 동작 원리 (3D):
-        #   1. 위상을 Ring 인덱스로 변환 (3D)
-        #      idx_x = (φx / 2π) * ring_size
-        #      idx_y = (φy / 2π) * ring_size
-        #      idx_z = (φz / 2π) * ring_size  ← Z 방향 추가
-        #
-        #   2. Ring에 위상 주입 (3개 Ring)
-        #      ring_x.inject(direction_idx=idx_x, strength=0.8)
-        #      ring_y.inject(direction_idx=idx_y, strength=0.8)
-        #      ring_z.inject(direction_idx=idx_z, strength=0.8)  ← Z 방향 추가
-        #
-        #   3. Ring 동역학 실행 (안정화, 3개 Ring)
-        #      ring_x.run(duration_ms=dt_ms)
-        #      ring_y.run(duration_ms=dt_ms)
-        #      ring_z.run(duration_ms=dt_ms)  ← Z 방향 추가
-        #
-        #   4. 안정화된 위상 추출 (3D)
-        #      φ_stabilized = (ring.center / ring_size) * 2π
-        #
-        # 효과 (3D):
-        #   - 노이즈 억제: 위상이 Attractor에 붙잡혀 노이즈가 감쇠됩니다 (3개 방향)
-        #   - 외란 저항성: 외부 외란이 있어도 위상이 안정적으로 유지됩니다 (3개 방향)
-        #   - 가중 평균: 원래 위상 90% + Ring 조정 10% (각 방향별)
-        stabilized_phi_x, stabilized_phi_y, stabilized_phi_z, energy_x, energy_y, energy_z = \
-            self.ring_adapter.step(new_phi_x, new_phi_y, new_phi_z, self.config.dt_ms)
-        
-        # ============================================================
-        # 3. 상태 업데이트 (위상 정규화 및 3D 좌표 투영)
-        # ============================================================
-        # 위상 정규화: 주기적 경계 조건 적용 (3D)
-        #
-        # 수식: φ_norm = φ mod 2π ∈ [0, 2π)
-        #
-        # 의미: 위상이 주기적 경계 조건을 만족하도록 [0, 2π) 범위로 감쌉니다.
-        #       토러스(Torus) 공간의 특성상 위상은 주기적입니다.
-        #
-        # 3D 확장:
-        #   - 2D: (φx, φy) → (φx_norm, φy_norm)
-        #   - 3D: (φx, φy, φz) → (φx_norm, φy_norm, φz_norm)
-        #
-        # 주의: Grid 3D Engine은 내부 위상(φx, φy, φz)만 관리합니다.
-        #       좌표(x, y, z)는 projector(관측자)가 계산합니다.
-        phi_x_norm = normalize_phase(stabilized_phi_x, self.config.phase_wrap)
-        phi_y_norm = normalize_phase(stabilized_phi_y, self.config.phase_wrap)
-        phi_z_norm = normalize_phase(stabilized_phi_z, self.config.phase_wrap)  # Z 방향 추가
+            self.state_prev = self.state.copy()
         
-        # 좌표 투영: 위상 → 3D 좌표 변환 (관측자 책임)
-        #
-        # 수식 (3D):
-        #   x = φx · (Lx / 2π)
-        #   y = φy · (Ly / 2π)
-        #   z = φz · (Lz / 2π)  ← Z 방향 추가
-        #
-        # 의미: 내부 위상 φ ∈ [0, 2π)³를 외부 좌표 (x, y, z) ∈ [0, L)³로 변환합니다.
-        #       이는 관측자 패턴(Observer Pattern)을 따릅니다.
-        #
-        # 책임 분리:
-        #   - Grid 3D Engine: 위상 상태만 유지 (φx, φy, φz)
-        #   - Coordinate3DProjector: 좌표 계산 (관측자, x, y, z)
-        x, y, z = self.projector.phase_to_coordinate(phi_x_norm, phi_y_norm, phi_z_norm)
-        
-        # 상태 업데이트 (좌표는 projector가 계산한 값으로)
-        self.state = Grid3DState(
-            phi_x=phi_x_norm,
-            phi_y=phi_y_norm,
-            phi_z=phi_z_norm,
-            x=x,  # projector가 계산한 좌표
-            y=y,  # projector가 계산한 좌표
-            z=z,  # projector가 계산한 좌표 (Z 방향 추가)
-            v_x=new_v_x,
-            v_y=new_v_y,
-            v_z=new_v_z,  # Z 방향 추가
-            a_x=inp.a_x if inp.a_x is not None else self.state.a_x,
-            a_y=inp.a_y if inp.a_y is not None else self.state.a_y,
-            a_z=inp.a_z if inp.a_z is not None else self.state.a_z,  # Z 방향 추가
-            t_ms=self.state.t_ms + self.config.dt_ms
-        )
-        
-        # 4. 출력 생성 (3D)
-        # 출력도 projector를 통해 좌표 계산 (일관성 유지)
-        output_x, output_y, output_z = self.projector.phase_to_coordinate(
-            self.state.phi_x, self.state.phi_y, self.state.phi_z
+        # 1~3. 수치 적분 → Ring 안정화 (3개) → 위상 정규화 및 좌표 투영 (Grid ND Engine)
+        self.core.step(
+            (inp.v_x, inp.v_y, inp.v_z),
+            (inp.a_x, inp.a_y, inp.a_z)
         )
         
-        output = Grid3DOutput(
-            x=output_x,
-            y=output_y,
-            z=output_z,  # Z 좌표 추가
-            phi_x=self.state.phi_x,
-            phi_y=self.state.phi_y,
-            phi_z=self.state.phi_z  # Z 위상 추가
-        )
+        # 출력 생성 (3D)
+        output = Grid3DOutput(*self.core.output_tuple())
         
         # 진단 정보 추가 (선택적)
         # 주의: 현재 energy.py는 2D만 지원하므로 3D 진단은 별도 구현 필요
@@ -367,9 +216,30 @@ class Grid3DEngine:
         
         return output
     
+    def run(self, inputs: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        궤적 롤아웃 (3D, T 스텝 연속 실행)
+        
+        step()을 T번 호출한 것과 같은 결과를 출력 배열 한 개에 기록합니다.
+        스텝마다 Grid3DOutput / Grid3DState 객체를 만들지 않습니다.
+        (진단용 state_prev는 갱신하지 않음)
+        
+        Args:
+            inputs: 입력 블록, shape (T, 3) 또는 (T, 6)
+                - 속도 열 [m/s]: v_x, v_y, v_z
+                - 가속도 열 [m/s²] (선택적, NaN은 가속도 없음): a_x, a_y, a_z
+            out: 출력 배열, shape (T, 6) (None이면 새로 할당)
+        
+        Returns:
+            출력 배열, shape (T, 6) — Grid3DOutput 필드 순서
+                - 좌표 열 [m]: x, y, z
+                - 위상 열 [rad]: phi_x, phi_y, phi_z
+        """
+        return self.core.run(inputs, out)
+    
     def get_state(self) -> Grid3DState:
-        """현재 상태 반환 (3D)"""
-        return self.state
+        """현재 상태 반환 (3D) (스냅샷, 이후 step()에도 바뀌지 않음)"""
+        return self.state.copy()
     
     def reset(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
         """
@@ -380,27 +250,4 @@ class Grid3DEngine:
             y: 초기 Y 좌표 [m]
             z: 초기 Z 좌표 [m] (새로 추가)
         """
-        # 좌표 → 위상 변환 (projector 사용, 3D)
-        phi_x, phi_y, phi_z = self.projector.coordinate_to_phase(x, y, z)
-        phi_x = normalize_phase(phi_x, self.config.phase_wrap)
-        phi_y = normalize_phase(phi_y, self.config.phase_wrap)
-        phi_z = normalize_phase(phi_z, self.config.phase_wrap)
-        
-        self.state = Grid3DState(
-            phi_x=phi_x,
-            phi_y=phi_y,
-            phi_z=phi_z,
-            x=x,
-            y=y,
-            z=z,
-            v_x=0.0,
-            v_y=0.0,
-            v_z=0.0,  # Z 방향 추가
-            a_x=0.0,
-            a_y=0.0,
-            a_z=0.0,  # Z 방향 추가
-            t_ms=0.0
-        )
-        # TODO: ring_adapter.reset() 구현 (3D)
-        # self.ring_adapter.reset()
-
+        self.core.reset((x, y, z))
@@ -13,7 +13,9 @@ License: MIT License
 """
 
 from dataclasses import dataclass
+from typing import List
 from ..dim3d.config_3d import Grid3DConfig
+from ..dimnd.config_nd import AxisSpec
 
 
 @dataclass
@@ -74,4 +76,13 @@ class Grid4DConfig(Grid3DConfig):
         # Ring 설정 검증 (간단한 검증)
         assert isinstance(self.ring_cfg_w, str), "ring_cfg_w must be a string"
         assert len(self.ring_cfg_w) > 0, "ring_cfg_w must not be empty"
-
+    
+    def axis_specs(self) -> List[AxisSpec]:
+        """
+        축 명세 (Grid ND Engine용, 4D)
+        
+        3D 축 명세에 W 위치 축 추가
+        """
+        return super().axis_specs() + [
+            AxisSpec("w", scale=self.spatial_scale_w, ring_cfg=self.ring_cfg_w),
+        ]
@@ -36,8 +36,9 @@ License: MIT License
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import List, Optional
 import math
+from ..dimnd.config_nd import AxisSpec, GridNDConfig
 
 # Ring Attractor Engine 설정 타입 (외부 패키지)
 try:
@@ -111,6 +112,10 @@ class Grid5DConfig:
     
     # Ring 설정 (각 축마다 독립적)
     ring_size: int = 15  # Ring 크기 (공통)
+    ring_backend: str = "auto"  # "auto" | "external" (RingAttractorEngine) | "bank" (in-tree Ring Bank)
+    ring_lut: bool = False  # True: Ring 수렴 응답 LUT로 안정화 (Ring 시뮬레이션 대신 인덱싱)
+    ring_converge_tol: float = 0.0  # > 0: 인덱스가 그대로이고 수렴한 축은 Ring 실행 생략 [rad]
+    ring_update_interval: int = 1  # Ring 안정화 주기 [step] (k > 1: 적분은 매 step, Ring은 k step마다)
     ring_cfg_x: Optional[RingEngineConfig] = None  # X축 Ring 설정
     ring_cfg_y: Optional[RingEngineConfig] = None  # Y축 Ring 설정
     ring_cfg_z: Optional[RingEngineConfig] = None  # Z축 Ring 설정
@@ -163,4 +168,36 @@ class Grid5DConfig:
         __post_init__에서 자동으로 호출되지만, 명시적으로도 호출 가능합니다.
         """
         self.__post_init__()
-
+    
+    def axis_specs(self) -> List[AxisSpec]:
+        """
+        축 명세 (Grid ND Engine용, 5D)
+        
+        - 위치 축 (X, Y, Z): 속도는 가속도 적분으로만 변함 (velocity_input=False)
+        - 회전 축 (A, B): 입력 [deg/s] → 내부 [rad/s]
+        
+        Returns:
+            [X, Y, Z, A, B] 축 명세
+        """
+        return [
+            AxisSpec("x", scale=self.spatial_scale_x, velocity_input=False, ring_cfg=self.ring_cfg_x),
+            AxisSpec("y", scale=self.spatial_scale_y, velocity_input=False, ring_cfg=self.ring_cfg_y),
+            AxisSpec("z", scale=self.spatial_scale_z, velocity_input=False, ring_cfg=self.ring_cfg_z),
+            AxisSpec("a", kind="rotary", scale=self.angular_scale_a, ring_cfg=self.ring_cfg_a),
+            AxisSpec("b", kind="rotary", scale=self.angular_scale_b, ring_cfg=self.ring_cfg_b),
+        ]
+    
+    def to_nd_config(self) -> GridNDConfig:
+        """Grid ND Engine 설정으로 변환 (5D)"""
+        return GridNDConfig(
+            axes=self.axis_specs(),
+            phase_wrap=self.phase_wrap,
+            dt_ms=self.dt_ms,
+            tau_ms=self.tau_ms,
+            max_dt_ratio=self.max_dt_ratio,
+            ring_size=self.ring_size,
+            ring_backend=self.ring_backend,
+            ring_lut=self.ring_lut,
+            ring_converge_tol=self.ring_converge_tol,
+            ring_update_interval=self.ring_update_interval
+        )
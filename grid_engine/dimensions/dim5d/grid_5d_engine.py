@@ -96,23 +96,26 @@ Version: v0.4.0-alpha (5D extension)
 License: MIT License
 """
 
-from typing import Optional, Dict, Any
-import math
+from typing import Optional, Dict, Any, Deque, Mapping
+from types import MappingProxyType
+from collections import deque
+import logging
+import time
 import numpy as np
 from .config_5d import Grid5DConfig
 from .types_5d import Grid5DState, Grid5DInput, Grid5DOutput, Grid5DDiagnostics
-from .integrator_5d import semi_implicit_euler_5d
-from ...common.coupling import normalize_phase
 from ...common.energy import compute_diagnostics, calculate_energy  # TODO: 5D 에너지 계산으로 확장
-from ...common.adapters.ring_5d_adapter import Ring5DAdapter
-from ...common.adapters.ring_adapter import RingAdapterConfig
+from ..dimnd.grid_nd_engine import GridNDEngine
 from ...hippocampus.place_cells import PlaceCellManager  # Place Cells ✨ NEW
 from ...hippocampus.context_binder import ContextBinder  # Context Binder ✨ NEW
 from ...hippocampus.replay_consolidation import ReplayConsolidation  # Replay/Consolidation ✨ NEW
 from ...hippocampus.learning_gate import LearningGate, LearningGateConfig  # Learning Gate ✨ NEW
-from ...hippocampus.replay_buffer import ReplayBuffer, TrajectoryPoint  # Replay Buffer ✨ NEW
+from ...hippocampus.replay_buffer import ReplayBuffer  # Replay Buffer ✨ NEW
+from ...hippocampus.consolidation_worker import ConsolidationJob, ConsolidationWorker, MemorySnapshot  # Background Consolidation ✨ NEW
+from ...hippocampus.consolidation_budget import BudgetMeter, ConsolidationBudget  # Consolidation 상한 ✨ NEW
 from ...hippocampus.universal_memory import UniversalMemory  # Universal Memory ✨ NEW
 from ...cerebellum.cerebellum_engine import CerebellumEngine, CerebellumConfig  # Cerebellum ✨ NEW
+from ...common.event_log import EventLog  # 구조화 이벤트 로그 ✨ NEW
 from .projector_5d import Coordinate5DProjector
 
 
@@ -156,54 +159,19 @@ class Grid5DEngine:
         self.config = config or Grid5DConfig()
         self.config.validate()
         
-        # Ring 5D Adapter 생성
-        ring_cfg_x = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_x
-        )
-        ring_cfg_y = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_y
-        )
-        ring_cfg_z = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_z
+        # Grid ND Engine 생성 (적분 → Ring 안정화 → 투영을 배열 연산으로 수행)
+        # 주의: Grid 5D Engine은 위상만 유지, 좌표/각도는 projector가 계산
+        self.core = GridNDEngine(
+            config=self.config.to_nd_config(),
+            initial=(initial_x, initial_y, initial_z, initial_theta_a, initial_theta_b)
         )
-        ring_cfg_a = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_a
-        )  # 회전 축 ✨ NEW
-        ring_cfg_b = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_b
-        )  # 회전 축 ✨ NEW
-        self.ring_adapter = Ring5DAdapter(ring_cfg_x, ring_cfg_y, ring_cfg_z, ring_cfg_a, ring_cfg_b)
+        self.ring_adapter = self.core.ring_adapter
         
         # Coordinate 5D Projector 생성 (좌표/각도 투영 담당)
         self.projector = Coordinate5DProjector(self.config)
         
-        # 초기 상태 설정 (5D)
-        # 주의: Grid 5D Engine은 위상만 유지, 좌표/각도는 projector가 계산
-        phi_x, phi_y, phi_z, phi_a, phi_b = self.projector.coordinate_to_phase(
-            initial_x, initial_y, initial_z, initial_theta_a, initial_theta_b
-        )
-        phi_x = normalize_phase(phi_x, self.config.phase_wrap)
-        phi_y = normalize_phase(phi_y, self.config.phase_wrap)
-        phi_z = normalize_phase(phi_z, self.config.phase_wrap)
-        phi_a = normalize_phase(phi_a, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        phi_b = normalize_phase(phi_b, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        
-        self.state = Grid5DState(
-            phi_x=phi_x, phi_y=phi_y, phi_z=phi_z, phi_a=phi_a, phi_b=phi_b,
-            x=initial_x, y=initial_y, z=initial_z,
-            theta_a=initial_theta_a, theta_b=initial_theta_b,  # 회전 각도 ✨ NEW
-            v_x=0.0, v_y=0.0, v_z=0.0,
-            v_a=0.0, v_b=0.0,  # 회전 각속도 ✨ NEW
-            a_x=0.0, a_y=0.0, a_z=0.0,
-            alpha_a=0.0, alpha_b=0.0,  # 회전 각가속도 ✨ NEW
-            t_ms=0.0
-        )
-        
+        # 상태 (core 상태 버퍼를 복사 없이 감싼 view, step마다 제자리 갱신)
+        self._state: Grid5DState = Grid5DState.from_buffer(self.core.buffer)
         self.state_prev: Optional[Grid5DState] = None
         
         # Persistent Bias Estimator를 위한 상태
@@ -232,12 +200,16 @@ class Grid5DEngine:
         # Context Binder (Place + Context 조합으로 기억 분리) ✨ NEW
         self.context_binder = ContextBinder(num_contexts=10000)
         self.use_context_binder: bool = True  # Context Binder 사용 여부 (기본값: True)
-        self.external_state: Dict[str, Any] = {}  # 외부 상태 (온도, 공구, 작업 단계 등)
+        self.external_state: Dict[str, Any] = {}  # 외부 상태 (온도, 공구, 작업 단계 등, 설정 시 Context ID 캐시)
         
         # Replay Buffer (Online phase에서 기록만) ✨ NEW
         self.replay_buffer = ReplayBuffer(
             max_size=10000,  # 최대 버퍼 크기
-            stable_window=10  # 안정성 판단 윈도우
+            stable_window=10,  # 안정성 판단 윈도우
+            dim=5,  # 열 차원 (5축)
+            velocity_threshold=0.01,  # 안정 구간: 속도 임계값 (기록 시 증분 추적)
+            acceleration_threshold=0.001,  # 안정 구간: 가속도 임계값
+            min_segment_length=5  # 안정 구간: 최소 길이
         )
         
         # Replay/Consolidation (휴지기에 기억 재검토 및 강화) ✨ NEW
@@ -247,8 +219,26 @@ class Grid5DEngine:
             significance_threshold=0.1  # 통계적 유의성 임계값 (더 관대하게 조정) ✨ FIXED
         )
         self.use_replay_consolidation: bool = True  # Replay/Consolidation 사용 여부 (기본값: True)
+        # Place별 bias 이동 평균/분산 창 = Consolidation 창 (유의성 검정이 미리 계산한 값을 읽음) ✨ NEW
+        self.place_manager.stats_window = self.replay_consolidation.consolidation_window
         self.last_update_time_for_replay: float = 0.0  # Replay용 마지막 업데이트 시간
         self.replay_enabled: bool = True  # Replay 활성화 여부 (기본값: True) ✨ NEW
+        self.consolidation_worker: Optional[ConsolidationWorker] = None  # 백그라운드 Consolidation (None이면 동기) ✨ NEW
+        # 동기 Replay 1회 상한 (기본값: 제한 없음), 남은 그룹은 replay_backlog에서 다음 휴지기에 이어서 처리 ✨ NEW
+        self.replay_budget: ConsolidationBudget = ConsolidationBudget()
+        self.replay_backlog: Deque[ConsolidationJob] = deque()
+        # backlog 상한 (그룹 수, None이면 제한 없음): 넘으면 오래된 그룹부터 버리고 수를 셈 ✨ NEW
+        self.max_backlog_places: Optional[int] = 10000
+        self.backlog_dropped_places: int = 0
+        
+        # 이벤트 로그 (logging: replay.start/end = INFO, replay.place/reference.place = DEBUG) ✨ NEW
+        # 이벤트별 빈도 제한 (최대 횟수, 시간 창 [s]), 레벨이 꺼져 있으면 필드 계산/포맷팅 없음
+        self.event_log = EventLog(__name__, rate_limits={
+            'replay.start': (10, 1.0),
+            'replay.end': (10, 1.0),
+            'replay.place': (25, 1.0),
+            'reference.place': (3, 1.0),
+        })
         
         # Universal Memory (범용 기억 인터페이스) ✨ NEW
         self.universal_memory = UniversalMemory(
@@ -273,6 +263,46 @@ class Grid5DEngine:
         )
         self.use_cerebellum: bool = True  # Cerebellum 사용 여부 (기본값: True) ✨ NEW
     
+    @property
+    def state(self) -> Grid5DState:
+        """
+        현재 상태 (Grid5DState, core 상태 버퍼의 view)
+        
+        같은 객체가 step()/reset()마다 제자리에서 갱신됩니다.
+        ⚠️ 특정 시점의 상태를 보관하려면 engine.state.copy() 또는 get_state()를 사용합니다.
+        """
+        return self._state
+    
+    @state.setter
+    def state(self, state: Grid5DState):
+        self.core.load_flat(state.array)
+    
+    @property
+    def external_state(self) -> Mapping[str, Any]:
+        """
+        외부 상태 (Context Binder용, 읽기 전용)
+        
+        ⚠️ Context ID를 설정 시 캐시하므로 제자리 수정은 막혀 있습니다 (TypeError).
+        외부 상태를 바꾸려면 set_external_state()를 사용합니다.
+        """
+        return MappingProxyType(self._external_state)
+    
+    @external_state.setter
+    def external_state(self, external_state: Mapping[str, Any]):
+        # Context ID는 외부 상태가 바뀔 때만 계산 (update()/provide_reference()는 캐시 사용) ✨ NEW
+        # 복사본 보관: 호출한 쪽의 딕셔너리를 나중에 고쳐도 캐시와 어긋나지 않음
+        self._external_state = dict(external_state)
+        self._context_id = self.context_binder.get_context_id(self._external_state)
+    
+    @property
+    def context_id(self) -> int:
+        """
+        현재 외부 상태의 Context ID (external_state 설정 시 계산한 값)
+        
+        external_state는 읽기 전용이므로 캐시는 항상 현재 외부 상태와 같습니다.
+        """
+        return self._context_id
+    
     def step(self, inp: Grid5DInput) -> Grid5DOutput:
         """
         Grid 5D Engine step 함수
@@ -305,77 +335,18 @@ class Grid5DEngine:
         Created: 2026-01-20
         Made in GNJz
         """
-        # 진단 모드: 이전 상태 저장
+        # 진단 모드: 이전 상태 저장 (state는 제자리 갱신되므로 버퍼 복사)
         if self.config.diagnostics_enabled:
-            self.state_prev = Grid5DState(
-                phi_x=self.state.phi_x, phi_y=self.state.phi_y, phi_z=self.state.phi_z,
-                phi_a=self.state.phi_a, phi_b=self.state.phi_b,  # 회전 위상 ✨ NEW
-                x=self.state.x, y=self.state.y, z=self.state.z,
-                theta_a=self.state.theta_a, theta_b=self.state.theta_b,  # 회전 각도 ✨ NEW
-                v_x=self.state.v_x, v_y=self.state.v_y, v_z=self.state.v_z,
-                v_a=self.state.v_a, v_b=self.state.v_b,  # 회전 각속도 ✨ NEW
-                a_x=self.state.a_x, a_y=self.state.a_y, a_z=self.state.a_z,
-                alpha_a=self.state.alpha_a, alpha_b=self.state.alpha_b,  # 회전 각가속도 ✨ NEW
-                t_ms=self.state.t_ms
-            )
+            self.state_prev = self.state.copy()
         
-        # 1. 수치 적분 (5D): 속도/가속도 → 위상 업데이트
-        # 뉴턴 2법칙 적용: 위치 축 (F = ma), 회전 축 (τ = Iα)
-        new_phi_x, new_phi_y, new_phi_z, new_phi_a, new_phi_b, \
-        new_v_x, new_v_y, new_v_z, new_v_a, new_v_b = semi_implicit_euler_5d(
-            self.state, inp, self.config.dt_ms, self.config.tau_ms
-        )
-        
-        # 2. Ring 안정화 (5개): 위상을 Attractor에 붙잡기
-        # 위치 Ring (X, Y, Z) + 회전 Ring (A, B)
-        stabilized_phi_x, stabilized_phi_y, stabilized_phi_z, stabilized_phi_a, stabilized_phi_b, \
-        energy_x, energy_y, energy_z, energy_a, energy_b = \
-            self.ring_adapter.step(
-                new_phi_x, new_phi_y, new_phi_z, new_phi_a, new_phi_b,
-                self.config.dt_ms
-            )
-        
-        # 위상 정규화 (5D)
-        phi_x_norm = normalize_phase(stabilized_phi_x, self.config.phase_wrap)
-        phi_y_norm = normalize_phase(stabilized_phi_y, self.config.phase_wrap)
-        phi_z_norm = normalize_phase(stabilized_phi_z, self.config.phase_wrap)
-        phi_a_norm = normalize_phase(stabilized_phi_a, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        phi_b_norm = normalize_phase(stabilized_phi_b, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        
-        # 3. 좌표/각도 투영: 위상 → 좌표/각도 변환
-        x, y, z, theta_a, theta_b = self.projector.phase_to_coordinate(
-            phi_x_norm, phi_y_norm, phi_z_norm, phi_a_norm, phi_b_norm
-        )
-        
-        # 상태 업데이트 (5D)
-        self.state = Grid5DState(
-            phi_x=phi_x_norm, phi_y=phi_y_norm, phi_z=phi_z_norm,
-            phi_a=phi_a_norm, phi_b=phi_b_norm,  # 회전 위상 ✨ NEW
-            x=x, y=y, z=z,
-            theta_a=theta_a, theta_b=theta_b,  # 회전 각도 ✨ NEW
-            v_x=new_v_x, v_y=new_v_y, v_z=new_v_z,
-            v_a=new_v_a, v_b=new_v_b,  # 회전 각속도 [rad/s] (내부 단위) ✨ NEW
-            a_x=inp.a_x if inp.a_x is not None else self.state.a_x,
-            a_y=inp.a_y if inp.a_y is not None else self.state.a_y,
-            a_z=inp.a_z if inp.a_z is not None else self.state.a_z,
-            # ⚠️ 단위: 입력 [deg/s²] → 내부 [rad/s²] 변환
-            #          state에는 rad/s² 저장 (내부 단위)
-            alpha_a=math.radians(inp.alpha_a) if inp.alpha_a is not None else self.state.alpha_a,  # 회전 각가속도 [rad/s²] ✨ NEW
-            alpha_b=math.radians(inp.alpha_b) if inp.alpha_b is not None else self.state.alpha_b,  # 회전 각가속도 [rad/s²] ✨ NEW
-            t_ms=self.state.t_ms + self.config.dt_ms
+        # 1~3. 수치 적분 → Ring 안정화 (5개) → 위상 정규화 및 좌표/각도 투영 (Grid ND Engine)
+        self.core.step(
+            (inp.v_x, inp.v_y, inp.v_z, inp.v_a, inp.v_b),
+            (inp.a_x, inp.a_y, inp.a_z, inp.alpha_a, inp.alpha_b)
         )
         
         # 출력 생성 (5D)
-        output_x, output_y, output_z, output_theta_a, output_theta_b = self.projector.phase_to_coordinate(
-            self.state.phi_x, self.state.phi_y, self.state.phi_z, self.state.phi_a, self.state.phi_b
-        )
-        
-        output = Grid5DOutput(
-            x=output_x, y=output_y, z=output_z,
-            theta_a=output_theta_a, theta_b=output_theta_b,  # 회전 각도 ✨ NEW
-            phi_x=self.state.phi_x, phi_y=self.state.phi_y, phi_z=self.state.phi_z,
-            phi_a=self.state.phi_a, phi_b=self.state.phi_b  # 회전 위상 ✨ NEW
-        )
+        output = Grid5DOutput(*self.core.output_tuple())
         
         # 진단 모드: 에너지 검증 (TODO: 5D 에너지 계산으로 확장)
         if self.config.diagnostics_enabled and self.state_prev is not None:
@@ -385,9 +356,30 @@ class Grid5DEngine:
         
         return output
     
+    def run(self, inputs: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        궤적 롤아웃 (5D, T 스텝 연속 실행)
+        
+        step()을 T번 호출한 것과 같은 결과를 출력 배열 한 개에 기록합니다.
+        스텝마다 Grid5DOutput / Grid5DState 객체를 만들지 않습니다.
+        (진단용 state_prev는 갱신하지 않음)
+        
+        Args:
+            inputs: 입력 블록, shape (T, 5) 또는 (T, 10)
+                - 속도 열 [m/s] 또는 [deg/s]: v_x, v_y, v_z, v_a, v_b
+                - 가속도 열 [m/s²] 또는 [deg/s²] (선택적, NaN은 가속도 없음): a_x, a_y, a_z, alpha_a, alpha_b
+            out: 출력 배열, shape (T, 10) (None이면 새로 할당)
+        
+        Returns:
+            출력 배열, shape (T, 10) — Grid5DOutput 필드 순서
+                - 좌표 열 [m] 또는 [deg]: x, y, z, theta_a, theta_b
+                - 위상 열 [rad]: phi_x, phi_y, phi_z, phi_a, phi_b
+        """
+        return self.core.run(inputs, out)
+    
     def get_state(self) -> Grid5DState:
-        """현재 상태 반환 (5D)"""
-        return self.state
+        """현재 상태 반환 (5D, 스냅샷, 이후 step()에도 바뀌지 않음)"""
+        return self.state.copy()
     
     def reset(
         self,
@@ -407,25 +399,7 @@ class Grid5DEngine:
             theta_a: 초기 A축 각도 [deg] (회전) ✨ NEW
             theta_b: 초기 B축 각도 [deg] (회전) ✨ NEW
         """
-        phi_x, phi_y, phi_z, phi_a, phi_b = self.projector.coordinate_to_phase(x, y, z, theta_a, theta_b)
-        phi_x = normalize_phase(phi_x, self.config.phase_wrap)
-        phi_y = normalize_phase(phi_y, self.config.phase_wrap)
-        phi_z = normalize_phase(phi_z, self.config.phase_wrap)
-        phi_a = normalize_phase(phi_a, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        phi_b = normalize_phase(phi_b, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        
-        self.state = Grid5DState(
-            phi_x=phi_x, phi_y=phi_y, phi_z=phi_z, phi_a=phi_a, phi_b=phi_b,
-            x=x, y=y, z=z,
-            theta_a=theta_a, theta_b=theta_b,  # 회전 각도 ✨ NEW
-            v_x=0.0, v_y=0.0, v_z=0.0,
-            v_a=0.0, v_b=0.0,  # 회전 각속도 ✨ NEW
-            a_x=0.0, a_y=0.0, a_z=0.0,
-            alpha_a=0.0, alpha_b=0.0,  # 회전 각가속도 ✨ NEW
-            t_ms=0.0
-        )
-        # TODO: ring_adapter.reset() 구현 (5D)
-        # self.ring_adapter.reset()
+        self.core.reset((x, y, z, theta_a, theta_b))
     
     def get_phase_vector(self) -> np.ndarray:
         """
@@ -434,13 +408,7 @@ class Grid5DEngine:
         Returns:
             위상 벡터 [phi_x, phi_y, phi_z, phi_a, phi_b] (rad)
         """
-        return np.array([
-            self.state.phi_x,
-            self.state.phi_y,
-            self.state.phi_z,
-            self.state.phi_a,
-            self.state.phi_b
-        ])
+        return self.core.get_phase_vector()
     
     def update(self, current_state: np.ndarray) -> None:
         """
@@ -486,17 +454,8 @@ class Grid5DEngine:
         phi_a = normalize_phase(phi_a, self.config.phase_wrap)
         phi_b = normalize_phase(phi_b, self.config.phase_wrap)
         
-        # 상태 업데이트 (속도/가속도는 0으로 유지, 위치/각도는 원래 입력값 직접 저장)
-        self.state = Grid5DState(
-            phi_x=phi_x, phi_y=phi_y, phi_z=phi_z, phi_a=phi_a, phi_b=phi_b,
-            x=x, y=y, z=z,  # 원래 좌표 직접 저장
-            theta_a=theta_a, theta_b=theta_b,  # 원래 각도 직접 저장
-            v_x=self.state.v_x, v_y=self.state.v_y, v_z=self.state.v_z,
-            v_a=self.state.v_a, v_b=self.state.v_b,
-            a_x=self.state.a_x, a_y=self.state.a_y, a_z=self.state.a_z,
-            alpha_a=self.state.alpha_a, alpha_b=self.state.alpha_b,
-            t_ms=self.state.t_ms
-        )
+        # 상태 업데이트 (속도/가속도는 유지, 위치/각도는 원래 입력값 직접 저장)
+        self.core.set_coordinates((x, y, z, theta_a, theta_b))
         
         # ✅ 핵심: 누적 편향 학습 (Persistent Bias Estimation)
         if self.stable_state is not None:
@@ -527,17 +486,11 @@ class Grid5DEngine:
                 # Context ID 할당 (Context Binder 사용 시)
                 context_id = None
                 if self.use_context_binder:
-                    context_id = self.context_binder.get_context_id(self.external_state)
+                    context_id = self._context_id
                 
                 # 현재 속도 및 가속도 계산
-                current_velocity = np.array([
-                    self.state.v_x, self.state.v_y, self.state.v_z,
-                    self.state.v_a, self.state.v_b
-                ])
-                current_acceleration = np.array([
-                    self.state.a_x, self.state.a_y, self.state.a_z,
-                    self.state.alpha_a, self.state.alpha_b
-                ])
+                current_velocity = self.core.v.copy()
+                current_acceleration = self.core.a.copy()
                 
                 # 오차 계산
                 error = drift
@@ -580,93 +533,36 @@ class Grid5DEngine:
                     self.last_update_time_for_replay / 1000.0,
                     current_time_s
                 ):
-                    # ✅ Replay Buffer에서 안정적인 구간만 추출 ✨ NEW
-                    stable_segments = self.replay_buffer.get_stable_segments(
-                        velocity_threshold=0.01,
-                        acceleration_threshold=0.001,
-                        min_segment_length=5
-                    )
+                    # ✅ 지난 Replay 이후 안정 구간 요약 (기록 시 증분 추적) ✨ NEW
+                    # 버퍼를 다시 훑지 않음, 휴지기를 넘어 이어지는 열린 구간은 지금까지 부분을 꺼내고
+                    # 나머지는 이어서 추적 (정지 상태에서도 학습)
+                    stable_segments = self.replay_buffer.pop_finished_segments(include_open=True)
                     
-                    # ✅ DEBUG: Replay 시작 로그 ✨ NEW
-                    print(f"[REPLAY] 시작 | segments={len(stable_segments)}, buffer_size={len(self.replay_buffer.buffer)}")
+                    # ✅ Replay 시작 이벤트 ✨ NEW
+                    self.event_log.event(
+                        logging.INFO, 'replay.start',
+                        segments=len(stable_segments), buffer_size=len(self.replay_buffer),
+                        backlog_places=sum(job.remaining for job in self.replay_backlog),
+                        backlog_dropped_places=self.backlog_dropped_places
+                    )
                     
-                    # ✅ 안정적인 구간만 재생하여 Place/Context bias 업데이트 ✨ NEW
-                    consolidated_count = 0
-                    total_places_updated = 0
-                    total_bias_norm = 0.0
+                    # ✅ 모든 구간의 (place, context) 그룹 합 (기록 시 계산, 최소 3개 포인트) ✨ NEW
+                    groups = self.replay_buffer.summary_groups(stable_segments, min_group_size=3)
                     
-                    for segment in stable_segments:
-                        # 각 구간의 Place별로 그룹화
-                        place_groups: Dict[Any, List[TrajectoryPoint]] = {}
-                        for point in segment:
-                            key = point.place_id if point.context_id is None else (point.place_id, point.context_id)
-                            if key not in place_groups:
-                                place_groups[key] = []
-                            place_groups[key].append(point)
-                        
-                        # 각 Place (및 Context)별로 bias 계산 및 업데이트
-                        for key, points in place_groups.items():
-                            if len(points) < 3:  # 최소 3개 포인트 필요
-                                continue
-                            
-                            # 구간의 평균 오차 계산 (안정적인 구간의 진짜 편향)
-                            errors = np.array([p.error for p in points])
-                            mean_error = np.mean(errors, axis=0)
-                            mean_error_norm = np.linalg.norm(mean_error)
-                            
-                            # Place ID 및 Context ID 추출
-                            if isinstance(key, tuple):
-                                place_id, context_id = key
-                            else:
-                                place_id = key
-                                context_id = None
-                            
-                            # ✅ Replay phase에서만 Place/Context bias 업데이트 ✨ NEW
-                            if self.use_context_binder and context_id is not None:
-                                # Place + Context 조합으로 bias 업데이트
-                                self.context_binder.update_context_memory(
-                                    place_id=place_id,
-                                    context_id=context_id,
-                                    bias=mean_error,
-                                    current_time=current_time_s * 1000.0,  # ms로 변환
-                                    learning_rate=self.bias_learning_rate
-                                )
-                            
-                            # Place Memory 업데이트
-                            phase_vector = points[0].phase_vector  # 첫 포인트의 위상 사용
-                            place_memory = self.place_manager.get_place_memory(place_id)
-                            
-                            # ✅ 중요: place_center 설정 (블렌딩을 위해 필수) ✨ FIXED
-                            if place_memory.place_center is None:
-                                place_memory.place_center = phase_vector.copy()
-                            else:
-                                # Place Field 중심 업데이트 (EMA)
-                                place_memory.update_place_center(phase_vector, learning_rate=0.05)
-                            
-                            # Bias 업데이트
-                            bias_before = place_memory.bias_estimate.copy()
-                            place_memory.update_bias(
-                                new_bias=mean_error,
-                                learning_rate=self.bias_learning_rate
-                            )
-                            bias_after = place_memory.bias_estimate.copy()
-                            place_memory.add_bias_to_history(mean_error)
-                            place_memory.last_update_time = current_time_s
-                            
-                            total_places_updated += 1
-                            total_bias_norm += np.linalg.norm(bias_after)
-                            
-                            # ✅ DEBUG: Place 업데이트 로그 ✨ NEW
-                            if total_places_updated <= 5:  # 처음 5개만 상세 로그
-                                bias_history_len = len(place_memory.bias_history)
-                                print(f"[REPLAY] Place {place_id} | bias_norm: {np.linalg.norm(bias_before):.6f} -> {np.linalg.norm(bias_after):.6f} | mean_error_norm: {mean_error_norm:.6f} | visit_count: {place_memory.visit_count} | bias_history_len: {bias_history_len}")
-                            
-                            # Consolidation 수행
-                            if self.replay_consolidation.consolidate_place_memory(place_memory, current_time_s):
-                                consolidated_count += 1
+                    # 빈 그룹은 작업을 만들지 않음 (snapshot 재생성 없음)
+                    if len(groups['place_ids']) > 0:
+                        self.replay_backlog.append(ConsolidationJob(groups, current_time_s))
+                        self._trim_replay_backlog()
                     
-                    # ✅ DEBUG: Replay 종료 로그 ✨ NEW
-                    print(f"[REPLAY] 종료 | places_updated={total_places_updated}, consolidated={consolidated_count}, avg_bias_norm={total_bias_norm/max(1, total_places_updated):.6f}")
+                    worker = self.consolidation_worker
+                    if worker is not None:
+                        # ✅ 백그라운드 Consolidation: 그룹 결과만 넘기고 대기하지 않음 ✨ NEW
+                        # 큐가 가득 차면 replay_backlog에 남겨 다음 휴지기에 순서대로 다시 제출
+                        self._submit_replay_backlog(worker)
+                    else:
+                        # ✅ 안정적인 구간만 재생하여 Place/Context bias 업데이트 ✨ NEW
+                        # replay_budget 상한까지만 (지난 휴지기에 남은 그룹부터), 나머지는 다음 휴지기로
+                        self.drain_replay_backlog()
                 
                 # 마지막 업데이트 시간 기록
                 self.last_update_time_for_replay = current_time_ms
@@ -685,6 +581,282 @@ class Grid5DEngine:
             # 편향 추정 초기화
             self.bias_estimate = np.zeros(5)
     
+    def drain_replay_backlog(self, budget: Optional[ConsolidationBudget] = None) -> Dict[str, Any]:
+        """
+        동기 Replay backlog 처리 (상한까지, 남은 그룹은 커서와 함께 다음 호출로) ✨ NEW
+        
+        update()가 휴지기마다 호출합니다. 상한에 닿아도 호출마다 최소 1개 그룹은 처리합니다.
+        
+        Args:
+            budget: 이번 호출 상한 (None이면 self.replay_budget)
+        
+        Returns:
+            통계 (places_updated, consolidated, backlog_places, backlog_dropped_places, budget_exhausted)
+        """
+        started_at = time.perf_counter()
+        budget = self.replay_budget if budget is None else budget
+        meter = None if budget.unlimited else budget.meter()
+        totals = {'places_updated': 0, 'consolidated': 0, 'bias_norm': 0.0}
+        
+        backlog = self.replay_backlog
+        while backlog:
+            job = backlog[0]
+            job.cursor = self._apply_replay_groups(
+                job.groups, job.current_time, start=job.cursor, meter=meter, totals=totals
+            )
+            if job.remaining == 0:
+                backlog.popleft()
+            if meter is not None and meter.exhausted:
+                break
+        
+        backlog_places = sum(job.remaining for job in backlog)
+        self._emit_replay_end(
+            totals, started_at,
+            backlog_places=backlog_places, backlog_dropped_places=self.backlog_dropped_places
+        )
+        return {
+            'places_updated': totals['places_updated'],
+            'consolidated': totals['consolidated'],
+            'backlog_places': backlog_places,
+            'backlog_dropped_places': self.backlog_dropped_places,
+            'budget_exhausted': backlog_places > 0
+        }
+    
+    def _submit_replay_backlog(self, worker: ConsolidationWorker) -> int:
+        """
+        replay_backlog을 오래된 것부터 작업 스레드에 제출 (큐가 가득 차면 남은 작업은 보관) ✨ NEW
+        
+        Returns:
+            제출한 작업 수
+        """
+        backlog = self.replay_backlog
+        submitted = 0
+        while backlog and worker.submit(backlog[0]):
+            backlog.popleft()
+            submitted += 1
+        return submitted
+    
+    def _trim_replay_backlog(self) -> int:
+        """
+        replay_backlog을 max_backlog_places 이하로 (오래된 그룹부터 버림) ✨ NEW
+        
+        Returns:
+            이번에 버린 그룹 수 (누적: backlog_dropped_places)
+        """
+        if self.max_backlog_places is None:
+            return 0
+        backlog = self.replay_backlog
+        excess = sum(job.remaining for job in backlog) - self.max_backlog_places
+        dropped = 0
+        while excess > 0:
+            job = backlog[0]
+            skip = min(excess, job.remaining)
+            job.cursor += skip
+            if job.remaining == 0:
+                backlog.popleft()
+            excess -= skip
+            dropped += skip
+        self.backlog_dropped_places += dropped
+        return dropped
+    
+    def get_replay_backlog(self) -> Dict[str, int]:
+        """Replay backlog 크기 (다음 휴지기로 넘어간 Replay 수 / 그룹 수 / 상한으로 버린 그룹 수) ✨ NEW"""
+        return {
+            'jobs': len(self.replay_backlog),
+            'places': sum(job.remaining for job in self.replay_backlog),
+            'dropped_places': self.backlog_dropped_places
+        }
+    
+    def _apply_replay_groups(
+        self,
+        groups: Dict[str, np.ndarray],
+        current_time_s: float,
+        start: int = 0,
+        meter: Optional[BudgetMeter] = None,
+        totals: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Replay 그룹 결과로 Place/Context bias 업데이트 + Consolidation
+        
+        동기 Replay에서는 drain_replay_backlog()가, 백그라운드 Consolidation에서는 작업 스레드가 호출합니다.
+        
+        Args:
+            groups: ReplayBuffer.summary_groups() (또는 group_segments()) 결과
+            current_time_s: Replay 시각 [s]
+            start: 처리를 시작할 그룹 위치 (재개 커서)
+            meter: 상한 (None이면 끝까지), 그룹을 하나 처리할 때마다 확인
+            totals: 누적 통계 (None이면 이번 호출만 집계해 replay.end 이벤트 기록)
+        
+        Returns:
+            처리를 멈춘 그룹 위치 (다음 재개 커서)
+        """
+        emit_summary = totals is None
+        if emit_summary:
+            started_at = time.perf_counter()
+            totals = {'places_updated': 0, 'consolidated': 0, 'bias_norm': 0.0}
+        consolidated_count = 0
+        total_places_updated = 0
+        total_bias_norm = 0.0
+        logged_places = totals['places_updated']
+        
+        # 로그 레벨이 꺼져 있으면 로그용 값 (norm, 복사)을 계산하지 않음
+        log_summary = self.event_log.logger.isEnabledFor(logging.INFO)
+        log_places = self.event_log.logger.isEnabledFor(logging.DEBUG)
+        
+        place_ids = groups['place_ids']
+        mean_errors = groups['mean_errors']
+        mean_error_norms = np.linalg.norm(mean_errors[start:], axis=1)
+        
+        # 각 Place 그룹별 Place Memory 업데이트 (구간 순서 → 구간 안 첫 등장 순서)
+        stop = start
+        for place_id, phase_vector, mean_error, mean_error_norm in zip(
+            place_ids[start:].tolist(), groups['first_phases'][start:],
+            mean_errors[start:], mean_error_norms.tolist()
+        ):
+            # Place Memory 업데이트 (그룹 첫 포인트의 위상 사용)
+            place_memory = self.place_manager.get_place_memory(place_id)
+            
+            # ✅ 중요: place_center 설정 (블렌딩을 위해 필수) ✨ FIXED
+            if place_memory.place_center is None:
+                place_memory.place_center = phase_vector.copy()
+            else:
+                # Place Field 중심 업데이트 (EMA)
+                place_memory.update_place_center(phase_vector, learning_rate=0.05)
+            
+            # ✅ Place 업데이트 이벤트 (Replay마다 처음 5개만) ✨ NEW
+            log_place = (
+                log_places and logged_places + total_places_updated < 5
+                and self.event_log.enabled(logging.DEBUG, 'replay.place')
+            )
+            if log_place:
+                bias_norm_before = float(np.linalg.norm(place_memory.bias_estimate))
+            
+            # Bias 업데이트
+            place_memory.update_bias(
+                new_bias=mean_error,
+                learning_rate=self.bias_learning_rate
+            )
+            place_memory.add_bias_to_history(mean_error)
+            place_memory.last_update_time = current_time_s
+            
+            total_places_updated += 1
+            if log_summary:
+                total_bias_norm += np.linalg.norm(place_memory.bias_estimate)
+            
+            if log_place:
+                self.event_log.emit(
+                    logging.DEBUG, 'replay.place',
+                    place_id=place_id,
+                    bias_norm_before=bias_norm_before,
+                    bias_norm=float(np.linalg.norm(place_memory.bias_estimate)),
+                    mean_error_norm=mean_error_norm,
+                    visit_count=place_memory.visit_count,
+                    bias_history_len=len(place_memory.bias_history)
+                )
+            
+            # Consolidation 수행
+            if self.replay_consolidation.consolidate_place_memory(place_memory, current_time_s):
+                consolidated_count += 1
+            
+            stop += 1
+            if meter is not None:
+                meter.spend()
+                if meter.exhausted:
+                    break
+        
+        # ✅ Replay phase에서만 Context bias 업데이트 (Place + Context 조합, 처리한 그룹만 일괄) ✨ NEW
+        context_ids = groups['context_ids'][start:stop]
+        has_context = context_ids != ReplayBuffer.NO_CONTEXT
+        if self.use_context_binder and np.any(has_context):
+            self.context_binder.update_context_memories(
+                place_ids=place_ids[start:stop][has_context],
+                context_ids=context_ids[has_context],
+                biases=mean_errors[start:stop][has_context],
+                current_time=current_time_s * 1000.0,  # ms로 변환
+                learning_rate=self.bias_learning_rate
+            )
+        
+        totals['places_updated'] += total_places_updated
+        totals['consolidated'] += consolidated_count
+        totals['bias_norm'] += total_bias_norm
+        if emit_summary:
+            self._emit_replay_end(totals, started_at)
+        return stop
+    
+    def _emit_replay_end(self, totals: Dict[str, Any], started_at: float, **fields: Any) -> None:
+        """✅ Replay 종료 이벤트 ✨ NEW"""
+        if self.event_log.enabled(logging.INFO, 'replay.end'):
+            self.event_log.emit(
+                logging.INFO, 'replay.end',
+                places_updated=totals['places_updated'],
+                consolidated=totals['consolidated'],
+                avg_bias_norm=float(totals['bias_norm'] / max(1, totals['places_updated'])),
+                duration_ms=(time.perf_counter() - started_at) * 1000.0,
+                **fields
+            )
+    
+    def enable_background_consolidation(self, max_queue_size: int = 4) -> ConsolidationWorker:
+        """
+        백그라운드 Consolidation 시작 (Replay 쓰기 작업을 작업 스레드로) ✨ NEW
+        
+        update()는 Replay 그룹 결과를 상한 있는 큐에 넣기만 하고
+        (대기 없음, 가득 차면 replay_backlog에 남겨 다음 휴지기에 다시 제출),
+        provide_reference()는 작업 스레드가 공개한 읽기 전용 MemorySnapshot만 읽습니다.
+        ⚠️ 동작하는 동안 place_manager / context_binder는 작업 스레드가 소유합니다
+        (직접 읽으려면 consolidation_worker.flush() 후 사용).
+        
+        Args:
+            max_queue_size: 대기 중인 Replay 작업 상한
+        
+        Returns:
+            ConsolidationWorker (큐 깊이/지연 시간 통계: get_statistics())
+        """
+        if self.consolidation_worker is None:
+            # 작업은 자기 worker를 지역 참조로 받음 (작업 중 disable되어 속성이 None이 되어도 안전)
+            worker = ConsolidationWorker(
+                consolidate=lambda job: self._consolidate_job(job, worker),
+                max_queue_size=max_queue_size,
+                initial_snapshot=self._capture_memory_snapshot(version=0),
+                name="grid5d-consolidation"
+            )
+            self.consolidation_worker = worker
+        return self.consolidation_worker
+    
+    def disable_background_consolidation(self, timeout: Optional[float] = None) -> None:
+        """남은 Replay 작업을 처리하고 작업 스레드 종료 (이후 동기 Replay)"""
+        if self.consolidation_worker is not None:
+            self.consolidation_worker.close(timeout)
+            self.consolidation_worker = None
+    
+    def _capture_memory_snapshot(self, version: int) -> MemorySnapshot:
+        """현재 Place/Context 기억의 읽기 전용 snapshot"""
+        return MemorySnapshot.capture(
+            self.place_manager,
+            self.context_binder if self.use_context_binder else None,
+            version=version
+        )
+    
+    def _consolidate_job(self, job: ConsolidationJob, worker: ConsolidationWorker) -> MemorySnapshot:
+        """작업 스레드: Replay 그룹 적용 후 새 snapshot 생성 (이전 snapshot + 작업이 건드린 행만)"""
+        previous = worker.snapshot
+        # 동기 Replay가 일부 처리한 backlog 작업이면 cursor부터
+        self._apply_replay_groups(job.groups, job.current_time, start=job.cursor)
+        place_ids = job.groups['place_ids'][job.cursor:]
+        context_ids = job.groups['context_ids'][job.cursor:]
+        context_keys = None
+        if self.use_context_binder:
+            has_context = context_ids != ReplayBuffer.NO_CONTEXT
+            context_keys = list(zip(
+                place_ids[has_context].tolist(),
+                context_ids[has_context].tolist()
+            ))
+        return previous.updated(
+            self.place_manager,
+            self.context_binder if self.use_context_binder else None,
+            place_ids=place_ids,
+            context_keys=context_keys
+        )
+    
     def set_target(self, target_state: np.ndarray) -> None:
         """
         목표 상태 설정 (Persistent Bias Estimator용)
@@ -791,32 +963,50 @@ class Grid5DEngine:
             # Place ID 할당
             place_id = self.place_manager.get_place_id(phase_vector)
             
+            # 백그라운드 Consolidation 사용 시: 최신 읽기 전용 snapshot (대기 없음) ✨ NEW
+            worker = self.consolidation_worker
+            snapshot = worker.snapshot if worker is not None else None
+            
             # ✅ Context Binder 사용 시: Place + Context 조합으로 bias 반환 ✨ NEW
             if self.use_context_binder:
-                # Context ID 할당
-                context_id = self.context_binder.get_context_id(self.external_state)
+                # Context ID (set_external_state 시 계산한 캐시)
+                context_id = self._context_id
                 
                 # Place + Context 조합의 bias 추정값 반환
-                context_bias = self.context_binder.get_bias_estimate(place_id, context_id)
+                if snapshot is not None:
+                    context_bias = snapshot.get_context_bias(place_id, context_id)
+                else:
+                    context_bias = self.context_binder.get_bias_estimate(place_id, context_id)
                 reference_correction = -context_bias
             else:
                 # Place만 사용 (Context 없음)
                 # ✅ Place Blending 사용 (Soft-Switching) ✨ NEW
-                place_bias = self.place_manager.get_bias_estimate(
-                    phase_vector,
-                    use_blending=True,  # Soft-Switching 활성화
-                    top_k=5,  # 상위 5개 Place Cell 사용
-                    sigma=0.5  # 가우시안 표준 편차
-                )
+                if snapshot is not None:
+                    place_bias = snapshot.get_place_bias(phase_vector, place_id, use_blending=True, top_k=5, sigma=0.5)
+                else:
+                    place_bias = self.place_manager.get_bias_estimate(
+                        phase_vector,
+                        use_blending=True,  # Soft-Switching 활성화
+                        top_k=5,  # 상위 5개 Place Cell 사용
+                        sigma=0.5  # 가우시안 표준 편차
+                    )
                 reference_correction = -place_bias
                 
-                # ✅ DEBUG: provide_reference 로그 (처음 몇 번만) ✨ NEW
-                if not hasattr(self, '_debug_ref_count'):
-                    self._debug_ref_count = 0
-                self._debug_ref_count += 1
-                if self._debug_ref_count <= 3:
-                    place_memory = self.place_manager.get_place_memory(place_id)
-                    print(f"[REF] place_id={place_id}, bias_norm={np.linalg.norm(place_bias):.6f}, corr_norm={np.linalg.norm(reference_correction):.6f}, visit_count={place_memory.visit_count}, place_center={place_memory.place_center is not None}")
+                # ✅ provide_reference 이벤트 (빈도 제한) ✨ NEW
+                if self.event_log.enabled(logging.DEBUG, 'reference.place'):
+                    fields = {
+                        'place_id': place_id,
+                        'bias_norm': float(np.linalg.norm(place_bias)),
+                        'corr_norm': float(np.linalg.norm(reference_correction)),
+                    }
+                    if snapshot is None:
+                        # 백그라운드 Consolidation 중에는 실제 기억이 작업 스레드 소유이므로 생략
+                        place_memory = self.place_manager.place_memory.get(place_id)
+                        fields['visit_count'] = place_memory.visit_count if place_memory is not None else 0
+                        fields['place_center'] = place_memory is not None and place_memory.place_center is not None
+                    else:
+                        fields['snapshot_version'] = snapshot.version
+                    self.event_log.emit(logging.DEBUG, 'reference.place', **fields)
         else:
             # 기존 방식: 전역 bias 반환
             hippocampus_correction = -self.bias_estimate
@@ -879,8 +1069,10 @@ class Grid5DEngine:
         - step_number: 작업 단계 (예: 0, 1, 2)
         - material: 재료 타입 (예: "aluminum", "steel")
         
+        Context ID는 여기서 한 번 계산해 캐시합니다 (ContextBinder의 intern 캐시 사용).
+        
         Args:
             external_state: 외부 상태 딕셔너리
         """
-        self.external_state = external_state.copy()
+        self.external_state = external_state
 
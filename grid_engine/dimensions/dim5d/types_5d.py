@@ -37,10 +37,10 @@ License: MIT License
 from dataclasses import dataclass
 from typing import Optional
 from .config_5d import Grid5DConfig
+from ..dimnd.state_nd import GridNDState
 
 
-@dataclass
-class Grid5DState:
+class Grid5DState(GridNDState):
     """
     Grid 5D 상태
     
@@ -64,10 +64,17 @@ class Grid5DState:
         - X, Y, Z: 위치 축 (선형 이동) [m]
         - A, B: 회전 축 (각도 회전) [deg]
     
+    저장 방식 (GridNDState):
+        - 모든 필드는 float64 버퍼 하나에 있고, 필드 이름은 property입니다
+        - 생성 시 위상을 [0, 2π)로 정규화합니다
+        - 엔진의 state는 엔진 버퍼를 감싼 view로 step마다 제자리 갱신됩니다 (보관하려면 copy())
+    
     Author: GNJz
     Created: 2026-01-20
     Made in GNJz
     """
+    __slots__ = ()
+    
     # 위상 (내부 상태) [rad]
     phi_x: float  # X 방향 위상 [0, 2π) [rad] (위치)
     phi_y: float  # Y 방향 위상 [0, 2π) [rad] (위치)
@@ -101,25 +108,6 @@ class Grid5DState:
     
     # 시간 [ms]
     t_ms: float  # 경과 시간 [ms]
-    
-    def __post_init__(self):
-        """
-        상태 초기화 후 검증
-        
-        위상이 [0, 2π) 범위에 있는지 확인합니다.
-        """
-        from ...common.coupling import normalize_phase
-        from .config_5d import Grid5DConfig
-        
-        config = Grid5DConfig()
-        phase_wrap = config.phase_wrap
-        
-        # 위상 정규화 (5D)
-        self.phi_x = normalize_phase(self.phi_x, phase_wrap)
-        self.phi_y = normalize_phase(self.phi_y, phase_wrap)
-        self.phi_z = normalize_phase(self.phi_z, phase_wrap)
-        self.phi_a = normalize_phase(self.phi_a, phase_wrap)  # A 방향 추가
-        self.phi_b = normalize_phase(self.phi_b, phase_wrap)  # B 방향 추가
 
 
 @dataclass
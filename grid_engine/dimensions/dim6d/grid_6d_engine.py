@@ -97,15 +97,11 @@ License: MIT License
 """
 
 from typing import Optional
-import math
 import numpy as np
 from .config_6d import Grid6DConfig
 from .types_6d import Grid6DState, Grid6DInput, Grid6DOutput, Grid6DDiagnostics
-from .integrator_6d import semi_implicit_euler_6d
-from ...common.coupling import normalize_phase
 from ...common.energy import compute_diagnostics, calculate_energy  # TODO: 6D 에너지 계산으로 확장
-from ...common.adapters.ring_6d_adapter import Ring6DAdapter
-from ...common.adapters.ring_adapter import RingAdapterConfig
+from ..dimnd.grid_nd_engine import GridNDEngine
 from .projector_6d import Coordinate6DProjector
 
 
@@ -150,59 +146,19 @@ class Grid6DEngine:
         self.config = config or Grid6DConfig()
         self.config.validate()
         
-        # Ring 6D Adapter 생성
-        ring_cfg_x = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_x
-        )
-        ring_cfg_y = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_y
-        )
-        ring_cfg_z = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_z
+        # Grid ND Engine 생성 (적분 → Ring 안정화 → 투영을 배열 연산으로 수행)
+        # 주의: Grid 6D Engine은 위상만 유지, 좌표/각도는 projector가 계산
+        self.core = GridNDEngine(
+            config=self.config.to_nd_config(),
+            initial=(initial_x, initial_y, initial_z, initial_theta_a, initial_theta_b, initial_theta_c)
         )
-        ring_cfg_a = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_a
-        )  # 회전 축 ✨ NEW
-        ring_cfg_b = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_b
-        )  # 회전 축 ✨ NEW
-        ring_cfg_c = RingAdapterConfig(
-            size=self.config.ring_size,
-            config=self.config.ring_cfg_c
-        )  # 회전 축
-        self.ring_adapter = Ring6DAdapter(ring_cfg_x, ring_cfg_y, ring_cfg_z, ring_cfg_a, ring_cfg_b, ring_cfg_c)
+        self.ring_adapter = self.core.ring_adapter
         
         # Coordinate 6D Projector 생성 (좌표/각도 투영 담당)
         self.projector = Coordinate6DProjector(self.config)
         
-        # 초기 상태 설정 (6D)
-        # 주의: Grid 6D Engine은 위상만 유지, 좌표/각도는 projector가 계산
-        phi_x, phi_y, phi_z, phi_a, phi_b, phi_c = self.projector.coordinate_to_phase(
-            initial_x, initial_y, initial_z, initial_theta_a, initial_theta_b, initial_theta_c
-        )
-        phi_x = normalize_phase(phi_x, self.config.phase_wrap)
-        phi_y = normalize_phase(phi_y, self.config.phase_wrap)
-        phi_z = normalize_phase(phi_z, self.config.phase_wrap)
-        phi_a = normalize_phase(phi_a, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        phi_b = normalize_phase(phi_b, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        phi_c = normalize_phase(phi_c, self.config.phase_wrap)  # 회전 위상
-        
-        self.state = Grid6DState(
-            phi_x=phi_x, phi_y=phi_y, phi_z=phi_z, phi_a=phi_a, phi_b=phi_b, phi_c=phi_c,
-            x=initial_x, y=initial_y, z=initial_z,
-            theta_a=initial_theta_a, theta_b=initial_theta_b, theta_c=initial_theta_c,  # 회전 각도
-            v_x=0.0, v_y=0.0, v_z=0.0,
-            v_a=0.0, v_b=0.0, v_c=0.0,  # 회전 각속도
-            a_x=0.0, a_y=0.0, a_z=0.0,
-            alpha_a=0.0, alpha_b=0.0, alpha_c=0.0,  # 회전 각가속도
-            t_ms=0.0
-        )
-        
+        # 상태 (core 상태 버퍼를 복사 없이 감싼 view, step마다 제자리 갱신)
+        self._state: Grid6DState = Grid6DState.from_buffer(self.core.buffer)
         self.state_prev: Optional[Grid6DState] = None
         
         # Persistent Bias Estimator를 위한 상태
@@ -212,6 +168,20 @@ class Grid6DEngine:
         self.update_counter: int = 0  # 업데이트 카운터 (저주파 제어용)
         self.slow_update_threshold: int = 50  # 느린 업데이트 임계값 (50~100 step, 더 빠른 학습)
     
+    @property
+    def state(self) -> Grid6DState:
+        """
+        현재 상태 (Grid6DState, core 상태 버퍼의 view)
+        
+        같은 객체가 step()/reset()마다 제자리에서 갱신됩니다.
+        ⚠️ 특정 시점의 상태를 보관하려면 engine.state.copy() 또는 get_state()를 사용합니다.
+        """
+        return self._state
+    
+    @state.setter
+    def state(self, state: Grid6DState):
+        self.core.load_flat(state.array)
+    
     def step(self, inp: Grid6DInput) -> Grid6DOutput:
         """
         Grid 6D Engine step 함수
@@ -244,79 +214,18 @@ class Grid6DEngine:
         Created: 2026-01-20
         Made in GNJz
         """
-        # 진단 모드: 이전 상태 저장
+        # 진단 모드: 이전 상태 저장 (state는 제자리 갱신되므로 버퍼 복사)
         if self.config.diagnostics_enabled:
-            self.state_prev = Grid6DState(
-                phi_x=self.state.phi_x, phi_y=self.state.phi_y, phi_z=self.state.phi_z,
-                phi_a=self.state.phi_a, phi_b=self.state.phi_b,  # 회전 위상 ✨ NEW
-                x=self.state.x, y=self.state.y, z=self.state.z,
-                theta_a=self.state.theta_a, theta_b=self.state.theta_b,  # 회전 각도 ✨ NEW
-                v_x=self.state.v_x, v_y=self.state.v_y, v_z=self.state.v_z,
-                v_a=self.state.v_a, v_b=self.state.v_b,  # 회전 각속도 ✨ NEW
-                a_x=self.state.a_x, a_y=self.state.a_y, a_z=self.state.a_z,
-                alpha_a=self.state.alpha_a, alpha_b=self.state.alpha_b,  # 회전 각가속도 ✨ NEW
-                t_ms=self.state.t_ms
-            )
-        
-        # 1. 수치 적분 (6D): 속도/가속도 → 위상 업데이트
-        # 뉴턴 2법칙 적용: 위치 축 (F = ma), 회전 축 (τ = Iα)
-        new_phi_x, new_phi_y, new_phi_z, new_phi_a, new_phi_b, new_phi_c, \
-        new_v_x, new_v_y, new_v_z, new_v_a, new_v_b, new_v_c = semi_implicit_euler_6d(
-            self.state, inp, self.config.dt_ms, self.config.tau_ms
-        )
-        
-        # 2. Ring 안정화 (6개): 위상을 Attractor에 붙잡기
-        # 위치 Ring (X, Y, Z) + 회전 Ring (A, B, C)
-        stabilized_phi_x, stabilized_phi_y, stabilized_phi_z, stabilized_phi_a, stabilized_phi_b, stabilized_phi_c, \
-        energy_x, energy_y, energy_z, energy_a, energy_b, energy_c = \
-            self.ring_adapter.step(
-                new_phi_x, new_phi_y, new_phi_z, new_phi_a, new_phi_b, new_phi_c,
-                self.config.dt_ms
-            )
+            self.state_prev = self.state.copy()
         
-        # 위상 정규화 (6D)
-        phi_x_norm = normalize_phase(stabilized_phi_x, self.config.phase_wrap)
-        phi_y_norm = normalize_phase(stabilized_phi_y, self.config.phase_wrap)
-        phi_z_norm = normalize_phase(stabilized_phi_z, self.config.phase_wrap)
-        phi_a_norm = normalize_phase(stabilized_phi_a, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        phi_b_norm = normalize_phase(stabilized_phi_b, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        phi_c_norm = normalize_phase(stabilized_phi_c, self.config.phase_wrap)  # 회전 위상
-        
-        # 3. 좌표/각도 투영: 위상 → 좌표/각도 변환
-        x, y, z, theta_a, theta_b, theta_c = self.projector.phase_to_coordinate(
-            phi_x_norm, phi_y_norm, phi_z_norm, phi_a_norm, phi_b_norm, phi_c_norm
-        )
-        
-        # 상태 업데이트 (6D)
-        self.state = Grid6DState(
-            phi_x=phi_x_norm, phi_y=phi_y_norm, phi_z=phi_z_norm,
-            phi_a=phi_a_norm, phi_b=phi_b_norm, phi_c=phi_c_norm,  # 회전 위상
-            x=x, y=y, z=z,
-            theta_a=theta_a, theta_b=theta_b, theta_c=theta_c,  # 회전 각도
-            v_x=new_v_x, v_y=new_v_y, v_z=new_v_z,
-            v_a=new_v_a, v_b=new_v_b, v_c=new_v_c,  # 회전 각속도 [rad/s] (내부 단위)
-            a_x=inp.a_x if inp.a_x is not None else self.state.a_x,
-            a_y=inp.a_y if inp.a_y is not None else self.state.a_y,
-            a_z=inp.a_z if inp.a_z is not None else self.state.a_z,
-            # ⚠️ 단위: 입력 [deg/s²] → 내부 [rad/s²] 변환
-            #          state에는 rad/s² 저장 (내부 단위)
-            alpha_a=math.radians(inp.alpha_a) if inp.alpha_a is not None else self.state.alpha_a,  # 회전 각가속도 [rad/s²]
-            alpha_b=math.radians(inp.alpha_b) if inp.alpha_b is not None else self.state.alpha_b,  # 회전 각가속도 [rad/s²]
-            alpha_c=math.radians(inp.alpha_c) if inp.alpha_c is not None else self.state.alpha_c,  # 회전 각가속도 [rad/s²]
-            t_ms=self.state.t_ms + self.config.dt_ms
+        # 1~3. 수치 적분 → Ring 안정화 (6개) → 위상 정규화 및 좌표/각도 투영 (Grid ND Engine)
+        self.core.step(
+            (inp.v_x, inp.v_y, inp.v_z, inp.v_a, inp.v_b, inp.v_c),
+            (inp.a_x, inp.a_y, inp.a_z, inp.alpha_a, inp.alpha_b, inp.alpha_c)
         )
         
         # 출력 생성 (6D)
-        output_x, output_y, output_z, output_theta_a, output_theta_b, output_theta_c = self.projector.phase_to_coordinate(
-            self.state.phi_x, self.state.phi_y, self.state.phi_z, self.state.phi_a, self.state.phi_b, self.state.phi_c
-        )
-        
-        output = Grid6DOutput(
-            x=output_x, y=output_y, z=output_z,
-            theta_a=output_theta_a, theta_b=output_theta_b, theta_c=output_theta_c,  # 회전 각도
-            phi_x=self.state.phi_x, phi_y=self.state.phi_y, phi_z=self.state.phi_z,
-            phi_a=self.state.phi_a, phi_b=self.state.phi_b, phi_c=self.state.phi_c  # 회전 위상
-        )
+        output = Grid6DOutput(*self.core.output_tuple())
         
         # 진단 모드: 에너지 검증 (TODO: 6D 에너지 계산으로 확장)
         if self.config.diagnostics_enabled and self.state_prev is not None:
@@ -326,9 +235,30 @@ class Grid6DEngine:
         
         return output
     
+    def run(self, inputs: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        궤적 롤아웃 (6D, T 스텝 연속 실행)
+        
+        step()을 T번 호출한 것과 같은 결과를 출력 배열 한 개에 기록합니다.
+        스텝마다 Grid6DOutput / Grid6DState 객체를 만들지 않습니다.
+        (진단용 state_prev는 갱신하지 않음)
+        
+        Args:
+            inputs: 입력 블록, shape (T, 6) 또는 (T, 12)
+                - 속도 열 [m/s] 또는 [deg/s]: v_x, v_y, v_z, v_a, v_b, v_c
+                - 가속도 열 [m/s²] 또는 [deg/s²] (선택적, NaN은 가속도 없음): a_x, a_y, a_z, alpha_a, alpha_b, alpha_c
+            out: 출력 배열, shape (T, 12) (None이면 새로 할당)
+        
+        Returns:
+            출력 배열, shape (T, 12) — Grid6DOutput 필드 순서
+                - 좌표 열 [m] 또는 [deg]: x, y, z, theta_a, theta_b, theta_c
+                - 위상 열 [rad]: phi_x, phi_y, phi_z, phi_a, phi_b, phi_c
+        """
+        return self.core.run(inputs, out)
+    
     def get_state(self) -> Grid6DState:
-        """현재 상태 반환 (6D)"""
-        return self.state
+        """현재 상태 반환 (6D, 스냅샷, 이후 step()에도 바뀌지 않음)"""
+        return self.state.copy()
     
     def reset(
         self,
@@ -336,7 +266,8 @@ class Grid6DEngine:
         y: float = 0.0,
         z: float = 0.0,
         theta_a: float = 0.0,  # 회전 각도 ✨ NEW
-        theta_b: float = 0.0   # 회전 각도 ✨ NEW
+        theta_b: float = 0.0,  # 회전 각도 ✨ NEW
+        theta_c: float = 0.0   # 회전 각도
     ):
         """
         상태 리셋 (6D)
@@ -347,26 +278,9 @@ class Grid6DEngine:
             z: 초기 Z 좌표 [m] (위치)
             theta_a: 초기 A축 각도 [deg] (회전) ✨ NEW
             theta_b: 초기 B축 각도 [deg] (회전) ✨ NEW
+            theta_c: 초기 C축 각도 [deg] (회전)
         """
-        phi_x, phi_y, phi_z, phi_a, phi_b = self.projector.coordinate_to_phase(x, y, z, theta_a, theta_b)
-        phi_x = normalize_phase(phi_x, self.config.phase_wrap)
-        phi_y = normalize_phase(phi_y, self.config.phase_wrap)
-        phi_z = normalize_phase(phi_z, self.config.phase_wrap)
-        phi_a = normalize_phase(phi_a, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        phi_b = normalize_phase(phi_b, self.config.phase_wrap)  # 회전 위상 ✨ NEW
-        
-        self.state = Grid6DState(
-            phi_x=phi_x, phi_y=phi_y, phi_z=phi_z, phi_a=phi_a, phi_b=phi_b,
-            x=x, y=y, z=z,
-            theta_a=theta_a, theta_b=theta_b,  # 회전 각도 ✨ NEW
-            v_x=0.0, v_y=0.0, v_z=0.0,
-            v_a=0.0, v_b=0.0,  # 회전 각속도 ✨ NEW
-            a_x=0.0, a_y=0.0, a_z=0.0,
-            alpha_a=0.0, alpha_b=0.0,  # 회전 각가속도 ✨ NEW
-            t_ms=0.0
-        )
-        # TODO: ring_adapter.reset() 구현 (6D)
-        # self.ring_adapter.reset()
+        self.core.reset((x, y, z, theta_a, theta_b, theta_c))
     
     def update(self, current_state: np.ndarray) -> None:
         """
@@ -414,17 +328,8 @@ class Grid6DEngine:
         phi_b = normalize_phase(phi_b, self.config.phase_wrap)
         phi_c = normalize_phase(phi_c, self.config.phase_wrap)
         
-        # 상태 업데이트 (속도/가속도는 0으로 유지, 위치/각도는 원래 입력값 직접 저장)
-        self.state = Grid6DState(
-            phi_x=phi_x, phi_y=phi_y, phi_z=phi_z, phi_a=phi_a, phi_b=phi_b, phi_c=phi_c,
-            x=x, y=y, z=z,  # 원래 좌표 직접 저장
-            theta_a=theta_a, theta_b=theta_b, theta_c=theta_c,  # 원래 각도 직접 저장
-            v_x=self.state.v_x, v_y=self.state.v_y, v_z=self.state.v_z,
-            v_a=self.state.v_a, v_b=self.state.v_b, v_c=self.state.v_c,
-            a_x=self.state.a_x, a_y=self.state.a_y, a_z=self.state.a_z,
-            alpha_a=self.state.alpha_a, alpha_b=self.state.alpha_b, alpha_c=self.state.alpha_c,
-            t_ms=self.state.t_ms
-        )
+        # 상태 업데이트 (속도/가속도는 유지, 위치/각도는 원래 입력값 직접 저장)
+        self.core.set_coordinates((x, y, z, theta_a, theta_b, theta_c))
         
         # ✅ 핵심: 누적 편향 학습 (Persistent Bias Estimation)
         if self.stable_state is not None:
@@ -0,0 +1,41 @@
+"""
+Grid Engine ND Module
+차원 일반화 Grid Engine 모듈 (벡터화)
+
+차원 일반화:
+    - 2D~7D: 축마다 스칼라 코드 (GridEngine ... Grid7DEngine)
+    - ND: 축 명세 리스트 + NumPy 상태 배열 (GridNDEngine) ✨ NEW
+    - Batch: N개 인스턴스 × D축 상태 행렬 (GridBatchEngine) ✨ NEW
+    - State: float64 버퍼 하나 + 필드 property (GridNDState, Grid 5D~7D State의 기반) ✨ NEW
+
+핵심 구조:
+    Grid ND = Ring 1 ⊗ Ring 2 ⊗ ... ⊗ Ring N
+    위상 공간: Tᴺ = S¹ × ... × S¹
+
+    Grid 2D~7D Engine은 GridNDEngine 위의 facade입니다.
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+from .grid_nd_engine import GridNDEngine
+from .grid_batch_engine import GridBatchEngine
+from .state_nd import GridNDState
+from .config_nd import AxisSpec, GridNDConfig
+from .integrator_nd import semi_implicit_euler_nd
+from .projector_nd import CoordinateNDProjector
+
+__all__ = [
+    'GridNDEngine',
+    'GridBatchEngine',
+    'GridNDState',
+    'GridNDConfig',
+    'AxisSpec',
+    'semi_implicit_euler_nd',
+    'CoordinateNDProjector',
+]
+
+__version__ = "0.5.0-alpha"
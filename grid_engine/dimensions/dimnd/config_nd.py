@@ -0,0 +1,115 @@
+"""
+Grid Engine ND Config
+N차원 설정 (독립 모듈)
+
+이 모듈은 차원 일반화(dimension-generic) Grid ND Engine의 설정을 정의합니다.
+2D~7D 엔진이 축마다 하드코딩하던 설정(spatial_scale_x, ring_cfg_x, ...)을
+축 명세(AxisSpec) 리스트 하나로 표현합니다.
+
+축 종류:
+    - linear: 위치 축 [m]
+        x = φ · (L / 2π), 입력 [m/s], [m/s²]
+    - rotary: 회전 축 [deg]
+        θ = φ · (180° / π), 입력 [deg/s], [deg/s²] → 내부 [rad/s], [rad/s²]
+
+속도 입력 규칙 (velocity_input):
+    - True: 가속도가 없으면 입력 속도를 직접 사용 (2D~4D 전 축, 5D~7D 회전 축)
+    - False: 속도는 가속도 적분으로만 변함 (5D~7D 위치 축)
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+import math
+
+
+@dataclass
+class AxisSpec:
+    """
+    Grid ND 축 명세
+
+    한 축(Ring 하나)의 종류, 스케일, Ring 설정을 나타냅니다.
+    """
+    name: str  # 축 이름 (예: "x", "a")
+    kind: str = "linear"  # "linear" (위치 [m]) 또는 "rotary" (회전 [deg])
+    scale: float = 1.0  # linear: 도메인 길이 L [m] (2π rad에 대응), rotary: 미사용
+    velocity_input: bool = True  # 가속도가 없을 때 입력 속도를 직접 사용할지 여부
+    ring_cfg: Optional[Any] = "case2"  # 이 축의 Ring 설정
+
+    def __post_init__(self):
+        """축 명세 검증"""
+        assert self.kind in ("linear", "rotary"), \
+            f"kind ({self.kind}) must be 'linear' or 'rotary'"
+        assert self.scale > 0, f"scale ({self.scale}) must be > 0"
+
+
+@dataclass
+class GridNDConfig:
+    """
+    Grid ND Engine 설정
+
+    설정 항목:
+        - axes: 축 명세 리스트 (축 수 = 차원 수)
+        - 시간 설정: dt_ms, tau_ms, max_dt_ratio
+        - Ring 설정: ring_size, ring_backend, ring_lut, ring_converge_tol, ring_update_interval (공통),
+          축별 ring_cfg는 AxisSpec에 포함
+    """
+    axes: List[AxisSpec] = field(default_factory=lambda: [AxisSpec("x"), AxisSpec("y")])
+
+    # 위상 래핑 (공통)
+    phase_wrap: float = 2.0 * math.pi  # 위상 래핑 값 [rad] (2π)
+
+    # 시간 설정
+    dt_ms: float = 0.1  # 시간 간격 [ms]
+    tau_ms: float = 10.0  # 시간 상수 [ms]
+    max_dt_ratio: float = 0.1  # 최대 dt 비율 (dt_ms < tau_ms * max_dt_ratio)
+
+    # Ring 설정
+    ring_size: int = 15  # Ring 크기 (공통)
+    ring_backend: str = "auto"  # "auto" | "external" (RingAttractorEngine) | "bank" (in-tree Ring Bank)
+    ring_lut: bool = False  # True: Ring 수렴 응답 LUT로 안정화 (Ring 시뮬레이션 대신 인덱싱)
+    ring_converge_tol: float = 0.0  # > 0: 인덱스가 그대로이고 수렴한 축은 Ring 실행 생략 [rad]
+    ring_update_interval: int = 1  # Ring 안정화 주기 [step] (k > 1: 적분은 매 step, Ring은 k step마다)
+
+    def __post_init__(self):
+        """
+        설정 검증
+
+        모든 설정 값이 유효한 범위에 있는지 확인합니다.
+        """
+        assert len(self.axes) > 0, "axes must not be empty"
+        names = [axis.name for axis in self.axes]
+        assert len(set(names)) == len(names), f"axis names ({names}) must be unique"
+
+        assert self.phase_wrap > 0, f"phase_wrap ({self.phase_wrap}) must be > 0"
+
+        assert self.dt_ms > 0, f"dt_ms ({self.dt_ms}) must be > 0"
+        assert self.tau_ms > 0, f"tau_ms ({self.tau_ms}) must be > 0"
+        assert self.max_dt_ratio > 0, f"max_dt_ratio ({self.max_dt_ratio}) must be > 0"
+        assert self.dt_ms < self.tau_ms * self.max_dt_ratio, \
+            f"dt_ms ({self.dt_ms}) must be < tau_ms * max_dt_ratio ({self.tau_ms * self.max_dt_ratio})"
+
+        assert self.ring_size > 0, f"ring_size ({self.ring_size}) must be > 0"
+        assert isinstance(self.ring_update_interval, int) and self.ring_update_interval >= 1, \
+            f"ring_update_interval ({self.ring_update_interval}) must be an int >= 1"
+        assert self.ring_converge_tol >= 0, f"ring_converge_tol ({self.ring_converge_tol}) must be >= 0"
+        assert self.ring_backend in ("auto", "external", "bank"), \
+            f"ring_backend ({self.ring_backend}) must be 'auto', 'external' or 'bank'"
+
+    @property
+    def num_axes(self) -> int:
+        """축 수 (차원)"""
+        return len(self.axes)
+
+    def validate(self):
+        """
+        설정 검증 (명시적 호출)
+
+        __post_init__에서 자동으로 호출되지만, 명시적으로도 호출 가능합니다.
+        """
+        self.__post_init__()
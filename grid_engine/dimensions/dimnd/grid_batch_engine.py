@@ -0,0 +1,248 @@
+"""
+Grid Batch Engine
+N개 독립 Grid Engine을 한 번의 step()으로 진행 (차원 일반화, 벡터화)
+
+이 모듈은 같은 설정을 공유하는 N개의 독립 Grid Engine 인스턴스(예: 기계 N대의 5축 스핀들)를
+N×D 상태 행렬로 유지합니다. 인스턴스마다 Python 루프로 step()을 호출하는 대신
+적분 → Ring 안정화 → 투영을 한 번의 행렬 연산으로 수행합니다.
+
+핵심 구조:
+    인스턴스 n: Grid ND = Ring (n,1) ⊗ ... ⊗ Ring (n,D)
+    상태 행렬 (shape (N, D), float64): phi, coord, v, a
+    시간 t_ms: 모든 인스턴스 공통 (같은 dt_ms로 함께 진행)
+
+인스턴스 호환성:
+    get_state(i) / get_output(i)는 인스턴스 i의 상태/출력을
+    state_cls / output_cls (예: Grid5DState / Grid5DOutput)로 반환합니다.
+    각 인스턴스의 결과는 같은 입력을 받은 GridNDEngine (또는 Grid5DEngine)과 같습니다.
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+from typing import Any, List, Optional
+import math
+import numpy as np
+from .config_nd import GridNDConfig
+from .integrator_nd import semi_implicit_euler_nd
+from .projector_nd import CoordinateNDProjector
+from ...common.adapters.ring_adapter import RingAdapterConfig
+from ...common.adapters.ring_nd_adapter import create_ring_nd_adapter
+
+
+class GridBatchEngine:
+    """
+    Grid Batch Engine
+
+    N개 인스턴스 × D축 상태를 행렬로 유지하고 한 번에 진행
+
+    사용 예:
+        batch = GridBatchEngine(500, config=Grid5DConfig(),
+                                state_cls=Grid5DState, output_cls=Grid5DOutput)
+        coord = batch.step(velocity)  # velocity: (500, 5)
+        state_7 = batch.get_state(7)  # Grid5DState
+    """
+
+    def __init__(
+        self,
+        num_instances: int,
+        config: Optional[Any] = None,
+        initial: Optional[np.ndarray] = None,
+        state_cls: Optional[type] = None,
+        output_cls: Optional[type] = None
+    ):
+        """
+        Grid Batch Engine 초기화
+
+        Args:
+            num_instances: 인스턴스 수 N
+            config: GridNDConfig 또는 to_nd_config()를 가진 차원별 설정 (예: Grid5DConfig)
+                (None이면 GridNDConfig 기본값)
+            initial: 초기 좌표/각도 [m] 또는 [deg], shape (D,) 또는 (N, D) (None이면 원점)
+            state_cls: 인스턴스 상태 타입 (예: Grid5DState), get_state()용
+            output_cls: 인스턴스 출력 타입 (예: Grid5DOutput), get_output()용
+        """
+        assert num_instances > 0, f"num_instances ({num_instances}) must be > 0"
+
+        if config is None:
+            config = GridNDConfig()
+        elif not isinstance(config, GridNDConfig):
+            config.validate()
+            config = config.to_nd_config()
+        self.config = config
+        self.config.validate()
+
+        self.num_instances: int = num_instances
+        self.num_axes: int = self.config.num_axes
+        self.state_cls = state_cls
+        self.output_cls = output_cls
+
+        # Ring Adapter 생성 (인스턴스 × 축마다 독립 Ring, 평탄화 순서 (n, d))
+        # ✨ NEW: 배치는 항상 Ring Bank (N×D Ring을 한 번의 행렬 연산으로)
+        #   "external"은 Ring마다 Python 루프라 N에 비례하므로 허용하지 않음, "auto"는 "bank"로 고정
+        assert self.config.ring_backend != "external", \
+            "GridBatchEngine requires ring_backend 'auto' or 'bank' ('external' steps each ring in a Python loop)"
+        axis_ring_cfgs = [
+            RingAdapterConfig(size=self.config.ring_size, config=axis.ring_cfg)
+            for axis in self.config.axes
+        ]
+        self.ring_adapter = create_ring_nd_adapter(
+            axis_ring_cfgs * num_instances, backend="bank",
+            lut=self.config.ring_lut, dt_ms=self.config.dt_ms,
+            converge_tol=self.config.ring_converge_tol
+        )
+
+        # Coordinate ND Projector 생성 (축별 변환 계수, 행 단위로 broadcast)
+        self.projector = CoordinateNDProjector(self.config)
+
+        # 축별 상수
+        # ⚠️ 단위: 회전 축 입력 [deg/s, deg/s²] → 내부 [rad/s, rad/s²]
+        self.input_scale = np.array([
+            1.0 if axis.kind == "linear" else math.pi / 180.0 for axis in self.config.axes
+        ], dtype=np.float64)
+        self.velocity_input = np.array([axis.velocity_input for axis in self.config.axes], dtype=bool)
+
+        # 상태 행렬 (연속 float64, shape (N, D))
+        shape = (num_instances, self.num_axes)
+        self.phi = np.zeros(shape, dtype=np.float64)
+        self.coord = np.zeros(shape, dtype=np.float64)
+        self.v = np.zeros(shape, dtype=np.float64)
+        self.a = np.zeros(shape, dtype=np.float64)
+        self.t_ms: float = 0.0
+
+        # 다중 속도 (multi-rate): Ring 안정화는 ring_update_interval step마다 (GridNDEngine과 같음)
+        self.ring_update_interval: int = self.config.ring_update_interval
+        self.ring_phase = np.zeros(shape, dtype=np.float64)
+        self._ring_countdown: int = 0
+
+        self.reset(initial)
+
+    def step(
+        self,
+        velocity: np.ndarray,
+        acceleration: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Grid Batch Engine step 함수
+
+        모든 인스턴스를 한 스텝 진행: 경로 통합 → Ring 안정화 → 좌표/각도 투영
+
+        Args:
+            velocity: 입력 속도 [m/s] 또는 [deg/s], shape (N, D)
+            acceleration: 입력 가속도 [m/s²] 또는 [deg/s²], shape (N, D)
+                - None: 모든 인스턴스/축 가속도 없음
+                - NaN 원소: 해당 인스턴스/축 가속도 없음 (이전 값 유지)
+
+        Returns:
+            좌표/각도 행렬 [m] 또는 [deg], shape (N, D)
+            ⚠️ 엔진 내부 버퍼(self.coord)이므로, 보관하려면 복사해야 합니다.
+        """
+        dt_ms = self.config.dt_ms
+
+        v_in = np.multiply(velocity, self.input_scale)
+        assert v_in.shape == self.phi.shape, \
+            f"velocity shape ({v_in.shape}) must be {self.phi.shape}"
+
+        has_a = None
+        a_in = None
+        if acceleration is not None:
+            a_raw = np.asarray(acceleration, dtype=np.float64)
+            has_a = ~np.isnan(a_raw)
+            if has_a.any():
+                a_in = a_raw * self.input_scale
+            else:
+                has_a = None
+
+        # 1. 수치 적분 (N×D)
+        new_phi, new_v = semi_implicit_euler_nd(
+            self.phi, self.v, v_in, a_in, has_a, self.velocity_input,
+            dt_ms, self.config.tau_ms
+        )
+
+        # 2. Ring 안정화 (N×D개 Ring, 평탄화하여 한 번에 전달)
+        interval = self.ring_update_interval
+        if interval == 1:
+            stabilized, _ = self.ring_adapter.step(new_phi.ravel(), dt_ms)
+            stabilized = stabilized.reshape(self.phi.shape)
+        elif self._ring_countdown == 0:
+            stabilized, _ = self.ring_adapter.step(new_phi.ravel(), dt_ms * interval)
+            stabilized = stabilized.reshape(self.phi.shape)
+            self.ring_phase[:] = (stabilized - 0.9 * np.mod(new_phi, self.config.phase_wrap)) / 0.1
+            self._ring_countdown = interval - 1
+        else:
+            # 보관한 Ring 위상으로 당김, 원형 차이 (GridNDEngine과 같은 규칙)
+            wrap = self.config.phase_wrap
+            phases_norm = np.mod(new_phi, wrap)
+            diff = np.mod(self.ring_phase - phases_norm + 0.5 * wrap, wrap) - 0.5 * wrap
+            stabilized = phases_norm + 0.1 * diff
+            self._ring_countdown -= 1
+
+        # 3. 위상 정규화 + 좌표/각도 투영 (버퍼에 직접 기록)
+        np.mod(stabilized, self.config.phase_wrap, out=self.phi)
+        np.multiply(self.phi, self.projector.coordinate_scale, out=self.coord)
+
+        np.copyto(self.v, new_v)
+        if has_a is not None:
+            np.copyto(self.a, a_in, where=has_a)
+        self.t_ms += dt_ms
+
+        return self.coord
+
+    def reset(self, coordinates: Optional[np.ndarray] = None):
+        """
+        상태 리셋 (모든 인스턴스)
+
+        Args:
+            coordinates: 초기 좌표/각도 [m] 또는 [deg], shape (D,) 또는 (N, D) (None이면 원점)
+        """
+        if coordinates is None:
+            self.coord[:] = 0.0
+        else:
+            self.coord[:] = coordinates
+        # ⚠️ 좌표는 입력값을 직접 저장 (정규화로 인한 손실 방지)
+        np.mod(self.projector.coordinate_to_phase(self.coord), self.config.phase_wrap, out=self.phi)
+        self.v[:] = 0.0
+        self.a[:] = 0.0
+        self.t_ms = 0.0
+        self.ring_adapter.reset()
+        self.ring_phase[:] = 0.0
+        self._ring_countdown = 0
+
+    def state_tuple(self, index: int) -> tuple:
+        """
+        인스턴스 상태 평탄화 (Python float)
+
+        Returns:
+            (φ₁..φ_D, c₁..c_D, v₁..v_D, a₁..a_D, t_ms) — Grid 2D~7D State 필드 순서
+        """
+        return (
+            *self.phi[index].tolist(), *self.coord[index].tolist(),
+            *self.v[index].tolist(), *self.a[index].tolist(), self.t_ms
+        )
+
+    def get_state(self, index: int):
+        """
+        인스턴스 상태 반환 (state_cls, 예: Grid5DState)
+
+        Args:
+            index: 인스턴스 인덱스
+        """
+        assert self.state_cls is not None, "state_cls must be set to build instance states"
+        return self.state_cls(*self.state_tuple(index))
+
+    def get_output(self, index: int):
+        """
+        인스턴스 출력 반환 (output_cls, 예: Grid5DOutput)
+
+        Args:
+            index: 인스턴스 인덱스
+        """
+        assert self.output_cls is not None, "output_cls must be set to build instance outputs"
+        return self.output_cls(*self.coord[index].tolist(), *self.phi[index].tolist())
+
+    def get_states(self) -> List[Any]:
+        """모든 인스턴스 상태 반환 (state_cls 리스트)"""
+        return [self.get_state(i) for i in range(self.num_instances)]
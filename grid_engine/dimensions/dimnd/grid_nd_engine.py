@@ -0,0 +1,379 @@
+"""
+Grid ND Engine
+Ring ⊗ ... ⊗ Ring 조립 + step()만 담당 (차원 일반화, 벡터화)
+
+이 모듈은 차원 일반화(dimension-generic) Grid Engine의 메인 엔진입니다.
+Grid 2D~7D Engine은 축마다 스칼라 코드를 반복했지만(semi_implicit_euler_5d의 10개 float,
+축별 normalize_phase, step()당 두 번의 phase_to_coordinate), Grid ND Engine은
+위상/속도/가속도/좌표를 연속된 float64 배열로 유지하고
+적분 → 정규화 → 투영을 각각 한 번의 벡터 연산으로 수행합니다.
+
+Grid 2D~7D Engine은 이 엔진 위의 얇은 facade입니다 (축 명세만 다름).
+
+핵심 구조:
+    Grid ND = Ring 1 ⊗ Ring 2 ⊗ ... ⊗ Ring N
+    위상 공간: Tᴺ = S¹ × ... × S¹
+
+상태 배열 (shape (N,), float64, 하나의 상태 버퍼 (길이 4N + 1)의 view):
+    phi: 위상 [rad] ∈ [0, 2π)
+    coord: 좌표/각도 [m] 또는 [deg]
+    v: 속도 [m/s] 또는 [rad/s] (내부 단위)
+    a: 가속도 [m/s²] 또는 [rad/s²] (내부 단위)
+    t_ms: 시간 [ms] (버퍼의 마지막 원소)
+
+알고리즘 흐름:
+    1. 수치 적분: integrator_nd.semi_implicit_euler_nd() (벡터)
+    2. Ring 안정화: ring_adapter.step() (ring_backend에 따라 RingNDAdapter 또는 RingBankAdapter)
+    3. 위상 정규화 + 좌표/각도 투영 (벡터)
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+from typing import List, Optional, Sequence
+import math
+import numpy as np
+from .config_nd import AxisSpec, GridNDConfig
+from .integrator_nd import semi_implicit_euler_nd
+from .projector_nd import CoordinateNDProjector
+from ...common.adapters.ring_adapter import RingAdapterConfig
+from ...common.adapters.ring_nd_adapter import create_ring_nd_adapter
+
+
+class GridNDEngine:
+    """
+    Grid ND Engine
+
+    Ring ⊗ ... ⊗ Ring 구조로 N차원 위치/각도 상태를 배열로 유지
+
+    사용 예:
+        engine = GridNDEngine(axes=[AxisSpec("x"), AxisSpec("y"), AxisSpec("a", kind="rotary")])
+        coord = engine.step(velocity=[0.1, 0.0, 5.0])
+    """
+
+    def __init__(
+        self,
+        config: Optional[GridNDConfig] = None,
+        axes: Optional[Sequence[AxisSpec]] = None,
+        initial: Optional[Sequence[float]] = None
+    ):
+        """
+        Grid ND Engine 초기화
+
+        Args:
+            config: 설정 (None이면 axes로 기본 설정 생성)
+            axes: 축 명세 리스트 (config가 None일 때만 사용)
+            initial: 초기 좌표/각도 [m] 또는 [deg] (None이면 원점)
+        """
+        if config is None:
+            config = GridNDConfig(axes=list(axes)) if axes is not None else GridNDConfig()
+        self.config = config
+        self.config.validate()
+
+        self.axes: List[AxisSpec] = list(self.config.axes)
+        self.num_axes: int = len(self.axes)
+
+        # Ring Adapter 생성 (축별 Ring 설정, ring_backend에 따라 외부 Ring 또는 Ring Bank)
+        self.ring_adapter = create_ring_nd_adapter([
+            RingAdapterConfig(size=self.config.ring_size, config=axis.ring_cfg)
+            for axis in self.axes
+        ], backend=self.config.ring_backend, lut=self.config.ring_lut, dt_ms=self.config.dt_ms,
+            converge_tol=self.config.ring_converge_tol)
+
+        # Coordinate ND Projector 생성 (좌표/각도 투영 담당)
+        self.projector = CoordinateNDProjector(self.config)
+
+        # 축별 상수 (step()마다 재계산하지 않음)
+        # ⚠️ 단위: 회전 축 입력 [deg/s, deg/s²] → 내부 [rad/s, rad/s²]
+        self.input_scale = np.array([
+            1.0 if axis.kind == "linear" else math.pi / 180.0 for axis in self.axes
+        ], dtype=np.float64)
+        self.velocity_input = np.array([axis.velocity_input for axis in self.axes], dtype=bool)
+
+        # 상태 버퍼 (연속 float64, 길이 4N + 1): (φ₁..φₙ, c₁..cₙ, v₁..vₙ, a₁..aₙ, t_ms)
+        # phi/coord/v/a는 버퍼의 view (제자리 갱신만 허용, 재할당 금지)
+        n = self.num_axes
+        self.buffer = np.zeros(4 * n + 1, dtype=np.float64)
+        self.phi = self.buffer[0:n]
+        self.coord = self.buffer[n:2 * n]
+        self.v = self.buffer[2 * n:3 * n]
+        self.a = self.buffer[3 * n:4 * n]
+
+        # 마지막 step의 Ring 에너지 (진단용)
+        self.last_energies: List[Optional[float]] = [None] * self.num_axes
+
+        # 다중 속도 (multi-rate): Ring 안정화는 ring_update_interval step마다
+        # 중간 step에는 마지막 Ring 위상 (φ_ring)을 유지하고, 현재 위상 기준 원형 차이로 당김
+        self.ring_update_interval: int = self.config.ring_update_interval
+        self.ring_phase = np.zeros(self.num_axes, dtype=np.float64)
+        self._ring_countdown: int = 0
+
+        self.reset(initial)
+
+    @property
+    def t_ms(self) -> float:
+        """경과 시간 [ms] (상태 버퍼의 마지막 원소)"""
+        return self.buffer.item(-1)
+
+    @t_ms.setter
+    def t_ms(self, value: float):
+        self.buffer[-1] = value
+
+    def step(
+        self,
+        velocity: Sequence[float],
+        acceleration: Optional[Sequence[Optional[float]]] = None
+    ) -> np.ndarray:
+        """
+        Grid ND Engine step 함수
+
+        한 스텝 실행: ND 경로 통합 → Ring 안정화 → ND 좌표/각도 투영
+
+        Args:
+            velocity: 축별 입력 속도 [m/s] 또는 [deg/s], shape (N,)
+            acceleration: 축별 입력 가속도 [m/s²] 또는 [deg/s²], shape (N,)
+                - None: 모든 축 가속도 없음
+                - 축별 None 또는 NaN: 해당 축 가속도 없음
+
+        Returns:
+            좌표/각도 배열 [m] 또는 [deg], shape (N,)
+            ⚠️ 엔진 내부 버퍼(self.coord)이므로, 보관하려면 복사해야 합니다.
+
+        Author: GNJz
+        Created: 2026-10-17
+        Made in GNJz
+        """
+        # 입력 단위 변환 (회전 축 deg → rad)
+        v_in = np.multiply(velocity, self.input_scale)
+
+        # 가속도 입력 여부 (모든 축이 None이면 가속도 없음 경로 사용)
+        has_a = None
+        if acceleration is not None:
+            if isinstance(acceleration, (tuple, list)) and acceleration.count(None) == len(acceleration):
+                acceleration = None
+            else:
+                a_raw = np.asarray(acceleration, dtype=np.float64)  # None → NaN
+                has_a = ~np.isnan(a_raw)
+                a_in = a_raw * self.input_scale
+        if has_a is None:
+            a_in = None
+
+        self._advance(v_in, a_in, has_a)
+
+        return self.coord
+
+    def _advance(
+        self,
+        v_in: np.ndarray,
+        a_in: Optional[np.ndarray],
+        has_a: Optional[np.ndarray]
+    ):
+        """
+        한 스텝 진행 (내부 단위 입력, 단위 변환 이후)
+
+        Args:
+            v_in: 입력 속도 (내부 단위), shape (N,)
+            a_in: 입력 가속도 (내부 단위), shape (N,) 또는 None
+            has_a: 가속도 입력 여부, shape (N,) bool 또는 None (모든 축 가속도 없음)
+        """
+        dt_ms = self.config.dt_ms
+
+        # 1. 수치 적분 (ND): 속도/가속도 → 위상 업데이트
+        new_phi, new_v = semi_implicit_euler_nd(
+            self.phi, self.v, v_in, a_in, has_a, self.velocity_input,
+            dt_ms, self.config.tau_ms
+        )
+
+        # 2. Ring 안정화: 위상을 Attractor에 붙잡기
+        interval = self.ring_update_interval
+        if interval == 1:
+            stabilized, self.last_energies = self.ring_adapter.step(new_phi, dt_ms)
+        elif self._ring_countdown == 0:
+            # Ring 갱신 step: 지난 갱신 이후 경과 시간 (interval · dt) 동안 Ring 실행
+            stabilized, self.last_energies = self.ring_adapter.step(new_phi, dt_ms * interval)
+            # Ring 위상 보관: stabilized = 0.9 · φ_norm + 0.1 · φ_ring
+            self.ring_phase[:] = (stabilized - 0.9 * np.mod(new_phi, self.config.phase_wrap)) / 0.1
+            self._ring_countdown = interval - 1
+        else:
+            # 중간 step: Ring 실행 없음, 보관한 Ring 위상으로 당김 (현재 위상 기준 원형 차이)
+            # φ + 0.1 · (φ_ring − φ)는 k = 1의 가중 평균과 같고, 래핑 경계에서도 가까운 쪽으로 당김
+            wrap = self.config.phase_wrap
+            phases_norm = np.mod(new_phi, wrap)
+            diff = np.mod(self.ring_phase - phases_norm + 0.5 * wrap, wrap) - 0.5 * wrap
+            stabilized = phases_norm + 0.1 * diff
+            self._ring_countdown -= 1
+
+        # 3. 위상 정규화 + 좌표/각도 투영 (버퍼에 직접 기록)
+        np.mod(stabilized, self.config.phase_wrap, out=self.phi)
+        np.multiply(self.phi, self.projector.coordinate_scale, out=self.coord)
+
+        np.copyto(self.v, new_v)
+        if has_a is not None:
+            np.copyto(self.a, a_in, where=has_a)
+        self.t_ms += dt_ms
+
+    def run(
+        self,
+        inputs: np.ndarray,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        궤적 롤아웃 (T 스텝 연속 실행)
+
+        입력 블록 전체를 한 번에 받아 step()을 T번 반복하고,
+        매 스텝의 좌표/각도와 위상을 미리 할당된 출력 배열에 기록합니다.
+        스텝마다 State/Output 객체를 만들지 않습니다.
+
+        Args:
+            inputs: 입력 블록, shape (T, N) 또는 (T, 2N)
+                - [:, :N]: 속도 [m/s] 또는 [deg/s]
+                - [:, N:]: 가속도 [m/s²] 또는 [deg/s²] (선택적, NaN은 가속도 없음)
+            out: 출력 배열, shape (T, 2N) (None이면 새로 할당)
+
+        Returns:
+            출력 배열, shape (T, 2N)
+                - [:, :N]: 좌표/각도 [m] 또는 [deg]
+                - [:, N:]: 위상 [rad]
+            (Grid 2D~7D Output 필드 순서와 같음)
+
+        Author: GNJz
+        Created: 2026-10-17
+        Made in GNJz
+        """
+        n = self.num_axes
+        inputs = np.asarray(inputs, dtype=np.float64)
+        assert inputs.ndim == 2 and inputs.shape[1] in (n, 2 * n), \
+            f"inputs shape ({inputs.shape}) must be (T, {n}) or (T, {2 * n})"
+        num_steps = inputs.shape[0]
+
+        if out is None:
+            out = np.empty((num_steps, 2 * n), dtype=np.float64)
+        assert out.shape == (num_steps, 2 * n), \
+            f"out shape ({out.shape}) must be ({num_steps}, {2 * n})"
+
+        # 입력 단위 변환 (블록 전체를 한 번에)
+        v_block = inputs[:, :n] * self.input_scale
+        if inputs.shape[1] == 2 * n:
+            a_raw = inputs[:, n:]
+            has_block = ~np.isnan(a_raw)
+            a_block = a_raw * self.input_scale
+            row_has_a = has_block.any(axis=1).tolist()
+        else:
+            row_has_a = [False] * num_steps
+
+        coord_out = out[:, :n]
+        phi_out = out[:, n:]
+        for t in range(num_steps):
+            if row_has_a[t]:
+                self._advance(v_block[t], a_block[t], has_block[t])
+            else:
+                self._advance(v_block[t], None, None)
+            coord_out[t] = self.coord
+            phi_out[t] = self.phi
+
+        return out
+
+    def reset(self, coordinates: Optional[Sequence[float]] = None):
+        """
+        상태 리셋 (ND)
+
+        Args:
+            coordinates: 초기 좌표/각도 [m] 또는 [deg] (None이면 원점)
+        """
+        if coordinates is None:
+            self.coord[:] = 0.0
+        else:
+            self.coord[:] = coordinates
+        # ⚠️ 좌표는 입력값을 직접 저장 (정규화로 인한 손실 방지)
+        np.mod(self.projector.coordinate_to_phase(self.coord), self.config.phase_wrap, out=self.phi)
+        self.v[:] = 0.0
+        self.a[:] = 0.0
+        self.t_ms = 0.0
+        self.ring_adapter.reset()
+        self.ring_phase[:] = 0.0
+        self._ring_countdown = 0
+
+    def set_coordinates(self, coordinates: Sequence[float]):
+        """
+        좌표/각도 설정 (속도/가속도/시간 유지)
+
+        측정된 현재 상태를 엔진에 반영할 때 사용합니다 (Persistent Bias Estimator).
+
+        Args:
+            coordinates: 좌표/각도 [m] 또는 [deg]
+        """
+        self.coord[:] = coordinates
+        np.mod(self.projector.coordinate_to_phase(self.coord), self.config.phase_wrap, out=self.phi)
+
+    def load(
+        self,
+        phi: Sequence[float],
+        coord: Sequence[float],
+        v: Sequence[float],
+        a: Sequence[float],
+        t_ms: float
+    ):
+        """
+        상태 배열 직접 설정 (facade 상태 동기화용)
+
+        Args:
+            phi: 위상 [rad]
+            coord: 좌표/각도 [m] 또는 [deg]
+            v: 속도 (내부 단위)
+            a: 가속도 (내부 단위)
+            t_ms: 시간 [ms]
+        """
+        self.phi[:] = phi
+        self.coord[:] = coord
+        self.v[:] = v
+        self.a[:] = a
+        self.t_ms = t_ms
+
+    def load_flat(self, values: Sequence[float]):
+        """
+        평탄화된 상태 설정 (state_tuple()의 역변환)
+
+        Args:
+            values: (φ₁..φₙ, c₁..cₙ, v₁..vₙ, a₁..aₙ, t_ms) 순서의 값 (길이 4N + 1)
+        """
+        n = self.num_axes
+        assert len(values) == 4 * n + 1, \
+            f"values length ({len(values)}) must be 4 * num_axes + 1 ({4 * n + 1})"
+        self.buffer[:] = values
+
+    def state_tuple(self) -> tuple:
+        """
+        평탄화된 상태 반환 (Python float)
+
+        Grid 2D~7D State의 필드 순서(위상, 좌표, 속도, 가속도, 시간)와 같으므로
+        Grid5DState(*engine.state_tuple())처럼 바로 생성할 수 있습니다.
+
+        Returns:
+            (φ₁..φₙ, c₁..cₙ, v₁..vₙ, a₁..aₙ, t_ms)
+        """
+        return (
+            *self.phi.tolist(), *self.coord.tolist(),
+            *self.v.tolist(), *self.a.tolist(), self.t_ms
+        )
+
+    def output_tuple(self) -> tuple:
+        """
+        평탄화된 출력 반환 (Python float)
+
+        Grid 2D~7D Output dataclass의 필드 순서(좌표, 위상)와 같습니다.
+
+        Returns:
+            (c₁..cₙ, φ₁..φₙ)
+        """
+        return (*self.coord.tolist(), *self.phi.tolist())
+
+    def get_phase_vector(self) -> np.ndarray:
+        """현재 위상 벡터 반환 (복사본)"""
+        return self.phi.copy()
+
+    def get_coordinates(self) -> np.ndarray:
+        """현재 좌표/각도 벡터 반환 (복사본)"""
+        return self.coord.copy()
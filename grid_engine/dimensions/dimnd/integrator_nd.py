@@ -0,0 +1,90 @@
+"""
+Semi-implicit Euler Integrator (ND)
+공용 수치 적분기 (독립 모듈, 벡터화)
+
+이 모듈은 N차원 경로 통합(Path Integration)을 배열 연산으로 수행합니다.
+2D~7D 적분기(semi_implicit_euler, ..., semi_implicit_euler_7d)가 축마다
+스칼라로 계산하던 식을 한 번의 벡터 연산으로 처리합니다.
+
+수치 적분 방법 (축별, 2D~7D와 동일):
+    가속도 입력이 있는 축:
+        vⁿ⁺¹ = vⁿ + aⁿ·Δt
+        φⁿ⁺¹ = φⁿ + vⁿ·Δt + ½aⁿ·(Δt)²
+    가속도 입력이 없고 velocity_input인 축:
+        vⁿ⁺¹ = v_in
+        φⁿ⁺¹ = φⁿ + v_in·Δt
+    가속도 입력이 없고 velocity_input이 아닌 축:
+        vⁿ⁺¹ = vⁿ
+        φⁿ⁺¹ = φⁿ + vⁿ·Δt
+
+    통합 표현:
+        v_base = v_in (가속도 없음 & velocity_input) 또는 vⁿ (그 외)
+        a₀ = a (가속도 있음) 또는 0
+        vⁿ⁺¹ = v_base + a₀·Δt
+        φⁿ⁺¹ = φⁿ + v_base·Δt + ½a₀·(Δt)²
+
+⚠️ 단위 규칙:
+    - 입력 단위 변환(회전 축 deg → rad)은 호출 측(GridNDEngine)에서 수행
+    - 이 모듈의 모든 값은 내부 단위 ([m/s], [rad/s], ...) 기준
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+
+
+def semi_implicit_euler_nd(
+    phi: np.ndarray,
+    v: np.ndarray,
+    v_in: np.ndarray,
+    a_in: np.ndarray,
+    has_a: Optional[np.ndarray],
+    velocity_input: np.ndarray,
+    dt_ms: float,
+    tau_ms: float  # 현재 미사용, 향후 확장용
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Semi-implicit Euler 적분기 (ND, 벡터화)
+
+    Args:
+        phi: 현재 위상 [rad], shape (..., D)
+        v: 현재 속도 (내부 단위), shape (..., D)
+        v_in: 입력 속도 (내부 단위), shape (..., D)
+        a_in: 입력 가속도 (내부 단위), shape (..., D), 가속도가 없는 축은 무시됨
+        has_a: 가속도 입력 여부, shape (..., D) bool (None이면 모든 축 가속도 없음)
+        velocity_input: 축별 속도 입력 사용 여부, shape (D,) bool
+        dt_ms: 시간 간격 [ms]
+        tau_ms: 시간 상수 [ms]
+
+    Returns:
+        (new_phi, new_v): 정규화 전 위상, 새로운 속도
+
+    물리 단위:
+        - dt_ms: [ms]
+        - dt_s: [s] (dt_ms / 1000.0)
+
+    Author: GNJz
+    Created: 2026-10-17
+    Made in GNJz
+    """
+    # ⚠️ 중요: 물리 법칙 적용을 위해 ms를 s로 변환
+    dt_s = dt_ms / 1000.0  # [s]
+
+    if has_a is None:
+        # 가속도 입력이 없는 축만 있는 경우 (고속 경로, a₀ = 0)
+        new_v = np.where(velocity_input, v_in, v)
+        new_phi = phi + new_v * dt_s
+        return new_phi, new_v
+
+    v_base = np.where(velocity_input & ~has_a, v_in, v)
+    a0 = np.where(has_a, a_in, 0.0)
+
+    new_v = v_base + a0 * dt_s
+    new_phi = phi + (v_base * dt_s + 0.5 * a0 * (dt_s ** 2))
+
+    return new_phi, new_v
@@ -0,0 +1,72 @@
+"""
+Coordinate Projector (ND)
+위상 → N차원 좌표/각도 투영 (관측자 책임, 벡터화)
+
+이 모듈은 Grid ND Engine의 내부 위상 벡터를 외부 좌표/각도 벡터로 투영합니다.
+축별 변환 계수를 한 번만 계산해 두고, 투영은 배열 곱셈 한 번으로 수행합니다.
+
+변환 관계 (축별):
+    위치 축 (linear):
+        x = φ · (L / 2π),  φ = x · (2π / L)
+    회전 축 (rotary):
+        θ = φ · (180° / π),  φ = θ · (π / 180°)
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+import math
+import numpy as np
+from .config_nd import GridNDConfig
+
+
+class CoordinateNDProjector:
+    """
+    ND 좌표/각도 투영기 (Observer)
+
+    Grid ND Engine의 내부 위상을 외부 좌표/각도로 투영합니다.
+    """
+
+    def __init__(self, config: GridNDConfig):
+        """
+        Args:
+            config: Grid ND Engine 설정
+        """
+        self.config = config
+
+        # 축별 변환 계수 (위상 → 좌표, 좌표 → 위상)
+        self.coordinate_scale = np.array([
+            axis.scale / config.phase_wrap if axis.kind == "linear" else 180.0 / math.pi
+            for axis in config.axes
+        ], dtype=np.float64)
+        self.phase_scale = np.array([
+            config.phase_wrap / axis.scale if axis.kind == "linear" else math.pi / 180.0
+            for axis in config.axes
+        ], dtype=np.float64)
+
+    def phase_to_coordinate(self, phi: np.ndarray) -> np.ndarray:
+        """
+        위상 → 좌표/각도 변환
+
+        Args:
+            phi: 위상 [rad], shape (..., D)
+
+        Returns:
+            좌표/각도 ([m] 또는 [deg]), shape (..., D)
+        """
+        return phi * self.coordinate_scale
+
+    def coordinate_to_phase(self, coord: np.ndarray) -> np.ndarray:
+        """
+        좌표/각도 → 위상 변환
+
+        Args:
+            coord: 좌표/각도 ([m] 또는 [deg]), shape (..., D)
+
+        Returns:
+            위상 [rad] (정규화되지 않음), shape (..., D)
+        """
+        return np.asarray(coord, dtype=np.float64) * self.phase_scale
@@ -0,0 +1,150 @@
+"""
+Grid ND State
+배열 기반 상태 타입 (__slots__, float64 버퍼 하나)
+
+Grid 5D~7D State는 필드마다 float 속성을 가진 dataclass였고,
+step()/update()/set_target()마다 새 객체를 만들고 __post_init__에서 위상을 정규화했습니다.
+Grid ND State는 모든 필드를 float64 버퍼 하나에 두고, 필드 이름은 버퍼 원소의 property입니다.
+
+버퍼 순서 (GridNDEngine.buffer / state_tuple()과 같음):
+    (φ₁..φₙ, c₁..cₙ, v₁..vₙ, a₁..aₙ, t_ms), 길이 4N + 1
+
+사용 방식:
+    - 생성: Grid5DState(phi_x=..., ..., t_ms=...) 또는 Grid5DState(*values) (위상 정규화)
+    - 엔진 상태: from_buffer(core.buffer)는 복사 없이 엔진 버퍼를 감쌈 (step마다 제자리 갱신)
+    - 스냅샷: copy() (버퍼 복사 한 번)
+    - 해마/배열 연산: array (버퍼 자체, zero-copy view)
+
+하위 클래스는 필드를 클래스 어노테이션으로 선언하고 __slots__ = ()를 지정합니다.
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+from typing import Iterator, Tuple
+import math
+import numpy as np
+
+
+def _field_property(index: int, name: str) -> property:
+    """버퍼 원소 index를 읽고 쓰는 property"""
+
+    def getter(self) -> float:
+        return self._buffer.item(index)
+
+    def setter(self, value: float):
+        self._buffer[index] = value
+
+    return property(getter, setter, doc=f"{name} (buffer[{index}])")
+
+
+class GridNDState:
+    """
+    Grid ND State (배열 기반)
+
+    필드 값은 _buffer (float64, shape (4N + 1,))에 있고, 필드 이름은 property로 접근합니다.
+    속성 이름은 기존 Grid 5D~7D State dataclass와 같습니다.
+    """
+
+    __slots__ = ("_buffer",)
+
+    # 하위 클래스에서 어노테이션으로 채움
+    _fields: Tuple[str, ...] = ()
+    num_axes: int = 0
+    phase_wrap: float = 2.0 * math.pi
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        annotations = cls.__dict__.get("__annotations__", {})
+        fields = tuple(name for name in annotations if not name.startswith("_"))
+        if not fields:
+            return
+        assert len(fields) % 4 == 1, \
+            f"{cls.__name__} fields ({len(fields)}) must be phi/coord/v/a × N + t_ms"
+        assert fields[-1] == "t_ms", f"{cls.__name__} last field must be t_ms"
+        cls._fields = fields
+        cls.num_axes = (len(fields) - 1) // 4
+        for index, name in enumerate(fields):
+            setattr(cls, name, _field_property(index, name))
+
+    def __init__(self, *args: float, **kwargs: float):
+        """
+        필드 값으로 생성 (dataclass와 같은 위치/키워드 인자)
+
+        위상 필드 (앞의 N개)는 [0, phase_wrap)로 정규화합니다.
+        """
+        fields = self._fields
+        if len(args) > len(fields):
+            raise TypeError(
+                f"{type(self).__name__}() takes {len(fields)} positional arguments "
+                f"but {len(args)} were given"
+            )
+        buffer = np.empty(len(fields), dtype=np.float64)
+        buffer[:len(args)] = args
+        for index in range(len(args), len(fields)):
+            name = fields[index]
+            if name not in kwargs:
+                raise TypeError(f"{type(self).__name__}() missing argument: '{name}'")
+            buffer[index] = kwargs.pop(name)
+        if kwargs:
+            raise TypeError(
+                f"{type(self).__name__}() got unexpected arguments: {', '.join(kwargs)}"
+            )
+
+        n = self.num_axes
+        np.mod(buffer[:n], self.phase_wrap, out=buffer[:n])
+        self._buffer = buffer
+
+    @classmethod
+    def from_buffer(cls, buffer: np.ndarray) -> "GridNDState":
+        """
+        버퍼를 복사 없이 감싼 상태 (정규화 없음)
+
+        Args:
+            buffer: float64 배열, shape (4N + 1,) (예: GridNDEngine.buffer)
+        """
+        assert buffer.shape == (len(cls._fields),), \
+            f"buffer shape {buffer.shape} must be ({len(cls._fields)},)"
+        state = cls.__new__(cls)
+        state._buffer = buffer
+        return state
+
+    @property
+    def array(self) -> np.ndarray:
+        """상태 버퍼 (zero-copy view, 수정하면 상태에 반영)"""
+        return self._buffer
+
+    def copy(self) -> "GridNDState":
+        """스냅샷 (버퍼 복사 한 번)"""
+        return type(self).from_buffer(self._buffer.copy())
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo) -> "GridNDState":
+        return self.copy()
+
+    def __reduce__(self):
+        return (type(self).from_buffer, (self._buffer.copy(),))
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __iter__(self) -> Iterator[float]:
+        """필드 순서대로 값 (Python float, astuple()과 같은 순서)"""
+        return iter(self._buffer.tolist())
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._buffer.tolist() == other._buffer.tolist()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={value!r}" for name, value in zip(self._fields, self._buffer.tolist())
+        )
+        return f"{type(self).__name__}({values})"
@@ -4,10 +4,16 @@ Hippocampus Module
 
 구성 요소:
 - Place Cells: 장소별 독립적인 기억
+- Place Bank: Place 기억의 행렬 저장소 (struct-of-arrays)
+- Bias Window Stats: Place별 bias 이력 ring + 이동 평균/분산 (Welford)
 - Context Binder: 맥락별 기억 분리
+- Context Store: 맥락 기억의 상한/제거 정책 배열 저장소
+- Context Schema: 외부 상태 양자화 → 조밀한 정수 Context ID
 - Learning Gate: 학습 조건 제어
 - Replay/Consolidation: 기억 정제 및 장기 기억 고정
 - Replay Buffer: 안정 구간 추출을 위한 버퍼
+- Consolidation Worker: 백그라운드 Replay/Consolidation + 읽기 전용 기억 snapshot
+- Consolidation Budget: Replay/Consolidation 1회 시간/작업량 상한 (남은 작업은 다음 휴지기로)
 
 Author: GNJz
 Created: 2026-01-20
@@ -16,6 +22,11 @@ License: MIT License
 """
 
 from .place_cells import PlaceMemory, PlaceCellManager
+from .place_index import PlaceSpatialIndex
+from .place_bank import PlaceRow, PlaceBank
+from .bias_stats import BiasHistoryPool, BiasHistoryView, BiasWindowStats
+from .context_store import ContextRow, ContextStore
+from .context_schema import ContextSchema, ContextEncoder
 from .context_binder import ContextMemory, ContextBinder
 from .learning_gate import LearningGateConfig, LearningGate
 from .replay_consolidation import (
@@ -23,16 +34,28 @@ from .replay_consolidation import (
     ReplayConsolidation,
     ReplayConsolidationManager
 )
-from .replay_buffer import TrajectoryPoint, ReplayBuffer
+from .replay_buffer import TrajectoryPoint, ReplaySegment, SegmentSummary, ReplayBuffer
+from .consolidation_worker import ConsolidationJob, MemorySnapshot, ConsolidationWorker
+from .consolidation_budget import ConsolidationBudget, BudgetMeter
 from .universal_memory import UniversalMemory, create_universal_memory
 
 __all__ = [
     # Place Cells
     'PlaceMemory',
     'PlaceCellManager',
+    'PlaceSpatialIndex',
+    'PlaceRow',
+    'PlaceBank',
+    'BiasHistoryPool',
+    'BiasHistoryView',
+    'BiasWindowStats',
     # Context Binder
     'ContextMemory',
     'ContextBinder',
+    'ContextRow',
+    'ContextStore',
+    'ContextSchema',
+    'ContextEncoder',
     # Learning Gate
     'LearningGateConfig',
     'LearningGate',
@@ -42,7 +65,16 @@ __all__ = [
     'ReplayConsolidationManager',
     # Replay Buffer
     'TrajectoryPoint',
+    'ReplaySegment',
+    'SegmentSummary',
     'ReplayBuffer',
+    # Consolidation Worker
+    'ConsolidationJob',
+    'MemorySnapshot',
+    'ConsolidationWorker',
+    # Consolidation Budget
+    'ConsolidationBudget',
+    'BudgetMeter',
     # Universal Memory Interface
     'UniversalMemory',
     'create_universal_memory',
@@ -0,0 +1,285 @@
+"""
+Bias Window Statistics Module
+Place별 bias 이력 + 최근 W회차 이동 평균/분산 (Welford, O(1) 갱신)
+
+ReplayConsolidation.consolidate_place_memory는 Place마다 bias_history (deque of 배열 복사본)를
+리스트로 바꾸고 잘라서 np.mean / np.std를 계산했습니다.
+BiasWindowStats는 이력을 미리 할당한 ring 배열 (H × D)에 두고,
+최근 W회차 (W ≤ H)의 평균/제곱 편차 합을 갱신합니다 (슬라이딩 윈도우 Welford):
+
+    창이 차기 전 (n < W):  δ = x - μ,  μ += δ / (n+1),  M2 += δ · (x - μ)
+    창이 찬 뒤 (x_old 제거): μ' = μ + (x - x_old) / W,  M2 += (x - x_old) · (x - μ' + x_old - μ)
+    분산 = M2 / n (np.std와 같은 모분산)
+
+add()는 ring 행 쓰기만 하고 (쓰기 경로에 통계 계산 없음), 갱신은 stats(W)가 읽을 때
+아직 반영하지 않은 bias만 한 번씩 반영합니다 (bias당 O(D), 분할 상환 O(1)).
+D가 작으므로 (5) 평균/M2는 Python float 리스트로 갱신합니다 (작은 배열의 numpy 호출 비용 없음).
+ring이 한 바퀴 돌면 창을 다시 계산해 반올림 오차 누적을 막습니다.
+bias_history는 ring을 복사하지 않는 읽기 전용 view (BiasHistoryView)입니다.
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+from typing import Iterator, List, Optional, Tuple
+from collections.abc import Sequence
+import numpy as np
+
+
+class BiasWindowStats:
+    """
+    bias 이력 ring buffer + 최근 W회차 이동 평균/분산
+
+    len()은 저장된 이력 수 (최대 history_size), recent(n)은 최근 n회차 (오래된 것부터)입니다.
+    """
+
+    __slots__ = ('history_size', 'window', 'count', 'history', 'mean', 'm2', '_folded', 'pool', 'row')
+
+    def __init__(self, history_size: int = 10, window: Optional[int] = None):
+        """
+        Args:
+            history_size: 이력 길이 H (기존 deque maxlen과 같음)
+            window: 이동 통계 창 W (None이면 H, W ≤ H)
+        """
+        window = history_size if window is None else window
+        assert history_size > 0, f"history_size ({history_size}) must be > 0"
+        assert 0 < window <= history_size, \
+            f"window ({window}) must be in (0, history_size={history_size}]"
+        self.history_size = history_size
+        self.window = window
+        self.count = 0  # 지금까지 추가된 수
+        self.history: Optional[np.ndarray] = None  # (H, D), 첫 add()에서 할당
+        self.mean: Optional[List[float]] = None  # 최근 W회차 평균 (D,)
+        self.m2: Optional[List[float]] = None  # 최근 W회차 제곱 편차 합 (D,)
+        self._folded = 0  # mean/m2에 반영된 bias 수 (≤ count)
+        self.pool: Optional["BiasHistoryPool"] = None  # 공유 이력 텐서 (있으면 history는 그 행 view)
+        self.row = -1  # pool 행
+
+    def __len__(self) -> int:
+        return min(self.count, self.history_size)
+
+    def add(self, bias: np.ndarray) -> None:
+        """bias 추가 (ring 행 쓰기 한 번, 이동 통계는 다음 stats()에서 반영)"""
+        if self.mean is None:
+            dim = len(bias)
+            if self.history is None:
+                self.history = np.zeros((self.history_size, dim))
+            self.mean = [0.0] * dim
+            self.m2 = [0.0] * dim
+        self.history[self.count % self.history_size] = bias
+        self.count += 1
+        if self.pool is not None:
+            self.pool.counts[self.row] = self.count
+
+    def _fold(self) -> None:
+        """
+        아직 반영하지 않은 bias를 이동 평균/M2에 반영 (각 bias는 한 번씩만, 원소별 Python float 연산)
+
+        반영할 bias가 창보다 많거나, 빠질 bias (x_old)가 ring에서 이미 덮어쓰였거나,
+        ring이 한 바퀴 돌았으면 창을 다시 계산합니다 (반올림 오차 누적 방지).
+        """
+        count, folded, window, size = self.count, self._folded, self.window, self.history_size
+        if folded == count:
+            return
+        pending = count - folded
+        if pending >= window or pending + window > size or count // size != folded // size:
+            n = min(count, window)
+            rows = self._window_array(n).tolist()
+            self.mean = [sum(column) / n for column in zip(*rows)]
+            self.m2 = [
+                sum((value - mean) * (value - mean) for value in column)
+                for column, mean in zip(zip(*rows), self.mean)
+            ]
+        else:
+            history, mean, m2 = self.history, self.mean, self.m2
+            for step in range(folded, count):
+                x = history[step % size].tolist()
+                if step < window:
+                    n = step + 1
+                    for i, value in enumerate(x):
+                        delta = value - mean[i]
+                        mean[i] += delta / n
+                        m2[i] += delta * (value - mean[i])
+                else:
+                    old_row = history[(step - window) % size].tolist()
+                    for i, value in enumerate(x):
+                        old = old_row[i]
+                        d = value - old
+                        old_mean = mean[i]
+                        mean[i] = old_mean + d / window
+                        m2[i] += d * ((value - mean[i]) + (old - old_mean))
+        self._folded = count
+
+    def _window_array(self, n: int) -> np.ndarray:
+        """최근 n회차 (n ≤ len(self)), shape (n, D), 오래된 것부터"""
+        slots = np.arange(self.count - n, self.count) % self.history_size
+        return self.history[slots]
+
+    def recent(self, n: int) -> List[np.ndarray]:
+        """최근 n회차 bias 리스트 (오래된 것부터, 복사본)"""
+        n = min(n, len(self))
+        if n <= 0:
+            return []
+        return list(self._window_array(n))
+
+    def history_ring(self) -> Tuple[Optional[np.ndarray], int]:
+        """(ring (H, D) 또는 None, 지금까지 추가된 수) — BiasHistoryView용"""
+        return self.history, self.count
+
+    def stats(self, n: int) -> Tuple[int, Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        최근 n회차 (가능한 만큼) 평균/모분산
+
+        n == window이면 누적값을 그대로 읽고 (O(D)), 아니면 ring에서 다시 계산합니다.
+
+        Returns:
+            (사용한 회차 수, 평균, 분산) — 이력이 없으면 (0, None, None)
+        """
+        used = min(n, len(self))
+        if used <= 0:
+            return 0, None, None
+        if n == self.window:
+            self._fold()
+            return used, np.array(self.mean), np.maximum(np.array(self.m2), 0.0) / used
+        window = self._window_array(used)
+        return used, window.mean(axis=0), window.var(axis=0)
+
+    def clear(self) -> None:
+        self.count = 0
+        if self.pool is not None:
+            self.history[:] = 0.0  # pool 행 view는 유지
+            self.pool.counts[self.row] = 0
+        else:
+            self.history = None
+        self.mean = None
+        self.m2 = None
+        self._folded = 0
+
+
+class BiasHistoryPool:
+    """
+    여러 Place의 bias 이력 ring을 한 텐서에 모은 저장소 (storage="dict" Replay용)
+
+    attach()한 BiasWindowStats의 history는 history (N × H × D)의 행 view이고,
+    counts / last_update_times도 행마다 함께 갱신되므로, Replay는 Place를 훑거나
+    np.stack 하지 않고 이 배열로 바로 계산합니다 (ReplayConsolidation.replay_all_places).
+    행은 제거 시 마지막 행을 옮겨 dense하게 유지하고, 용량이 차면 두 배로 늘립니다.
+    """
+
+    def __init__(self, history_size: int = 10, dim: int = 5, capacity: int = 64, mapping=None):
+        """
+        Args:
+            history_size: Place별 이력 길이 H (BiasWindowStats.history_size와 같아야 함)
+            dim: bias 차원 D
+            capacity: 초기 행 수
+            mapping: 이 pool의 Place 전체를 담은 딕셔너리 (PlaceCellManager.place_memory)
+                replay_all_places가 같은 객체를 받으면 pool 텐서로 계산합니다.
+        """
+        assert history_size > 0 and dim > 0 and capacity > 0
+        self.history_size = history_size
+        self.dim = dim
+        self.mapping = mapping
+        self.size = 0
+        self.history = np.zeros((capacity, history_size, dim))
+        self.counts = np.zeros(capacity, dtype=np.int64)  # 행별 누적 추가 수
+        self.last_update_times = np.zeros(capacity)  # 행별 owner.last_update_time
+        self.stats: List[BiasWindowStats] = []  # 행 → BiasWindowStats
+        self.owners: List = []  # 행 → Place Memory (Consolidation 결과 기록용)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def attach(self, stats: BiasWindowStats, owner) -> None:
+        """stats의 이력을 새 행으로 옮기고 history를 그 행 view로 바꿈"""
+        assert stats.pool is None, "stats already attached to a pool"
+        assert stats.history_size == self.history_size, \
+            f"history_size ({stats.history_size}) must match pool ({self.history_size})"
+        if self.size == len(self.counts):
+            self._grow(2 * self.size)
+        row = self.size
+        if stats.history is not None:
+            self.history[row] = stats.history
+        self.counts[row] = stats.count
+        self.last_update_times[row] = owner.last_update_time
+        stats.history = self.history[row]
+        stats.pool, stats.row = self, row
+        self.stats.append(stats)
+        self.owners.append(owner)
+        self.size += 1
+
+    def release(self, stats: BiasWindowStats) -> None:
+        """stats를 pool에서 분리 (이력은 자체 배열로 복사, 마지막 행을 빈 행으로 옮김)"""
+        assert stats.pool is self, "stats is not attached to this pool"
+        row, last = stats.row, self.size - 1
+        stats.history = self.history[row].copy()
+        stats.pool, stats.row = None, -1
+        if row != last:
+            self.history[row] = self.history[last]
+            self.counts[row] = self.counts[last]
+            self.last_update_times[row] = self.last_update_times[last]
+            moved = self.stats[last]
+            moved.history = self.history[row]
+            moved.row = row
+            self.stats[row] = moved
+            self.owners[row] = self.owners[last]
+        self.stats.pop()
+        self.owners.pop()
+        self.history[last] = 0.0
+        self.counts[last] = 0
+        self.last_update_times[last] = 0.0
+        self.size = last
+
+    def _grow(self, capacity: int) -> None:
+        """용량 늘리기 (연결된 stats의 history view를 새 텐서로 다시 연결)"""
+        history = np.zeros((capacity, self.history_size, self.dim))
+        history[:self.size] = self.history[:self.size]
+        counts = np.zeros(capacity, dtype=np.int64)
+        counts[:self.size] = self.counts[:self.size]
+        last_update_times = np.zeros(capacity)
+        last_update_times[:self.size] = self.last_update_times[:self.size]
+        self.history, self.counts, self.last_update_times = history, counts, last_update_times
+        for row, stats in enumerate(self.stats):
+            stats.history = history[row]
+
+
+class BiasHistoryView(Sequence):
+    """
+    bias 이력 읽기 전용 view (오래된 것부터, 복사 없음)
+
+    len()은 O(1)이고, 원소는 ring 행의 읽기 전용 view입니다.
+    append()가 없으므로 이력은 add_bias_to_history()로만 추가합니다.
+    source는 history_ring() → (ring (H, D) 또는 None, 추가된 수)를 제공합니다
+    (BiasWindowStats, PlaceRow).
+    """
+
+    __slots__ = ('_source', 'maxlen')
+
+    def __init__(self, source, maxlen: int):
+        self._source = source
+        self.maxlen = maxlen
+
+    def __len__(self) -> int:
+        return min(self._source.history_ring()[1], self.maxlen)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        ring, count = self._source.history_ring()
+        stored = min(count, self.maxlen)
+        if index < 0:
+            index += stored
+        if not 0 <= index < stored:
+            raise IndexError("bias history index out of range")
+        row = ring[(count - stored + index) % self.maxlen]
+        row.flags.writeable = False
+        return row
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        return f"BiasHistoryView(len={len(self)}, maxlen={self.maxlen})"
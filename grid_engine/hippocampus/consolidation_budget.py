@@ -0,0 +1,78 @@
+"""
+Consolidation Budget Module
+Replay/Consolidation 1회 호출의 시간/작업량 상한
+
+Grid5DEngine.update()와 UniversalMemory.replay()의 Consolidation은 쌓인 작업을 모두 처리할 때까지
+끝나지 않으므로, 작업이 많으면 휴지기 안에 끝나지 않고 다음 제어 주기를 늦춥니다.
+Consolidation Budget은 호출마다 상한을 두고, 남은 작업은 다음 휴지기로 넘깁니다:
+
+    max_ms:      경과 시간 상한 [ms] (Place 하나를 처리할 때마다 확인)
+    max_places:  처리할 Place 업데이트 수 상한
+
+상한에 닿으면 처리 중인 Place까지만 끝내고 멈추며 (호출마다 최소 1개는 처리, backlog가 줄어듦을 보장),
+호출한 쪽은 재개 커서와 backlog 크기를 보관합니다.
+
+사용 예:
+    meter = ConsolidationBudget(max_ms=2.0).meter()
+    for item in pending:
+        process(item)
+        meter.spend()
+        if meter.exhausted:
+            break  # 남은 작업은 다음 휴지기에
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+from typing import Callable, Optional
+from dataclasses import dataclass
+import time
+
+
+@dataclass
+class ConsolidationBudget:
+    """
+    Consolidation 호출 1회 상한 (None이면 제한 없음)
+    """
+    max_ms: Optional[float] = None  # 경과 시간 상한 [ms]
+    max_places: Optional[int] = None  # Place 업데이트 수 상한
+
+    def __post_init__(self):
+        assert self.max_ms is None or self.max_ms > 0, f"max_ms ({self.max_ms}) must be > 0"
+        assert self.max_places is None or self.max_places > 0, \
+            f"max_places ({self.max_places}) must be > 0"
+
+    @property
+    def unlimited(self) -> bool:
+        return self.max_ms is None and self.max_places is None
+
+    def meter(self, clock: Callable[[], float] = time.perf_counter) -> 'BudgetMeter':
+        """지금부터 상한을 재는 meter"""
+        return BudgetMeter(self, clock)
+
+
+class BudgetMeter:
+    """
+    Consolidation 호출 1회의 사용량 (처리한 Place 수 + 마감 시각)
+    """
+
+    __slots__ = ('max_places', 'deadline', 'clock', 'used')
+
+    def __init__(self, budget: ConsolidationBudget, clock: Callable[[], float] = time.perf_counter):
+        self.max_places = budget.max_places
+        self.deadline = None if budget.max_ms is None else clock() + budget.max_ms / 1000.0
+        self.clock = clock
+        self.used = 0  # 처리한 Place 업데이트 수
+
+    def spend(self, places: int = 1) -> None:
+        self.used += places
+
+    @property
+    def exhausted(self) -> bool:
+        """상한에 닿았는지 (작업 수 → 시간 순으로 확인)"""
+        if self.max_places is not None and self.used >= self.max_places:
+            return True
+        return self.deadline is not None and self.clock() >= self.deadline
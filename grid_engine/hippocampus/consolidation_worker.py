@@ -0,0 +1,443 @@
+"""
+Consolidation Worker Module
+Replay/Consolidation을 제어 스레드 밖 (백그라운드 스레드)에서 수행
+
+Grid5DEngine.update()는 휴지기가 감지되면 안정 구간 추출 → 그룹화 → Place/Context bias 업데이트
+→ Consolidation을 같은 호출 안에서 수행하므로, 그동안 제어 틱이 멈춥니다.
+Consolidation Worker는 이 중 쓰기 작업을 백그라운드 스레드로 옮깁니다:
+
+    제어 스레드:  Replay Buffer 그룹 결과 (복사된 배열) → submit() (상한 있는 큐, 가득 차면 버림, 대기 없음)
+    작업 스레드:  큐에서 꺼내 Place/Context 기억 업데이트 → 읽기 전용 MemorySnapshot 생성 → 교체
+                  (이전 snapshot 배열 복사 + 작업이 건드린 행만 기억에서 다시 읽음, MemorySnapshot.updated)
+    제어 스레드:  provide_reference()는 최신 snapshot만 읽음 (잠금/대기 없음)
+
+snapshot 교체는 속성 대입 한 번이므로 원자적이며 (GIL), 한 번 공개된 snapshot은 바뀌지 않습니다.
+작업 스레드가 동작하는 동안 실제 Place/Context 기억은 작업 스레드만 수정합니다.
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+import math
+import queue
+import threading
+import time
+import numpy as np
+
+
+@dataclass
+class ConsolidationJob:
+    """
+    Consolidation 작업 (Replay Buffer snapshot)
+
+    groups는 ReplayBuffer.summary_groups() 결과이며 Replay Buffer와 메모리를 공유하지 않습니다.
+    동기 Replay에서 시간/작업량 상한에 닿으면 cursor부터 다음 휴지기에 이어서 처리합니다.
+    """
+    groups: Dict[str, np.ndarray]  # (place, context) 그룹 통계
+    current_time: float  # Replay 시각 [s]
+    cursor: int = 0  # 재개 위치 (이미 처리한 그룹 수) ✨ NEW
+
+    @property
+    def remaining(self) -> int:
+        """아직 처리하지 않은 그룹 수"""
+        return len(self.groups['place_ids']) - self.cursor
+
+
+class MemorySnapshot:
+    """
+    읽기 전용 기억 snapshot (Reference 경로용)
+
+    Place 중심/bias와 Context bias를 배열로 복사해 두고, 읽기만 합니다
+    (PlaceCellManager.get_bias_estimate와 달리 Place를 만들거나 중심을 채우지 않음).
+    """
+
+    def __init__(
+        self,
+        place_ids: np.ndarray,
+        centers: np.ndarray,
+        has_center: np.ndarray,
+        place_biases: np.ndarray,
+        context_keys: Dict[Tuple[int, int], int],
+        context_biases: np.ndarray,
+        phase_wrap: float = 2.0 * math.pi,
+        version: int = 0,
+        context_evictions: int = 0,
+        place_removals: int = 0
+    ):
+        """
+        Args:
+            place_ids: Place ID, shape (P,)
+            centers: Place Field 중심, shape (P, D)
+            has_center: 중심 유무, shape (P,)
+            place_biases: Place bias, shape (P, D)
+            context_keys: (place_id, context_id) → context_biases 행
+            context_biases: Context bias, shape (C, D)
+            phase_wrap: 위상 wrapping 값
+            version: snapshot 번호 (공개 순서)
+            context_evictions: 생성 시점의 Context Store 제거 누적 수 (updated()의 제거 감지용)
+            place_removals: 생성 시점의 PlaceCellManager.removals (updated()의 Place 제거 감지용) ✨ NEW
+        """
+        self.place_ids = place_ids
+        self.centers = centers
+        self.has_center = has_center
+        self.place_biases = place_biases
+        self.context_keys = context_keys
+        self.context_biases = context_biases
+        self.phase_wrap = phase_wrap
+        self.version = version
+        self.context_evictions = context_evictions
+        self.place_removals = place_removals
+        self.dim = place_biases.shape[1]
+        self._place_row: Dict[int, int] = {place_id: row for row, place_id in enumerate(place_ids.tolist())}
+        for array in (place_ids, centers, has_center, place_biases, context_biases):
+            array.setflags(write=False)
+
+    @classmethod
+    def capture(
+        cls,
+        place_manager,
+        context_binder=None,
+        version: int = 0
+    ) -> "MemorySnapshot":
+        """
+        PlaceCellManager (+ ContextBinder) 현재 값 복사
+
+        Args:
+            place_manager: PlaceCellManager (storage="dict" / "bank")
+            context_binder: ContextBinder (None이면 Context 없음)
+            version: snapshot 번호
+
+        Returns:
+            MemorySnapshot
+        """
+        bank = place_manager.bank
+        if bank is not None:
+            n = bank.size
+            place_ids = bank.ids[:n].copy()
+            centers = bank.centers[:n].copy()
+            has_center = bank.has_center[:n].copy()
+            place_biases = bank.biases[:n].copy()
+            dim = bank.dim
+        else:
+            memories = list(place_manager.place_memory.values())
+            dim = len(memories[0].bias_estimate) if memories else 5
+            place_ids = np.array([memory.place_id for memory in memories], dtype=np.int64)
+            has_center = np.array([memory.place_center is not None for memory in memories], dtype=bool)
+            centers = np.zeros((len(memories), dim))
+            for row, memory in enumerate(memories):
+                if memory.place_center is not None:
+                    centers[row] = memory.place_center
+            place_biases = np.array([memory.bias_estimate for memory in memories]).reshape(-1, dim)
+
+        context_evictions = 0
+        if context_binder is not None:
+            store = context_binder.context_memory
+            keys = store.keys()
+            context_keys = {key: row for row, key in enumerate(keys)}
+            context_biases = store.biases[[store.row_of(key) for key in keys]].reshape(-1, store.dim)
+            context_evictions = sum(store.evictions.values())
+        else:
+            context_keys = {}
+            context_biases = np.zeros((0, dim))
+
+        return cls(
+            place_ids=place_ids,
+            centers=centers,
+            has_center=has_center,
+            place_biases=place_biases,
+            context_keys=context_keys,
+            context_biases=context_biases,
+            phase_wrap=place_manager.phase_wrap,
+            version=version,
+            context_evictions=context_evictions,
+            place_removals=place_manager.removals
+        )
+
+    def updated(
+        self,
+        place_manager,
+        context_binder=None,
+        place_ids: Optional[np.ndarray] = None,
+        context_keys: Optional[List[Tuple[int, int]]] = None,
+        version: Optional[int] = None
+    ) -> "MemorySnapshot":
+        """
+        작업이 건드린 행만 다시 읽은 새 snapshot (이 snapshot은 바뀌지 않음)
+
+        배열은 통째로 복사하고 (memcpy), 기억 객체는 place_ids / context_keys 행만 읽습니다.
+        capture()처럼 Place마다 기억을 읽지 않으므로 작업 비용이 전체 기억 수에 비례하지 않습니다.
+        그 사이에 Place/Context가 삭제되었으면 (Place/Context 제거 누적 수가 바뀌었거나 행 수가 맞지 않음)
+        capture()로 전체를 다시 읽습니다 (병합으로 k개 제거 + 새 Place k개처럼 행 수가 같아도).
+
+        Args:
+            place_manager: capture()에 쓴 PlaceCellManager
+            context_binder: capture()에 쓴 ContextBinder (None이면 Context 없음)
+            place_ids: 작업이 업데이트한 Place ID
+            context_keys: 작업이 업데이트한 (place_id, context_id)
+            version: 새 snapshot 번호 (None이면 self.version + 1)
+
+        Returns:
+            MemorySnapshot
+        """
+        version = self.version + 1 if version is None else version
+        place_memory = place_manager.place_memory
+        if place_manager.removals != self.place_removals:
+            return self.capture(place_manager, context_binder, version=version)
+
+        # Place: 기존 행 갱신 + 새 Place 행 추가 (처음 등장 순서)
+        place_rows, new_place_ids = {}, []
+        for place_id in ([] if place_ids is None else np.asarray(place_ids).tolist()):
+            if place_id in place_rows or place_id not in place_memory:
+                continue
+            row = self._place_row.get(place_id)
+            if row is None:
+                row = len(self.place_ids) + len(new_place_ids)
+                new_place_ids.append(place_id)
+            place_rows[place_id] = row
+        if len(place_memory) != len(self.place_ids) + len(new_place_ids):
+            return self.capture(place_manager, context_binder, version=version)
+
+        store = context_binder.context_memory if context_binder is not None else None
+        if store is not None and sum(store.evictions.values()) != self.context_evictions:
+            return self.capture(place_manager, context_binder, version=version)
+
+        count = len(self.place_ids) + len(new_place_ids)
+        new_ids = np.concatenate([self.place_ids, np.array(new_place_ids, dtype=np.int64)])
+        centers = np.zeros((count, self.dim))
+        centers[:len(self.place_ids)] = self.centers
+        has_center = np.zeros(count, dtype=bool)
+        has_center[:len(self.place_ids)] = self.has_center
+        place_biases = np.zeros((count, self.dim))
+        place_biases[:len(self.place_ids)] = self.place_biases
+        for place_id, row in place_rows.items():
+            memory = place_memory[place_id]
+            place_biases[row] = memory.bias_estimate
+            center = memory.place_center
+            has_center[row] = center is not None
+            centers[row] = 0.0 if center is None else center
+
+        # Context: 기존 행 갱신 + 새 키 행 추가
+        context_index = self.context_keys
+        context_biases = self.context_biases
+        if store is not None and len(store) != len(context_index) + len(
+            {key for key in (context_keys or []) if key in store and key not in context_index}
+        ):
+            return self.capture(place_manager, context_binder, version=version)
+        if store is not None and context_keys:
+            context_index = dict(self.context_keys)
+            new_keys = [key for key in dict.fromkeys(context_keys) if key in store and key not in context_index]
+            for key in new_keys:
+                context_index[key] = len(context_index)
+            context_biases = np.zeros((len(context_index), store.dim))
+            context_biases[:len(self.context_biases)] = self.context_biases
+            for key in dict.fromkeys(context_keys):
+                if key in store:
+                    context_biases[context_index[key]] = store.biases[store.row_of(key)]
+
+        return MemorySnapshot(
+            place_ids=new_ids,
+            centers=centers,
+            has_center=has_center,
+            place_biases=place_biases,
+            context_keys=context_index,
+            context_biases=context_biases,
+            phase_wrap=self.phase_wrap,
+            version=version,
+            context_evictions=self.context_evictions,
+            place_removals=self.place_removals
+        )
+
+    def __len__(self) -> int:
+        return len(self.place_ids)
+
+    def get_context_bias(self, place_id: int, context_id: int) -> np.ndarray:
+        """Place + Context 조합의 bias (없으면 0 벡터, ContextBinder.get_bias_estimate와 같음)"""
+        row = self.context_keys.get((place_id, context_id))
+        if row is None:
+            return np.zeros(self.context_biases.shape[1] if len(self.context_biases) else self.dim)
+        return self.context_biases[row].copy()
+
+    def get_place_bias(
+        self,
+        phase_vector: np.ndarray,
+        place_id: int,
+        use_blending: bool = True,
+        top_k: int = 5,
+        sigma: float = 0.5,
+        min_activation: float = 1e-5
+    ) -> np.ndarray:
+        """
+        Place bias (Soft-switching: 상위 K개 Place의 가우시안 가중 평균, PlaceBank.top_k와 같음)
+
+        활성화된 Place가 없으면 place_id의 bias (없으면 0 벡터)를 반환합니다.
+        """
+        if use_blending and len(self.place_ids) > 0:
+            diff = phase_vector - self.centers
+            diff -= self.phase_wrap * np.round(diff / self.phase_wrap)
+            activation = np.exp(-np.einsum('ij,ij->i', diff, diff) / (2 * sigma ** 2))
+            activation[~self.has_center] = 0.0
+            if top_k < len(activation):
+                rows = np.argpartition(-activation, top_k - 1)[:top_k]
+            else:
+                rows = np.arange(len(activation))
+            rows = rows[activation[rows] > min_activation]
+            if len(rows) > 0:
+                weights = activation[rows]
+                total_activation = weights.sum()
+                if total_activation < 1e-10:
+                    return np.zeros(self.dim)
+                return (weights / total_activation) @ self.place_biases[rows]
+
+        row = self._place_row.get(place_id)
+        if row is None:
+            return np.zeros(self.dim)
+        return self.place_biases[row].copy()
+
+
+class ConsolidationWorker:
+    """
+    백그라운드 Consolidation 작업자 (스레드 1개 + 상한 있는 큐)
+
+    submit()은 절대 대기하지 않으며 (큐가 가득 차면 작업을 버리고 False 반환),
+    consolidate(job)의 반환값 (MemorySnapshot)을 snapshot으로 공개합니다.
+    """
+
+    _STOP = object()  # 종료 신호
+
+    def __init__(
+        self,
+        consolidate: Callable[[ConsolidationJob], MemorySnapshot],
+        max_queue_size: int = 4,
+        initial_snapshot: Optional[MemorySnapshot] = None,
+        clock: Callable[[], float] = time.perf_counter,
+        name: str = "consolidation-worker"
+    ):
+        """
+        Args:
+            consolidate: 작업 처리 함수 (작업 스레드에서 호출, 새 snapshot 반환)
+            max_queue_size: 큐 상한 (대기 중인 작업 수)
+            initial_snapshot: 첫 작업이 끝나기 전까지 공개할 snapshot
+            clock: 지연 시간 측정용 clock [s]
+            name: 스레드 이름
+        """
+        assert max_queue_size > 0, f"max_queue_size ({max_queue_size}) must be > 0"
+        self.consolidate = consolidate
+        self.max_queue_size = max_queue_size
+        self.clock = clock
+        self.snapshot: Optional[MemorySnapshot] = initial_snapshot
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue_size)
+        self._idle = threading.Condition()
+        self._pending = 0  # 큐 + 처리 중인 작업 수
+
+        # 통계
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0  # 큐가 가득 차 받지 않은 제출 수
+        self.failed = 0  # consolidate 예외 수
+        self.last_error: Optional[BaseException] = None
+        self.max_queue_depth = 0
+        self.last_latency = 0.0  # submit → snapshot 공개 [s]
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+        self.last_duration = 0.0  # consolidate 실행 시간 [s]
+        self.total_duration = 0.0
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def queue_depth(self) -> int:
+        """대기 중인 작업 수"""
+        return self._queue.qsize()
+
+    @property
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def submit(self, job: ConsolidationJob) -> bool:
+        """
+        작업 제출 (대기 없음)
+
+        Returns:
+            큐에 들어갔으면 True, 가득 차서 받지 않았으면 False (작업 보관/재제출은 호출자 몫)
+        """
+        with self._idle:
+            self._pending += 1
+        try:
+            self._queue.put_nowait((job, self.clock()))
+        except queue.Full:
+            with self._idle:
+                self._pending -= 1
+            self.dropped += 1
+            return False
+        self.submitted += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return True
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            job, submitted_at = item
+            started_at = self.clock()
+            try:
+                snapshot = self.consolidate(job)
+            except Exception as error:  # 작업 스레드는 계속 동작
+                self.failed += 1
+                self.last_error = error
+            else:
+                self.snapshot = snapshot  # 원자적 교체
+                finished_at = self.clock()
+                self.completed += 1
+                self.last_duration = finished_at - started_at
+                self.total_duration += self.last_duration
+                self.last_latency = finished_at - submitted_at
+                self.total_latency += self.last_latency
+                self.max_latency = max(self.max_latency, self.last_latency)
+            finally:
+                with self._idle:
+                    self._pending -= 1
+                    self._idle.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        제출된 작업이 모두 끝날 때까지 대기 (제어 루프 밖에서만 사용)
+
+        Returns:
+            모두 끝났으면 True, timeout이면 False
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """남은 작업을 처리한 뒤 작업 스레드 종료"""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """큐 깊이 / 처리 수 / 지연 시간 통계 [ms]"""
+        completed = max(1, self.completed)
+        return {
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'max_queue_size': self.max_queue_size,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'last_error': repr(self.last_error) if self.last_error is not None else None,
+            'snapshot_version': self.snapshot.version if self.snapshot is not None else None,
+            'last_latency_ms': self.last_latency * 1000.0,
+            'mean_latency_ms': self.total_latency / completed * 1000.0,
+            'max_latency_ms': self.max_latency * 1000.0,
+            'last_duration_ms': self.last_duration * 1000.0,
+            'mean_duration_ms': self.total_duration / completed * 1000.0,
+        }
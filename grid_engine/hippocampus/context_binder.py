@@ -14,10 +14,13 @@ Version: v0.4.0-alpha (Context Binder extension)
 License: MIT License
 """
 
-from typing import Dict, Tuple, Optional, Any
+from typing import Callable, Dict, Sequence, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
 import numpy as np
 import hashlib
+import time
+from .context_store import ContextRow, ContextStore
+from .context_schema import ContextSchema
 
 
 @dataclass
@@ -26,6 +29,7 @@ class ContextMemory:
     Place + Context 조합의 기억 데이터 구조
     
     각 (place_id, context_id) 조합마다 독립적인 bias 추정값을 저장합니다.
+    (ContextBinder는 ContextStore 배열에 저장하고 같은 인터페이스의 ContextRow를 반환합니다.)
     """
     place_id: int
     context_id: int
@@ -67,24 +71,81 @@ class ContextBinder:
     Place + Context 조합으로 기억을 분리합니다.
     """
     
-    def __init__(self, num_contexts: int = 10000):
+    def __init__(
+        self,
+        num_contexts: int = 10000,
+        max_interned: int = 4096,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        eviction: str = "lru",
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        dim: int = 5,
+        schema: Optional[ContextSchema] = None
+    ):
         """
         Context Binder 초기화
         
         Args:
             num_contexts: 최대 Context 수 (기본값: 10000)
+            max_interned: Context ID 캐시에 보관할 최대 외부 상태 수 (기본값: 4096) ✨ NEW
+            max_entries: 저장할 최대 (place_id, context_id) 조합 수 (None이면 상한 없음, 제거 없음) ✨ NEW
+            max_bytes: Context Memory 배열 메모리 상한 [bytes] (None이면 max_entries만 적용) ✨ NEW
+            eviction: 가득 찼을 때 제거 정책 ("lru", "lfu", "ttl") ✨ NEW
+            ttl: 접근 없이 유지되는 최대 시간 (clock 단위, None이면 만료 없음) ✨ NEW
+            clock: 현재 시간 함수 (기본값: time.monotonic) ✨ NEW
+            dim: bias 차원 (기본값: 5)
+            schema: Context Schema (주어지면 MD5 대신 양자화 정수 인코더 사용,
+                    num_contexts는 스키마의 코드 조합 수) ✨ NEW
         """
+        assert max_interned > 0, f"max_interned ({max_interned}) must be > 0"
         self.num_contexts = num_contexts
+        self.max_interned = max_interned
+        self.clock = clock
+        
+        # Context Schema 인코더 (None이면 MD5 해시) ✨ NEW
+        self.schema = schema
+        self.encoder = schema.compile() if schema is not None else None
+        if self.encoder is not None:
+            self.num_contexts = self.encoder.num_contexts
+        
+        # Context Memory 저장소: (place_id, context_id) → ContextRow (상한 + 제거 정책) ✨ NEW
+        self.context_memory = ContextStore(
+            dim=dim,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            policy=eviction,
+            ttl=ttl,
+            clock=clock
+        )
+        
+        # Context ID 캐시 (intern): 정규화된 외부 상태 → Context ID ✨ NEW
+        # 외부 상태마다 MD5는 처음 한 번만 계산 (가득 차면 가장 오래된 항목부터 제거)
+        self._context_ids: Dict[Tuple, int] = {}
+        self.context_id_hits: int = 0
+        self.context_id_misses: int = 0
+    
+    @staticmethod
+    def _intern_key(external_state: Dict[str, Any]) -> Tuple:
+        """
+        외부 상태 → 캐시 키 (키 정렬, 값 타입 포함)
         
-        # Context Memory 저장소: (place_id, context_id) → ContextMemory
-        self.context_memory: Dict[Tuple[int, int], ContextMemory] = {}
+        20과 20.0은 str()이 달라 Context ID도 다르므로 타입을 키에 포함합니다.
+        """
+        return tuple(
+            (key, type(value), value) for key, value in sorted(external_state.items())
+        )
     
     def get_context_id(
         self,
         external_state: Dict[str, Any]
     ) -> int:
         """
-        외부 상태를 Context ID로 변환
+        외부 상태를 Context ID로 변환 (캐시)
+        
+        스키마가 있으면 양자화 정수 인코더로 계산합니다 (캐시 없음).
+        없으면 같은 외부 상태는 처음 한 번만 MD5를 계산하고 이후에는 캐시에서 반환합니다.
+        값이 해시 불가능하면 (예: list) 캐시 없이 매번 계산합니다.
         
         외부 상태의 예:
         - tool_type: 공구 타입 (예: "tool_A", "tool_B")
@@ -98,6 +159,48 @@ class ContextBinder:
         Returns:
             Context ID (0 ~ num_contexts-1)
         """
+        if self.encoder is not None:
+            return self.encoder.encode(external_state)
+        
+        try:
+            key = self._intern_key(external_state)
+            context_id = self._context_ids.get(key)
+        except TypeError:
+            # 해시 불가능한 값: 캐시 없이 계산
+            self.context_id_misses += 1
+            return self._compute_context_id(external_state)
+        
+        if context_id is not None:
+            self.context_id_hits += 1
+            return context_id
+        
+        self.context_id_misses += 1
+        context_id = self._compute_context_id(external_state)
+        if len(self._context_ids) >= self.max_interned:
+            del self._context_ids[next(iter(self._context_ids))]
+        self._context_ids[key] = context_id
+        return context_id
+    
+    def get_context_ids(
+        self,
+        states: Union[Sequence[Dict[str, Any]], Dict[str, Sequence[Any]]]
+    ) -> np.ndarray:
+        """
+        외부 상태 로그 → Context ID 배열 (배치)
+        
+        Args:
+            states: 외부 상태 딕셔너리 리스트 또는 키별 열 {key: 값 배열} (열 형식은 스키마 필요)
+        
+        Returns:
+            Context ID 배열 (int64), shape (N,)
+        """
+        if self.encoder is not None:
+            return self.encoder.encode_batch(states)
+        assert not isinstance(states, dict), "column-wise states require a context schema"
+        return np.array([self.get_context_id(state) for state in states], dtype=np.int64)
+    
+    def _compute_context_id(self, external_state: Dict[str, Any]) -> int:
+        """외부 상태 → Context ID (MD5, 캐시 없음)"""
         # 외부 상태를 문자열로 변환하여 해시
         # 정렬하여 순서에 무관하게 동일한 상태는 동일한 Context ID 생성
         state_str = str(sorted(external_state.items()))
@@ -115,34 +218,25 @@ class ContextBinder:
         self,
         place_id: int,
         context_id: int
-    ) -> ContextMemory:
+    ) -> ContextRow:
         """
-        Context Memory 반환 (없으면 생성)
+        Context Memory 반환 (없으면 생성, 저장소가 가득 차면 정책에 따라 먼저 제거)
         
         Args:
             place_id: Place ID
             context_id: Context ID
         
         Returns:
-            ContextMemory 객체
+            ContextRow (ContextMemory와 같은 인터페이스)
         """
-        key = (place_id, context_id)
-        
-        if key not in self.context_memory:
-            # 새로운 Context Memory 생성
-            self.context_memory[key] = ContextMemory(
-                place_id=place_id,
-                context_id=context_id
-            )
-        
-        return self.context_memory[key]
+        return self.context_memory.get_or_add((place_id, context_id))
     
     def update_context_memory(
         self,
         place_id: int,
         context_id: int,
         bias: np.ndarray,
-        current_time: float = 0.0,
+        current_time: Optional[float] = None,
         learning_rate: float = 0.1
     ) -> None:
         """
@@ -152,7 +246,7 @@ class ContextBinder:
             place_id: Place ID
             context_id: Context ID
             bias: 새로운 bias 추정값
-            current_time: 현재 시간
+            current_time: 현재 시간 (None이면 clock())
             learning_rate: 학습률
         """
         context_memory = self.get_context_memory(place_id, context_id)
@@ -161,7 +255,36 @@ class ContextBinder:
         context_memory.update_bias(bias, learning_rate)
         
         # 방문 시간 업데이트
-        context_memory.last_visit_time = current_time
+        context_memory.last_visit_time = self.clock() if current_time is None else current_time
+    
+    def update_context_memories(
+        self,
+        place_ids: np.ndarray,
+        context_ids: np.ndarray,
+        biases: np.ndarray,
+        current_time: Optional[float] = None,
+        learning_rate: float = 0.1
+    ) -> None:
+        """
+        여러 Context Memory 일괄 업데이트 (Replay 그룹 결과용) ✨ NEW
+        
+        같은 (place_id, context_id)가 여러 번 나오면 순서대로 적용합니다 (update_context_memory와 같음).
+        
+        Args:
+            place_ids: Place ID 배열, shape (G,)
+            context_ids: Context ID 배열, shape (G,)
+            biases: 새로운 bias 추정값, shape (G, D)
+            current_time: 현재 시간 (None이면 clock())
+            learning_rate: 학습률
+        """
+        visit_time = self.clock() if current_time is None else current_time
+        get_or_add = self.context_memory.get_or_add
+        for place_id, context_id, bias in zip(
+            np.asarray(place_ids).tolist(), np.asarray(context_ids).tolist(), biases
+        ):
+            context_memory = get_or_add((place_id, context_id))
+            context_memory.update_bias(bias, learning_rate)
+            context_memory.last_visit_time = visit_time
     
     def get_bias_estimate(
         self,
@@ -169,7 +292,10 @@ class ContextBinder:
         context_id: int
     ) -> np.ndarray:
         """
-        Place + Context 조합의 bias 추정값 반환
+        Place + Context 조합의 bias 추정값 반환 (읽기 전용)
+        
+        제거 순서(LRU/LFU/TTL)는 바꾸지 않습니다. 접근 기록은 update_context_memory()만 남기므로
+        Background Consolidation 작업 스레드가 쓰는 동안에도 읽기가 저장소 상태를 바꾸지 않습니다.
         
         Args:
             place_id: Place ID
@@ -179,11 +305,12 @@ class ContextBinder:
             Bias 추정값 (없으면 0 벡터)
         """
         key = (place_id, context_id)
+        store = self.context_memory
         
-        if key not in self.context_memory:
-            return np.zeros(5)  # 초기값
+        if key not in store:
+            return np.zeros(store.dim)  # 초기값
         
-        return self.context_memory[key].bias_estimate.copy()
+        return store.biases[store.row_of(key)].copy()
     
     def get_statistics(self) -> Dict[str, any]:
         """
@@ -192,56 +319,84 @@ class ContextBinder:
         Returns:
             통계 정보 딕셔너리
         """
-        if not self.context_memory:
+        store = self.context_memory
+        
+        # Context ID 캐시 통계 ✨ NEW
+        registry_stats = {
+            'num_interned_states': len(self._context_ids),
+            'context_id_hits': self.context_id_hits,
+            'context_id_misses': self.context_id_misses,
+        }
+        
+        # 저장소 상한/제거 통계 ✨ NEW
+        store_stats = {
+            'max_entries': store.max_entries,
+            'eviction_policy': store.policy,
+            'evictions_capacity': store.evictions['capacity'],
+            'evictions_ttl': store.evictions['ttl'],
+            'evictions_manual': store.evictions['manual'],
+        }
+        
+        if len(store) == 0:
             return {
                 'num_contexts': 0,
                 'total_visits': 0,
                 'avg_visits_per_context': 0.0,
-                'memory_size_bytes': 0
+                'memory_size_bytes': 0,
+                **registry_stats,
+                **store_stats
             }
         
-        total_visits = sum(c.visit_count for c in self.context_memory.values())
-        num_contexts = len(self.context_memory)
+        total_visits = int(store.visit_counts[:store.size].sum())
+        num_contexts = len(store)
         
-        # 메모리 사용량 추정 (대략적)
-        # ContextMemory: 약 200 bytes per context
-        memory_size_bytes = num_contexts * 200
+        # 메모리 사용량 (사용 중인 배열 행)
+        memory_size_bytes = store.nbytes
         
         return {
             'num_contexts': num_contexts,
             'total_visits': total_visits,
             'avg_visits_per_context': total_visits / num_contexts if num_contexts > 0 else 0.0,
             'memory_size_bytes': memory_size_bytes,
-            'memory_size_kb': memory_size_bytes / 1024.0
+            'memory_size_kb': memory_size_bytes / 1024.0,
+            **registry_stats,
+            **store_stats
         }
     
     def clear_unused_contexts(
         self,
         min_visits: int = 2,
-        max_age: float = 3600.0  # 1시간
+        max_age: float = 3600.0,  # 1시간
+        current_time: Optional[float] = None
     ) -> int:
         """
         사용되지 않는 Context Memory 정리
         
+        나이:
+            - current_time이 없으면: clock() - 마지막 접근 시간 (clock 기준)
+            - current_time이 있으면: current_time - last_visit_time (호출자 시간 기준)
+        
         Args:
-            min_visits: 최소 방문 횟수 (이하이면 삭제)
-            max_age: 최대 나이 (초, 초과이면 삭제)
+            min_visits: 최소 방문 횟수 (미만이면 삭제)
+            max_age: 최대 나이 (초과이면 삭제)
+            current_time: 현재 시간 (None이면 clock())
         
         Returns:
             삭제된 Context 수
         """
-        current_time = 0.0  # 실제로는 외부에서 전달받아야 함
-        keys_to_delete = []
+        store = self.context_memory
+        n = store.size
+        if current_time is None:
+            age = self.clock() - store.last_access_times[:n]
+        else:
+            age = current_time - store.last_visit_times[:n]
         
-        for key, context_memory in self.context_memory.items():
-            age = current_time - context_memory.last_visit_time
-            
-            if (context_memory.visit_count < min_visits or
-                age > max_age):
-                keys_to_delete.append(key)
+        stale = (store.visit_counts[:n] < min_visits) | (age > max_age)
+        keys_to_delete = list(zip(
+            store.place_ids[:n][stale].tolist(), store.context_ids[:n][stale].tolist()
+        ))
         
         for key in keys_to_delete:
-            del self.context_memory[key]
+            store.remove(key)
         
         return len(keys_to_delete)
-
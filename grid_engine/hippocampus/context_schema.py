@@ -0,0 +1,220 @@
+"""
+Context Schema Module
+외부 상태를 양자화하여 작은 정수 Context ID로 변환하는 선언적 스키마
+
+ContextBinder.get_context_id는 외부 상태 값을 그대로 MD5로 해시하므로
+20.01°C와 20.02°C가 서로 다른 Context가 되고, 측정 잡음마다 다시 방문되지 않는
+Context Memory가 생깁니다.
+Context Schema는 키별 변환 규칙을 선언하고, 이를 혼합 기수 (mixed-radix) 정수 인코더로 컴파일합니다:
+
+    bins:       수치 키 → 구간 경계 (edges, 오름차순), 코드 = searchsorted(edges, x, 'right')
+    categories: 범주 키 → 어휘 (vocabulary), 코드 = 어휘 내 위치
+    ignore:     무시할 키 (Context에 영향 없음)
+
+키별 코드 수 (cardinality):
+    bins:       len(edges) + 2  (구간 len(edges) + 1개, 마지막 코드 = 값 없음/NaN)
+    categories: len(vocab) + 1  (마지막 코드 = 값 없음/어휘 밖)
+
+Context ID = Σ code_k · stride_k (키 이름 순서, 0 ~ num_contexts - 1, 조밀)
+
+사용 예:
+    schema = ContextSchema(
+        bins={'temperature': [18.0, 20.0, 22.0, 24.0]},
+        categories={'tool_type': ['tool_A', 'tool_B']},
+        ignore=['timestamp']
+    )
+    binder = ContextBinder(schema=schema)
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+from typing import Any, Dict, Hashable, List, Mapping, Sequence, Union
+from dataclasses import dataclass, field
+import bisect
+import math
+import numbers
+import numpy as np
+
+
+@dataclass
+class ContextSchema:
+    """
+    Context Schema 설정
+
+    bins/categories에 없는 키는 ignore에 있거나 ignore_unknown=True이면 무시하고,
+    아니면 인코딩 시 ValueError를 발생시킵니다.
+    """
+    # 수치 키 → 구간 경계 (오름차순)
+    bins: Dict[str, Sequence[float]] = field(default_factory=dict)
+
+    # 범주 키 → 어휘
+    categories: Dict[str, Sequence[Hashable]] = field(default_factory=dict)
+
+    # 무시할 키
+    ignore: Sequence[str] = ()
+
+    # 선언되지 않은 키 무시 여부 (False면 ValueError)
+    ignore_unknown: bool = False
+
+    def __post_init__(self):
+        """설정 검증"""
+        overlap = set(self.bins) & set(self.categories)
+        assert not overlap, f"keys {sorted(overlap)} declared as both bins and categories"
+        ignored = set(self.ignore) & (set(self.bins) | set(self.categories))
+        assert not ignored, f"keys {sorted(ignored)} are both declared and ignored"
+        for key, edges in self.bins.items():
+            edges = np.asarray(edges, dtype=np.float64)
+            assert edges.ndim == 1 and len(edges) > 0, f"bins[{key!r}] must be a non-empty 1D sequence"
+            assert np.all(np.diff(edges) > 0), f"bins[{key!r}] edges must be strictly increasing"
+        for key, vocab in self.categories.items():
+            assert len(vocab) > 0, f"categories[{key!r}] must be non-empty"
+            assert len(set(vocab)) == len(vocab), f"categories[{key!r}] has duplicate values"
+
+    def compile(self) -> "ContextEncoder":
+        """인코더로 컴파일"""
+        return ContextEncoder(self)
+
+
+class ContextEncoder:
+    """
+    컴파일된 Context Schema (외부 상태 → 조밀한 정수 Context ID)
+
+    encode()는 딕셔너리 하나, encode_batch()는 로그 (딕셔너리 리스트 또는 키별 열)를 변환합니다.
+    """
+
+    def __init__(self, schema: ContextSchema):
+        self.schema = schema
+        self.keys: List[str] = sorted(list(schema.bins) + list(schema.categories))
+        self._ignore = frozenset(schema.ignore)
+        self._edges: Dict[str, np.ndarray] = {
+            key: np.asarray(edges, dtype=np.float64) for key, edges in schema.bins.items()
+        }
+        self._edge_lists: Dict[str, List[float]] = {
+            key: edges.tolist() for key, edges in self._edges.items()
+        }
+        self._vocab: Dict[str, Dict[Hashable, int]] = {
+            key: {value: code for code, value in enumerate(vocab)}
+            for key, vocab in schema.categories.items()
+        }
+
+        # 키별 코드 수 / 혼합 기수 stride (마지막 키의 stride = 1)
+        self.cardinalities: Dict[str, int] = {}
+        for key in self.keys:
+            if key in self._edges:
+                self.cardinalities[key] = len(self._edges[key]) + 2
+            else:
+                self.cardinalities[key] = len(self._vocab[key]) + 1
+        self.strides: Dict[str, int] = {}
+        stride = 1
+        for key in reversed(self.keys):
+            self.strides[key] = stride
+            stride *= self.cardinalities[key]
+        self.num_contexts = stride
+        assert self.num_contexts <= np.iinfo(np.int64).max, \
+            f"schema cardinality ({self.num_contexts}) exceeds int64"
+
+    def _check_keys(self, keys) -> None:
+        if self.schema.ignore_unknown:
+            return
+        unknown = [key for key in keys if key not in self.strides and key not in self._ignore]
+        if unknown:
+            raise ValueError(f"external_state keys {sorted(unknown)} are not declared in the context schema")
+
+    @staticmethod
+    def _not_numeric(key: str, value: Any) -> ValueError:
+        return ValueError(f"bins[{key!r}] expects a numeric value, got {type(value).__name__} ({value!r})")
+
+    def _bin_code(self, key: str, value: Any) -> int:
+        edges = self._edge_lists[key]
+        if value is None:
+            return len(edges) + 1
+        # np.float32 등 모든 실수 타입의 NaN은 값 없음 (encode_batch와 같음) ✨ NEW
+        if not isinstance(value, numbers.Real):
+            raise self._not_numeric(key, value)
+        if math.isnan(value):
+            return len(edges) + 1
+        return bisect.bisect_right(edges, value)  # == searchsorted(edges, value, 'right')
+
+    def encode(self, external_state: Mapping[str, Any]) -> int:
+        """
+        외부 상태 → Context ID
+
+        Args:
+            external_state: 외부 상태 딕셔너리
+
+        Returns:
+            Context ID (0 ~ num_contexts - 1)
+        """
+        self._check_keys(external_state)
+        context_id = 0
+        for key in self.keys:
+            value = external_state.get(key)
+            if key in self._edge_lists:
+                code = self._bin_code(key, value)
+            else:
+                vocab = self._vocab[key]
+                code = vocab.get(value, len(vocab)) if isinstance(value, Hashable) else len(vocab)
+            context_id += code * self.strides[key]
+        return context_id
+
+    def encode_batch(
+        self,
+        states: Union[Sequence[Mapping[str, Any]], Mapping[str, Sequence[Any]]]
+    ) -> np.ndarray:
+        """
+        외부 상태 로그 → Context ID 배열 (키별 벡터화)
+
+        Args:
+            states: 딕셔너리 리스트 또는 키별 열 {key: 값 배열} (모든 열의 길이가 같아야 함)
+
+        Returns:
+            Context ID 배열 (int64), shape (N,)
+        """
+        if isinstance(states, Mapping):
+            self._check_keys(states)
+            lengths = {len(column) for column in states.values()}
+            assert len(lengths) <= 1, "all columns must have the same length"
+            n = lengths.pop() if lengths else 0
+            columns = {key: states.get(key) for key in self.keys}
+        else:
+            n = len(states)
+            for state in states:
+                self._check_keys(state)
+            columns = {key: [state.get(key) for state in states] for key in self.keys}
+
+        context_ids = np.zeros(n, dtype=np.int64)
+        for key in self.keys:
+            column = columns[key]
+            if key in self._edges:
+                edges = self._edges[key]
+                if column is None:
+                    codes = np.full(n, len(edges) + 1, dtype=np.int64)
+                else:
+                    # 숫자가 아닌 값은 encode()와 같이 ValueError ("1.5" 같은 문자열도 변환하지 않음) ✨ NEW
+                    if isinstance(column, np.ndarray) and column.dtype.kind in "iuf":
+                        values = column.astype(np.float64)
+                    else:
+                        column = column.tolist() if isinstance(column, np.ndarray) else column
+                        for value in column:
+                            if value is not None and not isinstance(value, numbers.Real):
+                                raise self._not_numeric(key, value)
+                        values = np.array(
+                            [np.nan if value is None else value for value in column], dtype=np.float64
+                        )
+                    codes = np.searchsorted(edges, values, side='right').astype(np.int64)
+                    codes[np.isnan(values)] = len(edges) + 1
+            else:
+                vocab = self._vocab[key]
+                if column is None:
+                    codes = np.full(n, len(vocab), dtype=np.int64)
+                else:
+                    codes = np.array([
+                        vocab.get(value, len(vocab)) if isinstance(value, Hashable) else len(vocab)
+                        for value in (column.tolist() if isinstance(column, np.ndarray) else column)
+                    ], dtype=np.int64).reshape(n)
+            context_ids += codes * self.strides[key]
+        return context_ids
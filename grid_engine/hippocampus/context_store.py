@@ -0,0 +1,390 @@
+"""
+Context Store Module
+Place + Context 기억을 용량/바이트 상한이 있는 연속 배열에 저장하는 Context Binder 저장소
+
+ContextBinder.context_memory는 (place_id, context_id) 조합마다 ContextMemory 객체를 만들고
+지우지 않았으므로, 공구/온도가 계속 바뀌는 장기 실행에서 메모리가 계속 늘었습니다.
+Context Store는 같은 데이터를 고정 상한의 배열에 저장하고, 가득 차면 정책에 따라 제거합니다:
+
+    place_ids (N,), context_ids (N,)            키
+    biases (N × D), visit_counts (N,)           bias 추정값 / 방문 횟수
+    last_visit_times (N,)                       호출자가 전달한 방문 시간
+    last_access_times (N,), access_counts (N,)  clock() 기준 접근 시간 / 접근 횟수 (제거 정책용)
+    (place_id, context_id) → 행 딕셔너리        (dense: 삭제 시 마지막 행을 빈 행으로 이동)
+
+상한은 선택 사항입니다 (max_entries / max_bytes가 None이면 제거 없이 늘어남).
+
+제거 정책 (모두 상수 시간):
+    - "lru": 가장 오래 전에 접근한 항목 (접근 순서 OrderedDict)
+    - "lfu": 접근 횟수가 가장 적은 항목 (횟수별 OrderedDict, 동률이면 LRU)
+             살아 있는 횟수들은 오름차순 연결 리스트로 유지 (최소 횟수 = 머리)
+    - "ttl": 용량 초과 시 LRU와 같음 + ttl마다 만료
+    ttl이 주어지면 정책과 무관하게 clock() - last_access_time > ttl인 항목을 만료시킵니다.
+
+시간은 주입된 clock (기본값: time.monotonic)으로 측정합니다 (테스트/시뮬레이션 시간 주입 가능).
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from collections import OrderedDict
+import time
+import numpy as np
+
+ContextKey = Tuple[int, int]
+
+
+class ContextRow:
+    """
+    Context Store 행 view (ContextMemory와 같은 인터페이스)
+
+    행 번호는 삭제 시 바뀔 수 있으므로 키로 매번 행을 찾습니다.
+    bias_estimate는 store 행렬의 view입니다.
+    """
+
+    __slots__ = ("store", "place_id", "context_id")
+
+    def __init__(self, store: "ContextStore", place_id: int, context_id: int):
+        self.store = store
+        self.place_id = place_id
+        self.context_id = context_id
+
+    @property
+    def _row(self) -> int:
+        return self.store.row_of((self.place_id, self.context_id))
+
+    def __repr__(self) -> str:
+        return (
+            f"ContextRow(place_id={self.place_id!r}, context_id={self.context_id!r}, "
+            f"row={self._row})"
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ContextRow):
+            return NotImplemented
+        return (
+            self.store is other.store and self.place_id == other.place_id
+            and self.context_id == other.context_id
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.store), self.place_id, self.context_id))
+
+    @property
+    def bias_estimate(self) -> np.ndarray:
+        return self.store.biases[self._row]
+
+    @bias_estimate.setter
+    def bias_estimate(self, value: np.ndarray):
+        self.store.biases[self._row] = value
+
+    @property
+    def visit_count(self) -> int:
+        return int(self.store.visit_counts[self._row])
+
+    @visit_count.setter
+    def visit_count(self, value: int):
+        self.store.visit_counts[self._row] = value
+
+    @property
+    def last_visit_time(self) -> float:
+        return float(self.store.last_visit_times[self._row])
+
+    @last_visit_time.setter
+    def last_visit_time(self, value: float):
+        self.store.last_visit_times[self._row] = value
+
+    def update_bias(self, new_bias: np.ndarray, learning_rate: float = 0.1) -> None:
+        """Context별 bias 업데이트 (지수 이동 평균, ContextMemory.update_bias와 같음)"""
+        row = self._row
+        store = self.store
+        if store.visit_counts[row] == 0:
+            store.biases[row] = new_bias
+        else:
+            store.biases[row] = learning_rate * new_bias + (1 - learning_rate) * store.biases[row]
+        store.visit_counts[row] += 1
+
+
+class ContextStore:
+    """
+    Context Store (용량/바이트 상한, 제거 정책이 있는 배열 저장소)
+
+    (place_id, context_id) → ContextRow 매핑처럼 사용할 수 있습니다 (in, len, [], keys/values/items, del).
+    매핑 접근은 제거 순서를 바꾸지 않으며, touch()/get_or_add()만 접근으로 기록됩니다.
+    """
+
+    POLICIES = ("lru", "lfu", "ttl")
+
+    _COLUMNS = (
+        'place_ids', 'context_ids', 'biases', 'visit_counts', 'last_visit_times',
+        'last_access_times', 'access_counts'
+    )
+
+    def __init__(
+        self,
+        dim: int = 5,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        policy: str = "lru",
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        capacity: int = 1024
+    ):
+        """
+        Args:
+            dim: bias 차원 (기본값: 5)
+            max_entries: 최대 항목 수 (None이면 상한 없음)
+            max_bytes: 배열 메모리 상한 [bytes] (None이면 max_entries만 적용)
+            policy: 용량 초과 시 제거 정책 ("lru", "lfu", "ttl")
+            ttl: 항목 수명 (clock 단위, None이면 만료 없음, policy="ttl"이면 필수)
+            clock: 현재 시간 함수 (기본값: time.monotonic)
+            capacity: 초기 행 수 (가득 차면 상한까지 두 배로 늘림)
+        """
+        assert dim > 0, f"dim ({dim}) must be > 0"
+        assert max_entries is None or max_entries > 0, f"max_entries ({max_entries}) must be > 0"
+        assert policy in self.POLICIES, f"policy ({policy!r}) must be one of {self.POLICIES}"
+        assert ttl is None or ttl > 0, f"ttl ({ttl}) must be > 0"
+        assert policy != "ttl" or ttl is not None, "policy='ttl' requires ttl"
+        self.dim = dim
+        self.policy = policy
+        self.ttl = ttl
+        self.clock = clock
+
+        # 바이트 상한 → 행 수 상한 (둘 다 None이면 상한 없음)
+        self.row_nbytes = 8 * (6 + dim)
+        self.max_entries = max_entries
+        if max_bytes is not None:
+            byte_rows = max_bytes // self.row_nbytes
+            self.max_entries = byte_rows if max_entries is None else min(max_entries, byte_rows)
+            assert self.max_entries > 0, \
+                f"max_bytes ({max_bytes}) must hold at least one row ({self.row_nbytes} bytes)"
+        self.max_bytes = max_bytes
+        self.size = 0
+
+        self._row_of: Dict[ContextKey, int] = {}
+        # 접근 순서 (오래된 것부터) / LFU: 접근 횟수 → 키 (오래된 것부터)
+        self._recency: "OrderedDict[ContextKey, None]" = OrderedDict()
+        self._frequency: Dict[int, "OrderedDict[ContextKey, None]"] = {}
+        # LFU: 살아 있는 접근 횟수의 오름차순 연결 리스트 (횟수 → 다음/이전 횟수, 머리 = 최소)
+        self._next_frequency: Dict[int, Optional[int]] = {}
+        self._prev_frequency: Dict[int, Optional[int]] = {}
+        self._min_frequency: Optional[int] = None
+
+        # 제거 통계
+        self.evictions: Dict[str, int] = {'capacity': 0, 'ttl': 0, 'manual': 0}
+
+        self._allocate(capacity if self.max_entries is None else min(capacity, self.max_entries))
+
+    def _allocate(self, capacity: int) -> None:
+        """배열 (재)할당, 기존 행 보존"""
+        arrays = {
+            'place_ids': np.zeros(capacity, dtype=np.int64),
+            'context_ids': np.zeros(capacity, dtype=np.int64),
+            'biases': np.zeros((capacity, self.dim), dtype=np.float64),
+            'visit_counts': np.zeros(capacity, dtype=np.int64),
+            'last_visit_times': np.zeros(capacity, dtype=np.float64),
+            'last_access_times': np.zeros(capacity, dtype=np.float64),
+            'access_counts': np.zeros(capacity, dtype=np.int64),
+        }
+        for name, array in arrays.items():
+            old = getattr(self, name, None)
+            if old is not None:
+                array[:self.size] = old[:self.size]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    # --- 매핑 인터페이스 ((place_id, context_id) → ContextRow) ---
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, key: ContextKey) -> bool:
+        return key in self._row_of
+
+    def __getitem__(self, key: ContextKey) -> ContextRow:
+        if key not in self._row_of:
+            raise KeyError(key)
+        return ContextRow(self, *key)
+
+    def __delitem__(self, key: ContextKey) -> None:
+        if key not in self._row_of:
+            raise KeyError(key)
+        self.remove(key)
+
+    def __iter__(self) -> Iterator[ContextKey]:
+        return iter(list(self._row_of))
+
+    def get(self, key: ContextKey, default=None) -> Optional[ContextRow]:
+        return ContextRow(self, *key) if key in self._row_of else default
+
+    def keys(self) -> List[ContextKey]:
+        return list(self._row_of)
+
+    def values(self) -> List[ContextRow]:
+        return [ContextRow(self, *key) for key in self._row_of]
+
+    def items(self) -> List[Tuple[ContextKey, ContextRow]]:
+        return [(key, ContextRow(self, *key)) for key in self._row_of]
+
+    def row_of(self, key: ContextKey) -> int:
+        """키 → 행 번호"""
+        return self._row_of[key]
+
+    @property
+    def nbytes(self) -> int:
+        """사용 중인 행의 배열 메모리 [bytes]"""
+        return self.size * self.row_nbytes
+
+    # --- 접근 기록 (상수 시간) ---
+
+    def touch(self, key: ContextKey) -> None:
+        """접근 기록 (접근 시간/횟수 갱신, 제거 순서 갱신)"""
+        row = self._row_of[key]
+        self.last_access_times[row] = self.clock()
+        count = int(self.access_counts[row])
+        self.access_counts[row] = count + 1
+        self._recency.move_to_end(key)
+        if self.policy == "lfu":
+            if count + 1 not in self._frequency:
+                self._link_frequency(count + 1, after=count)
+            self._frequency[count + 1][key] = None
+            self._discard_frequency(key, count)
+
+    # --- LFU 접근 횟수 리스트 (상수 시간) ---
+
+    def _link_frequency(self, count: int, after: Optional[int]) -> None:
+        """횟수 count의 빈 버킷을 after 다음에 연결 (after가 None이면 머리)"""
+        following = self._min_frequency if after is None else self._next_frequency[after]
+        self._frequency[count] = OrderedDict()
+        self._prev_frequency[count] = after
+        self._next_frequency[count] = following
+        if after is None:
+            self._min_frequency = count
+        else:
+            self._next_frequency[after] = count
+        if following is not None:
+            self._prev_frequency[following] = count
+
+    def _discard_frequency(self, key: ContextKey, count: int) -> None:
+        """횟수 count 버킷에서 키 제거 (버킷이 비면 리스트에서 분리)"""
+        bucket = self._frequency[count]
+        del bucket[key]
+        if bucket:
+            return
+        del self._frequency[count]
+        prev = self._prev_frequency.pop(count)
+        following = self._next_frequency.pop(count)
+        if prev is None:
+            self._min_frequency = following
+        else:
+            self._next_frequency[prev] = following
+        if following is not None:
+            self._prev_frequency[following] = prev
+
+    def get_or_add(self, key: ContextKey) -> ContextRow:
+        """
+        항목 반환 (없으면 생성, 가득 차면 정책에 따라 먼저 제거), 접근으로 기록
+
+        Returns:
+            ContextRow
+        """
+        if key not in self._row_of:
+            self.expire()
+            while self.max_entries is not None and self.size >= self.max_entries:
+                self._remove(self._victim(), 'capacity')
+            self._add(key)
+        self.touch(key)
+        return ContextRow(self, *key)
+
+    def _add(self, key: ContextKey) -> None:
+        if self.size == self.capacity:
+            grown = 2 * self.capacity
+            self._allocate(grown if self.max_entries is None else min(grown, self.max_entries))
+        row = self.size
+        self.place_ids[row], self.context_ids[row] = key
+        self.last_access_times[row] = self.clock()
+        self._row_of[key] = row
+        self._recency[key] = None
+        if self.policy == "lfu":
+            if 0 not in self._frequency:
+                self._link_frequency(0, after=None)
+            self._frequency[0][key] = None
+        self.size += 1
+
+    def _victim(self) -> ContextKey:
+        """제거할 키 (lfu: 최소 접근 횟수 중 가장 오래된 것, 그 외: 가장 오래된 접근)"""
+        if self.policy == "lfu":
+            return next(iter(self._frequency[self._min_frequency]))
+        return next(iter(self._recency))
+
+    def _remove(self, key: ContextKey, reason: str) -> None:
+        """행 제거 (마지막 행을 빈 행으로 옮겨 dense 유지)"""
+        row = self._row_of.pop(key)
+        del self._recency[key]
+        if self.policy == "lfu":
+            self._discard_frequency(key, int(self.access_counts[row]))
+        last = self.size - 1
+        if row != last:
+            for name in self._COLUMNS:
+                array = getattr(self, name)
+                array[row] = array[last]
+            self._row_of[(int(self.place_ids[row]), int(self.context_ids[row]))] = row
+        for name in self._COLUMNS:
+            getattr(self, name)[last] = 0
+        self.size = last
+        self.evictions[reason] += 1
+
+    def remove(self, key: ContextKey) -> None:
+        """항목 제거 (없으면 무시)"""
+        if key in self._row_of:
+            self._remove(key, 'manual')
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        수명(ttl)이 지난 항목 제거 (접근 순서 앞에서부터, 만료된 항목 수에 비례)
+
+        Args:
+            now: 현재 시간 (None이면 clock())
+
+        Returns:
+            제거된 항목 수
+        """
+        if self.ttl is None or not self._recency:
+            return 0
+        now = self.clock() if now is None else now
+        removed = 0
+        while self._recency:
+            key = next(iter(self._recency))
+            if now - self.last_access_times[self._row_of[key]] <= self.ttl:
+                break
+            self._remove(key, 'ttl')
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """모든 항목 제거 (제거 통계는 유지)"""
+        for name in self._COLUMNS:
+            getattr(self, name)[:self.size] = 0
+        self._row_of.clear()
+        self._recency.clear()
+        self._frequency.clear()
+        self._next_frequency.clear()
+        self._prev_frequency.clear()
+        self._min_frequency = None
+        self.size = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """용량/제거 통계"""
+        return {
+            'num_entries': self.size,
+            'max_entries': self.max_entries,
+            'nbytes': self.nbytes,
+            'policy': self.policy,
+            'evictions_capacity': self.evictions['capacity'],
+            'evictions_ttl': self.evictions['ttl'],
+            'evictions_manual': self.evictions['manual'],
+        }
@@ -0,0 +1,415 @@
+"""
+Place Bank Module
+Place별 기억을 연속 배열(struct-of-arrays)로 저장하는 Place Cells 저장소
+
+PlaceMemory는 Place마다 dataclass 객체 하나와 numpy 배열/deque를 따로 가지므로,
+Place가 많아지면 (10^5개) 순회가 느리고 실제 데이터보다 메모리를 몇 배 더 씁니다.
+Place Bank는 같은 데이터를 행렬/벡터로 저장합니다:
+
+    centers (N × D), has_center (N,)         Place Field 중심
+    biases (N × D)                           bias 추정값
+    visit_counts (N,), last_visit_times (N,), last_update_times (N,)
+    history (N × H × D), history_counts (N,) 최근 H회차 bias 이력 (ring buffer)
+    consolidated (N × D), has_consolidated (N,), consolidation_times (N,)
+    ids (N,) + id → row 딕셔너리            (dense: 삭제 시 마지막 행을 빈 행으로 이동)
+
+블렌딩:
+    활성화 a = exp(-d² / 2σ²)를 모든 Place에 대해 한 번의 broadcast로 계산하고
+    argpartition으로 top-k를 고릅니다.
+
+PlaceMemory 접근 (get_place_memory, bank[place_id])은 행을 가리키는 가벼운 view
+(PlaceRow)를 반환하며, PlaceMemory와 같은 속성/메서드를 가집니다.
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+from .bias_stats import BiasHistoryView
+import math
+import numpy as np
+
+
+class PlaceRow:
+    """
+    Place Bank 행 view (PlaceMemory와 같은 인터페이스)
+
+    행 번호는 삭제 시 바뀔 수 있으므로 place_id로 매번 행을 찾습니다.
+    배열 속성 (bias_estimate, place_center)은 bank 행렬의 view입니다.
+    """
+
+    __slots__ = ("bank", "place_id")
+
+    def __init__(self, bank: "PlaceBank", place_id: int):
+        self.bank = bank
+        self.place_id = place_id
+
+    @property
+    def _row(self) -> int:
+        return self.bank.row_of(self.place_id)
+
+    def __repr__(self) -> str:
+        return f"PlaceRow(place_id={self.place_id!r}, row={self._row})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PlaceRow):
+            return NotImplemented
+        return self.bank is other.bank and self.place_id == other.place_id
+
+    def __hash__(self) -> int:
+        return hash((id(self.bank), self.place_id))
+
+    # --- 필드 (PlaceMemory와 같은 이름) ---
+
+    @property
+    def bias_estimate(self) -> np.ndarray:
+        return self.bank.biases[self._row]
+
+    @bias_estimate.setter
+    def bias_estimate(self, value: np.ndarray):
+        self.bank.biases[self._row] = value
+
+    @property
+    def place_center(self) -> Optional[np.ndarray]:
+        row = self._row
+        if not self.bank.has_center[row]:
+            return None
+        return self.bank.centers[row]
+
+    @place_center.setter
+    def place_center(self, value: Optional[np.ndarray]):
+        row = self._row
+        if value is None:
+            self.bank.has_center[row] = False
+        else:
+            self.bank.centers[row] = value
+            self.bank.has_center[row] = True
+
+    @property
+    def visit_count(self) -> int:
+        return int(self.bank.visit_counts[self._row])
+
+    @visit_count.setter
+    def visit_count(self, value: int):
+        self.bank.visit_counts[self._row] = value
+
+    @property
+    def last_visit_time(self) -> float:
+        return float(self.bank.last_visit_times[self._row])
+
+    @last_visit_time.setter
+    def last_visit_time(self, value: float):
+        self.bank.last_visit_times[self._row] = value
+
+    @property
+    def last_update_time(self) -> float:
+        return float(self.bank.last_update_times[self._row])
+
+    @last_update_time.setter
+    def last_update_time(self, value: float):
+        self.bank.last_update_times[self._row] = value
+
+    @property
+    def consolidated_bias(self) -> Optional[np.ndarray]:
+        row = self._row
+        if not self.bank.has_consolidated[row]:
+            return None
+        return self.bank.consolidated[row]
+
+    @consolidated_bias.setter
+    def consolidated_bias(self, value: Optional[np.ndarray]):
+        row = self._row
+        if value is None:
+            self.bank.has_consolidated[row] = False
+        else:
+            self.bank.consolidated[row] = value
+            self.bank.has_consolidated[row] = True
+
+    @property
+    def consolidation_time(self) -> float:
+        return float(self.bank.consolidation_times[self._row])
+
+    @consolidation_time.setter
+    def consolidation_time(self, value: float):
+        self.bank.consolidation_times[self._row] = value
+
+    @property
+    def bias_history(self) -> BiasHistoryView:
+        """bias 이력 읽기 전용 view (오래된 것부터, 복사 없음)"""
+        return BiasHistoryView(self, self.bank.history_size)
+
+    def history_ring(self) -> Tuple[np.ndarray, int]:
+        """(이 행의 ring (H, D), 지금까지 추가된 수) — BiasHistoryView용"""
+        row = self._row
+        return self.bank.history[row], int(self.bank.history_counts[row])
+
+    # --- 메서드 (PlaceMemory와 같은 수식) ---
+
+    def update_bias(self, new_bias: np.ndarray, learning_rate: float = 0.1) -> None:
+        """Place별 bias 업데이트 (지수 이동 평균, PlaceMemory.update_bias와 같음)"""
+        row = self._row
+        bank = self.bank
+        if bank.visit_counts[row] == 0:
+            bank.biases[row] = new_bias
+        else:
+            bank.biases[row] = learning_rate * new_bias + (1 - learning_rate) * bank.biases[row]
+        bank.visit_counts[row] += 1
+
+    def add_bias_to_history(self, bias: np.ndarray) -> None:
+        """Bias 이력에 추가 (ring buffer)"""
+        row = self._row
+        bank = self.bank
+        count = int(bank.history_counts[row])
+        bank.history[row, count % bank.history_size] = bias
+        bank.history_counts[row] = count + 1
+
+    def get_recent_biases(self, n: int) -> List[np.ndarray]:
+        """최근 N회차의 bias 이력 (오래된 것부터)"""
+        row = self._row
+        bank = self.bank
+        count = int(bank.history_counts[row])
+        stored = min(count, bank.history_size)
+        n = min(n, stored)
+        if n <= 0:
+            return []
+        slots = np.arange(count - n, count) % bank.history_size
+        return list(bank.history[row, slots])
+
+    def get_window_stats(self, n: int) -> Tuple[int, Optional[np.ndarray], Optional[np.ndarray]]:
+        """최근 N회차 bias 평균/분산 (ring 행에서 계산, PlaceMemory.get_window_stats와 같음)"""
+        row = self._row
+        bank = self.bank
+        count = int(bank.history_counts[row])
+        used = min(n, count, bank.history_size)
+        if used <= 0:
+            return 0, None, None
+        window = bank.history[row, np.arange(count - used, count) % bank.history_size]
+        return used, window.mean(axis=0), window.var(axis=0)
+
+    def update_place_center(self, phase_vector: np.ndarray, learning_rate: float = 0.05) -> None:
+        """Place Field 중심 업데이트 (PlaceMemory.update_place_center와 같음)"""
+        row = self._row
+        bank = self.bank
+        if not bank.has_center[row]:
+            bank.centers[row] = phase_vector
+            bank.has_center[row] = True
+        else:
+            bank.centers[row] = learning_rate * phase_vector + (1 - learning_rate) * bank.centers[row]
+
+
+class PlaceBank:
+    """
+    Place Bank (struct-of-arrays Place 저장소)
+
+    place_id → PlaceRow 매핑처럼 사용할 수 있습니다 (in, len, [], keys/values/items, del).
+    """
+
+    def __init__(
+        self,
+        dim: int = 5,
+        phase_wrap: float = 2.0 * math.pi,
+        capacity: int = 1024,
+        history_size: int = 10
+    ):
+        """
+        Args:
+            dim: 위상/bias 차원 (기본값: 5)
+            phase_wrap: 위상 wrapping 값 (기본값: 2π)
+            capacity: 초기 행 수 (가득 차면 두 배로 늘림)
+            history_size: Place별 bias 이력 길이 (PlaceMemory deque maxlen과 같음)
+        """
+        assert dim > 0, f"dim ({dim}) must be > 0"
+        assert capacity > 0, f"capacity ({capacity}) must be > 0"
+        assert history_size > 0, f"history_size ({history_size}) must be > 0"
+        self.dim = dim
+        self.phase_wrap = phase_wrap
+        self.history_size = history_size
+        self.size = 0
+
+        self._row_of: Dict[int, int] = {}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """배열 (재)할당, 기존 행 보존"""
+        d, h = self.dim, self.history_size
+        arrays = {
+            'ids': np.zeros(capacity, dtype=np.int64),
+            'centers': np.zeros((capacity, d), dtype=np.float64),
+            'has_center': np.zeros(capacity, dtype=bool),
+            'biases': np.zeros((capacity, d), dtype=np.float64),
+            'visit_counts': np.zeros(capacity, dtype=np.int64),
+            'last_visit_times': np.zeros(capacity, dtype=np.float64),
+            'last_update_times': np.zeros(capacity, dtype=np.float64),
+            'history': np.zeros((capacity, h, d), dtype=np.float64),
+            'history_counts': np.zeros(capacity, dtype=np.int64),
+            'consolidated': np.zeros((capacity, d), dtype=np.float64),
+            'has_consolidated': np.zeros(capacity, dtype=bool),
+            'consolidation_times': np.zeros(capacity, dtype=np.float64),
+        }
+        for name, array in arrays.items():
+            old = getattr(self, name, None)
+            if old is not None:
+                array[:self.size] = old[:self.size]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    _COLUMNS = (
+        'ids', 'centers', 'has_center', 'biases', 'visit_counts', 'last_visit_times',
+        'last_update_times', 'history', 'history_counts', 'consolidated',
+        'has_consolidated', 'consolidation_times'
+    )
+
+    # --- 매핑 인터페이스 (place_id → PlaceRow) ---
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, place_id: int) -> bool:
+        return place_id in self._row_of
+
+    def __getitem__(self, place_id: int) -> PlaceRow:
+        if place_id not in self._row_of:
+            raise KeyError(place_id)
+        return PlaceRow(self, place_id)
+
+    def __delitem__(self, place_id: int) -> None:
+        if place_id not in self._row_of:
+            raise KeyError(place_id)
+        self.remove(place_id)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self._row_of))
+
+    def get(self, place_id: int, default=None) -> Optional[PlaceRow]:
+        return PlaceRow(self, place_id) if place_id in self._row_of else default
+
+    def keys(self) -> List[int]:
+        return list(self._row_of)
+
+    def values(self) -> List[PlaceRow]:
+        return [PlaceRow(self, place_id) for place_id in self._row_of]
+
+    def items(self) -> List[Tuple[int, PlaceRow]]:
+        return [(place_id, PlaceRow(self, place_id)) for place_id in self._row_of]
+
+    # --- 행 관리 ---
+
+    def row_of(self, place_id: int) -> int:
+        """place_id → 행 번호"""
+        return self._row_of[place_id]
+
+    def add(self, place_id: int) -> int:
+        """
+        Place 추가 (이미 있으면 기존 행)
+
+        Returns:
+            행 번호
+        """
+        row = self._row_of.get(place_id)
+        if row is not None:
+            return row
+        if self.size == self.capacity:
+            self._allocate(2 * self.capacity)
+        row = self.size
+        self.ids[row] = place_id
+        self._row_of[place_id] = row
+        self.size += 1
+        return row
+
+    def get_place_memory(self, place_id: int) -> PlaceRow:
+        """Place 행 view 반환 (없으면 생성)"""
+        self.add(place_id)
+        return PlaceRow(self, place_id)
+
+    def remove(self, place_id: int) -> None:
+        """Place 제거 (없으면 무시, 마지막 행을 빈 행으로 옮겨 dense 유지)"""
+        row = self._row_of.pop(place_id, None)
+        if row is None:
+            return
+        last = self.size - 1
+        if row != last:
+            for name in self._COLUMNS:
+                array = getattr(self, name)
+                array[row] = array[last]
+            self._row_of[int(self.ids[row])] = row
+        for name in self._COLUMNS:
+            getattr(self, name)[last] = 0
+        self.size = last
+
+    def remove_many(self, place_ids) -> None:
+        """여러 Place 제거 (없는 id는 무시, 남은 행을 순서대로 앞으로 압축)"""
+        rows = [self._row_of.pop(place_id) for place_id in place_ids if place_id in self._row_of]
+        if not rows:
+            return
+        keep = np.ones(self.size, dtype=bool)
+        keep[rows] = False
+        new_size = int(keep.sum())
+        for name in self._COLUMNS:
+            array = getattr(self, name)
+            array[:new_size] = array[:self.size][keep]
+            array[new_size:self.size] = 0
+        self.size = new_size
+        self._row_of = {place_id: row for row, place_id in enumerate(self.ids[:new_size].tolist())}
+
+    def clear(self) -> None:
+        """모든 Place 제거"""
+        for name in self._COLUMNS:
+            getattr(self, name)[:self.size] = 0
+        self._row_of.clear()
+        self.size = 0
+
+    @property
+    def nbytes(self) -> int:
+        """사용 중인 행의 배열 메모리 [bytes]"""
+        return sum(getattr(self, name)[:self.size].nbytes for name in self._COLUMNS)
+
+    # --- 벡터 연산 ---
+
+    def activations(self, phase_vector: np.ndarray, sigma: float) -> np.ndarray:
+        """
+        모든 Place의 활성화 강도 (중심이 없는 Place는 0)
+
+        수식: a_i = exp(-||Φ - Φ_i||² / 2σ²), 토러스 거리 (주기 경계)
+
+        Returns:
+            shape (size,)
+        """
+        n = self.size
+        diff = phase_vector - self.centers[:n]
+        diff -= self.phase_wrap * np.round(diff / self.phase_wrap)
+        activation = np.exp(-np.einsum('ij,ij->i', diff, diff) / (2 * sigma ** 2))
+        activation[~self.has_center[:n]] = 0.0
+        return activation
+
+    def top_k(
+        self,
+        phase_vector: np.ndarray,
+        k: int,
+        sigma: float,
+        min_activation: float = 1e-5
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        활성화 상위 K개 Place (argpartition)
+
+        Returns:
+            (rows, activations) 활성화 내림차순, activation > min_activation 인 행만
+        """
+        activation = self.activations(phase_vector, sigma)
+        if k <= 0:
+            rows = np.zeros(0, dtype=np.intp)
+        elif k < len(activation):
+            rows = np.argpartition(-activation, k - 1)[:k]
+        else:
+            rows = np.arange(len(activation))
+        rows = rows[np.argsort(-activation[rows], kind='stable')]
+        rows = rows[activation[rows] > min_activation]
+        return rows, activation[rows]
+
+    def assign_missing_centers(self, phase_vector: np.ndarray) -> None:
+        """중심이 없는 모든 Place의 중심을 phase_vector로 설정"""
+        missing = ~self.has_center[:self.size]
+        self.centers[:self.size][missing] = phase_vector
+        self.has_center[:self.size] = True
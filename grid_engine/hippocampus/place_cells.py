@@ -14,11 +14,14 @@ Version: v0.4.0-alpha (Place Cells extension)
 License: MIT License
 """
 
-from typing import Dict, Optional, Tuple, List
+from typing import Any, Dict, Optional, Tuple, List
 from dataclasses import dataclass, field
-from collections import deque
 import numpy as np
 import math
+import time
+from .place_index import PlaceSpatialIndex, torus_close_pairs
+from .place_bank import PlaceBank
+from .bias_stats import BiasHistoryPool, BiasHistoryView, BiasWindowStats
 
 
 @dataclass
@@ -34,10 +37,22 @@ class PlaceMemory:
     last_visit_time: float = 0.0
     last_update_time: float = 0.0  # 마지막 업데이트 시간 (Replay용) ✨ NEW
     place_center: Optional[np.ndarray] = None  # Place Field 중심 위상 벡터 [phi_x, phi_y, phi_z, phi_a, phi_b]
-    bias_history: deque = field(default_factory=lambda: deque(maxlen=10))  # 최근 10회차 bias 이력 (Replay용) ✨ NEW
+    bias_stats: BiasWindowStats = field(default_factory=BiasWindowStats, repr=False)  # 최근 10회차 bias 이력 + 이동 평균/분산 (Replay용) ✨ NEW
     consolidated_bias: Optional[np.ndarray] = None  # Consolidated bias (통계적 유의성 검증 통과) ✨ NEW
     consolidation_time: float = 0.0  # Consolidation 수행 시간 ✨ NEW
     
+    def __setattr__(self, name: str, value) -> None:
+        """place_center가 바뀌면 소속 PlaceCellManager의 공간 색인에 알림 (last_update_time은 이력 pool에도 기록)"""
+        object.__setattr__(self, name, value)
+        if name == "place_center":
+            owner = self.__dict__.get("_owner")
+            if owner is not None:
+                owner._on_place_center_changed(self)
+        elif name == "last_update_time":
+            stats = self.__dict__.get("bias_stats")
+            if stats is not None and stats.pool is not None:
+                stats.pool.last_update_times[stats.row] = value
+    
     def update_bias(
         self,
         new_bias: np.ndarray,
@@ -70,7 +85,12 @@ class PlaceMemory:
         Args:
             bias: 새로운 bias 추정값
         """
-        self.bias_history.append(bias.copy())
+        self.bias_stats.add(bias)  # 이력 ring 쓰기 (이동 평균/분산은 읽을 때 O(1) 분할 상환 반영)
+    
+    @property
+    def bias_history(self) -> BiasHistoryView:
+        """bias 이력 읽기 전용 view (오래된 것부터, 복사 없음, 추가는 add_bias_to_history)"""
+        return BiasHistoryView(self.bias_stats, self.bias_stats.history_size)
     
     def get_recent_biases(self, n: int) -> List[np.ndarray]:
         """
@@ -80,14 +100,18 @@ class PlaceMemory:
             n: 반환할 회차 수
         
         Returns:
-            최근 N회차의 bias 리스트
+            최근 N회차의 bias 리스트 (이력이 N개보다 적으면 모두)
+        """
+        return self.bias_stats.recent(n)
+    
+    def get_window_stats(self, n: int) -> Tuple[int, Optional[np.ndarray], Optional[np.ndarray]]:
         """
-        if len(self.bias_history) == 0:
-            return []
+        최근 N회차 bias 평균/분산 (Consolidation 유의성 검정용) ✨ NEW
         
-        # 최근 N개 반환 (이력이 N개보다 적으면 모두 반환)
-        recent = list(self.bias_history)[-n:]
-        return recent
+        Returns:
+            (사용한 회차 수, 평균, 분산)
+        """
+        return self.bias_stats.stats(n)
     
     def update_place_center(
         self,
@@ -125,55 +149,132 @@ class PlaceCellManager:
         self,
         num_places: int = 1000,
         phase_wrap: float = 2.0 * math.pi,
-        quantization_level: int = 100
+        quantization_level: int = 100,
+        storage: str = "dict",
+        dim: int = 5
     ):
         """
         Place Cell Manager 초기화
         
         Args:
-            num_places: 최대 Place 수 (기본값: 1000)
+            num_places: 예상 Place 수 (기본값: 1000, 하위 호환용 — Place ID 범위를 제한하지 않음)
             phase_wrap: 위상 wrapping 값 (기본값: 2π)
             quantization_level: 위상 공간 양자화 레벨 (기본값: 100)
+            storage: Place Memory 저장 방식 ✨ NEW
+                - "dict": place_id → PlaceMemory 객체 (공간 색인으로 블렌딩 질의)
+                - "bank": PlaceBank 행렬 (행 view, 벡터화 활성화 + argpartition top-k)
+            dim: 위상/bias 차원 (storage="bank" 행렬 / storage="dict" 이력 pool, 기본값: 5)
         """
+        assert storage in ("dict", "bank"), f"storage ({storage!r}) must be 'dict' or 'bank'"
         self.num_places = num_places
         self.phase_wrap = phase_wrap
         self.quantization_level = quantization_level
+        self.storage = storage
+        self._radix_cache: Dict[int, np.ndarray] = {}  # 차원 → 혼합 기수 가중치 (get_place_id)
+        
+        # Place Memory 저장소: place_id → PlaceMemory (bank: place_id → PlaceRow)
+        self.bank: Optional[PlaceBank] = None
+        if storage == "bank":
+            self.bank = PlaceBank(dim=dim, phase_wrap=phase_wrap)
+            self.place_memory = self.bank
+        else:
+            self.place_memory: Dict[int, PlaceMemory] = {}
+        
+        # storage="dict": Place별 bias 이력 ring을 한 텐서 (N × H × D)에 유지 (replay_all_places 일괄 계산용) ✨ NEW
+        self.history_pool: Optional[BiasHistoryPool] = None
+        if storage == "dict":
+            self.history_pool = BiasHistoryPool(dim=dim, mapping=self.place_memory)
         
-        # Place Memory 저장소: place_id → PlaceMemory
-        self.place_memory: Dict[int, PlaceMemory] = {}
+        # Place Field 중심의 공간 색인 (storage="dict"의 블렌딩 top-k 질의용) ✨ NEW
+        # place_center가 바뀌면 PlaceMemory.__setattr__가 색인을 갱신
+        self.spatial_index = PlaceSpatialIndex(phase_wrap=phase_wrap)
+        self._centerless: Dict[int, None] = {}  # 중심이 아직 없는 Place (삽입 순서)
         
         # Place Field 파라미터
         self.place_field_sigma: float = 0.1  # Place Field 폭 (rad)
         self.merge_threshold: float = 0.1  # Place Field 병합 임계 거리 (rad)
+        
+        # Place별 bias 이동 평균/분산 창 (None이면 이력 길이, ReplayConsolidation.consolidation_window와 같으면 O(1) 검정) ✨ NEW
+        self.stats_window: Optional[int] = None
+        self.last_merge_stats: Dict[str, Any] = {}  # 마지막 merge_nearby_places() 통계 ✨ NEW
+        self.removals: int = 0  # remove_place(s)로 제거한 Place 누적 수 (MemorySnapshot 삭제 감지용) ✨ NEW
+    
+    def _lattice_radix(self, dim: int) -> np.ndarray:
+        """
+        혼합 기수 (mixed-radix) 가중치 [q^(D-1), ..., q, 1] (차원별 캐시)
+        
+        place_id가 int64 범위 안에 있도록 q^D ≤ 2^63 - 1을 검사합니다.
+        """
+        radix = self._radix_cache.get(dim)
+        if radix is None:
+            q = self.quantization_level
+            if q ** dim > np.iinfo(np.int64).max:
+                raise ValueError(
+                    f"quantization_level^dim ({q}^{dim}) exceeds the int64 place_id range"
+                )
+            radix = q ** np.arange(dim - 1, -1, -1, dtype=np.int64)
+            self._radix_cache[dim] = radix
+        return radix
     
     def get_place_id(self, phase_vector: np.ndarray) -> int:
         """
-        위상 벡터를 Place ID로 변환
+        위상 벡터를 Place ID로 변환 (격자 좌표의 혼합 기수 키, 충돌 없음)
         
-        수식: place_id = hash(Φ) mod N
+        수식:
+            c_d = floor((φ_d mod W) · q / W)  (축별 격자 좌표, 0 ≤ c_d < q)
+            place_id = Σ c_d · q^(D-1-d)
+        
+        서로 다른 격자 칸은 항상 서로 다른 ID를 가지며, hash()를 쓰지 않으므로
+        프로세스가 달라도 같은 위상은 같은 ID입니다 (저장한 기억 재적재 가능).
         
         Args:
             phase_vector: 위상 벡터 [phi_x, phi_y, phi_z, phi_a, phi_b] (rad)
         
         Returns:
-            Place ID (0 ~ num_places-1)
+            Place ID (0 ~ quantization_level^D - 1)
         """
-        # 위상 공간 양자화
-        # 위상 벡터를 정수 배열로 변환 (소수점 이하 자릿수 처리)
-        phase_int = (phase_vector * self.quantization_level / self.phase_wrap).astype(int)
+        q = self.quantization_level
+        wrap = self.phase_wrap
+        self._lattice_radix(len(phase_vector))  # 범위 검사 (캐시)
+        
+        # 축별 격자 좌표를 q진법 자릿수로 누적 (get_place_ids와 같은 부동소수 연산)
+        place_id = 0
+        for phase in np.asarray(phase_vector, dtype=np.float64).tolist():
+            cell = int((phase % wrap) * q / wrap)
+            place_id = place_id * q + (cell if cell < q else q - 1)
+        return place_id
+    
+    def get_place_ids(self, phases: np.ndarray) -> np.ndarray:
+        """
+        위상 행렬을 Place ID 배열로 변환 (get_place_id의 벡터화)
         
-        # 해시 함수 적용
-        # tuple로 변환하여 해시 가능하게 만듦
-        place_hash = hash(tuple(phase_int))
+        Args:
+            phases: 위상 행렬 (rad), shape (N, D)
         
-        # 모듈로 연산으로 Place ID 생성
-        place_id = place_hash % self.num_places
+        Returns:
+            Place ID 배열 (int64), shape (N,)
+        """
+        phases = np.asarray(phases, dtype=np.float64)
+        assert phases.ndim == 2, f"phases must be 2D (N, D), got shape {phases.shape}"
+        q = self.quantization_level
+        radix = self._lattice_radix(phases.shape[1])
+        cells = (np.mod(phases, self.phase_wrap) * q / self.phase_wrap).astype(np.int64)
+        np.minimum(cells, q - 1, out=cells)
+        return cells @ radix
+    
+    def get_place_lattice(self, place_id: int, dim: int = 5) -> np.ndarray:
+        """
+        Place ID → 축별 격자 좌표 (get_place_id의 역변환)
         
-        # 음수 처리 (Python hash는 음수 가능)
-        if place_id < 0:
-            place_id = -place_id
+        Args:
+            place_id: Place ID
+            dim: 위상 차원 (기본값: 5)
         
-        return place_id
+        Returns:
+            격자 좌표 (int64), shape (dim,), 각 원소 0 ~ quantization_level-1
+        """
+        radix = self._lattice_radix(dim)
+        return (int(place_id) // radix) % self.quantization_level
     
     def torus_distance(
         self,
@@ -244,12 +345,90 @@ class PlaceCellManager:
         Returns:
             PlaceMemory 객체
         """
+        if self.bank is not None:
+            return self.bank.get_place_memory(place_id)
+        
         if place_id not in self.place_memory:
-            # 새로운 Place Memory 생성
-            self.place_memory[place_id] = PlaceMemory(place_id=place_id)
+            # 새로운 Place Memory 생성 (공간 색인에 연결)
+            place_memory = PlaceMemory(
+                place_id=place_id,
+                bias_stats=BiasWindowStats(window=self.stats_window)
+            )
+            self.place_memory[place_id] = place_memory
+            self.history_pool.attach(place_memory.bias_stats, place_memory)
+            object.__setattr__(place_memory, "_owner", self)
+            self._centerless[place_id] = None
         
         return self.place_memory[place_id]
     
+    def _on_place_center_changed(self, place_memory: PlaceMemory) -> None:
+        """Place 중심 변경을 공간 색인에 반영"""
+        place_id = place_memory.place_id
+        if self.place_memory.get(place_id) is not place_memory:
+            return  # 이미 제거된 Place
+        if place_memory.place_center is None:
+            self.spatial_index.remove(place_id)
+            self._centerless[place_id] = None
+        else:
+            self.spatial_index.update(place_id, place_memory.place_center)
+            self._centerless.pop(place_id, None)
+    
+    def remove_place(self, place_id: int) -> None:
+        """
+        Place 제거 (Place Memory 및 공간 색인)
+        
+        Args:
+            place_id: Place ID
+        """
+        if self.bank is not None:
+            size = self.bank.size
+            self.bank.remove(place_id)
+            self.removals += size - self.bank.size
+            return
+        
+        place_memory = self.place_memory.pop(place_id, None)
+        if place_memory is not None:
+            self.removals += 1
+            object.__setattr__(place_memory, "_owner", None)
+            if place_memory.bias_stats.pool is self.history_pool:
+                self.history_pool.release(place_memory.bias_stats)
+        self.spatial_index.remove(place_id)
+        self._centerless.pop(place_id, None)
+    
+    def remove_places(self, place_ids: List[int]) -> None:
+        """
+        여러 Place 제거 (storage="bank"는 한 번에 행 압축)
+        
+        Args:
+            place_ids: Place ID 리스트
+        """
+        if self.bank is not None:
+            size = self.bank.size
+            self.bank.remove_many(place_ids)
+            self.removals += size - self.bank.size
+            return
+        for place_id in place_ids:
+            self.remove_place(place_id)
+    
+    def _nearest_places(
+        self,
+        phase_vector: np.ndarray,
+        top_k: int,
+        max_distance: float
+    ) -> List[Tuple[float, int]]:
+        """
+        공간 색인으로 top-k 최근접 Place 질의
+        
+        place_memory에서 직접 삭제된 Place는 색인에서도 제거하고 다시 질의합니다.
+        """
+        while True:
+            neighbors = self.spatial_index.query(phase_vector, top_k, max_distance)
+            stale = [place_id for _, place_id in neighbors if place_id not in self.place_memory]
+            if not stale:
+                return neighbors
+            for place_id in stale:
+                self.remove_place(place_id)
+    
     def update_place_memory(
         self,
         place_id: int,
@@ -320,23 +499,27 @@ class PlaceCellManager:
             return place_memory.bias_estimate.copy()
         
         # Soft-switching: 주변 Place Cell들의 가중 평균
-        # 1. 모든 Place Cell의 활성화 강도 계산
-        activations = []
-        for place_id, place_memory in self.place_memory.items():
-            if place_memory.place_center is None:
-                # ✅ place_center가 None이면 현재 phase_vector로 설정 ✨ FIXED
+        if self.bank is not None:
+            return self._get_bank_bias_estimate(phase_vector, top_k, sigma)
+        
+        # ✅ place_center가 None이면 현재 phase_vector로 설정 ✨ FIXED
+        for place_id in list(self._centerless):
+            place_memory = self.place_memory.get(place_id)
+            if place_memory is None:
+                self._centerless.pop(place_id, None)
+            elif place_memory.place_center is None:
                 place_memory.place_center = phase_vector.copy()
-            
+        
+        # 1. 공간 색인으로 상위 K개 Place Cell 후보 질의 (토러스 top-k 최근접) ✨ NEW
+        # ✅ 활성화가 너무 낮으면 스킵 (1e-5 이상만 고려) ✨ FIXED
+        #    a > 1e-5  ⇔  d < σ·√(2·ln(1e5))
+        max_distance = sigma * math.sqrt(2.0 * math.log(1e5))
+        activations = []
+        for distance, place_id in self._nearest_places(phase_vector, top_k, max_distance):
             # 가우시안 활성화 강도 계산
-            activation = self.place_cell_activation(
-                phase_vector=phase_vector,
-                place_center=place_memory.place_center,
-                sigma=sigma
-            )
-            
-            # ✅ 활성화가 너무 낮으면 스킵 (1e-5 이상만 고려) ✨ FIXED
+            activation = math.exp(-(distance ** 2) / (2 * sigma ** 2))
             if activation > 1e-5:
-                activations.append((activation, place_id, place_memory))
+                activations.append((activation, place_id, self.place_memory[place_id]))
         
         if len(activations) == 0:
             # 활성화된 Place가 없으면 place_id 기반으로 fallback ✨ FIXED
@@ -347,9 +530,8 @@ class PlaceCellManager:
                 place_memory.place_center = phase_vector.copy()
             return place_memory.bias_estimate.copy()
         
-        # 2. 활성화 강도 순으로 정렬하여 상위 K개 선택
-        activations.sort(key=lambda x: x[0], reverse=True)
-        top_activations = activations[:top_k]
+        # 2. 활성화 강도 순 상위 K개 (색인이 거리 오름차순으로 반환)
+        top_activations = activations
         
         # 3. 가중 평균 계산
         total_activation = sum(a[0] for a in top_activations)
@@ -371,6 +553,35 @@ class PlaceCellManager:
         
         return weighted_bias
     
+    def _get_bank_bias_estimate(
+        self,
+        phase_vector: np.ndarray,
+        top_k: int,
+        sigma: float
+    ) -> np.ndarray:
+        """
+        Soft-switching (storage="bank")
+        
+        모든 Place 활성화를 한 번에 계산하고 argpartition으로 상위 K개를 고릅니다.
+        """
+        bank = self.bank
+        bank.assign_missing_centers(phase_vector)
+        rows, activations = bank.top_k(phase_vector, top_k, sigma)
+        
+        if len(rows) == 0:
+            # 활성화된 Place가 없으면 place_id 기반으로 fallback
+            place_memory = self.get_place_memory(self.get_place_id(phase_vector))
+            if place_memory.place_center is None:
+                place_memory.place_center = phase_vector.copy()
+            return place_memory.bias_estimate.copy()
+        
+        total_activation = activations.sum()
+        if total_activation < 1e-10:
+            return np.zeros(bank.dim)
+        
+        # 가중 평균: B_final = Σ(a_i · Bias_i) / Σ(a_i)
+        return (activations / total_activation) @ bank.biases[rows]
+    
     def merge_nearby_places(
         self,
         distance_threshold: Optional[float] = None
@@ -378,6 +589,18 @@ class PlaceCellManager:
         """
         가까운 Place Field들을 병합
         
+        이웃 칸 hashing (torus_close_pairs)으로 임계 거리 미만인 쌍만 찾고,
+        병합은 그룹 단위로 한 번에 수행합니다 (O(N²) 쌍 비교 없음). ✨ NEW
+        
+        병합 규칙 (이전 쌍별 병합과 같은 순서):
+            - Place 순서대로, 아직 병합되지 않은 Place가 대표가 되어
+              임계 거리 안의 뒤쪽 Place들을 흡수 (대표의 병합 전 중심 기준)
+            - Bias / 중심: 방문 횟수 가중 평균 (중심은 대표 기준으로 주기 경계를 풀어서 평균)
+            - 방문 횟수: 합산
+        
+        결과 통계는 last_merge_stats에 기록합니다
+        (merged_count, num_groups, num_close_pairs, num_places_before/after, elapsed_ms).
+        
         Args:
             distance_threshold: 병합 임계 거리 (None이면 기본값 사용)
         
@@ -387,58 +610,90 @@ class PlaceCellManager:
         if distance_threshold is None:
             distance_threshold = self.merge_threshold
         
+        start_time = time.perf_counter()
+        num_places_before = len(self.place_memory)
+        
+        # 중심이 있는 Place (place_memory 순서): place_id, 중심, 방문 횟수, bias
+        if self.bank is not None:
+            rows = np.flatnonzero(self.bank.has_center[:self.bank.size])
+            place_ids = self.bank.ids[rows].tolist()
+            centers = self.bank.centers[rows]
+            visits = self.bank.visit_counts[rows].astype(np.float64)
+            biases = self.bank.biases[rows]
+        else:
+            places = [
+                place for place in self.place_memory.values()
+                if place.place_center is not None
+            ]
+            place_ids = [place.place_id for place in places]
+            centers = np.array([place.place_center for place in places], dtype=np.float64)
+            visits = np.array([place.visit_count for place in places], dtype=np.float64)
+            biases = np.array([place.bias_estimate for place in places], dtype=np.float64)
+        
         merged_count = 0
-        place_ids = list(self.place_memory.keys())
+        num_groups = 0
+        num_close_pairs = 0
         
-        # 모든 Place 쌍에 대해 거리 계산
-        for i, place_id1 in enumerate(place_ids):
-            if place_id1 not in self.place_memory:
-                continue
+        if len(place_ids) > 1:
+            pair_i, pair_j, _ = torus_close_pairs(centers, distance_threshold, self.phase_wrap)
+            num_close_pairs = len(pair_i)
             
-            place1 = self.place_memory[place_id1]
-            if place1.place_center is None:
-                continue
-            
-            for place_id2 in place_ids[i+1:]:
-                if place_id2 not in self.place_memory:
-                    continue
-                
-                place2 = self.place_memory[place_id2]
-                if place2.place_center is None:
+            # 대표 배정: i 오름차순, 흡수되지 않은 i가 뒤쪽 j를 흡수 (쌍은 i 오름차순으로 정렬됨)
+            leader = list(range(len(place_ids)))
+            bounds = np.flatnonzero(np.diff(pair_i, prepend=-1)).tolist() + [num_close_pairs]
+            heads = pair_i[bounds[:-1]].tolist()
+            tails = pair_j.tolist()
+            for k, i in enumerate(heads):
+                if leader[i] != i:
                     continue
+                for j in tails[bounds[k]:bounds[k + 1]]:
+                    if leader[j] == j:
+                        leader[j] = i
+            leader = np.array(leader, dtype=np.intp)
+            
+            absorbed = np.flatnonzero(leader != np.arange(len(place_ids)))
+            if len(absorbed) > 0:
+                # 중심: 대표 기준으로 주기 경계를 풀어서 평균
+                offset = centers - centers[leader]
+                offset -= self.phase_wrap * np.round(offset / self.phase_wrap)
+                unwrapped = centers[leader] + offset
                 
-                # 토러스 거리 계산
-                distance = self.torus_distance(
-                    place1.place_center,
-                    place2.place_center
-                )
-                
-                # 임계 거리 이하이면 병합
-                if distance < distance_threshold:
-                    # place_id1에 place_id2의 정보 병합
-                    # Bias는 가중 평균 (방문 횟수 기준)
-                    total_visits = place1.visit_count + place2.visit_count
+                # 대표별 흡수 Place (대표 순으로 정렬 후 분할)
+                by_leader = absorbed[np.argsort(leader[absorbed], kind="stable")]
+                group_leaders, group_starts = np.unique(leader[by_leader], return_index=True)
+                groups = np.split(by_leader, group_starts[1:])
+                updates = []
+                for i, group in zip(group_leaders.tolist(), groups):
+                    members = np.concatenate(([i], group))
+                    total_visits = visits[members].sum()
                     if total_visits > 0:
-                        weight1 = place1.visit_count / total_visits
-                        weight2 = place2.visit_count / total_visits
-                        place1.bias_estimate = (
-                            weight1 * place1.bias_estimate +
-                            weight2 * place2.bias_estimate
-                        )
-                    
-                    # Place Field 중심도 가중 평균
-                    place1.place_center = (
-                        weight1 * place1.place_center +
-                        weight2 * place2.place_center
-                    )
-                    
-                    # 방문 횟수 합산
-                    place1.visit_count += place2.visit_count
-                    
-                    # place_id2 삭제
-                    del self.place_memory[place_id2]
-                    merged_count += 1
-        
+                        weights = visits[members] / total_visits
+                        bias = weights @ biases[members]
+                    else:
+                        weights = np.full(len(members), 1.0 / len(members))
+                        bias = None
+                    center = np.mod(weights @ unwrapped[members], self.phase_wrap)
+                    updates.append((place_ids[i], bias, center, int(total_visits)))
+                
+                # 대표 갱신 후 흡수된 Place 삭제 (공간 색인 포함)
+                for place_id, bias, center, total_visits in updates:
+                    place1 = self.place_memory[place_id]
+                    if bias is not None:
+                        place1.bias_estimate = bias
+                    place1.place_center = center
+                    place1.visit_count = total_visits
+                self.remove_places([place_ids[j] for j in absorbed.tolist()])
+                merged_count = len(absorbed)
+                num_groups = len(updates)
+        
+        self.last_merge_stats = {
+            'merged_count': merged_count,
+            'num_groups': num_groups,
+            'num_close_pairs': num_close_pairs,
+            'num_places_before': num_places_before,
+            'num_places_after': len(self.place_memory),
+            'elapsed_ms': (time.perf_counter() - start_time) * 1000.0
+        }
         return merged_count
     
     def get_statistics(self) -> Dict[str, any]:
@@ -460,8 +715,11 @@ class PlaceCellManager:
         num_places = len(self.place_memory)
         
         # 메모리 사용량 추정 (대략적)
-        # PlaceMemory: 약 240 bytes per place
-        memory_size_bytes = num_places * 240
+        # PlaceMemory: 약 240 bytes per place, PlaceBank: 배열 크기
+        if self.bank is not None:
+            memory_size_bytes = self.bank.nbytes
+        else:
+            memory_size_bytes = num_places * 240
         
         return {
             'num_places': num_places,
@@ -0,0 +1,322 @@
+"""
+Place Spatial Index
+Place Field 중심의 토러스 공간 색인 (주기 경계 bucket grid)
+
+PlaceCellManager.get_bias_estimate(use_blending=True)는 모든 Place에 대해
+torus_distance와 math.exp를 호출하고 전체 활성화 리스트를 정렬했습니다 (Place 수에 선형).
+Place Spatial Index는 Place 중심을 위상 공간의 격자 칸(bucket)에 나누어 두고,
+질의 위상이 속한 칸에서 바깥쪽 껍질(shell) 순서로 후보를 모아 top-k 최근접 Place를 찾습니다.
+
+격자:
+    - 축마다 cells_per_axis개의 칸, 칸 크기 h = phase_wrap / cells_per_axis
+    - 칸 인덱스는 축마다 mod cells_per_axis (주기 경계: 0번 칸과 마지막 칸은 이웃)
+
+최근접 탐색 (정확):
+    - 껍질 s: 질의 칸과의 칸 오프셋 최댓값(Chebyshev)이 s인 칸들
+    - 껍질 0..s를 모두 본 뒤, 그 밖의 Place는 질의에서 최소 s·h만큼 떨어져 있음
+    - k번째 후보 거리 ≤ s·h 이거나 s·h ≥ max_distance 이면 종료
+    - 다음 껍질까지의 칸 수가 점유된 칸 수보다 많으면 전체 Place를 한 번에 계산 (벡터)
+    - Place 수가 brute_force_below 미만이면 껍질 탐색 없이 전체 계산
+      (중심은 연속 행렬로 보관하므로 전체 계산은 numpy 한 번)
+
+거리는 PlaceCellManager.torus_distance와 같은 수식입니다:
+    d(Φ₁, Φ₂) = ||Δ - 2π·round(Δ / 2π)||, Δ = Φ₁ - Φ₂
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+from typing import Dict, Hashable, List, Optional, Tuple
+import itertools
+import math
+import numpy as np
+
+
+class PlaceSpatialIndex:
+    """
+    Place Spatial Index (토러스 bucket grid)
+
+    키(place_id)별 중심 위상 벡터를 저장하고, 주기 경계를 고려한 top-k 최근접 질의를 제공합니다.
+    중심이 바뀌면 update(), Place가 사라지면 remove()로 색인을 갱신합니다.
+    """
+
+    def __init__(
+        self,
+        phase_wrap: float = 2.0 * math.pi,
+        cells_per_axis: int = 8,
+        brute_force_below: int = 20000
+    ):
+        """
+        Args:
+            phase_wrap: 위상 wrapping 값 (기본값: 2π)
+            cells_per_axis: 축별 칸 수 (기본값: 8)
+            brute_force_below: Place 수가 이보다 적으면 껍질 탐색 없이 전체 벡터 계산 (기본값: 20000)
+        """
+        assert cells_per_axis > 0, f"cells_per_axis ({cells_per_axis}) must be > 0"
+        assert brute_force_below >= 0, f"brute_force_below ({brute_force_below}) must be >= 0"
+        self.phase_wrap = phase_wrap
+        self.cells_per_axis = cells_per_axis
+        self.cell_size = phase_wrap / cells_per_axis
+        self.brute_force_below = brute_force_below
+        self.dim: Optional[int] = None
+
+        # 중심 행렬 (연속 메모리, 앞쪽 len(self)행만 유효) / 행 → 키 / 키 → 행
+        self._matrix = np.zeros((0, 0), dtype=np.float64)
+        self._keys: List[Hashable] = []
+        self._rows: Dict[Hashable, int] = {}
+        self._cells: Dict[Hashable, Tuple[int, ...]] = {}
+        # 칸 → 키 집합 (삽입 순서 유지)
+        self._buckets: Dict[Tuple[int, ...], Dict[Hashable, None]] = {}
+        # 껍질 s의 칸 오프셋, shape (n_cells, dim)
+        self._shells: Dict[int, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def _cell_of(self, center: np.ndarray) -> Tuple[int, ...]:
+        """중심 위상 → 칸 인덱스 (축마다 [0, cells_per_axis))"""
+        cell = np.floor(np.mod(center, self.phase_wrap) / self.cell_size).astype(np.int64)
+        return tuple((cell % self.cells_per_axis).tolist())
+
+    def update(self, key: Hashable, center: np.ndarray) -> None:
+        """
+        Place 중심 추가 또는 갱신
+
+        Args:
+            key: Place 키 (place_id)
+            center: 중심 위상 벡터 [rad]
+        """
+        center = np.asarray(center, dtype=np.float64)
+        if self.dim is None:
+            self.dim = len(center)
+            self._matrix = np.zeros((16, self.dim), dtype=np.float64)
+        assert len(center) == self.dim, \
+            f"center dimension ({len(center)}) must match index dimension ({self.dim})"
+
+        cell = self._cell_of(center)
+        old_cell = self._cells.get(key)
+        if old_cell != cell:
+            if old_cell is not None:
+                self._discard(key, old_cell)
+            self._buckets.setdefault(cell, {})[key] = None
+            self._cells[key] = cell
+
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._keys)
+            if row == len(self._matrix):
+                grown = np.zeros((2 * row, self.dim), dtype=np.float64)
+                grown[:row] = self._matrix
+                self._matrix = grown
+            self._keys.append(key)
+            self._rows[key] = row
+        self._matrix[row] = center
+
+    def remove(self, key: Hashable) -> None:
+        """Place 제거 (없으면 무시, 마지막 행을 빈 행으로 옮김)"""
+        cell = self._cells.pop(key, None)
+        if cell is None:
+            return
+        self._discard(key, cell)
+        row = self._rows.pop(key)
+        last_key = self._keys.pop()
+        if last_key != key:
+            self._matrix[row] = self._matrix[len(self._keys)]
+            self._keys[row] = last_key
+            self._rows[last_key] = row
+
+    def clear(self) -> None:
+        """모든 Place 제거"""
+        self._keys.clear()
+        self._rows.clear()
+        self._cells.clear()
+        self._buckets.clear()
+
+    def _discard(self, key: Hashable, cell: Tuple[int, ...]) -> None:
+        bucket = self._buckets[cell]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[cell]
+
+    def _shell_offsets(self, s: int) -> np.ndarray:
+        """껍질 s의 칸 오프셋 (Chebyshev 거리 = s)"""
+        offsets = self._shells.get(s)
+        if offsets is None:
+            offsets = np.array([
+                offset for offset in itertools.product(range(-s, s + 1), repeat=self.dim)
+                if max(abs(o) for o in offset) == s
+            ], dtype=np.int64).reshape(-1, self.dim)
+            self._shells[s] = offsets
+        return offsets
+
+    def _distances(self, phase_vector: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        """행들의 토러스 거리 [rad] (벡터, rows가 None이면 전체)"""
+        centers = self._matrix[:len(self._keys)] if rows is None else self._matrix[rows]
+        diff = phase_vector - centers
+        diff -= self.phase_wrap * np.round(diff / self.phase_wrap)
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+    def _nearest(
+        self,
+        phase_vector: np.ndarray,
+        rows: Optional[np.ndarray],
+        k: int,
+        max_distance: float
+    ) -> List[Tuple[float, Hashable]]:
+        distances = self._distances(phase_vector, rows)
+        if k < len(distances):
+            top = np.argpartition(distances, k - 1)[:k]
+            order = top[np.argsort(distances[top], kind="stable")]
+        else:
+            order = np.argsort(distances, kind="stable")
+        order_rows = order if rows is None else rows[order]
+        keys = self._keys
+        return [
+            (float(distance), keys[row])
+            for distance, row in zip(distances[order].tolist(), order_rows.tolist())
+            if distance <= max_distance
+        ]
+
+    def query(
+        self,
+        phase_vector: np.ndarray,
+        k: int,
+        max_distance: float = math.inf
+    ) -> List[Tuple[float, Hashable]]:
+        """
+        top-k 최근접 Place (주기 경계 고려, 정확)
+
+        Place 수가 brute_force_below보다 적으면 중심 행렬 전체를 한 번에 계산합니다
+        (5D, 칸 8개/축 기준 약 2만 개까지는 껍질 탐색보다 빠름).
+
+        Args:
+            phase_vector: 질의 위상 벡터 [rad]
+            k: 반환할 최대 Place 수
+            max_distance: 최대 거리 [rad] (이보다 먼 Place는 제외)
+
+        Returns:
+            [(distance, key), ...] 거리 오름차순
+        """
+        if not self._keys or k <= 0:
+            return []
+        phase_vector = np.asarray(phase_vector, dtype=np.float64)
+        assert len(phase_vector) == self.dim, \
+            f"phase_vector dimension ({len(phase_vector)}) must match index dimension ({self.dim})"
+
+        if len(self._keys) < self.brute_force_below:
+            return self._nearest(phase_vector, None, k, max_distance)
+
+        m = self.cells_per_axis
+        base = np.array(self._cell_of(phase_vector), dtype=np.int64)
+        candidates: List[int] = []
+        rows = self._rows
+
+        for s in itertools.count():
+            # 껍질이 토러스 전체를 덮거나, 볼 칸이 점유된 칸보다 많으면 전체 계산
+            if s > 0 and (2 * s + 1 >= m or (2 * s + 1) ** self.dim > len(self._buckets)):
+                return self._nearest(phase_vector, None, k, max_distance)
+
+            for cell in ((base + self._shell_offsets(s)) % m).tolist():
+                bucket = self._buckets.get(tuple(cell))
+                if bucket:
+                    candidates.extend(rows[key] for key in bucket)
+
+            # 껍질 0..s 밖의 Place는 최소 s·h만큼 떨어져 있음
+            bound = s * self.cell_size
+            if bound >= max_distance:
+                break
+            if len(candidates) >= k:
+                distances = self._distances(phase_vector, np.array(candidates, dtype=np.intp))
+                if np.partition(distances, k - 1)[k - 1] <= bound:
+                    break
+
+        if not candidates:
+            return []
+        return self._nearest(phase_vector, np.array(candidates, dtype=np.intp), k, max_distance)
+
+
+def torus_close_pairs(
+    centers: np.ndarray,
+    threshold: float,
+    phase_wrap: float = 2.0 * math.pi
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    토러스 거리가 threshold 미만인 모든 중심 쌍 (이웃 칸 hashing)
+
+    중심을 칸 크기 h ≥ threshold인 격자에 나누면, 가까운 쌍은 같은 칸 또는
+    이웃 칸 (축마다 오프셋 -1, 0, +1, 주기 경계)에만 있습니다.
+    오프셋마다 점유된 칸끼리 한 번에 짝지어 거리를 계산합니다 (O(N²) 쌍 비교 없음).
+
+    Args:
+        centers: 중심 위상 행렬 [rad], shape (N, D)
+        threshold: 임계 거리 [rad]
+        phase_wrap: 위상 wrapping 값 (기본값: 2π)
+
+    Returns:
+        (i, j, distance) — i < j, 거리 < threshold 인 쌍, (i, j) 오름차순
+    """
+    centers = np.asarray(centers, dtype=np.float64)
+    n = len(centers)
+    empty = (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp), np.zeros(0))
+    if n < 2 or threshold <= 0.0:
+        return empty
+    dim = centers.shape[1]
+
+    # 칸 수 (칸 크기 ≥ threshold, 선형 키가 int64 범위를 넘지 않도록 제한)
+    m = max(1, min(int(phase_wrap // threshold), int((2 ** 62) ** (1.0 / dim))))
+    h = phase_wrap / m
+    cells = np.floor(np.mod(centers, phase_wrap) / h).astype(np.int64) % m
+    radix = m ** np.arange(dim - 1, -1, -1, dtype=np.int64)
+
+    # 점유된 칸: 칸 키 오름차순으로 점 정렬, 칸별 [start, start + count)
+    keys = cells @ radix
+    order = np.argsort(keys, kind="stable")
+    cell_keys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+    cell_coords = cells[order[starts]]
+
+    # 이웃 오프셋 (m < 3이면 mod m으로 겹치는 오프셋 제거)
+    offsets = np.array(list(itertools.product((-1, 0, 1), repeat=dim)), dtype=np.int64)
+    offsets = np.unique(offsets % m, axis=0)
+
+    pair_i, pair_j, pair_d = [], [], []
+    for offset in offsets:
+        target = ((cell_coords + offset) % m) @ radix
+        pos = np.searchsorted(cell_keys, target)
+        pos[pos == len(cell_keys)] = 0
+        hit = cell_keys[pos] == target
+        a_start, a_count = starts[hit], counts[hit]
+        b_start, b_count = starts[pos[hit]], counts[pos[hit]]
+
+        # 칸 쌍 (a, b)마다 a_count × b_count개의 점 쌍
+        sizes = a_count * b_count
+        total = int(sizes.sum())
+        if total == 0:
+            continue
+        pair = np.repeat(np.arange(len(sizes)), sizes)
+        k = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        i = order[a_start[pair] + k // b_count[pair]]
+        j = order[b_start[pair] + k % b_count[pair]]
+
+        keep = i < j
+        i, j = i[keep], j[keep]
+        diff = centers[i] - centers[j]
+        diff = diff - phase_wrap * np.round(diff / phase_wrap)
+        distance = np.sqrt(np.sum(diff * diff, axis=1))
+        close = distance < threshold
+        pair_i.append(i[close])
+        pair_j.append(j[close])
+        pair_d.append(distance[close])
+
+    if not pair_i:
+        return empty
+    i, j, distance = np.concatenate(pair_i), np.concatenate(pair_j), np.concatenate(pair_d)
+    # 같은 칸 쌍이 여러 오프셋에서 나오지 않도록 (m < 3) 중복 제거 + 정렬
+    pair_key = i.astype(np.int64) * n + j
+    pair_key, first = np.unique(pair_key, return_index=True)
+    return i[first], j[first], distance[first]
@@ -13,7 +13,7 @@ Version: v0.4.1-alpha (Replay Buffer extension)
 License: MIT License
 """
 
-from typing import List, Dict, Optional, Any
+from typing import Iterator, List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field
 import numpy as np
 from collections import deque
@@ -65,18 +65,143 @@ class TrajectoryPoint:
                 acceleration_norm < acceleration_threshold)
 
 
+class ReplaySegment:
+    """
+    안정 구간 (Replay Buffer의 연속 포인트 범위) ✨ NEW
+    
+    [start, end)는 기록 순서 위치 (0 = 가장 오래된 포인트), rows는 해당 열 행 번호입니다.
+    열 속성 (errors, place_ids, ...)은 구간의 배열이며, 반복하면 TrajectoryPoint view를 반환합니다.
+    다음 add_point 전까지 유효합니다.
+    """
+    
+    __slots__ = ("buffer", "start", "end", "rows")
+    
+    def __init__(self, buffer: "ReplayBuffer", start: int, end: int, rows: np.ndarray):
+        self.buffer = buffer
+        self.start = start
+        self.end = end
+        self.rows = rows
+    
+    def __repr__(self) -> str:
+        return f"ReplaySegment(start={self.start}, end={self.end})"
+    
+    def __len__(self) -> int:
+        return self.end - self.start
+    
+    def __iter__(self) -> Iterator[TrajectoryPoint]:
+        return (self.buffer.point(row) for row in self.rows.tolist())
+    
+    def __getitem__(self, index: int) -> TrajectoryPoint:
+        return self.buffer.point(int(self.rows[index]))
+    
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.buffer.timestamps[self.rows]
+    
+    @property
+    def phase_vectors(self) -> np.ndarray:
+        return self.buffer.phase_vectors[self.rows]
+    
+    @property
+    def errors(self) -> np.ndarray:
+        return self.buffer.errors[self.rows]
+    
+    @property
+    def place_ids(self) -> np.ndarray:
+        return self.buffer.place_ids[self.rows]
+    
+    @property
+    def context_ids(self) -> np.ndarray:
+        return self.buffer.context_ids[self.rows]
+    
+    @property
+    def seqs(self) -> np.ndarray:
+        return self.buffer.seqs[self.rows]
+
+
+def _group_order(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (N, K) 정수 키 그룹화 (lexsort, 안정 정렬, 첫 열이 가장 우선)
+    
+    Returns:
+        (order, starts) — keys[order]는 키 오름차순 (같은 키는 원래 순서),
+        starts는 각 그룹의 order 내 시작 위치 (order[starts] = 그룹별 첫 원소)
+    """
+    order = np.lexsort(keys.T[::-1])
+    sorted_keys = keys[order]
+    change = np.ones(len(order), dtype=bool)
+    change[1:] = np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1)
+    return order, np.flatnonzero(change)
+
+
+@dataclass
+class SegmentSummary:
+    """
+    안정 구간 요약 (기록 시 증분 추적) ✨ NEW
+    
+    [start, end)는 포인트 순번 (seq, ReplayBuffer.seqs)이며,
+    (place_id, context_id) 그룹별 포인트 수 / 오차 합 / 첫 포인트 위상 / 첫 포인트 순번을 가집니다.
+    그룹 합은 기록 시점 값이므로 행이 덮어써져도 유효합니다.
+    """
+    start: int  # 첫 포인트 순번
+    end: int  # 마지막 포인트 다음 순번
+    keys: np.ndarray  # (G, 2) [place_id, context_id] (context_id = NO_CONTEXT이면 없음)
+    counts: np.ndarray  # (G,) 그룹별 포인트 수
+    error_sums: np.ndarray  # (G, D) 그룹별 오차 합
+    first_phases: np.ndarray  # (G, D) 그룹별 첫 포인트 위상 벡터
+    first_seqs: np.ndarray  # (G,) 그룹별 첫 포인트 순번 (구간 안 첫 등장 순서)
+    
+    @property
+    def length(self) -> int:
+        """구간 길이 (포인트 수)"""
+        return self.end - self.start
+    
+    @property
+    def mean_errors(self) -> np.ndarray:
+        """그룹별 평균 오차, shape (G, D)"""
+        return self.error_sums / self.counts[:, None]
+
+
 class ReplayBuffer:
     """
     Replay Buffer
     
     Online phase에서 trajectory/error/state를 기록하고,
     Replay phase에서 안정적인 구간만 재생합니다.
+    
+    저장 방식 (열 기반 ring buffer) ✨ NEW:
+        phase_vectors, current_states, target_states, errors, velocities, accelerations (max_size × D)
+        timestamps (max_size,), place_ids (max_size,), context_ids (max_size,, NO_CONTEXT = 없음)
+        seqs (max_size,): 포인트 순번 (단조 증가, Replay watermark 기준)
+        head: 다음 기록 위치, size: 저장된 포인트 수 (가득 차면 가장 오래된 행부터 덮어씀)
+    
+    기록은 행 하나에 대한 slice 대입뿐이며, 벡터화 소비자는 get_arrays()/rows()로
+    변환 없이 열을 사용합니다. 반복 (for point in buffer)과 buffer[i]는 행을 가리키는
+    TrajectoryPoint view를 반환합니다 (덮어쓰기 전까지 유효, 보관하려면 배열을 복사).
+    
+    증분 안정 구간 추적 ✨ NEW:
+        생성 시 임계값 (velocity/acceleration_threshold, min_segment_length)으로 새 포인트만
+        처리해 열린 구간을 이어가고, 끝난 구간은 SegmentSummary로 쌓습니다.
+        새 포인트는 조회 시 또는 덮어쓰기 직전에 한 번에 (벡터로) 처리합니다.
+        Replay는 pop_finished_segments() + summary_groups()로 끝난 구간의 그룹 합만 소비합니다
+        (버퍼 행을 다시 읽지 않음). include_open=True면 휴지기에도 끝나지 않은 열린 구간의
+        지금까지 부분을 함께 꺼내고, 같은 run의 나머지는 이어서 추적합니다 (최소 길이 검사 없이).
     """
     
+    NO_CONTEXT = -1  # context_ids에서 "Context 없음"
+    
+    _VECTOR_COLUMNS = (
+        'phase_vectors', 'current_states', 'target_states', 'errors', 'velocities', 'accelerations'
+    )
+    
     def __init__(
         self,
         max_size: int = 10000,  # 최대 버퍼 크기
-        stable_window: int = 10  # 안정성 판단 윈도우 (최근 N 포인트)
+        stable_window: int = 10,  # 안정성 판단 윈도우 (최근 N 포인트)
+        dim: Optional[int] = None,  # 벡터 차원 (None이면 첫 포인트에서 결정)
+        velocity_threshold: float = 0.01,  # 증분 구간 추적: 속도 임계값
+        acceleration_threshold: float = 0.001,  # 증분 구간 추적: 가속도 임계값
+        min_segment_length: int = 5  # 증분 구간 추적: 최소 구간 길이
     ):
         """
         Replay Buffer 초기화
@@ -84,16 +209,191 @@ class ReplayBuffer:
         Args:
             max_size: 최대 버퍼 크기
             stable_window: 안정성 판단 윈도우 크기
+            dim: 벡터 열 차원 (None이면 첫 add_point에서 결정)
+            velocity_threshold: 증분 구간 추적의 속도 임계값
+            acceleration_threshold: 증분 구간 추적의 가속도 임계값
+            min_segment_length: 증분 구간 추적의 최소 구간 길이
         """
+        assert max_size > 0, f"max_size ({max_size}) must be > 0"
+        assert min_segment_length > 0, f"min_segment_length ({min_segment_length}) must be > 0"
         self.max_size = max_size
         self.stable_window = stable_window
+        self.velocity_threshold = velocity_threshold
+        self.acceleration_threshold = acceleration_threshold
+        self.min_segment_length = min_segment_length
+        self.dim: Optional[int] = None
         
-        # 버퍼 (deque 사용하여 자동 오버플로우 처리)
-        self.buffer: deque = deque(maxlen=max_size)
+        # 열 (dim이 정해지면 할당)
+        self.head: int = 0
+        self.size: int = 0
+        if dim is not None:
+            self._allocate(dim)
         
         # 통계
         self.total_points: int = 0
-        self.stable_points: int = 0
+        self._stable_count: int = 0
+        
+        # 포인트 순번 (단조 증가, clear()에서도 초기화하지 않음) / Replay watermark ✨ NEW
+        self.next_seq: int = 0  # 다음 포인트 순번
+        self.replay_watermark: int = 0  # 이 순번부터 아직 Replay하지 않음
+        
+        # 증분 구간 추적 상태
+        self._tracked: int = 0  # 구간 추적이 처리한 다음 순번
+        self._open: Optional[SegmentSummary] = None  # 열린 (아직 끝나지 않은) 안정 구간
+        self._open_carried: bool = False  # 열린 구간이 앞부분을 이미 꺼낸 run의 나머지인지
+        self._carry: bool = False  # 열린 구간을 꺼낸 직후 (다음 포인트가 안정이면 같은 run의 나머지)
+        self._finished: deque = deque(maxlen=max(1, max_size // min_segment_length))
+        self.dropped_segments: int = 0  # 소비되지 않고 밀려난 구간 수
+    
+    @property
+    def stable_points(self) -> int:
+        """기록된 전체 포인트 중 안정 포인트 수 (증분 추적 임계값)"""
+        self._advance()
+        return self._stable_count
+    
+    def _group(self, rows: np.ndarray, start: int, end: int) -> SegmentSummary:
+        """행들의 (place_id, context_id) 그룹 합 (그룹은 키 오름차순)"""
+        keys = np.stack([self.place_ids[rows], self.context_ids[rows]], axis=1)
+        order, starts = _group_order(keys)
+        return SegmentSummary(
+            start=start,
+            end=end,
+            keys=keys[order[starts]],
+            counts=np.diff(np.append(starts, len(order))),
+            error_sums=np.add.reduceat(self.errors[rows[order]], starts, axis=0),
+            first_phases=self.phase_vectors[rows[order[starts]]],
+            first_seqs=start + order[starts]
+        )
+    
+    def _merge(self, head: SegmentSummary, tail: SegmentSummary) -> SegmentSummary:
+        """이어지는 두 구간 요약 합치기 (첫 위상은 앞 구간 우선)"""
+        keys = np.concatenate([head.keys, tail.keys])
+        order, starts = _group_order(keys)
+        counts = np.concatenate([head.counts, tail.counts])[order]
+        return SegmentSummary(
+            start=head.start,
+            end=tail.end,
+            keys=keys[order[starts]],
+            counts=np.add.reduceat(counts, starts),
+            error_sums=np.add.reduceat(
+                np.concatenate([head.error_sums, tail.error_sums])[order], starts, axis=0
+            ),
+            first_phases=np.concatenate([head.first_phases, tail.first_phases])[order[starts]],
+            first_seqs=np.concatenate([head.first_seqs, tail.first_seqs])[order[starts]]
+        )
+    
+    def _finish(self, segment: SegmentSummary, carried: bool = False) -> None:
+        """끝난 구간: 최소 길이 이상이거나 앞부분을 이미 꺼낸 run의 나머지면 보관"""
+        if carried or segment.length >= self.min_segment_length:
+            if len(self._finished) == self._finished.maxlen:
+                self.dropped_segments += 1
+            self._finished.append(segment)
+    
+    def _advance(self) -> None:
+        """
+        아직 처리하지 않은 포인트로 구간 추적 진행 (새 포인트 수에 비례, 벡터)
+        
+        열린 구간은 새 포인트의 첫 안정 run과 이어지고, run이 끝까지 이어지면 계속 열린 상태입니다.
+        """
+        pending = self.next_seq - self._tracked
+        if pending == 0:
+            return
+        base = self._tracked
+        rows = (self.head - pending + np.arange(pending)) % self.max_size
+        mask = self._stable_mask(rows, self.velocity_threshold, self.acceleration_threshold)
+        self._stable_count += int(np.count_nonzero(mask))
+        
+        padded = np.zeros(pending + 2, dtype=np.int8)
+        padded[1:-1] = mask
+        boundaries = np.flatnonzero(np.diff(padded))
+        
+        # 열린 구간 (또는 꺼낸 run)이 새 포인트 첫 원소에서 끊기면 종료
+        if not mask[0]:
+            if self._open is not None:
+                self._finish(self._open, self._open_carried)
+                self._open = None
+            self._carry = False
+        
+        for start, end in zip(boundaries[0::2].tolist(), boundaries[1::2].tolist()):
+            segment = self._group(rows[start:end], base + start, base + end)
+            carried = False
+            if start == 0:
+                if self._open is not None:
+                    segment = self._merge(self._open, segment)
+                    carried = self._open_carried
+                    self._open = None
+                else:
+                    carried = self._carry
+                self._carry = False
+            if end == pending:
+                self._open = segment
+                self._open_carried = carried
+            else:
+                self._finish(segment, carried)
+        
+        self._tracked = self.next_seq
+    
+    def pop_finished_segments(self, include_open: bool = False) -> List[SegmentSummary]:
+        """
+        끝난 안정 구간 요약을 꺼냄 (꺼낸 구간은 다시 반환하지 않음) + replay_watermark 전진
+        
+        Args:
+            include_open: True면 열린 구간의 지금까지 부분도 꺼냄 (최소 길이 이상이거나 run의 나머지일 때).
+                같은 run이 이어지면 나머지는 새 구간으로 추적하고 끝날 때 길이와 관계없이 보관합니다.
+                정지 상태가 휴지기를 넘어 계속되어도 Replay가 학습하도록 합니다.
+        
+        Returns:
+            SegmentSummary 리스트 (순번 순서)
+        """
+        self._advance()
+        segments = list(self._finished)
+        self._finished.clear()
+        open_segment = self._open
+        if include_open and open_segment is not None and (
+            self._open_carried or open_segment.length >= self.min_segment_length
+        ):
+            segments.append(open_segment)
+            self._open = None
+            self._carry = True
+        # 꺼내지 않은 열린 구간의 시작부터 아직 Replay하지 않음
+        self.replay_watermark = self._open.start if self._open is not None else self._tracked
+        return segments
+    
+    @property
+    def finished_segments(self) -> List[SegmentSummary]:
+        """아직 꺼내지 않은 끝난 안정 구간 요약 (꺼내지 않음)"""
+        self._advance()
+        return list(self._finished)
+    
+    @property
+    def open_segment(self) -> Optional[SegmentSummary]:
+        """현재 열린 안정 구간 요약 (없으면 None)"""
+        self._advance()
+        return self._open
+    
+    def _stable_mask(
+        self,
+        rows: np.ndarray,
+        velocity_threshold: float = 0.01,
+        acceleration_threshold: float = 0.001
+    ) -> np.ndarray:
+        """행별 안정 여부 (||v|| < v_th and ||a|| < a_th), shape (len(rows),)"""
+        velocities = self.velocities[rows]
+        accelerations = self.accelerations[rows]
+        return (
+            (np.sqrt(np.einsum('ij,ij->i', velocities, velocities)) < velocity_threshold) &
+            (np.sqrt(np.einsum('ij,ij->i', accelerations, accelerations)) < acceleration_threshold)
+        )
+    
+    def _allocate(self, dim: int) -> None:
+        """열 할당 (max_size × dim)"""
+        self.dim = dim
+        for name in self._VECTOR_COLUMNS:
+            setattr(self, name, np.zeros((self.max_size, dim), dtype=np.float64))
+        self.timestamps = np.zeros(self.max_size, dtype=np.float64)
+        self.place_ids = np.zeros(self.max_size, dtype=np.int64)
+        self.context_ids = np.full(self.max_size, self.NO_CONTEXT, dtype=np.int64)
+        self.seqs = np.zeros(self.max_size, dtype=np.int64)
     
     def add_point(
         self,
@@ -108,7 +408,7 @@ class ReplayBuffer:
         context_id: Optional[int] = None
     ) -> None:
         """
-        궤적 포인트 추가 (Online phase)
+        궤적 포인트 추가 (Online phase, 행 하나에 slice 대입)
         
         Args:
             timestamp: 시간 (ms)
@@ -121,31 +421,133 @@ class ReplayBuffer:
             place_id: Place ID
             context_id: Context ID (None이면 Context 없음)
         """
-        point = TrajectoryPoint(
-            timestamp=timestamp,
-            phase_vector=phase_vector.copy(),
-            current_state=current_state.copy(),
-            target_state=target_state.copy(),
-            error=error.copy(),
-            velocity=velocity.copy(),
-            acceleration=acceleration.copy(),
-            place_id=place_id,
-            context_id=context_id
-        )
+        if self.dim is None:
+            self._allocate(len(phase_vector))
+        
+        # 덮어쓸 행이 아직 처리하지 않은 포인트면 먼저 구간 추적 진행
+        if self.next_seq - self._tracked == self.max_size:
+            self._advance()
         
-        self.buffer.append(point)
+        row = self.head
+        self.phase_vectors[row] = phase_vector
+        self.current_states[row] = current_state
+        self.target_states[row] = target_state
+        self.errors[row] = error
+        self.velocities[row] = velocity
+        self.accelerations[row] = acceleration
+        self.timestamps[row] = timestamp
+        self.place_ids[row] = place_id
+        self.context_ids[row] = self.NO_CONTEXT if context_id is None else context_id
+        self.seqs[row] = self.next_seq
+        
+        self.head = (row + 1) % self.max_size
+        if self.size < self.max_size:
+            self.size += 1
         self.total_points += 1
+        self.next_seq += 1
+    
+    # --- 열 접근 (벡터화 소비자용) ✨ NEW ---
+    
+    def rows(self) -> np.ndarray:
+        """저장된 포인트의 행 번호 (오래된 것부터), shape (size,)"""
+        start = (self.head - self.size) % self.max_size
+        return (start + np.arange(self.size)) % self.max_size
+    
+    def get_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        모든 열 (오래된 것부터 정렬)
+        
+        ring이 한 바퀴 돌기 전에는 열의 view (복사 없음), 이후에는 순서대로 모은 복사본입니다.
+        
+        Returns:
+            {'timestamps', 'phase_vectors', 'current_states', 'target_states', 'errors',
+             'velocities', 'accelerations', 'place_ids', 'context_ids', 'seqs'}
+        """
+        if self.dim is None:
+            return {}
+        if self.size < self.max_size or self.head == 0:
+            index = slice(0, self.size)
+        else:
+            index = self.rows()
+        names = ('timestamps',) + self._VECTOR_COLUMNS + ('place_ids', 'context_ids', 'seqs')
+        return {name: getattr(self, name)[index] for name in names}
+    
+    def point(self, row: int) -> TrajectoryPoint:
+        """행 → TrajectoryPoint view (배열 속성은 열의 view)"""
+        context_id = int(self.context_ids[row])
+        return TrajectoryPoint(
+            timestamp=float(self.timestamps[row]),
+            phase_vector=self.phase_vectors[row],
+            current_state=self.current_states[row],
+            target_state=self.target_states[row],
+            error=self.errors[row],
+            velocity=self.velocities[row],
+            acceleration=self.accelerations[row],
+            place_id=int(self.place_ids[row]),
+            context_id=None if context_id == self.NO_CONTEXT else context_id
+        )
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __iter__(self) -> Iterator[TrajectoryPoint]:
+        """포인트 (오래된 것부터, TrajectoryPoint view)"""
+        return (self.point(row) for row in self.rows().tolist())
+    
+    def __getitem__(self, index: int) -> TrajectoryPoint:
+        """index번째 포인트 (0 = 가장 오래된 것, 음수 허용)"""
+        if not -self.size <= index < self.size:
+            raise IndexError(f"replay buffer index {index} out of range ({self.size})")
+        return self.point((self.head - self.size + index % self.size) % self.max_size)
+    
+    @property
+    def buffer(self) -> List[TrajectoryPoint]:
+        """포인트 리스트 (하위 호환, 호출마다 TrajectoryPoint view 생성)"""
+        return list(self)
+    
+    def get_stable_mask(
+        self,
+        velocity_threshold: float = 0.01,
+        acceleration_threshold: float = 0.001
+    ) -> np.ndarray:
+        """
+        포인트별 안정 여부 (기록 순서, 한 번에 벡터 계산) ✨ NEW
+        
+        Returns:
+            bool 배열, shape (size,)
+        """
+        if self.size == 0:
+            return np.zeros(0, dtype=bool)
+        return self._stable_mask(self.rows(), velocity_threshold, acceleration_threshold)
+    
+    def get_stable_segment_ranges(
+        self,
+        velocity_threshold: float = 0.01,
+        acceleration_threshold: float = 0.001,
+        min_segment_length: int = 5
+    ) -> np.ndarray:
+        """
+        안정 구간의 위치 범위 (run-length 경계) ✨ NEW
         
-        # 안정적인 포인트인지 확인
-        if point.is_stable():
-            self.stable_points += 1
+        안정 mask의 diff로 구간 시작/끝을 찾고, 길이가 min_segment_length 이상인 구간만 남깁니다.
+        
+        Returns:
+            [start, end) 기록 순서 위치, shape (num_segments, 2), int64
+        """
+        mask = self.get_stable_mask(velocity_threshold, acceleration_threshold)
+        padded = np.zeros(len(mask) + 2, dtype=np.int8)
+        padded[1:-1] = mask
+        boundaries = np.flatnonzero(np.diff(padded))
+        starts, ends = boundaries[0::2], boundaries[1::2]
+        keep = ends - starts >= min_segment_length
+        return np.stack([starts[keep], ends[keep]], axis=1).astype(np.int64)
     
     def get_stable_segments(
         self,
         velocity_threshold: float = 0.01,
         acceleration_threshold: float = 0.001,
         min_segment_length: int = 5
-    ) -> List[List[TrajectoryPoint]]:
+    ) -> List[ReplaySegment]:
         """
         안정적인 구간만 추출 (Replay phase용)
         
@@ -159,28 +561,169 @@ class ReplayBuffer:
             min_segment_length: 최소 구간 길이
         
         Returns:
-            안정적인 구간 리스트 (각 구간은 TrajectoryPoint 리스트)
+            안정적인 구간 리스트 (각 구간은 ReplaySegment, 반복하면 TrajectoryPoint)
         """
-        if len(self.buffer) < min_segment_length:
+        ranges = self.get_stable_segment_ranges(
+            velocity_threshold, acceleration_threshold, min_segment_length
+        )
+        if len(ranges) == 0:
             return []
+        rows = self.rows()
+        return [
+            ReplaySegment(self, start, end, rows[start:end])
+            for start, end in ranges.tolist()
+        ]
+    
+    @property
+    def oldest_seq(self) -> int:
+        """버퍼에 남아 있는 가장 오래된 포인트 순번"""
+        return self.next_seq - self.size
+    
+    @property
+    def pending_points(self) -> int:
+        """watermark 이후 (아직 Replay하지 않은) 버퍼 포인트 수"""
+        return self.next_seq - max(self.replay_watermark, self.oldest_seq)
+    
+    def consume_stable_segments(
+        self,
+        velocity_threshold: float = 0.01,
+        acceleration_threshold: float = 0.001,
+        min_segment_length: int = 5,
+        include_open: bool = False
+    ) -> List[ReplaySegment]:
+        """
+        watermark 이후 포인트의 안정 구간만 추출하고 watermark를 전진 ✨ NEW
         
-        stable_segments = []
-        current_segment = []
+        같은 포인트는 한 번만 반환됩니다 (Replay마다 같은 데이터를 다시 학습하지 않음).
+        버퍼 끝까지 이어지는 (아직 끝나지 않은) 안정 run은 반환하지 않고
+        watermark를 그 run의 시작에 두어 다음 Replay에서 전체 구간으로 처리합니다.
+        덮어써진 포인트는 건너뜁니다 (watermark < oldest_seq).
         
-        for point in self.buffer:
-            if point.is_stable(velocity_threshold, acceleration_threshold):
-                current_segment.append(point)
-            else:
-                # 안정적인 구간이 끝남
-                if len(current_segment) >= min_segment_length:
-                    stable_segments.append(current_segment)
-                current_segment = []
+        Args:
+            velocity_threshold: 속도 임계값
+            acceleration_threshold: 가속도 임계값
+            min_segment_length: 최소 구간 길이
+            include_open: True면 버퍼 끝의 열린 run도 지금 반환 (이후 포인트는 새 구간)
+        
+        Returns:
+            안정적인 구간 리스트 (ReplaySegment, 위치는 버퍼 전체 기준)
+        """
+        start_seq = max(self.replay_watermark, self.oldest_seq)
+        offset = start_seq - self.oldest_seq
+        rows = self.rows()[offset:]
+        new_watermark = self.next_seq
+        segments = []
+        if len(rows) > 0:
+            mask = self._stable_mask(rows, velocity_threshold, acceleration_threshold)
+            padded = np.zeros(len(rows) + 2, dtype=np.int8)
+            padded[1:-1] = mask
+            boundaries = np.flatnonzero(np.diff(padded))
+            for start, end in zip(boundaries[0::2].tolist(), boundaries[1::2].tolist()):
+                if end == len(rows) and not include_open:
+                    # 열린 run: 다음 Replay로 이월
+                    new_watermark = start_seq + start
+                    continue
+                if end - start >= min_segment_length:
+                    segments.append(ReplaySegment(self, offset + start, offset + end, rows[start:end]))
+        self.replay_watermark = new_watermark
+        return segments
+    
+    def group_segments(
+        self,
+        segments: List[ReplaySegment],
+        min_group_size: int = 1
+    ) -> Dict[str, np.ndarray]:
+        """
+        구간별 (place_id, context_id) 그룹 통계 (모든 구간을 한 번에, 벡터) ✨ NEW
+        
+        그룹 키는 (구간 번호, place_id, context_id)이며, 그룹 순서는 구간 순서 →
+        구간 안 첫 등장 순서입니다 (구간마다 딕셔너리로 모으던 순서와 같음).
+        
+        Args:
+            segments: 안정 구간 리스트 (get_stable_segments / consume_stable_segments 결과)
+            min_group_size: 최소 그룹 포인트 수 (미만인 그룹 제외)
+        
+        Returns:
+            {'segment_index', 'place_ids', 'context_ids', 'counts', 'mean_errors', 'first_phases'}
+            (그룹 수 G, 벡터 열은 (G, D))
+        """
+        dim = self.dim or 0
+        if not segments:
+            return {
+                'segment_index': np.zeros(0, dtype=np.int64),
+                'place_ids': np.zeros(0, dtype=np.int64),
+                'context_ids': np.zeros(0, dtype=np.int64),
+                'counts': np.zeros(0, dtype=np.int64),
+                'mean_errors': np.zeros((0, dim)),
+                'first_phases': np.zeros((0, dim)),
+            }
+        rows = np.concatenate([segment.rows for segment in segments])
+        segment_index = np.repeat(
+            np.arange(len(segments)), [len(segment) for segment in segments]
+        )
+        place_ids = self.place_ids[rows]
+        context_ids = self.context_ids[rows]
         
-        # 마지막 구간 처리
-        if len(current_segment) >= min_segment_length:
-            stable_segments.append(current_segment)
+        # (구간, place, context) 정렬 (안정 정렬: 그룹 안에서는 기록 순서)
+        order, starts = _group_order(np.stack([segment_index, place_ids, context_ids], axis=1))
+        counts = np.diff(np.append(starts, len(order)))
+        error_sums = np.add.reduceat(self.errors[rows[order]], starts, axis=0)
+        first = order[starts]  # 그룹별 첫 포인트 (concat 위치)
         
-        return stable_segments
+        # 구간 순서 → 구간 안 첫 등장 순서, 최소 크기 필터
+        group_order = np.argsort(first, kind='stable')
+        group_order = group_order[counts[group_order] >= min_group_size]
+        first = first[group_order]
+        counts = counts[group_order]
+        return {
+            'segment_index': segment_index[first],
+            'place_ids': place_ids[first],
+            'context_ids': context_ids[first],
+            'counts': counts,
+            'mean_errors': error_sums[group_order] / counts[:, None],
+            'first_phases': self.phase_vectors[rows[first]],
+        }
+    
+    def summary_groups(
+        self,
+        segments: List[SegmentSummary],
+        min_group_size: int = 1
+    ) -> Dict[str, np.ndarray]:
+        """
+        증분 구간 요약 → (place_id, context_id) 그룹 통계 (group_segments와 같은 형식/순서) ✨ NEW
+        
+        그룹 합은 기록 시 이미 계산되어 있으므로 버퍼 행을 다시 읽지 않습니다 (그룹 수에 비례).
+        그룹 순서는 구간 순서 → 구간 안 첫 등장 순서입니다.
+        
+        Args:
+            segments: pop_finished_segments() 결과
+            min_group_size: 최소 그룹 포인트 수 (미만인 그룹 제외)
+        
+        Returns:
+            {'segment_index', 'place_ids', 'context_ids', 'counts', 'mean_errors', 'first_phases'}
+        """
+        if not segments:
+            return self.group_segments([])
+        segment_index = np.repeat(
+            np.arange(len(segments)), [len(segment.counts) for segment in segments]
+        )
+        keys = np.concatenate([segment.keys for segment in segments])
+        counts = np.concatenate([segment.counts for segment in segments])
+        error_sums = np.concatenate([segment.error_sums for segment in segments])
+        first_phases = np.concatenate([segment.first_phases for segment in segments])
+        first_seqs = np.concatenate([segment.first_seqs for segment in segments])
+        
+        # 순번은 구간 사이에서도 단조 증가하므로 첫 순번 정렬 = 구간 순서 → 첫 등장 순서
+        order = np.argsort(first_seqs, kind='stable')
+        order = order[counts[order] >= min_group_size]
+        return {
+            'segment_index': segment_index[order],
+            'place_ids': keys[order, 0],
+            'context_ids': keys[order, 1],
+            'counts': counts[order],
+            'mean_errors': error_sums[order] / counts[order, None],
+            'first_phases': first_phases[order],
+        }
     
     def get_place_bias_data(
         self,
@@ -197,27 +740,37 @@ class ReplayBuffer:
         Returns:
             해당 Place의 TrajectoryPoint 리스트
         """
-        if context_id is None:
-            # Context 무시
-            return [p for p in self.buffer if p.place_id == place_id]
-        else:
+        if self.size == 0:
+            return []
+        rows = self.rows()
+        mask = self.place_ids[rows] == place_id
+        if context_id is not None:
             # Place + Context 조합
-            return [p for p in self.buffer 
-                   if p.place_id == place_id and p.context_id == context_id]
+            mask &= self.context_ids[rows] == context_id
+        return [self.point(row) for row in rows[mask].tolist()]
     
     def clear(self):
         """버퍼 초기화"""
-        self.buffer.clear()
+        self.head = 0
+        self.size = 0
         self.total_points = 0
-        self.stable_points = 0
+        self._stable_count = 0
+        self._tracked = self.next_seq
+        self.replay_watermark = self.next_seq
+        self._open = None
+        self._open_carried = False
+        self._carry = False
+        self._finished.clear()
     
     def get_statistics(self) -> Dict[str, Any]:
         """Replay Buffer 통계 정보"""
         return {
-            "buffer_size": len(self.buffer),
+            "buffer_size": self.size,
             "total_points": self.total_points,
             "stable_points": self.stable_points,
             "stable_ratio": self.stable_points / self.total_points if self.total_points > 0 else 0.0,
-            "max_size": self.max_size
+            "max_size": self.max_size,
+            "replay_watermark": self.replay_watermark,
+            "pending_points": self.pending_points
         }
 
@@ -17,7 +17,8 @@ License: MIT License
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import numpy as np
-from collections import deque
+from .bias_stats import BiasHistoryPool, BiasHistoryView, BiasWindowStats
+from .place_bank import PlaceBank
 
 
 @dataclass
@@ -29,7 +30,7 @@ class PlaceMemoryWithHistory:
     """
     place_id: int
     bias_estimate: np.ndarray = field(default_factory=lambda: np.zeros(5))  # 장기 기억 (Consolidated)
-    bias_history: deque = field(default_factory=lambda: deque(maxlen=10))  # 최근 10회차 bias 이력
+    bias_stats: BiasWindowStats = field(default_factory=BiasWindowStats, repr=False)  # 최근 10회차 bias 이력 + 이동 평균/분산 ✨ NEW
     visit_count: int = 0
     last_visit_time: float = 0.0
     last_update_time: float = 0.0  # 마지막 업데이트 시간
@@ -43,7 +44,12 @@ class PlaceMemoryWithHistory:
         Args:
             bias: 새로운 bias 추정값
         """
-        self.bias_history.append(bias.copy())
+        self.bias_stats.add(bias)  # 이력 ring 쓰기 (이동 평균/분산은 읽을 때 O(1) 분할 상환 반영)
+    
+    @property
+    def bias_history(self) -> BiasHistoryView:
+        """bias 이력 읽기 전용 view (오래된 것부터, 복사 없음, 추가는 add_bias_to_history)"""
+        return BiasHistoryView(self.bias_stats, self.bias_stats.history_size)
     
     def get_recent_biases(self, n: int) -> List[np.ndarray]:
         """
@@ -53,14 +59,18 @@ class PlaceMemoryWithHistory:
             n: 반환할 회차 수
         
         Returns:
-            최근 N회차의 bias 리스트
+            최근 N회차의 bias 리스트 (이력이 N개보다 적으면 모두)
+        """
+        return self.bias_stats.recent(n)
+    
+    def get_window_stats(self, n: int) -> Tuple[int, Optional[np.ndarray], Optional[np.ndarray]]:
         """
-        if len(self.bias_history) == 0:
-            return []
+        최근 N회차 bias 평균/분산 ✨ NEW
         
-        # 최근 N개 반환 (이력이 N개보다 적으면 모두 반환)
-        recent = list(self.bias_history)[-n:]
-        return recent
+        Returns:
+            (사용한 회차 수, 평균, 분산)
+        """
+        return self.bias_stats.stats(n)
 
 
 class ReplayConsolidation:
@@ -129,6 +139,22 @@ class ReplayConsolidation:
         bias_array = np.array(recent_biases)
         std = np.std(bias_array, axis=0)
         
+        return self.is_significant_std(len(recent_biases), std)
+    
+    def is_significant_std(self, num_biases: int, std: np.ndarray) -> bool:
+        """
+        미리 계산한 표준 편차로 통계적 유의성 검증 ✨ NEW
+        
+        Args:
+            num_biases: 표준 편차를 계산한 회차 수
+            std: 차원별 표준 편차 (모표준편차, np.std와 같음)
+        
+        Returns:
+            통계적 유의성 여부
+        """
+        if num_biases < self.consolidation_window:
+            return False  # 충분한 데이터가 없으면 유의하지 않음
+        
         # 모든 차원의 표준 편차가 임계값 이하이면 유의함
         return np.all(std < self.significance_threshold)
     
@@ -150,24 +176,33 @@ class ReplayConsolidation:
         Returns:
             Consolidation 성공 여부
         """
-        # ✅ bias_history가 있으면 Consolidation 가능 (visit_count는 참고용) ✨ FIXED
-        # Replay에서 여러 번 업데이트하면 bias_history가 쌓임
-        if len(place_memory.bias_history) < 2:  # 최소 2개 이상 필요
-            return False
-        
-        # 최근 N회차의 bias 이력 가져오기 (가능한 만큼)
-        available_history = len(place_memory.bias_history)
-        window_size = min(self.consolidation_window, available_history)  # 실제 사용 가능한 크기
-        recent_biases = place_memory.get_recent_biases(window_size)
-        
-        if len(recent_biases) < 2:  # 최소 2개 이상 필요 (완화)
-            return False  # 충분한 이력이 없음
-        
-        # 최근 N회차의 bias를 평균하여 노이즈 제거
-        consolidated_bias = np.mean(recent_biases, axis=0)
+        get_window_stats = getattr(place_memory, 'get_window_stats', None)
+        if get_window_stats is not None:
+            # ✅ 최근 N회차 (가능한 만큼) 평균/분산: 이동 Welford 누적값 (창 = stats_window일 때) ✨ NEW
+            num_biases, consolidated_bias, variance = get_window_stats(self.consolidation_window)
+            if num_biases < 2:  # 최소 2개 이상 필요
+                return False  # 충분한 이력이 없음
+            significant = self.is_significant_std(num_biases, np.sqrt(variance))
+        else:
+            # ✅ bias_history가 있으면 Consolidation 가능 (visit_count는 참고용) ✨ FIXED
+            # Replay에서 여러 번 업데이트하면 bias_history가 쌓임
+            if len(place_memory.bias_history) < 2:  # 최소 2개 이상 필요
+                return False
+            
+            # 최근 N회차의 bias 이력 가져오기 (가능한 만큼)
+            available_history = len(place_memory.bias_history)
+            window_size = min(self.consolidation_window, available_history)  # 실제 사용 가능한 크기
+            recent_biases = place_memory.get_recent_biases(window_size)
+            
+            if len(recent_biases) < 2:  # 최소 2개 이상 필요 (완화)
+                return False  # 충분한 이력이 없음
+            
+            # 최근 N회차의 bias를 평균하여 노이즈 제거
+            consolidated_bias = np.mean(recent_biases, axis=0)
+            significant = self.is_significant(consolidated_bias, recent_biases)
         
         # 통계적 유의성 검증
-        if self.is_significant(consolidated_bias, recent_biases):
+        if significant:
             # 진짜 편향으로 판단 → 장기 기억으로 고정
             place_memory.consolidated_bias = consolidated_bias.copy()
             place_memory.bias_estimate = consolidated_bias.copy()  # 장기 기억 업데이트
@@ -200,6 +235,96 @@ class ReplayConsolidation:
         # Consolidation 수행
         return self.consolidate_place_memory(place_memory, current_time)
     
+    def consolidate_windows(self, windows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 Place의 최근 W회차 bias를 한 번에 평균/유의성 검증 ✨ NEW
+        
+        Args:
+            windows: (N, W, D) Place별 최근 W회차 bias
+        
+        Returns:
+            (consolidated_biases (N, D), significant (N,))
+        """
+        consolidated_biases = windows.mean(axis=1)
+        std = windows.std(axis=1)
+        significant = np.all(std < self.significance_threshold, axis=1)
+        return consolidated_biases, significant
+    
+    def _replay_bank(self, bank: PlaceBank, current_time: float) -> int:
+        """PlaceBank 전체 Replay (휴지기 + 이력 W회차 이상인 행만, 통과한 행만 기록)"""
+        window = self.consolidation_window
+        n = bank.size
+        if window > bank.history_size or n == 0:
+            return 0  # 이력이 W회차보다 짧으면 유의할 수 없음
+        
+        counts = bank.history_counts[:n]
+        due = (current_time - bank.last_update_times[:n]) > self.replay_threshold
+        rows = np.flatnonzero(due & (counts >= window))
+        if len(rows) == 0:
+            return 0
+        
+        consolidated_biases, significant = self.consolidate_windows(
+            _window_tensor(bank.history[rows], counts[rows], window)
+        )
+        rows = rows[significant]
+        consolidated_biases = consolidated_biases[significant]
+        bank.consolidated[rows] = consolidated_biases
+        bank.has_consolidated[rows] = True
+        bank.biases[rows] = consolidated_biases  # 장기 기억 업데이트
+        bank.consolidation_times[rows] = current_time
+        return len(rows)
+    
+    def _replay_pool(self, pool: BiasHistoryPool, current_time: float) -> int:
+        """공유 이력 텐서 (PlaceCellManager storage="dict") 전체 Replay (통과한 Place만 기록)"""
+        window = self.consolidation_window
+        n = pool.size
+        if window > pool.history_size or n == 0:
+            return 0  # 이력이 W회차보다 짧으면 유의할 수 없음
+        
+        counts = pool.counts[:n]
+        due = (current_time - pool.last_update_times[:n]) > self.replay_threshold
+        rows = np.flatnonzero(due & (counts >= window))
+        if len(rows) == 0:
+            return 0
+        
+        consolidated_biases, significant = self.consolidate_windows(
+            _window_tensor(pool.history[rows], counts[rows], window)
+        )
+        rows = rows[significant]
+        consolidated_biases = consolidated_biases[significant]
+        for row, consolidated_bias in zip(rows.tolist(), consolidated_biases):
+            place_memory = pool.owners[row]
+            place_memory.consolidated_bias = consolidated_bias.copy()
+            place_memory.bias_estimate = consolidated_bias.copy()  # 장기 기억 업데이트
+            place_memory.consolidation_time = current_time
+        return len(rows)
+    
+    def _replay_memories(self, place_memories: List['PlaceMemoryWithHistory'], current_time: float) -> int:
+        """bias_stats를 가진 Place Memory 전체 Replay (pool 밖의 딕셔너리: 이력을 (N × W × D) 텐서로 모아 계산)"""
+        window = self.consolidation_window
+        candidates = [
+            place_memory for place_memory in place_memories
+            if len(place_memory.bias_stats) >= window
+            and (current_time - place_memory.last_update_time) > self.replay_threshold
+        ]
+        if len(candidates) == 0:
+            return 0
+        
+        if len({place_memory.bias_stats.history.shape for place_memory in candidates}) > 1:
+            # 이력 길이/차원이 섞여 있으면 텐서로 모을 수 없음 → Place마다
+            return sum(self.consolidate_place_memory(place_memory, current_time) for place_memory in candidates)
+        history = np.stack([place_memory.bias_stats.history for place_memory in candidates])
+        counts = np.array([place_memory.bias_stats.count for place_memory in candidates])
+        consolidated_biases, significant = self.consolidate_windows(
+            _window_tensor(history, counts, window)
+        )
+        for index in np.flatnonzero(significant).tolist():
+            place_memory = candidates[index]
+            place_memory.consolidated_bias = consolidated_biases[index].copy()
+            place_memory.bias_estimate = consolidated_biases[index].copy()  # 장기 기억 업데이트
+            place_memory.consolidation_time = current_time
+        return int(significant.sum())
+    
     def replay_all_places(
         self,
         place_memory_dict: Dict[int, 'PlaceMemoryWithHistory'],
@@ -208,19 +333,32 @@ class ReplayConsolidation:
         """
         모든 Place Memory에 대해 Replay 수행
         
+        PlaceBank 또는 bias_stats를 가진 Place Memory (PlaceMemory, PlaceMemoryWithHistory)는
+        (N × W × D) 이력 텐서로 한 번에 계산합니다 (replay_place_memory를 Place마다 호출한 것과 같음). ✨ NEW
+        PlaceCellManager(storage="dict").place_memory는 유지 중인 이력 pool 텐서를 그대로 사용합니다
+        (Place를 훑거나 np.stack 하지 않음).
+        
         Args:
-            place_memory_dict: Place Memory 딕셔너리 (place_id → PlaceMemoryWithHistory)
+            place_memory_dict: Place Memory 딕셔너리 (place_id → PlaceMemoryWithHistory), PlaceBank 또는 BiasHistoryPool
             current_time: 현재 시간
         
         Returns:
             통계 정보 딕셔너리 (consolidated_count, total_count)
         """
-        consolidated_count = 0
         total_count = len(place_memory_dict)
         
-        for place_id, place_memory in place_memory_dict.items():
-            if self.replay_place_memory(place_memory, current_time):
-                consolidated_count += 1
+        pool = _history_pool_of(place_memory_dict)
+        if isinstance(place_memory_dict, PlaceBank):
+            consolidated_count = self._replay_bank(place_memory_dict, current_time)
+        elif pool is not None:
+            consolidated_count = self._replay_pool(pool, current_time)
+        elif all(hasattr(place_memory, 'bias_stats') for place_memory in place_memory_dict.values()):
+            consolidated_count = self._replay_memories(list(place_memory_dict.values()), current_time)
+        else:
+            consolidated_count = 0
+            for place_id, place_memory in place_memory_dict.items():
+                if self.replay_place_memory(place_memory, current_time):
+                    consolidated_count += 1
         
         return {
             'consolidated_count': consolidated_count,
@@ -229,6 +367,35 @@ class ReplayConsolidation:
         }
 
 
+def _history_pool_of(place_memory_dict) -> Optional[BiasHistoryPool]:
+    """BiasHistoryPool 자체이거나, pool이 소유한 딕셔너리 (Place 전체가 pool 안)면 그 pool"""
+    if isinstance(place_memory_dict, BiasHistoryPool):
+        return place_memory_dict
+    if not isinstance(place_memory_dict, dict) or len(place_memory_dict) == 0:
+        return None
+    stats = getattr(next(iter(place_memory_dict.values())), 'bias_stats', None)
+    pool = getattr(stats, 'pool', None)
+    if pool is not None and pool.mapping is place_memory_dict and pool.size == len(place_memory_dict):
+        return pool
+    return None
+
+
+def _window_tensor(history: np.ndarray, counts: np.ndarray, window: int) -> np.ndarray:
+    """
+    ring 이력 텐서에서 최근 W회차 추출
+    
+    Args:
+        history: (N, H, D) ring 이력
+        counts: (N,) Place별 누적 추가 수 (모두 ≥ W)
+        window: W (≤ H)
+    
+    Returns:
+        (N, W, D) 오래된 것부터
+    """
+    slots = (counts[:, None] - window + np.arange(window)) % history.shape[1]
+    return history[np.arange(len(counts))[:, None], slots]
+
+
 class ReplayConsolidationManager:
     """
     Replay/Consolidation 통합 관리자
@@ -14,13 +14,15 @@ Version: v0.4.0-alpha (Universal Memory Interface)
 License: MIT License
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from types import MappingProxyType
 import numpy as np
 from .place_cells import PlaceCellManager, PlaceMemory
 from .context_binder import ContextBinder, ContextMemory
 from .learning_gate import LearningGate, LearningGateConfig
 from .replay_consolidation import ReplayConsolidation
 from .replay_buffer import ReplayBuffer, TrajectoryPoint
+from .consolidation_budget import ConsolidationBudget
 
 
 class UniversalMemory:
@@ -59,7 +61,8 @@ class UniversalMemory:
         self.place_manager = PlaceCellManager(
             num_places=num_places,
             phase_wrap=phase_wrap,
-            quantization_level=quantization_level
+            quantization_level=quantization_level,
+            dim=memory_dim
         )
         
         self.context_binder = ContextBinder(num_contexts=num_contexts)
@@ -76,16 +79,43 @@ class UniversalMemory:
             consolidation_window=3,
             significance_threshold=0.1
         )
+        # Place별 bias 이동 평균/분산 창 = Consolidation 창 ✨ NEW
+        self.place_manager.stats_window = self.replay_consolidation.consolidation_window
         
         self.replay_buffer = ReplayBuffer(
             max_size=10000,
-            stable_window=10
+            stable_window=10,
+            dim=memory_dim
         )
         
         # 상태 관리
-        self.external_state: Dict[str, Any] = {}
+        self.external_state: Dict[str, Any] = {}  # 설정 시 Context ID 캐시
         self.last_update_time: float = 0.0
         self.is_replay_phase: bool = False
+        # 상한에 닿아 남은 Replay 포인트 (place_ids, errors), 다음 replay()에서 먼저 처리 ✨ NEW
+        self._replay_backlog: Tuple[np.ndarray, np.ndarray] = (
+            np.zeros(0, dtype=np.int64), np.zeros((0, memory_dim))
+        )
+        # backlog 상한 (포인트 수, None이면 제한 없음): 넘으면 오래된 포인트부터 버리고 수를 셈 ✨ NEW
+        self.max_backlog_places: Optional[int] = 10000
+        self.backlog_dropped_places: int = 0
+    
+    @property
+    def external_state(self) -> Mapping[str, Any]:
+        """
+        현재 맥락 (외부 상태, 읽기 전용)
+        
+        ⚠️ Context ID를 설정 시 캐시하므로 제자리 수정은 막혀 있습니다 (TypeError).
+        맥락을 바꾸려면 새 딕셔너리를 할당하거나 store()/retrieve()의 context로 전달합니다.
+        """
+        return MappingProxyType(self._external_state)
+    
+    @external_state.setter
+    def external_state(self, external_state: Mapping[str, Any]):
+        # Context ID는 맥락이 바뀔 때만 계산 (store()/retrieve()는 캐시 사용) ✨ NEW
+        # 복사본 보관: 호출한 쪽의 딕셔너리를 나중에 고쳐도 캐시와 어긋나지 않음
+        self._external_state = dict(external_state)
+        self._context_id = self.context_binder.get_context_id(self._external_state)
     
     def store(
         self,
@@ -118,8 +148,8 @@ class UniversalMemory:
         # Place ID 할당
         place_id = self.place_manager.get_place_id(phase_vector)
         
-        # Context ID 할당
-        context_id = self.context_binder.get_context_id(self.external_state)
+        # Context ID (external_state 설정 시 계산한 캐시)
+        context_id = self._context_id
         
         # Place Memory 업데이트
         place_memory = self.place_manager.get_place_memory(place_id)
@@ -183,8 +213,8 @@ class UniversalMemory:
         # Place ID 할당
         place_id = self.place_manager.get_place_id(phase_vector)
         
-        # Context ID 할당
-        context_id = self.context_binder.get_context_id(self.external_state)
+        # Context ID (external_state 설정 시 계산한 캐시)
+        context_id = self._context_id
         
         # Place Memory에서 bias 검색
         place_bias = self.place_manager.get_bias_estimate(
@@ -343,16 +373,30 @@ class UniversalMemory:
             "has_memory": average_confidence > 0.1
         }
     
-    def replay(self, current_time: Optional[float] = None) -> Dict[str, Any]:
+    def replay(
+        self,
+        current_time: Optional[float] = None,
+        max_ms: Optional[float] = None,
+        max_places: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Replay 수행 (기억 정제)
         
+        max_ms / max_places에 닿으면 멈추고, 남은 포인트는 backlog에 두었다가
+        다음 replay()에서 새 구간보다 먼저 처리합니다 (호출마다 최소 1개 처리). ✨ NEW
+        
         Args:
             current_time: 현재 시간 (None이면 자동 계산)
+            max_ms: 이번 호출 시간 상한 [ms] (None이면 제한 없음)
+            max_places: 이번 호출 Place 업데이트 (포인트) 수 상한 (None이면 제한 없음)
         
         Returns:
-            Replay 결과 통계
+            Replay 결과 통계 (backlog_places: 다음 호출로 넘어간 포인트 수,
+            backlog_dropped_places: max_backlog_places를 넘어 버린 포인트 누적 수)
         """
+        budget = ConsolidationBudget(max_ms=max_ms, max_places=max_places)
+        meter = None if budget.unlimited else budget.meter()
+        
         if current_time is None:
             current_time = self.last_update_time + 2.0  # 기본 2초 후
         
@@ -365,20 +409,41 @@ class UniversalMemory:
         # ReplayBuffer의 get_stable_segments는 내부적으로 안정성 판단을 수행
         stable_segments = self.replay_buffer.get_stable_segments(min_segment_length=5)
         
+        # 지난 호출에서 남은 포인트 → 새 구간 포인트 순서 (버퍼를 비우기 전에 열 복사)
+        place_ids, errors = self._replay_backlog
+        if stable_segments:
+            place_ids = np.concatenate([place_ids] + [segment.place_ids for segment in stable_segments])
+            errors = np.concatenate([errors] + [segment.errors for segment in stable_segments])
+        
         # Replay 수행
         consolidated_count = 0
-        for segment in stable_segments:
-            for point in segment:
-                # Place Memory 업데이트
-                place_memory = self.place_manager.get_place_memory(point.place_id)
-                place_memory.update_bias(point.error, learning_rate=0.1)
-                place_memory.add_bias_to_history(point.error)
-                
-                # Consolidation 수행
-                if self.replay_consolidation.consolidate_place_memory(
-                    place_memory, current_time_s
-                ):
-                    consolidated_count += 1
+        processed = 0
+        for place_id, error in zip(place_ids.tolist(), errors):
+            # Place Memory 업데이트
+            place_memory = self.place_manager.get_place_memory(place_id)
+            place_memory.update_bias(error, learning_rate=0.1)
+            place_memory.add_bias_to_history(error)
+            
+            # Consolidation 수행
+            if self.replay_consolidation.consolidate_place_memory(
+                place_memory, current_time_s
+            ):
+                consolidated_count += 1
+            
+            processed += 1
+            if meter is not None:
+                meter.spend()
+                if meter.exhausted:
+                    break
+        
+        # 상한을 넘는 backlog는 오래된 포인트부터 버림 ✨ NEW
+        start = processed
+        if self.max_backlog_places is not None:
+            excess = len(place_ids) - processed - self.max_backlog_places
+            if excess > 0:
+                start += excess
+                self.backlog_dropped_places += excess
+        self._replay_backlog = (place_ids[start:], errors[start:])
         
         # Replay phase 종료
         self.is_replay_phase = False
@@ -389,8 +454,17 @@ class UniversalMemory:
         return {
             "segments_processed": len(stable_segments),
             "consolidated_count": consolidated_count,
-            "total_places": len(self.place_manager.place_memory)
+            "total_places": len(self.place_manager.place_memory),
+            "places_processed": processed,
+            "backlog_places": self.replay_backlog_size,
+            "backlog_dropped_places": self.backlog_dropped_places,
+            "budget_exhausted": self.replay_backlog_size > 0
         }
+    
+    @property
+    def replay_backlog_size(self) -> int:
+        """다음 replay()로 넘어간 포인트 수 ✨ NEW"""
+        return len(self._replay_backlog[0])
 
 
 # 편의 함수: 범용 메모리 생성
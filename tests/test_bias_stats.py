@@ -0,0 +1,218 @@
+"""
+Bias Window Stats 테스트
+
+Consolidation 유의성 검정:
+    - 이전: Place마다 deque (배열 복사본) → list → 자르기 → np.mean / np.std
+    - 현재: 최근 W회차 평균/분산 O(1) 갱신 (Welford, add는 ring 쓰기만, 읽을 때 반영), 이력은 ring 배열 ✨ NEW
+
+replay_all_places:
+    - 이전: Place마다 should_replay + consolidate_place_memory
+    - 현재: (N × W × D) 이력 텐서로 평균/표준 편차/유의성 mask를 한 번에, 통과한 Place만 기록 ✨ NEW
+      (PlaceCellManager storage="dict"는 유지 중인 BiasHistoryPool 텐서를 그대로 사용)
+
+테스트 항목:
+    1. 이동 평균/분산 == np.mean / np.var (창이 차기 전/후, ring 한 바퀴 이후, 다른 창 크기, 가끔 읽기)
+    2. bias_history 읽기 전용 view (오래된 것부터, maxlen 10, append 없음), get_recent_biases 복사본
+    3. consolidate_place_memory 결과 == 기존 리스트 방식 (PlaceMemory / PlaceMemoryWithHistory / PlaceRow)
+    4. replay_all_places 일괄 == Place마다 replay_place_memory
+       (PlaceMemory / PlaceMemoryWithHistory / PlaceBank / PlaceCellManager 이력 pool)
+    5. BiasHistoryPool: 행 view 유지 (용량 증가, 제거 시 행 이동), 제거된 Place는 이력 보존, 딕셔너리 스캔 없음
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+import sys
+import os
+import numpy as np
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.hippocampus.bias_stats import BiasWindowStats
+from grid_engine.hippocampus.place_cells import PlaceCellManager, PlaceMemory
+from grid_engine.hippocampus.place_bank import PlaceBank
+from grid_engine.hippocampus.replay_consolidation import PlaceMemoryWithHistory, ReplayConsolidation
+
+
+@pytest.mark.parametrize("window", [1, 3, 10])
+def test_window_stats_match_numpy(window):
+    """이동 평균/분산 == 최근 W회차의 np.mean / np.var"""
+    rng = np.random.default_rng(window)
+    stats = BiasWindowStats(history_size=10, window=window)
+    sparse = BiasWindowStats(history_size=10, window=window)  # 가끔만 읽음 (여러 bias를 한 번에 반영)
+    values = []
+    assert stats.stats(window) == (0, None, None)
+    for step in range(57):
+        bias = rng.normal(loc=100.0, scale=0.01, size=5)  # 큰 평균 + 작은 분산 (상쇄 오차)
+        stats.add(bias)
+        sparse.add(bias)
+        values.append(bias)
+        if step % 3 == 1:
+            used, mean, var = sparse.stats(window)
+            np.testing.assert_allclose(mean, np.mean(values[-window:], axis=0), rtol=1e-12)
+            np.testing.assert_allclose(var, np.var(values[-window:], axis=0), rtol=1e-6, atol=1e-18)
+        used, mean, var = stats.stats(window)
+        recent = np.array(values[-window:])
+        assert used == len(recent)
+        np.testing.assert_allclose(mean, recent.mean(axis=0), rtol=1e-12)
+        np.testing.assert_allclose(var, recent.var(axis=0), rtol=1e-6, atol=1e-18)
+
+        # 창과 다른 n은 ring에서 다시 계산
+        used, mean, var = stats.stats(4)
+        np.testing.assert_allclose(mean, np.mean(values[-4:], axis=0), rtol=1e-12)
+        assert used == min(4, len(values))
+
+    with pytest.raises(AssertionError):
+        BiasWindowStats(history_size=3, window=5)
+
+
+@pytest.mark.parametrize("kind", ["place_memory", "with_history", "bank"])
+def test_bias_history_read_only_view(kind):
+    """bias_history: 읽기 전용 view (maxlen 10, 오래된 것부터, 복사 없음), get_recent_biases는 복사본"""
+    makers = {
+        "place_memory": lambda: PlaceMemory(place_id=1),
+        "with_history": lambda: PlaceMemoryWithHistory(place_id=1),
+        "bank": lambda: PlaceBank(dim=5).get_place_memory(1),
+    }
+    memory = makers[kind]()
+    history = memory.bias_history
+    assert len(history) == 0 and list(history) == []
+    for step in range(13):
+        memory.add_bias_to_history(np.full(5, float(step)))
+    assert history.maxlen == 10 and len(history) == 10  # 같은 view가 이후 추가를 반영
+    assert [b[0] for b in history] == [float(step) for step in range(3, 13)]
+    assert history[0][0] == 3.0 and history[-1][0] == 12.0
+    assert [b[0] for b in history[-2:]] == [11.0, 12.0]
+    with pytest.raises(IndexError):
+        history[10]
+
+    # 추가/제자리 수정은 조용히 무시되지 않고 실패
+    assert not hasattr(history, 'append')
+    with pytest.raises(ValueError):
+        history[-1][0] = -1.0
+    assert [b[0] for b in memory.get_recent_biases(3)] == [10.0, 11.0, 12.0]
+    memory.get_recent_biases(1)[0][:] = -1.0
+    assert memory.get_recent_biases(1)[0][0] == 12.0
+
+
+def reference_consolidate(replay, biases):
+    """기존 방식: 리스트 자르기 + np.mean / np.std"""
+    if len(biases) < 2:
+        return None
+    recent = biases[-min(replay.consolidation_window, len(biases)):]
+    if len(recent) < replay.consolidation_window:
+        return None
+    if np.all(np.std(recent, axis=0) < replay.significance_threshold):
+        return np.mean(recent, axis=0)
+    return None
+
+
+def test_consolidation_matches_list_reference():
+    """PlaceMemory (창 일치/불일치), PlaceMemoryWithHistory, PlaceRow == 기존 리스트 방식"""
+    replay = ReplayConsolidation(consolidation_window=3, significance_threshold=0.05)
+    bank = PlaceBank(dim=5)
+    memories = [
+        PlaceMemory(place_id=0, bias_stats=BiasWindowStats(window=3)),  # O(1) 경로
+        PlaceMemory(place_id=1),  # 창 10 → ring에서 다시 계산
+        PlaceMemoryWithHistory(place_id=2, bias_stats=BiasWindowStats(window=3)),
+        bank.get_place_memory(3),
+    ]
+    rng = np.random.default_rng(7)
+    biases = []
+    results = []
+    for step in range(40):
+        scale = 0.01 if (step // 6) % 2 == 0 else 0.2  # 일관된 구간 / 노이즈 구간
+        bias = np.full(5, 0.5) + rng.normal(scale=scale, size=5)
+        biases.append(bias)
+        expected = reference_consolidate(replay, biases)
+        for memory in memories:
+            memory.add_bias_to_history(bias)
+            memory.consolidated_bias = None
+            consolidated = replay.consolidate_place_memory(memory, current_time=float(step))
+            assert consolidated == (expected is not None)
+            if consolidated:
+                np.testing.assert_allclose(memory.consolidated_bias, expected, rtol=1e-12)
+        results.append(expected is not None)
+    assert any(results) and not all(results)
+
+
+def fill_place_memories(make_memory, n_places=300, seed=11):
+    """Place별 이력 길이/일관성/마지막 업데이트 시간이 다른 Place Memory 집합"""
+    rng = np.random.default_rng(seed)
+    memories = {}
+    for place_id in range(n_places):
+        memory = make_memory(place_id)
+        scale = 0.01 if place_id % 3 else 0.3
+        for _ in range(int(rng.integers(0, 15))):
+            memory.add_bias_to_history(np.full(5, 0.2 * (place_id % 7)) + rng.normal(scale=scale, size=5))
+        memory.last_update_time = float(rng.uniform(0.0, 10.0))
+        memories[place_id] = memory
+    return memories
+
+
+@pytest.mark.parametrize("kind", ["place_memory", "with_history", "bank", "manager"])
+def test_replay_all_places_matches_per_place(kind):
+    """replay_all_places (텐서 일괄) == Place마다 replay_place_memory"""
+    replay = ReplayConsolidation(replay_threshold=4.0, consolidation_window=3, significance_threshold=0.05)
+    makers = {
+        "place_memory": lambda: (lambda place_id: PlaceMemory(place_id=place_id)),
+        "with_history": lambda: (lambda place_id: PlaceMemoryWithHistory(place_id=place_id)),
+        "bank": lambda: PlaceBank(dim=5).get_place_memory,
+        "manager": lambda: PlaceCellManager().get_place_memory,
+    }
+    bulk = fill_place_memories(makers[kind]())
+    loop = fill_place_memories(makers[kind]())
+    if kind == "bank":
+        bulk = next(iter(bulk.values())).bank
+    elif kind == "manager":
+        bulk = next(iter(bulk.values()))._owner.place_memory
+
+    stats = replay.replay_all_places(bulk, current_time=12.0)
+    expected = sum(replay.replay_place_memory(memory, 12.0) for memory in loop.values())
+    assert stats['consolidated_count'] == expected > 0
+    assert stats['total_count'] == len(loop)
+    for place_id, memory in loop.items():
+        other = bulk[place_id]
+        assert (other.consolidated_bias is None) == (memory.consolidated_bias is None)
+        if memory.consolidated_bias is not None:
+            np.testing.assert_allclose(other.consolidated_bias, memory.consolidated_bias, rtol=1e-12)
+            assert other.consolidation_time == memory.consolidation_time == 12.0
+        np.testing.assert_allclose(other.bias_estimate, memory.bias_estimate, rtol=1e-12)
+
+
+def test_history_pool_rows_follow_places(monkeypatch):
+    """pool 행 view: 용량 증가/제거 후에도 Place 이력과 일치, 제거된 Place는 자체 배열로 이력 유지"""
+    manager = PlaceCellManager()
+    pool = manager.history_pool
+    rng = np.random.default_rng(2)
+    values = {}
+    for place_id in range(200):  # 초기 용량 64 → 두 번 증가
+        memory = manager.get_place_memory(place_id)
+        values[place_id] = rng.normal(size=(int(rng.integers(1, 13)), 5))
+        for bias in values[place_id]:
+            memory.add_bias_to_history(bias)
+        memory.last_update_time = float(place_id)
+
+    removed = manager.place_memory[7]
+    manager.remove_places(list(range(0, 200, 7)))
+    assert pool.size == len(manager.place_memory) == 200 - len(range(0, 200, 7))
+    for place_id, memory in manager.place_memory.items():
+        stats = memory.bias_stats
+        assert pool.owners[stats.row] is memory and np.shares_memory(stats.history, pool.history)
+        assert pool.counts[stats.row] == len(values[place_id])
+        assert pool.last_update_times[stats.row] == float(place_id)
+        np.testing.assert_array_equal(list(memory.bias_history), values[place_id][-10:])
+    assert removed.bias_stats.pool is None and not np.shares_memory(removed.bias_stats.history, pool.history)
+    np.testing.assert_array_equal(list(removed.bias_history), values[7][-10:])
+
+    # Manager 딕셔너리: Place를 훑지 않고 pool 텐서로 계산
+    monkeypatch.setattr(ReplayConsolidation, "_replay_memories", None)
+    stats = ReplayConsolidation(replay_threshold=1.0, consolidation_window=3).replay_all_places(
+        manager.place_memory, current_time=500.0
+    )
+    assert stats['total_count'] == pool.size
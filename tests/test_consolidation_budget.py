@@ -0,0 +1,183 @@
+"""
+Consolidation Budget 테스트
+
+Replay/Consolidation 1회 호출:
+    - 이전: 쌓인 작업을 모두 처리할 때까지 진행 (작업량에 비례하는 지연 시간)
+    - 현재: max_ms / max_places 상한, 재개 커서 + backlog로 다음 휴지기에 이어서 처리 ✨ NEW
+
+테스트 항목:
+    1. BudgetMeter: Place 수 / 시간 상한, 잘못된 상한은 AssertionError
+    2. Grid5DEngine: 상한 있는 Replay → backlog 보고, 모두 처리하면 결과 == 상한 없는 Replay
+    3. UniversalMemory.replay(max_places=...): backlog 이어서 처리, 결과 == 상한 없는 Replay
+    4. max_backlog_places: backlog 상한 (오래된 것부터 버리고 수를 보고) ✨ NEW
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+import sys
+import os
+import numpy as np
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.hippocampus.consolidation_budget import ConsolidationBudget
+from grid_engine.hippocampus.universal_memory import UniversalMemory
+from grid_engine.dimensions.dim5d import Grid5DEngine
+
+
+class FakeClock:
+    """테스트용 clock (수동으로 시간 진행)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_budget_meter_limits():
+    """Place 수 상한 / 시간 상한 / 제한 없음"""
+    meter = ConsolidationBudget(max_places=3).meter()
+    for _ in range(2):
+        meter.spend()
+        assert not meter.exhausted
+    meter.spend()
+    assert meter.exhausted and meter.used == 3
+
+    clock = FakeClock()
+    meter = ConsolidationBudget(max_ms=5.0).meter(clock)
+    meter.spend(100)
+    assert not meter.exhausted
+    clock.now = 0.005
+    assert meter.exhausted
+
+    assert ConsolidationBudget().unlimited
+    with pytest.raises(AssertionError):
+        ConsolidationBudget(max_ms=0.0)
+    with pytest.raises(AssertionError):
+        ConsolidationBudget(max_places=0)
+
+
+def make_engine(budget: ConsolidationBudget) -> Grid5DEngine:
+    engine = Grid5DEngine()
+    engine.use_place_cells = True
+    engine.slow_update_threshold = 1
+    engine.replay_budget = budget
+    engine.set_external_state({"tool_type": "tool_A"})
+    engine.set_target(np.zeros(5))
+    return engine
+
+
+def drive(engine: Grid5DEngine, rounds: int = 3) -> list:
+    """정지 구간 (여러 Place) → 휴지기 (Replay, 열린 구간 포함) 반복, 휴지기마다 backlog 크기"""
+    rng = np.random.default_rng(0)
+    t_ms = 0.0
+    backlog = []
+    for _ in range(rounds):
+        for offset in rng.uniform(0.0, 0.05, size=(4, 5)):
+            for _ in range(8):
+                t_ms += 100.0
+                engine.state.t_ms = t_ms
+                engine.update(offset)
+        t_ms += 10000.0  # 휴지기 → Replay
+        engine.state.t_ms = t_ms
+        engine.update(np.zeros(5))
+        backlog.append(engine.get_replay_backlog()['places'])
+    return backlog
+
+
+def test_engine_budgeted_replay_resumes_to_same_result():
+    """상한 있는 Replay: 휴지기마다 2개씩, backlog 보고, 모두 처리하면 상한 없는 Replay와 같음"""
+    full = make_engine(ConsolidationBudget())
+    budgeted = make_engine(ConsolidationBudget(max_places=2))
+    assert drive(full) == [0, 0, 0]
+    backlog = drive(budgeted)
+    assert backlog[0] > 0 and backlog[-1] > backlog[0]  # 유입 > 처리량이면 backlog 증가 (max_backlog_places까지)
+
+    stats = budgeted.drain_replay_backlog()
+    assert stats['places_updated'] == 2 and stats['budget_exhausted']
+    assert stats['backlog_places'] == backlog[-1] - 2
+    while budgeted.replay_backlog:
+        budgeted.drain_replay_backlog()
+    assert budgeted.get_replay_backlog() == {'jobs': 0, 'places': 0, 'dropped_places': 0}
+
+    places = full.place_manager.place_memory
+    assert sorted(budgeted.place_manager.place_memory) == sorted(places)
+    for place_id, memory in places.items():
+        other = budgeted.place_manager.place_memory[place_id]
+        np.testing.assert_allclose(other.bias_estimate, memory.bias_estimate)
+        assert len(other.bias_history) == len(memory.bias_history)
+    for key in full.context_binder.context_memory.keys():
+        np.testing.assert_allclose(
+            budgeted.context_binder.get_bias_estimate(*key),
+            full.context_binder.get_bias_estimate(*key)
+        )
+
+    # 호출 상한을 따로 주면 그 상한만 사용 (제한 없음 → 한 번에 모두)
+    drive(budgeted, rounds=1)
+    assert budgeted.drain_replay_backlog(ConsolidationBudget())['backlog_places'] == 0
+
+
+def test_universal_memory_budgeted_replay():
+    """UniversalMemory.replay(max_places=...) → 다음 호출에서 이어서, 결과 == 상한 없는 Replay"""
+    rng = np.random.default_rng(5)
+    keys = rng.uniform(0.0, 2 * np.pi, size=(6, 5))
+    values = rng.normal(scale=0.01, size=(6, 5))
+    memories = [UniversalMemory(memory_dim=5), UniversalMemory(memory_dim=5)]
+    for memory in memories:
+        for step in range(30):
+            memory.store(keys[step % 6], values[step % 6] + 0.001 * step, timestamp=float(step))
+
+    full = memories[0].replay(current_time=100.0)
+    assert full['backlog_places'] == 0 and full['places_processed'] == 30
+
+    calls = []
+    while True:
+        stats = memories[1].replay(current_time=100.0, max_places=7)
+        calls.append(stats)
+        if not stats['budget_exhausted']:
+            break
+    assert [stats['places_processed'] for stats in calls] == [7, 7, 7, 7, 2]
+    assert [stats['backlog_places'] for stats in calls] == [23, 16, 9, 2, 0]
+    assert sum(stats['consolidated_count'] for stats in calls) == full['consolidated_count']
+    for place_id, memory in memories[0].place_manager.place_memory.items():
+        np.testing.assert_allclose(
+            memories[1].place_manager.place_memory[place_id].bias_estimate,
+            memory.bias_estimate
+        )
+
+
+def test_backlog_is_capped():
+    """max_backlog_places: 유입 > 처리량이어도 backlog는 상한 이하, 오래된 것부터 버리고 수를 보고"""
+    engine = make_engine(ConsolidationBudget(max_places=2))
+    engine.max_backlog_places = 5
+    backlog = drive(engine, rounds=4)
+    assert backlog == [2, 3, 3, 3]  # 상한 5까지 남기고 휴지기마다 2개 처리
+    dropped = engine.get_replay_backlog()['dropped_places']
+    assert dropped > 0 and engine.backlog_dropped_places == dropped
+    # 남은 그룹은 가장 최근 휴지기의 것 (오래된 작업부터 버림)
+    last_job = engine.replay_backlog[-1]
+    assert all(job.current_time == last_job.current_time for job in engine.replay_backlog)
+    assert last_job.cursor > 0
+
+    stats = engine.drain_replay_backlog()
+    assert stats['places_updated'] == 2
+    assert stats['backlog_places'] == 1 and stats['backlog_dropped_places'] == dropped
+
+    # UniversalMemory: 포인트 상한
+    rng = np.random.default_rng(5)
+    keys = rng.uniform(0.0, 2 * np.pi, size=(6, 5))
+    memory = UniversalMemory(memory_dim=5)
+    memory.max_backlog_places = 10
+    for step in range(30):
+        memory.store(keys[step % 6], np.full(5, 0.001 * step), timestamp=float(step))
+    stats = memory.replay(current_time=100.0, max_places=7)
+    assert stats['places_processed'] == 7
+    assert stats['backlog_places'] == 10 and stats['backlog_dropped_places'] == 13
+    np.testing.assert_allclose(memory._replay_backlog[1][:, 0], 0.001 * np.arange(20, 30))
@@ -0,0 +1,318 @@
+"""
+Consolidation Worker 테스트
+
+Replay/Consolidation:
+    - 이전: update() 안에서 동기 수행 (휴지기 감지 시 제어 틱이 Consolidation을 기다림)
+    - 현재: 선택적 백그라운드 작업 스레드 + 상한 있는 큐 + 읽기 전용 snapshot 교체 ✨ NEW
+
+테스트 항목:
+    1. submit()은 대기하지 않음 (큐가 가득 차면 버림), 큐 깊이/지연 시간/실패 통계
+    2. 백그라운드 결과 == 동기 Replay 결과 (Place/Context bias, provide_reference)
+    3. MemorySnapshot 읽기 == PlaceCellManager/ContextBinder 읽기 (dict/bank), 읽기 전용
+    4. MemorySnapshot.updated() (건드린 행만 다시 읽음) == capture(), 삭제 시 전체 capture
+       (Place k개 제거 + k개 추가로 행 수가 같아도 제거 누적 수로 감지) ✨ NEW
+    5. 작업 처리 중 disable_background_consolidation() (timeout) → 작업은 실패 없이 끝남
+    6. 큐가 가득 차면 작업은 replay_backlog에 남아 다음 휴지기에 다시 제출, 빈 그룹은 제출 안 함 ✨ NEW
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+import sys
+import os
+import threading
+import numpy as np
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.hippocampus.consolidation_worker import (
+    ConsolidationJob,
+    ConsolidationWorker,
+    MemorySnapshot
+)
+from grid_engine.hippocampus.place_cells import PlaceCellManager
+from grid_engine.hippocampus.context_binder import ContextBinder
+from grid_engine.dimensions.dim5d import Grid5DEngine
+
+
+def make_engine(background: bool) -> Grid5DEngine:
+    engine = Grid5DEngine()
+    engine.use_place_cells = True
+    engine.slow_update_threshold = 1
+    engine.set_external_state({"tool_type": "tool_A"})
+    engine.set_target(np.zeros(5))
+    if background:
+        engine.enable_background_consolidation(max_queue_size=8)
+    return engine
+
+
+def drive(engine: Grid5DEngine, rounds: int = 4) -> None:
+    """정지 구간 (여러 Place) → 휴지기 (Replay, 열린 구간 포함) 반복"""
+    rng = np.random.default_rng(0)
+    t_ms = 0.0
+    for _ in range(rounds):
+        for offset in rng.uniform(0.0, 0.05, size=(3, 5)):
+            for _ in range(8):
+                t_ms += 100.0
+                engine.state.t_ms = t_ms
+                engine.update(offset)
+        t_ms += 10000.0  # 휴지기 → Replay
+        engine.state.t_ms = t_ms
+        engine.update(np.zeros(5))
+
+
+def test_worker_never_blocks_and_reports_metrics():
+    """가득 찬 큐 → 즉시 False, 통계 (큐 깊이, 지연 시간, 실패)"""
+    release = threading.Event()
+    calls = []
+
+    def consolidate(job):
+        release.wait(5.0)
+        if job.current_time < 0:
+            raise ValueError("bad job")
+        calls.append(job.current_time)
+        return MemorySnapshot.capture(PlaceCellManager(), version=len(calls))
+
+    worker = ConsolidationWorker(consolidate, max_queue_size=2)
+    try:
+        accepted = [worker.submit(ConsolidationJob({}, float(i))) for i in range(6)]
+        # 1개는 처리 중 (대기), 2개는 큐, 나머지는 버림 (처리 시작 타이밍에 따라 1개 차이)
+        assert accepted[:2] == [True, True] and accepted[-1] is False
+        assert worker.dropped == accepted.count(False)
+        assert worker.get_statistics()['max_queue_depth'] <= 2
+
+        release.set()
+        assert worker.flush(timeout=5.0)
+        stats = worker.get_statistics()
+        assert stats['completed'] == accepted.count(True) == len(calls)
+        assert stats['queue_depth'] == 0
+        assert stats['snapshot_version'] == len(calls)
+        assert stats['max_latency_ms'] >= stats['mean_latency_ms'] > 0.0
+
+        # consolidate 예외: 통계만 남기고 작업 스레드는 계속 동작
+        worker.submit(ConsolidationJob({}, -1.0))
+        worker.submit(ConsolidationJob({}, 99.0))
+        assert worker.flush(timeout=5.0)
+        assert worker.failed == 1 and calls[-1] == 99.0 and worker.is_alive
+    finally:
+        release.set()
+        worker.close(timeout=5.0)
+    assert not worker.is_alive
+
+
+def test_background_matches_synchronous_replay():
+    """백그라운드 Consolidation 후 기억/Reference == 동기 Replay"""
+    sync_engine = make_engine(background=False)
+    bg_engine = make_engine(background=True)
+    drive(sync_engine)
+    drive(bg_engine)
+
+    worker = bg_engine.consolidation_worker
+    assert worker.flush(timeout=10.0)
+    stats = worker.get_statistics()
+    assert stats['completed'] == 4 and stats['dropped'] == 0 and stats['failed'] == 0
+
+    places = sync_engine.place_manager.place_memory
+    assert len(places) > 3
+    assert sorted(bg_engine.place_manager.place_memory) == sorted(places)
+    for place_id, memory in places.items():
+        other = bg_engine.place_manager.place_memory[place_id]
+        np.testing.assert_allclose(other.bias_estimate, memory.bias_estimate)
+        assert other.visit_count == memory.visit_count
+    assert sorted(bg_engine.context_binder.context_memory.keys()) == \
+        sorted(sync_engine.context_binder.context_memory.keys())
+
+    # 공개된 snapshot == 동기 엔진의 실제 기억
+    snapshot = worker.snapshot
+    assert snapshot.version == 4 and len(snapshot) == len(places)
+    for place_id, context_id in sync_engine.context_binder.context_memory.keys():
+        np.testing.assert_allclose(
+            snapshot.get_context_bias(place_id, context_id),
+            sync_engine.context_binder.get_bias_estimate(place_id, context_id)
+        )
+
+    # provide_reference: snapshot 읽기 == 동기 엔진 읽기 (Context / Place 블렌딩)
+    for use_context_binder in (True, False):
+        for engine in (sync_engine, bg_engine):
+            engine.use_context_binder = use_context_binder
+            engine.core.set_coordinates((0.01, 0.02, 0.0, 0.0, 0.0))
+        np.testing.assert_allclose(
+            bg_engine.provide_reference(np.zeros(5), np.zeros(5)),
+            sync_engine.provide_reference(np.zeros(5), np.zeros(5))
+        )
+
+    bg_engine.disable_background_consolidation(timeout=5.0)
+    assert bg_engine.consolidation_worker is None and not worker.is_alive
+
+
+@pytest.mark.parametrize("storage", ["dict", "bank"])
+def test_memory_snapshot_matches_live_reads(storage):
+    """MemorySnapshot 블렌딩/Context 읽기 == PlaceCellManager/ContextBinder, 배열 읽기 전용"""
+    rng = np.random.default_rng(3)
+    manager = PlaceCellManager(storage=storage)
+    binder = ContextBinder()
+    for place_id in range(50):
+        memory = manager.get_place_memory(place_id)
+        memory.place_center = rng.uniform(0.0, 2 * np.pi, size=5)
+        memory.update_bias(rng.normal(size=5))
+        binder.update_context_memory(place_id, place_id % 3, rng.normal(size=5))
+
+    snapshot = MemorySnapshot.capture(manager, binder, version=7)
+    assert snapshot.version == 7 and len(snapshot) == 50
+    for phase in rng.uniform(0.0, 2 * np.pi, size=(20, 5)):
+        np.testing.assert_allclose(
+            snapshot.get_place_bias(phase, manager.get_place_id(phase), top_k=5, sigma=2.0),
+            manager.get_bias_estimate(phase, use_blending=True, top_k=5, sigma=2.0)
+        )
+    np.testing.assert_array_equal(snapshot.get_context_bias(4, 1), binder.get_bias_estimate(4, 1))
+    np.testing.assert_array_equal(snapshot.get_context_bias(4, 2), np.zeros(5))
+
+    # 공개 후에는 실제 기억이 바뀌어도 snapshot은 그대로
+    before = snapshot.place_biases.copy()
+    manager.get_place_memory(0).update_bias(np.ones(5), learning_rate=1.0)
+    np.testing.assert_array_equal(snapshot.place_biases, before)
+    with pytest.raises(ValueError):
+        snapshot.place_biases[0] = 0.0
+
+
+def assert_snapshots_equal(actual: MemorySnapshot, expected: MemorySnapshot) -> None:
+    assert actual.place_ids.tolist() == expected.place_ids.tolist()
+    np.testing.assert_array_equal(actual.has_center, expected.has_center)
+    np.testing.assert_array_equal(actual.centers, expected.centers)
+    np.testing.assert_array_equal(actual.place_biases, expected.place_biases)
+    assert sorted(actual.context_keys) == sorted(expected.context_keys)
+    for place_id, context_id in expected.context_keys:
+        np.testing.assert_array_equal(
+            actual.get_context_bias(place_id, context_id),
+            expected.get_context_bias(place_id, context_id)
+        )
+
+
+@pytest.mark.parametrize("storage", ["dict", "bank"])
+def test_memory_snapshot_updated_matches_capture(storage):
+    """건드린 행만 다시 읽은 snapshot == 전체 capture (새 Place/Context 추가, 삭제 시 전체 capture)"""
+    rng = np.random.default_rng(5)
+    manager = PlaceCellManager(storage=storage)
+    binder = ContextBinder()
+    for place_id in range(20):
+        manager.get_place_memory(place_id).update_bias(rng.normal(size=5))
+        binder.update_context_memory(place_id, 0, rng.normal(size=5))
+    snapshot = MemorySnapshot.capture(manager, binder, version=1)
+
+    # 기존 Place/Context 업데이트 + 새 Place/Context (중복 ID 포함)
+    place_ids = np.array([3, 25, 3, 7, 30])
+    for place_id in place_ids.tolist():
+        memory = manager.get_place_memory(place_id)
+        memory.place_center = rng.uniform(0.0, 2 * np.pi, size=5)
+        memory.update_bias(rng.normal(size=5))
+    context_keys = [(3, 0), (25, 1), (7, 2), (3, 0)]
+    for place_id, context_id in context_keys:
+        binder.update_context_memory(place_id, context_id, rng.normal(size=5))
+
+    updated = snapshot.updated(manager, binder, place_ids=place_ids, context_keys=context_keys)
+    assert updated.version == 2 and len(updated) == 22 and len(snapshot) == 20
+    assert_snapshots_equal(updated, MemorySnapshot.capture(manager, binder))
+    with pytest.raises(ValueError):
+        updated.place_biases[0] = 0.0
+
+    # Context 삭제 / 건드리지 않은 Place 추가 → 전체 capture
+    binder.context_memory.remove((5, 0))
+    assert_snapshots_equal(updated.updated(manager, binder), MemorySnapshot.capture(manager, binder))
+    manager.get_place_memory(99)
+    assert_snapshots_equal(updated.updated(manager, binder), MemorySnapshot.capture(manager, binder))
+
+    # Place k개 제거 (병합) + 새 Place k개 → 행 수는 같아도 제거된 Place 행이 남지 않음
+    snapshot = MemorySnapshot.capture(manager, binder)
+    removals = manager.removals
+    manager.remove_places([3, 7])
+    manager.remove_place(12345)  # 없는 Place는 세지 않음
+    assert manager.removals == removals + 2
+    for place_id in (200, 201):
+        manager.get_place_memory(place_id).update_bias(rng.normal(size=5))
+    assert len(manager.place_memory) == len(snapshot)
+    rebuilt = snapshot.updated(manager, binder, place_ids=np.array([25]))
+    assert 3 not in rebuilt.place_ids.tolist() and 200 in rebuilt.place_ids.tolist()
+    assert_snapshots_equal(rebuilt, MemorySnapshot.capture(manager, binder))
+    assert rebuilt.place_removals == manager.removals
+
+
+def test_disable_while_job_in_flight():
+    """작업 처리 중 disable (timeout) → 작업은 자기 worker 참조로 끝남 (AttributeError 없음)"""
+    engine = make_engine(background=True)
+    worker = engine.consolidation_worker
+    release = threading.Event()
+    apply_replay_groups = engine._apply_replay_groups
+
+    def blocked_apply(*args, **kwargs):
+        release.wait(5.0)
+        return apply_replay_groups(*args, **kwargs)
+
+    engine._apply_replay_groups = blocked_apply
+    drive(engine, rounds=1)
+    assert worker.submitted == 1
+    engine.disable_background_consolidation(timeout=0.05)
+    assert engine.consolidation_worker is None and worker.is_alive
+
+    release.set()
+    assert worker.flush(timeout=5.0)
+    worker.close(timeout=5.0)
+    assert worker.failed == 0 and worker.completed == 1
+    assert worker.snapshot.version == 1 and len(worker.snapshot) == len(engine.place_manager.place_memory)
+
+
+def idle(engine: Grid5DEngine) -> None:
+    """휴지기 1회 (Replay)"""
+    engine.state.t_ms += 10000.0
+    engine.update(np.zeros(5))
+
+
+def test_full_queue_keeps_jobs_in_backlog():
+    """큐가 가득 차도 Replay 작업은 버리지 않음 (다음 휴지기에 재제출) → 동기 Replay 결과와 같음"""
+    sync_engine = make_engine(background=False)
+    engine = make_engine(background=False)
+    worker = engine.enable_background_consolidation(max_queue_size=1)
+    release = threading.Event()
+    apply_replay_groups = engine._apply_replay_groups
+
+    def blocked_apply(*args, **kwargs):
+        release.wait(5.0)
+        return apply_replay_groups(*args, **kwargs)
+
+    engine._apply_replay_groups = blocked_apply
+    drive(engine, rounds=4)
+    drive(sync_engine, rounds=4)
+    # 1개 처리 중 + 1개 큐 → 나머지는 backlog에 보관 (버리지 않음)
+    assert worker.dropped >= 1
+    assert engine.get_replay_backlog()['jobs'] >= 1
+    assert worker.submitted + engine.get_replay_backlog()['jobs'] == 4
+
+    release.set()
+    idles = 0
+    while engine.replay_backlog:
+        assert worker.flush(timeout=5.0)
+        idle(engine)
+        idle(sync_engine)
+        idles += 1
+        assert idles < 10
+    assert worker.flush(timeout=5.0)
+    assert worker.failed == 0 and worker.completed == worker.submitted
+
+    places = sync_engine.place_manager.place_memory
+    assert sorted(engine.place_manager.place_memory) == sorted(places)
+    for place_id, memory in places.items():
+        np.testing.assert_allclose(
+            engine.place_manager.place_memory[place_id].bias_estimate, memory.bias_estimate
+        )
+
+    # 새 안정 구간 없는 휴지기 → 빈 그룹은 제출하지 않음 (snapshot 그대로)
+    submitted, version = worker.submitted, worker.snapshot.version
+    engine.replay_buffer.clear()
+    idle(engine)
+    assert worker.flush(timeout=5.0)
+    assert worker.submitted == submitted and worker.snapshot.version == version
+    engine.disable_background_consolidation(timeout=5.0)
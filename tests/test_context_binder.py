@@ -0,0 +1,271 @@
+"""
+Context Binder 테스트
+
+Context ID:
+    - 이전: 호출마다 str(sorted(items)) + MD5
+    - 현재: 외부 상태별 intern 캐시 + 엔진은 set_external_state 시 한 번 계산 ✨ NEW
+
+Context Memory:
+    - 이전: (place_id, context_id)마다 ContextMemory 객체, 제거 없음 (current_time = 0.0 고정)
+    - 현재: ContextStore 배열 + 선택적 상한 (LRU/LFU/TTL 제거, clock 주입) ✨ NEW
+
+Context Schema:
+    - 이전: 외부 상태 값을 그대로 해시 (20.01°C ≠ 20.02°C)
+    - 현재: 키별 구간/어휘/무시 목록 → 조밀한 정수 Context ID (배치 인코딩) ✨ NEW
+
+테스트 항목:
+    1. 캐시된 Context ID == MD5 계산 값, hit/miss 카운터
+    2. 값 타입이 다른 상태 (20 vs 20.0), 해시 불가능한 값, 캐시 상한
+    3. Grid5DEngine/UniversalMemory는 외부 상태 설정 시에만 Context ID 계산 (external_state 읽기 전용)
+    4. LRU/LFU 용량 제거 (상한은 선택, 읽기는 제거 순서 유지), 바이트 상한, TTL 만료,
+       clear_unused_contexts (clock 기준)
+    5. Context Schema 양자화 (구간/어휘/무시/값 없음), 배치 == 단건, 선언 안 된 키
+    6. 구간 키의 NaN (float32/float64)은 단건/배치 모두 값 없음, 숫자가 아닌 값은 ValueError ✨ NEW
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+import sys
+import os
+import numpy as np
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.hippocampus.context_binder import ContextBinder
+from grid_engine.hippocampus.context_store import ContextStore
+from grid_engine.hippocampus.context_schema import ContextSchema
+from grid_engine.hippocampus.universal_memory import UniversalMemory
+from grid_engine.dimensions.dim5d import Grid5DEngine
+
+
+def test_context_id_cache_matches_md5():
+    """캐시 값 == MD5 값, 순서 무관, hit/miss 카운트"""
+    binder = ContextBinder()
+    state = {"tool_type": "tool_A", "temperature": 20.0, "step_number": 1}
+
+    context_id = binder.get_context_id(state)
+    assert context_id == binder._compute_context_id(state)
+    assert binder.get_context_id(dict(reversed(list(state.items())))) == context_id
+    assert binder.get_context_id(state) == context_id
+
+    stats = binder.get_statistics()
+    assert stats['context_id_misses'] == 1
+    assert stats['context_id_hits'] == 2
+    assert stats['num_interned_states'] == 1
+
+
+def test_context_id_cache_edge_cases():
+    """값 타입 구분, 해시 불가능한 값, 캐시 상한"""
+    binder = ContextBinder(max_interned=3)
+
+    # 20 과 20.0은 str()이 다르므로 다른 Context ID
+    for value in (20, 20.0, 20, 20.0):
+        assert binder.get_context_id({"t": value}) == binder._compute_context_id({"t": value})
+
+    # 해시 불가능한 값: 캐시 없이 계산
+    state = {"offsets": [1, 2, 3]}
+    assert binder.get_context_id(state) == binder._compute_context_id(state)
+    assert binder.get_statistics()['num_interned_states'] == 2
+
+    # 상한 초과 시 가장 오래된 항목 제거
+    for step in range(10):
+        binder.get_context_id({"step_number": step})
+    assert len(binder._context_ids) == 3
+
+
+def test_engine_caches_context_id_on_set():
+    """Grid5DEngine/UniversalMemory: 외부 상태 설정 시에만 Context ID 계산"""
+    engine = Grid5DEngine()
+    engine.set_external_state({"tool_type": "tool_B", "temperature": 25.0})
+    binder = engine.context_binder
+    misses, hits = binder.context_id_misses, binder.context_id_hits
+    assert engine.context_id == binder._compute_context_id(engine.external_state)
+
+    engine.use_place_cells = True
+    engine.set_target(np.zeros(5))
+    for _ in range(5):
+        engine.provide_reference(np.zeros(5), np.zeros(5))
+    assert (binder.context_id_misses, binder.context_id_hits) == (misses, hits)
+
+    memory = UniversalMemory(num_places=100)
+    for value in range(3):
+        memory.store(np.full(5, 0.1 * value), np.full(5, 0.01), context={"op": "A"})
+    result = memory.retrieve(np.full(5, 0.1), context={"op": "A"})
+    assert memory.context_binder.context_id_misses == 2  # {} (초기값), {"op": "A"}
+    assert result is not None
+
+
+def test_external_state_is_read_only():
+    """external_state는 읽기 전용 (제자리 수정으로 캐시된 Context ID가 어긋나지 않음)"""
+    state = {"tool_type": "tool_A", "temperature": 20.0}
+    engine = Grid5DEngine()
+    engine.set_external_state(state)
+    memory = UniversalMemory(num_places=100)
+    memory.external_state = state
+
+    for owner in (engine, memory):
+        with pytest.raises(TypeError):
+            owner.external_state["temperature"] = 25.0
+
+    # 호출한 쪽의 딕셔너리를 고쳐도 보관한 외부 상태/캐시는 그대로
+    state["temperature"] = 25.0
+    for owner, binder in ((engine, engine.context_binder), (memory, memory.context_binder)):
+        assert owner.external_state["temperature"] == 20.0
+        assert owner._context_id == binder._compute_context_id(dict(owner.external_state))
+
+
+class FakeClock:
+    """테스트용 clock (수동으로 시간 진행)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_context_store_lru_lfu_eviction():
+    """용량 초과 시 LRU/LFU 제거 + 제거 통계"""
+    clock = FakeClock()
+    binder = ContextBinder(max_entries=3, eviction="lru", clock=clock)
+    for place_id in range(3):
+        binder.update_context_memory(place_id, 7, np.full(5, place_id))
+    binder.get_bias_estimate(1, 7)  # 읽기는 제거 순서를 바꾸지 않음
+    binder.context_memory.touch((0, 7))  # 0을 최근 접근으로
+    binder.update_context_memory(3, 7, np.ones(5))
+    assert sorted(binder.context_memory.keys()) == [(0, 7), (2, 7), (3, 7)]
+    np.testing.assert_array_equal(binder.get_bias_estimate(2, 7), np.full(5, 2.0))
+    assert binder.get_statistics()['evictions_capacity'] == 1
+
+    store = ContextStore(max_entries=3, policy="lfu", clock=clock)
+    for place_id in range(3):
+        store.get_or_add((place_id, 0))
+    for _ in range(3):
+        store.touch((0, 0))
+    store.touch((1, 0))
+    store.get_or_add((3, 0))  # 접근 1회 (2, 0) 제거
+    assert sorted(store.keys()) == [(0, 0), (1, 0), (3, 0)]
+    store.get_or_add((4, 0))  # 접근 1회인 (3, 0) 제거 ((1, 0)은 2회)
+    assert sorted(store.keys()) == [(0, 0), (1, 0), (4, 0)]
+    assert store.evictions['capacity'] == 2
+
+    # 최소 횟수 버킷이 삭제로 비면 다음으로 살아 있는 횟수 (사이의 빈 횟수는 건너뜀)
+    for _ in range(50):
+        store.touch((1, 0))
+    store.remove((4, 0))  # 횟수 1 버킷이 빔 → 최소 횟수 4 ((0, 0))
+    assert store._min_frequency == 4
+    store.get_or_add((5, 0))
+    store.get_or_add((6, 0))  # 접근 1회 (5, 0) 제거
+    assert sorted(store.keys()) == [(0, 0), (1, 0), (6, 0)]
+
+
+def test_context_binder_unbounded_by_default():
+    """기본 ContextBinder는 상한 없음 (학습한 Context를 제거하지 않음), 상한은 선택"""
+    binder = ContextBinder()
+    store = ContextStore(capacity=4)
+    assert binder.context_memory.max_entries is None and store.max_entries is None
+    for place_id in range(100):
+        store.get_or_add((place_id, 0))
+    assert len(store) == 100 and store.evictions['capacity'] == 0
+
+
+def test_context_store_byte_budget_and_ttl():
+    """바이트 상한 → 행 수 상한, TTL 만료, clear_unused_contexts (clock 기준)"""
+    clock = FakeClock()
+    store = ContextStore(max_bytes=10 * ContextStore(dim=5).row_nbytes, clock=clock)
+    for place_id in range(50):
+        store.get_or_add((place_id, 0))
+    assert len(store) == 10 and store.nbytes <= 10 * store.row_nbytes
+
+    binder = ContextBinder(eviction="ttl", ttl=10.0, clock=clock)
+    for place_id in range(5):
+        clock.now = float(place_id)
+        binder.update_context_memory(place_id, 1, np.ones(5))
+    clock.now = 12.5
+    binder.context_memory.touch((0, 1))  # 0은 다시 접근 (만료 연장)
+    assert binder.context_memory.expire() == 2  # 1, 2 만료 (접근 시각 1.0, 2.0)
+    assert sorted(binder.context_memory.keys()) == [(0, 1), (3, 1), (4, 1)]
+    assert binder.get_statistics()['evictions_ttl'] == 2
+
+    # 방문 2회 이상, 5초 이내 접근한 항목만 유지
+    binder.update_context_memory(3, 1, np.ones(5))
+    binder.update_context_memory(4, 1, np.ones(5))
+    clock.now = 18.0
+    binder.update_context_memory(4, 1, np.ones(5))
+    assert binder.clear_unused_contexts(min_visits=2, max_age=5.0) == 2
+    assert binder.context_memory.keys() == [(4, 1)]
+
+    with pytest.raises(AssertionError):
+        ContextStore(policy="ttl")
+
+
+def test_context_schema_quantizes_and_batches():
+    """구간/어휘/무시 → 조밀한 정수 ID, 배치 == 단건"""
+    schema = ContextSchema(
+        bins={'temperature': [18.0, 20.0, 22.0]},
+        categories={'tool_type': ['tool_A', 'tool_B']},
+        ignore=['timestamp']
+    )
+    binder = ContextBinder(schema=schema)
+    assert binder.num_contexts == 5 * 3  # temperature: 구간 4 + 값 없음, tool_type: 어휘 2 + 기타
+    encode = binder.get_context_id
+
+    # 측정 잡음 / 무시할 키는 같은 Context
+    base = encode({'temperature': 20.01, 'tool_type': 'tool_A', 'timestamp': 1.0})
+    assert encode({'temperature': 20.02, 'tool_type': 'tool_A', 'timestamp': 2.0}) == base
+    assert encode({'temperature': 22.5, 'tool_type': 'tool_A'}) != base
+    assert encode({'temperature': 20.01, 'tool_type': 'tool_B'}) != base
+
+    states = [
+        {'temperature': t, 'tool_type': tool}
+        for t in (10.0, 18.0, 19.9, 20.0, 25.0, None, float('nan'))
+        for tool in ('tool_A', 'tool_B', 'tool_C', None)
+    ] + [{}]
+    ids = binder.get_context_ids(states)
+    assert ids.tolist() == [encode(state) for state in states]
+    assert len(set(ids.tolist())) == 15  # 19.9/18.0, None/NaN, tool_C/None은 같은 코드
+    assert ids.min() >= 0 and ids.max() < binder.num_contexts
+
+    # 키별 열 (로그) 형식
+    columns = {
+        'temperature': np.array([state.get('temperature', np.nan) for state in states], dtype=float),
+        'tool_type': [state.get('tool_type') for state in states],
+    }
+    np.testing.assert_array_equal(binder.get_context_ids(columns), ids)
+
+    with pytest.raises(ValueError):
+        encode({'temperature': 20.0, 'material': 'steel'})
+    relaxed = ContextBinder(schema=ContextSchema(bins={'t': [0.0]}, ignore_unknown=True))
+    assert relaxed.get_context_id({'t': 1.0, 'material': 'steel'}) == 1
+
+
+def test_context_schema_nan_and_non_numeric():
+    """구간 키: 모든 실수 타입 NaN → 값 없음 (encode == encode_batch), 문자열 → ValueError"""
+    schema = ContextSchema(bins={'temperature': [18.0, 20.0, 22.0]})
+    binder = ContextBinder(schema=schema)
+    encoder = binder.encoder
+    missing = encoder.encode({})
+
+    values = [np.float32('nan'), np.float64('nan'), float('nan'), None,
+              np.float32(19.5), np.int64(25), 21, True]
+    states = [{'temperature': value} for value in values]
+    single = [encoder.encode(state) for state in states]
+    assert single[:4] == [missing] * 4
+    assert missing not in single[4:]
+    assert encoder.encode_batch(states).tolist() == single
+    column = np.array([value for value in values if value is not None], dtype=np.float32)
+    assert encoder.encode_batch({'temperature': column}).tolist() == single[:3] + single[4:]
+
+    for value in ('20.5', 'warm', b'1'):
+        with pytest.raises(ValueError):
+            encoder.encode({'temperature': value})
+        with pytest.raises(ValueError):
+            encoder.encode_batch([{'temperature': value}])
+        with pytest.raises(ValueError):
+            encoder.encode_batch({'temperature': np.array([value])})
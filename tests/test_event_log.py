@@ -0,0 +1,99 @@
+"""
+Event Log 테스트
+
+Replay/Reference 로그:
+    - 이전: 제어 루프 안에서 print() (f-string + np.linalg.norm 항상 계산, stdout 쓰기)
+    - 현재: logging 이벤트 (레벨, 이벤트별 빈도 제한, 구조화 필드, 지연 포맷팅) ✨ NEW
+
+테스트 항목:
+    1. 빈도 제한 (시간 창별 최대 횟수), 버린 횟수는 다음 기록의 suppressed 필드
+    2. 레벨이 꺼져 있으면 기록/빈도 제한 소비 없음
+    3. Grid5DEngine Replay: stdout 출력 없음, replay.start/place/end 구조화 필드
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+import sys
+import os
+import logging
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.common.event_log import EventLog
+from grid_engine.dimensions.dim5d import Grid5DEngine
+
+
+class FakeClock:
+    """테스트용 clock (수동으로 시간 진행)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_event_log_rate_limit_and_fields(caplog):
+    """시간 창별 최대 횟수, suppressed 필드, 구조화 필드"""
+    clock = FakeClock()
+    log = EventLog("tests.event_log", rate_limits={"tick": (2, 1.0)}, clock=clock)
+    with caplog.at_level(logging.DEBUG, logger="tests.event_log"):
+        for step in range(5):
+            log.event(logging.DEBUG, "tick", step=step)
+        clock.now = 1.5
+        log.event(logging.DEBUG, "tick", step=5)
+        log.event(logging.INFO, "other", value=0.5)  # 제한 없는 이벤트
+
+    records = [record for record in caplog.records if record.name == "tests.event_log"]
+    assert [record.fields['step'] for record in records[:3]] == [0, 1, 5]
+    assert records[2].fields['suppressed'] == 3 and 'suppressed' not in records[0].fields
+    assert records[3].event == "other" and records[3].getMessage() == "[other] value=0.500000"
+
+
+def test_event_log_disabled_level_is_free(caplog):
+    """레벨이 꺼져 있으면 enabled() == False, 빈도 제한 창도 소비하지 않음"""
+    log = EventLog("tests.event_log.disabled", rate_limits={"tick": (1, 10.0)}, clock=FakeClock())
+    with caplog.at_level(logging.INFO, logger="tests.event_log.disabled"):
+        assert not log.enabled(logging.DEBUG, "tick")
+        log.event(logging.DEBUG, "tick", step=0)
+        assert log.suppressed == {} and log._windows == {}
+        assert log.enabled(logging.INFO, "tick")
+    assert not [record for record in caplog.records if record.name == "tests.event_log.disabled"]
+
+
+def test_engine_replay_logs_events_not_stdout(caplog, capsys):
+    """Replay: stdout 없음, replay.start / replay.place / replay.end 구조화 필드"""
+    engine = Grid5DEngine()
+    engine.use_place_cells = True
+    engine.slow_update_threshold = 1
+    engine.set_external_state({"tool_type": "tool_A"})
+    engine.set_target(np.zeros(5))
+
+    def run():
+        t_ms = engine.state.t_ms
+        for offset in (np.full(5, 0.01), np.full(5, 0.03)):
+            for _ in range(8):
+                t_ms += 100.0
+                engine.state.t_ms = t_ms
+                engine.update(offset)
+        engine.state.t_ms = t_ms + 10000.0  # 휴지기 → Replay
+        engine.update(np.zeros(5))
+
+    run()  # 로그 레벨 기본값 (WARNING): 이벤트 없음
+    assert not [record for record in caplog.records if hasattr(record, 'event')]
+
+    with caplog.at_level(logging.DEBUG, logger=engine.event_log.logger.name):
+        run()
+    assert capsys.readouterr().out == ""
+    events = {record.event: record.fields for record in caplog.records if hasattr(record, 'event')}
+    assert events['replay.start']['segments'] == 1
+    assert set(events['replay.place']) >= {'place_id', 'bias_norm', 'mean_error_norm', 'visit_count'}
+    end = events['replay.end']
+    assert end['places_updated'] >= 1 and end['duration_ms'] >= 0.0
+    assert set(end) >= {'places_updated', 'consolidated', 'avg_bias_norm', 'duration_ms'}
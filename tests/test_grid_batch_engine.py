@@ -0,0 +1,103 @@
+"""
+Grid Batch Engine 테스트
+
+N개 독립 인스턴스 × D축 (벡터화):
+    - 단일 인스턴스: test_grid_nd_engine.py
+    - 배치: test_grid_batch_engine.py ✨ NEW
+
+테스트 항목:
+    1. 초기화 (N×D 상태 행렬)
+    2. 배치 step과 인스턴스별 Grid5DEngine 일치
+    3. 인스턴스별 가속도 (NaN은 가속도 없음)
+    4. Ring 백엔드: 외부 Ring이 있어도 Ring Bank, "external" 거부 ✨ NEW
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+import pytest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.dimensions.dimnd import GridBatchEngine
+from grid_engine.common.adapters import ring_nd_adapter
+from grid_engine.common.adapters.ring_bank_adapter import RingBankAdapter
+from grid_engine.dimensions.dim5d import (
+    Grid5DEngine, Grid5DConfig, Grid5DInput, Grid5DState, Grid5DOutput
+)
+
+
+def test_grid_batch_engine_init():
+    """초기화 테스트 (N×D)"""
+    batch = GridBatchEngine(
+        4, config=Grid5DConfig(), initial=[0.1, 0.2, 0.3, 10.0, 20.0],
+        state_cls=Grid5DState, output_cls=Grid5DOutput
+    )
+
+    assert batch.phi.shape == (4, 5)
+    assert batch.coord.flags['C_CONTIGUOUS']
+    state = batch.get_state(3)
+    assert isinstance(state, Grid5DState)
+    assert state.x == 0.1
+    assert state.theta_b == 20.0
+    assert state.t_ms == 0.0
+
+
+def test_grid_batch_engine_matches_single_engines():
+    """배치 step과 인스턴스별 Grid5DEngine 일치 테스트"""
+    config = Grid5DConfig(dt_ms=1.0, tau_ms=100.0)
+    n = 3
+    rng = np.random.default_rng(0)
+    velocity = rng.uniform(-1.0, 1.0, size=(n, 5))
+    acceleration = rng.uniform(-1.0, 1.0, size=(n, 5))
+    acceleration[1, :] = np.nan  # 인스턴스 1: 가속도 없음
+
+    batch = GridBatchEngine(n, config=config, state_cls=Grid5DState, output_cls=Grid5DOutput)
+    engines = [Grid5DEngine(config=config) for _ in range(n)]
+
+    for _ in range(15):
+        batch.step(velocity, acceleration)
+        for i, engine in enumerate(engines):
+            a = [None if np.isnan(x) else float(x) for x in acceleration[i]]
+            engine.step(Grid5DInput(
+                *velocity[i].tolist(),
+                a_x=a[0], a_y=a[1], a_z=a[2], alpha_a=a[3], alpha_b=a[4]
+            ))
+
+    for i, engine in enumerate(engines):
+        assert batch.get_state(i) == engine.get_state()
+        output = batch.get_output(i)
+        assert isinstance(output, Grid5DOutput)
+        assert output.theta_a == engine.get_state().theta_a
+
+
+def test_grid_batch_engine_shape_check():
+    """입력 shape 검증 테스트"""
+    batch = GridBatchEngine(2, config=Grid5DConfig())
+
+    with pytest.raises(AssertionError):
+        batch.step(np.zeros((3, 5)))
+    with pytest.raises(AssertionError):
+        batch.get_state(0)  # state_cls 없음
+
+
+def test_grid_batch_engine_uses_ring_bank(monkeypatch):
+    """Ring 백엔드 테스트: 외부 Ring 패키지가 있어도 "auto"는 Ring Bank ✨ NEW"""
+    class ExternalRing:  # 외부 RingAttractorEngine 설치 상태 (생성되면 실패)
+        def __init__(self, *args, **kwargs):
+            raise AssertionError("external ring must not be constructed by GridBatchEngine")
+
+    monkeypatch.setattr(ring_nd_adapter, "RingAttractorEngine", ExternalRing)
+
+    batch = GridBatchEngine(8, config=Grid5DConfig())
+    assert isinstance(batch.ring_adapter, RingBankAdapter)
+
+    with pytest.raises(AssertionError, match="requires ring_backend"):
+        GridBatchEngine(8, config=Grid5DConfig(ring_backend="external"))
@@ -0,0 +1,304 @@
+"""
+Grid ND Engine 테스트
+
+차원 일반화 (벡터화):
+    - 2D~7D: test_grid_*_engine_*.py
+    - ND: test_grid_nd_engine.py ✨ NEW
+
+테스트 항목:
+    1. 초기화 (ND)
+    2. 등속 운동 (ND)
+    3. 축별 가속도 (None/NaN 축은 가속도 없음)
+    4. 2D~7D facade와 Grid ND Engine 일치
+    5. 궤적 롤아웃 (run)과 step 반복 일치
+    6. 다중 속도 Ring 안정화 (ring_update_interval): k = 1 대비 오차 상한, 래핑 경계
+    7. 2D~7D state: core 버퍼 view (필드 쓰기 반영), get_state()는 스냅샷
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+import math
+import pytest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.dimensions.dimnd import GridNDEngine, GridNDConfig, AxisSpec
+from grid_engine.dimensions.dim5d import Grid5DEngine, Grid5DConfig, Grid5DInput, Grid5DState
+from grid_engine.dimensions.dim6d.grid_6d_engine import Grid6DEngine
+from grid_engine.dimensions.dim7d.grid_7d_engine import Grid7DEngine
+from grid_engine import GridEngine
+from grid_engine.dimensions.dim3d.grid_3d_engine import Grid3DEngine
+from grid_engine.dimensions.dim4d.grid_4d_engine import Grid4DEngine
+
+
+def test_grid_nd_engine_init():
+    """초기화 테스트 (ND)"""
+    engine = GridNDEngine(
+        axes=[AxisSpec("x", scale=2.0), AxisSpec("a", kind="rotary")],
+        initial=[0.5, 90.0]
+    )
+
+    assert engine.num_axes == 2
+    assert engine.phi.dtype == np.float64
+    assert engine.phi.flags['C_CONTIGUOUS']
+    assert engine.coord.tolist() == [0.5, 90.0]
+    assert engine.phi[0] == pytest.approx(0.5 * (2.0 * math.pi / 2.0))
+    assert engine.phi[1] == pytest.approx(math.pi / 2.0)
+    assert engine.t_ms == 0.0
+
+
+def test_grid_nd_engine_uniform_motion():
+    """등속 운동 테스트 (ND)"""
+    config = GridNDConfig(
+        axes=[AxisSpec("x"), AxisSpec("y"), AxisSpec("a", kind="rotary")],
+        dt_ms=1.0, tau_ms=100.0
+    )
+    engine = GridNDEngine(config=config)
+
+    for _ in range(10):
+        coord = engine.step([1.0, 0.5, 30.0])
+
+    assert coord is engine.coord
+    assert np.all(engine.coord != 0.0)
+    assert np.all((engine.phi >= 0.0) & (engine.phi < config.phase_wrap))
+    # 회전 축 속도는 내부 단위 [rad/s]로 저장
+    assert engine.v[2] == pytest.approx(math.radians(30.0))
+    assert engine.t_ms == pytest.approx(10.0)
+
+
+def test_grid_nd_engine_partial_acceleration():
+    """축별 가속도 테스트 (None 축은 가속도 없음, 이전 값 유지)"""
+    engine = GridNDEngine(axes=[AxisSpec("x"), AxisSpec("y")])
+
+    engine.step([0.0, 1.0], [2.0, None])
+    assert engine.a.tolist() == [2.0, 0.0]
+    assert engine.v[0] == pytest.approx(2.0 * engine.config.dt_ms / 1000.0)
+    assert engine.v[1] == 1.0
+
+    engine.step([0.0, 1.0], [None, np.nan])
+    assert engine.a.tolist() == [2.0, 0.0]
+
+
+def test_grid_5d_facade_matches_nd_engine():
+    """Grid 5D Engine (facade)과 Grid ND Engine 일치 테스트"""
+    config = Grid5DConfig(dt_ms=1.0, tau_ms=100.0)
+    facade = Grid5DEngine(config=config, initial_x=0.1, initial_theta_a=45.0)
+    engine = GridNDEngine(config=config.to_nd_config(), initial=[0.1, 0.0, 0.0, 45.0, 0.0])
+
+    inp = Grid5DInput(v_x=0.2, v_y=0.1, v_z=0.0, v_a=10.0, v_b=-5.0, a_x=1.0, alpha_b=20.0)
+    for _ in range(20):
+        output = facade.step(inp)
+        engine.step([0.2, 0.1, 0.0, 10.0, -5.0], [1.0, None, None, None, 20.0])
+
+    state = facade.get_state()
+    assert [output.x, output.y, output.z, output.theta_a, output.theta_b] == engine.coord.tolist()
+    assert [state.phi_x, state.phi_y, state.phi_z, state.phi_a, state.phi_b] == engine.phi.tolist()
+    assert state.alpha_b == pytest.approx(math.radians(20.0))
+    np.testing.assert_array_equal(facade.get_phase_vector(), engine.phi)
+
+
+def test_grid_facade_state_assignment():
+    """state 할당이 core 배열에 반영되는지 테스트"""
+    engine = Grid5DEngine(config=Grid5DConfig(dt_ms=1.0, tau_ms=100.0))
+    engine.step(Grid5DInput(v_x=0.0, v_y=0.0, v_z=0.0, v_a=10.0, v_b=0.0))
+
+    saved = engine.state.copy()
+    engine.step(Grid5DInput(v_x=0.0, v_y=0.0, v_z=0.0, v_a=10.0, v_b=0.0))
+    assert engine.state.t_ms != saved.t_ms
+
+    engine.state = saved
+    assert engine.state == saved
+    assert engine.core.phi[3] == saved.phi_a
+    assert engine.core.t_ms == saved.t_ms
+
+
+def test_grid_state_buffer_in_place():
+    """Grid 5D State: 엔진 버퍼 view (제자리 갱신) + 필드 호환성"""
+    engine = Grid5DEngine(config=Grid5DConfig(dt_ms=1.0, tau_ms=100.0))
+    state = engine.state
+    snapshot = state.copy()
+    assert np.shares_memory(state.array, engine.core.buffer)
+    assert not np.shares_memory(snapshot.array, engine.core.buffer)
+
+    engine.step(Grid5DInput(v_x=0.1, v_y=0.0, v_z=0.0, v_a=10.0, v_b=0.0))
+    assert engine.state is state
+    assert state.t_ms == 1.0
+    assert state.x == engine.core.coord[0]
+    assert snapshot.t_ms == 0.0
+
+    # dataclass와 같은 생성 (키워드, 위상 정규화)
+    built = Grid5DState(
+        phi_x=-math.pi / 2.0, phi_y=0.0, phi_z=0.0, phi_a=0.0, phi_b=0.0,
+        x=0.0, y=0.0, z=0.0, theta_a=0.0, theta_b=0.0,
+        v_x=0.0, v_y=0.0, v_z=0.0, v_a=0.0, v_b=0.0,
+        a_x=0.0, a_y=0.0, a_z=0.0, alpha_a=0.0, alpha_b=0.0, t_ms=3.0
+    )
+    assert built.phi_x == pytest.approx(1.5 * math.pi)
+    assert Grid5DState(*built) == built
+    assert not hasattr(built, "__dict__")
+    with pytest.raises(TypeError):
+        Grid5DState(phi_x=0.0)
+
+
+@pytest.mark.parametrize(
+    "engine_cls", [GridEngine, Grid3DEngine, Grid4DEngine, Grid5DEngine, Grid6DEngine, Grid7DEngine]
+)
+def test_grid_facade_state_writes_through(engine_cls):
+    """2D~7D: engine.state 필드 쓰기는 core에 반영, get_state()는 이후 step에도 그대로"""
+    engine = engine_cls()
+    state = engine.state
+    assert np.shares_memory(state.array, engine.core.buffer)
+
+    engine.state.t_ms += 250.0
+    engine.state.x = 0.5
+    assert engine.core.t_ms == 250.0
+    assert engine.core.coord[0] == 0.5
+
+    before = engine.get_state()
+    engine.run(np.ones((3, engine.core.num_axes)))
+    assert engine.state is state and state.t_ms > 250.0
+    assert before.t_ms == 250.0 and before.x == 0.5
+
+    engine.state = before
+    assert engine.state == before and engine.state is state
+
+
+def test_grid_6d_reset_all_axes():
+    """Grid 6D Engine 리셋 테스트 (C축 포함)"""
+    engine = Grid6DEngine()
+    engine.reset(x=0.5, theta_c=90.0)
+
+    state = engine.get_state()
+    assert state.x == 0.5
+    assert state.theta_c == 90.0
+    assert state.phi_c == pytest.approx(math.pi / 2.0)
+    assert state.t_ms == 0.0
+
+
+def test_grid_nd_engine_run_matches_step():
+    """궤적 롤아웃 (run) 테스트: step 반복과 일치"""
+    axes = [AxisSpec("x"), AxisSpec("a", kind="rotary")]
+    inputs = np.array([
+        [0.5, 10.0, 1.0, np.nan],
+        [0.5, 10.0, np.nan, np.nan],
+        [0.2, -5.0, np.nan, 20.0],
+    ])
+    engine = GridNDEngine(axes=axes, initial=[0.1, 45.0])
+    reference = GridNDEngine(axes=axes, initial=[0.1, 45.0])
+
+    out = np.empty((3, 4))
+    result = engine.run(inputs, out=out)
+    assert result is out
+
+    for t, row in enumerate(inputs):
+        reference.step(row[:2], row[2:])
+        assert out[t, :2].tolist() == reference.coord.tolist()
+        assert out[t, 2:].tolist() == reference.phi.tolist()
+
+    assert engine.a.tolist() == reference.a.tolist()
+    assert engine.t_ms == reference.t_ms
+
+
+def test_grid_5d_facade_run_matches_step():
+    """Grid 5D Engine 궤적 롤아웃 테스트 (속도 열만, Output 필드 순서)"""
+    config = Grid5DConfig(dt_ms=1.0, tau_ms=100.0)
+    engine = Grid5DEngine(config=config)
+    reference = Grid5DEngine(config=config)
+
+    inputs = np.tile([0.2, 0.1, 0.0, 10.0, -5.0], (20, 1))
+    out = engine.run(inputs)
+    assert out.shape == (20, 10)
+
+    for _ in range(20):
+        output = reference.step(Grid5DInput(v_x=0.2, v_y=0.1, v_z=0.0, v_a=10.0, v_b=-5.0))
+
+    assert out[-1].tolist() == [
+        output.x, output.y, output.z, output.theta_a, output.theta_b,
+        output.phi_x, output.phi_y, output.phi_z, output.phi_a, output.phi_b
+    ]
+    assert engine.get_state().t_ms == reference.get_state().t_ms
+
+
+def test_grid_nd_engine_ring_update_interval():
+    """다중 속도 테스트: Ring은 ring_update_interval step마다 (경과 시간만큼) 실행"""
+    config = GridNDConfig(
+        axes=[AxisSpec("x"), AxisSpec("a", kind="rotary")],
+        dt_ms=1.0, tau_ms=100.0, ring_backend="bank", ring_update_interval=4
+    )
+    engine = GridNDEngine(config=config)
+
+    calls = []
+    ring_step = engine.ring_adapter.step
+
+    def counting_step(phases, dt_ms):
+        calls.append(dt_ms)
+        return ring_step(phases, dt_ms)
+
+    engine.ring_adapter.step = counting_step
+
+    out = engine.run(np.tile([0.5, 30.0], (10, 1)))
+
+    assert calls == [4.0, 4.0, 4.0]  # step 0, 4, 8
+    assert engine.t_ms == pytest.approx(10.0)
+    # 중간 step: φ_norm + 0.1 · (마지막 Ring 위상 − φ_norm), 원형 차이
+    assert np.all((out[:, 2:] >= 0.0) & (out[:, 2:] < 2.0 * math.pi))
+    wrap = config.phase_wrap
+    v_phase = engine.v * (config.dt_ms / 1000.0)
+    phases_norm = np.mod(engine.phi + v_phase, wrap)
+    diff = np.mod(engine.ring_phase - phases_norm + 0.5 * wrap, wrap) - 0.5 * wrap
+    expected = np.mod(phases_norm + 0.1 * diff, wrap)
+    engine.step([0.5, 30.0])
+    assert len(calls) == 3
+    np.testing.assert_allclose(engine.phi, expected, rtol=0, atol=1e-12)
+
+    engine.reset()
+    engine.step([0.5, 30.0])
+    assert len(calls) == 4
+
+
+def make_interval_engine(interval: int) -> GridNDEngine:
+    config = GridNDConfig(
+        axes=[AxisSpec("x"), AxisSpec("y"), AxisSpec("a", kind="rotary")],
+        ring_backend="bank", ring_update_interval=interval
+    )
+    engine = GridNDEngine(config=config)
+    engine.phi[:] = [2.0, 3.0, 4.0]
+    return engine
+
+
+@pytest.mark.parametrize("velocity", [[0.05, -0.03, 10.0], [0.5, -0.5, 90.0]])
+def test_grid_nd_engine_ring_update_interval_error_bound(velocity):
+    """다중 속도 오차: k = 2 / k = 10 궤적은 k = 1 궤적에서 Ring 격자 한 칸 안쪽"""
+    inputs = np.tile(velocity, (4000, 1))
+    reference = make_interval_engine(1).run(inputs)[:, 3:]
+    wrap = 2.0 * math.pi
+    bin_width = wrap / 15  # ring_size = 15
+
+    errors = {}
+    for interval in (2, 10):
+        phases = make_interval_engine(interval).run(inputs)[:, 3:]
+        error = np.mod(phases - reference + 0.5 * wrap, wrap) - 0.5 * wrap
+        errors[interval] = np.abs(error).max()
+
+    assert errors[2] < 0.1 * bin_width
+    assert errors[10] < 0.75 * bin_width
+
+
+def test_grid_nd_engine_ring_update_interval_wrap():
+    """중간 step: 래핑 경계 건너편의 Ring 위상은 가까운 쪽으로 당김 (위상 점프 없음)"""
+    engine = make_interval_engine(4)
+    engine.step([0.0, 0.0, 0.0])  # 갱신 step
+    engine.phi[:] = 2.0 * math.pi - 0.01
+    engine.ring_phase[:] = 0.01
+    engine.step([0.0, 0.0, 0.0])  # 중간 step
+
+    distance = np.minimum(engine.phi, 2.0 * math.pi - engine.phi)
+    assert np.all(distance < 0.01)
@@ -0,0 +1,79 @@
+"""
+Place 주소 지정 테스트
+
+Place ID:
+    - 이전: hash(tuple(양자화 위상)) % num_places (서로 다른 격자 칸 충돌, 프로세스마다 hash 의존)
+    - 현재: 격자 좌표의 혼합 기수 키 + 벡터화 get_place_ids ✨ NEW
+
+테스트 항목:
+    1. 서로 다른 격자 칸은 서로 다른 ID (충돌 없음), 고정된 값 (프로세스 무관)
+    2. get_place_ids == get_place_id (음수/경계 위상 포함)
+    3. get_place_lattice가 격자 좌표를 복원
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+import math
+import pytest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.hippocampus.place_cells import PlaceCellManager
+
+TWO_PI = 2.0 * math.pi
+
+
+def test_place_id_collision_free_and_stable():
+    """격자 칸 ↔ Place ID 일대일, 값 고정"""
+    manager = PlaceCellManager(num_places=10, quantization_level=100)
+    rng = np.random.default_rng(0)
+
+    # 격자 칸 중심 위상 → ID (num_places보다 훨씬 많은 칸)
+    cells = np.unique(rng.integers(0, 100, size=(20000, 5)), axis=0)
+    phases = (cells + 0.5) * TWO_PI / 100
+    place_ids = [manager.get_place_id(phase) for phase in phases]
+    assert len(set(place_ids)) == len(cells)
+
+    # 고정 값 (hash() 무관)
+    assert manager.get_place_id(np.zeros(5)) == 0
+    phase = (np.array([1, 2, 3, 4, 5]) + 0.5) * TWO_PI / 100
+    assert manager.get_place_id(phase) == 102030405
+
+    # 같은 칸 안의 위상 → 같은 ID
+    assert manager.get_place_id(phase + 0.01) == manager.get_place_id(phase)
+
+
+def test_get_place_ids_matches_scalar():
+    """벡터화 get_place_ids == get_place_id (음수, 주기 경계 근처 포함)"""
+    rng = np.random.default_rng(1)
+    for dim in (5, 6, 7):
+        manager = PlaceCellManager(quantization_level=100)
+        phases = np.concatenate([
+            rng.uniform(-3 * TWO_PI, 3 * TWO_PI, size=(2000, dim)),
+            np.full((1, dim), -1e-300),
+            np.full((1, dim), TWO_PI - 1e-15),
+            np.full((1, dim), TWO_PI),
+        ])
+        place_ids = manager.get_place_ids(phases)
+        assert place_ids.dtype == np.int64
+        assert place_ids.tolist() == [manager.get_place_id(phase) for phase in phases]
+        assert place_ids.min() >= 0 and place_ids.max() < 100 ** dim
+
+
+def test_get_place_lattice_roundtrip():
+    """get_place_lattice(get_place_id(Φ)) == 격자 좌표, 범위 초과 시 ValueError"""
+    manager = PlaceCellManager(quantization_level=100)
+    cells = np.array([[0, 99, 50, 1, 7], [99, 99, 99, 99, 99]])
+    for cell, place_id in zip(cells, manager.get_place_ids((cells + 0.5) * TWO_PI / 100)):
+        np.testing.assert_array_equal(manager.get_place_lattice(place_id, dim=5), cell)
+
+    with pytest.raises(ValueError):
+        manager.get_place_id(np.zeros(10))
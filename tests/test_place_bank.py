@@ -0,0 +1,130 @@
+"""
+Place Bank 테스트
+
+Place Cells 저장 방식:
+    - storage="dict": place_id → PlaceMemory 객체
+    - storage="bank": PlaceBank 행렬 + PlaceRow 행 view ✨ NEW
+
+테스트 항목:
+    1. PlaceRow가 PlaceMemory와 같은 값으로 갱신됨 (bias, 중심, 이력, 방문 수)
+    2. 삭제 후에도 id ↔ row 매핑이 dense하고 정확함
+    3. storage="bank" 블렌딩 결과가 storage="dict"와 같음
+    4. 병합 / Consolidation이 bank에서도 동작
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+import math
+import pytest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.hippocampus.place_cells import PlaceCellManager, PlaceMemory
+from grid_engine.hippocampus.place_bank import PlaceBank, PlaceRow
+from grid_engine.hippocampus.replay_consolidation import ReplayConsolidation
+
+TWO_PI = 2.0 * math.pi
+
+
+def fill_managers(n_updates, seed=0):
+    """같은 업데이트 순서를 dict / bank 저장소에 적용"""
+    rng = np.random.default_rng(seed)
+    managers = [PlaceCellManager(num_places=500), PlaceCellManager(num_places=500, storage="bank")]
+    for t in range(n_updates):
+        phase_vector = rng.uniform(0.0, TWO_PI, size=5)
+        bias = rng.normal(size=5)
+        for manager in managers:
+            manager.update_place_memory(
+                manager.get_place_id(phase_vector), phase_vector, bias, current_time=float(t)
+            )
+    return managers
+
+
+def test_place_row_matches_place_memory():
+    """PlaceRow 갱신 == PlaceMemory 갱신"""
+    bank = PlaceBank(dim=5, capacity=2)
+    row = bank.get_place_memory(42)
+    memory = PlaceMemory(place_id=42)
+    assert isinstance(row, PlaceRow)
+    assert row.place_center is None and row.consolidated_bias is None
+
+    rng = np.random.default_rng(0)
+    for _ in range(13):
+        bias = rng.normal(size=5)
+        phase_vector = rng.uniform(0.0, TWO_PI, size=5)
+        for target in (row, memory):
+            target.update_bias(bias, learning_rate=0.2)
+            target.add_bias_to_history(bias)
+            target.update_place_center(phase_vector)
+
+    assert row.bias_estimate.tolist() == memory.bias_estimate.tolist()
+    assert row.place_center.tolist() == memory.place_center.tolist()
+    assert row.visit_count == memory.visit_count == 13
+    assert len(row.bias_history) == len(memory.bias_history) == 10
+    for a, b in zip(row.get_recent_biases(4), memory.get_recent_biases(4)):
+        assert a.tolist() == b.tolist()
+
+    # 행 view: bank 행렬을 직접 가리킴
+    row.bias_estimate[0] = 7.0
+    assert bank.biases[bank.row_of(42), 0] == 7.0
+
+
+def test_place_bank_remove_keeps_rows_dense():
+    """삭제 후 id ↔ row 매핑 (마지막 행 이동)"""
+    bank = PlaceBank(dim=2, capacity=4)
+    for place_id in range(10):
+        bank.get_place_memory(place_id).bias_estimate = [place_id, -place_id]
+    assert bank.capacity >= 10
+
+    del bank[3]
+    bank.remove(0)
+    bank.remove(99)  # 없는 Place는 무시
+
+    assert len(bank) == 8
+    assert 3 not in bank and 0 not in bank
+    for place_id in bank:
+        assert bank[place_id].bias_estimate.tolist() == [place_id, -place_id]
+        assert bank.ids[bank.row_of(place_id)] == place_id
+    assert sorted(bank.row_of(place_id) for place_id in bank) == list(range(8))
+
+
+def test_place_bank_blending_matches_dict_storage():
+    """storage="bank" 블렌딩 == storage="dict" 블렌딩"""
+    dict_manager, bank_manager = fill_managers(3000)
+    assert len(dict_manager.place_memory) == len(bank_manager.place_memory)
+
+    rng = np.random.default_rng(1)
+    for query in rng.uniform(0.0, TWO_PI, size=(20, 5)):
+        for top_k, sigma in [(5, 0.5), (1, 1.0), (50, 0.3)]:
+            expected = dict_manager.get_bias_estimate(query, use_blending=True, top_k=top_k, sigma=sigma)
+            result = bank_manager.get_bias_estimate(query, use_blending=True, top_k=top_k, sigma=sigma)
+            np.testing.assert_allclose(result, expected, rtol=1e-9, atol=1e-12)
+
+
+def test_place_bank_merge_and_consolidation():
+    """병합 / Consolidation (bank 행 view)"""
+    dict_manager, bank_manager = fill_managers(400, seed=2)
+    for manager in (dict_manager, bank_manager):
+        manager.merge_nearby_places(distance_threshold=2.0)
+    assert sorted(dict_manager.place_memory) == sorted(bank_manager.place_memory)
+    for place_id, memory in dict_manager.place_memory.items():
+        row = bank_manager.place_memory[place_id]
+        np.testing.assert_allclose(row.bias_estimate, memory.bias_estimate, rtol=1e-12)
+        np.testing.assert_allclose(row.place_center, memory.place_center, rtol=1e-12)
+
+    replay = ReplayConsolidation(consolidation_window=3, significance_threshold=10.0)
+    row = bank_manager.get_place_memory(12345)
+    for value in (1.0, 1.1, 0.9):
+        row.add_bias_to_history(np.full(5, value))
+    assert replay.consolidate_place_memory(row, current_time=5.0)
+    assert row.consolidated_bias == pytest.approx(np.full(5, 1.0))
+    assert row.consolidation_time == 5.0
+    assert bank_manager.get_statistics()['memory_size_bytes'] == bank_manager.bank.nbytes
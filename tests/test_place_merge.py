@@ -0,0 +1,132 @@
+"""
+Place 병합 테스트
+
+merge_nearby_places:
+    - 이전: 모든 Place 쌍 비교 (O(N²) torus_distance 호출)
+    - 현재: 이웃 칸 hashing (torus_close_pairs) + 그룹 단위 가중 평균 ✨ NEW
+
+테스트 항목:
+    1. torus_close_pairs == 전체 쌍 비교 (주기 경계 포함)
+    2. 떨어진 군집의 병합 결과가 쌍별 병합과 같음 (bias, 중심, 방문 횟수)
+    3. 경계 (0 / 2π)를 걸친 군집의 중심이 경계 근처에 남음
+    4. 큰 메모리 (수만 Place) 병합 + last_merge_stats
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+import math
+import pytest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.hippocampus.place_cells import PlaceCellManager
+from grid_engine.hippocampus.place_index import torus_close_pairs
+
+TWO_PI = 2.0 * math.pi
+
+
+def torus_distance_matrix(centers):
+    diff = centers[:, None, :] - centers[None, :, :]
+    diff -= TWO_PI * np.round(diff / TWO_PI)
+    return np.sqrt(np.sum(diff * diff, axis=-1))
+
+
+def add_place(manager, place_id, center, bias, visits):
+    place = manager.get_place_memory(place_id)
+    place.place_center = np.asarray(center, dtype=np.float64)
+    place.bias_estimate = np.asarray(bias, dtype=np.float64)
+    place.visit_count = visits
+
+
+def test_torus_close_pairs_matches_all_pairs():
+    """이웃 칸 쌍 == 전체 쌍 비교"""
+    rng = np.random.default_rng(0)
+    for n, dim, threshold in [(400, 3, 0.7), (300, 5, 2.5), (200, 2, 4.0), (50, 5, 0.01)]:
+        centers = rng.uniform(0.0, TWO_PI, size=(n, dim))
+        i, j, distance = torus_close_pairs(centers, threshold)
+        expected_i, expected_j = np.nonzero(np.triu(torus_distance_matrix(centers) < threshold, 1))
+        assert i.tolist() == expected_i.tolist()
+        assert j.tolist() == expected_j.tolist()
+        assert np.all(distance < threshold)
+
+
+@pytest.mark.parametrize("storage", ["dict", "bank"])
+def test_merge_nearby_places_separated_clusters(storage):
+    """떨어진 군집: 대표 Place에 방문 횟수 가중 평균으로 병합"""
+    rng = np.random.default_rng(1)
+    manager = PlaceCellManager(storage=storage)
+    expected = {}
+    place_id = 0
+    for cluster in range(20):
+        base = rng.uniform(1.0, TWO_PI - 1.0, size=5)
+        members = []
+        for _ in range(int(rng.integers(1, 5))):
+            center = base + rng.normal(scale=0.005, size=5)
+            bias = rng.normal(size=5)
+            visits = int(rng.integers(1, 10))
+            add_place(manager, place_id, center, bias, visits)
+            members.append((place_id, center, bias, visits))
+            place_id += 1
+        visits = np.array([m[3] for m in members], dtype=np.float64)
+        weights = visits / visits.sum()
+        expected[members[0][0]] = (
+            weights @ np.array([m[2] for m in members]),
+            weights @ np.array([m[1] for m in members]),
+            int(visits.sum()),
+        )
+    # 군집 사이 거리 > 임계 거리인지 확인 (무작위 배치)
+    centers = np.array([p.place_center for p in manager.place_memory.values()])
+    distance = torus_distance_matrix(centers)
+    assert np.all((distance < 0.1) == (distance < 0.5))
+
+    merged = manager.merge_nearby_places(distance_threshold=0.1)
+
+    assert merged == place_id - len(expected)
+    assert sorted(manager.place_memory) == sorted(expected)
+    for leader, (bias, center, visits) in expected.items():
+        place = manager.place_memory[leader]
+        np.testing.assert_allclose(place.bias_estimate, bias, rtol=1e-12)
+        np.testing.assert_allclose(place.place_center, center, rtol=1e-12)
+        assert place.visit_count == visits
+    stats = manager.last_merge_stats
+    assert stats['merged_count'] == merged
+    assert stats['num_places_after'] == len(expected)
+    assert stats['elapsed_ms'] >= 0.0
+
+
+def test_merge_nearby_places_across_wrap_boundary():
+    """경계를 걸친 두 Place → 병합 중심은 경계 근처"""
+    manager = PlaceCellManager()
+    add_place(manager, 1, [0.01, 3.0], [1.0, 0.0], 1)
+    add_place(manager, 2, [TWO_PI - 0.01, 3.0], [3.0, 0.0], 1)
+
+    assert manager.merge_nearby_places(distance_threshold=0.1) == 1
+    center = manager.place_memory[1].place_center
+    assert min(center[0], TWO_PI - center[0]) < 1e-9
+    assert manager.place_memory[1].bias_estimate[0] == pytest.approx(2.0)
+    # 공간 색인도 병합 결과를 반영
+    assert len(manager.spatial_index) == 1
+
+
+def test_merge_nearby_places_large_memory():
+    """수만 Place 병합 (쌍별 비교 없이)"""
+    rng = np.random.default_rng(2)
+    manager = PlaceCellManager(storage="bank")
+    walk = np.mod(np.cumsum(rng.normal(scale=0.02, size=(30000, 5)), axis=0), TWO_PI)
+    for place_id, center in enumerate(walk):
+        add_place(manager, place_id, center, np.zeros(5), 1)
+
+    merged = manager.merge_nearby_places(distance_threshold=0.1)
+
+    assert merged > 0
+    assert len(manager.place_memory) == 30000 - merged
+    assert sum(p.visit_count for p in manager.place_memory.values()) == 30000
+    assert manager.last_merge_stats['num_close_pairs'] >= merged
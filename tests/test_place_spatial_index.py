@@ -0,0 +1,129 @@
+"""
+Place Spatial Index 테스트
+
+Place Cells 블렌딩 질의:
+    - 이전: 모든 Place에 대해 거리 계산 + 전체 정렬
+    - 현재: 토러스 bucket grid 색인으로 top-k 최근접 질의 ✨ NEW
+
+테스트 항목:
+    1. 색인 top-k 결과가 전체 탐색과 같음 (껍질 탐색 / 작은 색인은 전체 벡터 계산, 주기 경계 포함)
+    2. place_center 갱신 / 병합 / 삭제 후에도 색인이 정확함
+    3. get_bias_estimate(use_blending=True) 결과가 전체 탐색 블렌딩과 같음
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+import math
+import pytest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.hippocampus.place_cells import PlaceCellManager
+from grid_engine.hippocampus.place_index import PlaceSpatialIndex
+
+TWO_PI = 2.0 * math.pi
+
+
+def brute_force_nearest(centers, phase_vector, k, max_distance=math.inf):
+    """전체 탐색 top-k (기준값)"""
+    result = []
+    for key, center in centers.items():
+        diff = phase_vector - center
+        diff = diff - TWO_PI * np.round(diff / TWO_PI)
+        distance = float(np.linalg.norm(diff))
+        if distance <= max_distance:
+            result.append((distance, key))
+    result.sort(key=lambda item: item[0])
+    return result[:k]
+
+
+def brute_force_blend(manager, phase_vector, top_k, sigma):
+    """이전 get_bias_estimate 블렌딩 (모든 Place 활성화 + 정렬)"""
+    activations = []
+    for place_memory in manager.place_memory.values():
+        activation = manager.place_cell_activation(phase_vector, place_memory.place_center, sigma)
+        if activation > 1e-5:
+            activations.append((activation, place_memory))
+    activations.sort(key=lambda item: item[0], reverse=True)
+    top = activations[:top_k]
+    total = sum(a for a, _ in top)
+    return sum(a / total * memory.bias_estimate for a, memory in top)
+
+
+@pytest.mark.parametrize("brute_force_below", [0, 20000])
+def test_place_spatial_index_matches_brute_force(brute_force_below):
+    """색인 top-k == 전체 탐색 top-k (껍질 탐색 / 전체 벡터 계산, 경계 근처 질의 포함)"""
+    rng = np.random.default_rng(0)
+    index = PlaceSpatialIndex(cells_per_axis=8, brute_force_below=brute_force_below)
+    centers = {}
+    for key in range(3000):
+        center = rng.uniform(0.0, TWO_PI, size=5)
+        centers[key] = center
+        index.update(key, center)
+    # 삭제 (마지막 행 이동) 후에도 일치
+    for key in range(0, 3000, 7):
+        index.remove(key)
+        del centers[key]
+
+    queries = list(rng.uniform(0.0, TWO_PI, size=(30, 5))) + [
+        np.full(5, 1e-3), np.full(5, TWO_PI - 1e-3)
+    ]
+    for query in queries:
+        for k, max_distance in [(1, math.inf), (5, math.inf), (10, 1.5)]:
+            expected = brute_force_nearest(centers, query, k, max_distance)
+            result = index.query(query, k, max_distance)
+            assert [key for _, key in result] == [key for _, key in expected]
+            assert [d for d, _ in result] == pytest.approx([d for d, _ in expected], abs=1e-12)
+
+
+def test_place_spatial_index_tracks_center_updates():
+    """place_center 갱신 / 병합 / 삭제 후 색인 일치"""
+    rng = np.random.default_rng(1)
+    manager = PlaceCellManager(num_places=1000)
+    for place_id in range(200):
+        memory = manager.get_place_memory(place_id)
+        memory.place_center = rng.uniform(0.0, TWO_PI, size=5)
+        memory.visit_count = 1
+
+    # 중심 이동 (EMA, 직접 할당)
+    for place_id in range(0, 200, 3):
+        manager.get_place_memory(place_id).update_place_center(
+            rng.uniform(0.0, TWO_PI, size=5), learning_rate=0.9
+        )
+    manager.get_place_memory(7).place_center = np.full(5, 0.01)
+
+    # 병합 + place_memory에서 직접 삭제
+    manager.merge_nearby_places(distance_threshold=1.0)
+    del manager.place_memory[next(iter(manager.place_memory))]
+
+    centers = {pid: memory.place_center for pid, memory in manager.place_memory.items()}
+    for query in rng.uniform(0.0, TWO_PI, size=(20, 5)):
+        expected = brute_force_nearest(centers, query, 5)
+        result = manager._nearest_places(query, 5, math.inf)
+        assert [key for _, key in result] == [key for _, key in expected]
+    assert len(manager.spatial_index) == len(manager.place_memory)
+
+
+def test_place_cell_manager_blending_matches_brute_force():
+    """get_bias_estimate(use_blending=True) == 전체 탐색 블렌딩"""
+    rng = np.random.default_rng(2)
+    manager = PlaceCellManager(num_places=100000)
+    for _ in range(2000):
+        phase_vector = rng.uniform(0.0, TWO_PI, size=5)
+        manager.update_place_memory(
+            manager.get_place_id(phase_vector), phase_vector, rng.normal(size=5)
+        )
+
+    for query in rng.uniform(0.0, TWO_PI, size=(20, 5)):
+        for sigma in (0.5, 1.0):
+            expected = brute_force_blend(manager, query, 5, sigma)
+            result = manager.get_bias_estimate(query, use_blending=True, top_k=5, sigma=sigma)
+            np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-15)
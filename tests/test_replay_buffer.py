@@ -0,0 +1,348 @@
+"""
+Replay Buffer 테스트
+
+Replay Buffer 저장 방식:
+    - 이전: 포인트마다 TrajectoryPoint + 배열 6개 복사, deque
+    - 현재: 미리 할당한 열 (max_size × D) ring buffer + TrajectoryPoint view ✨ NEW
+
+안정 구간 추출:
+    - 이전: 포인트마다 is_stable() (norm 2회) + 리스트의 리스트
+    - 현재: 전체 안정 mask 한 번 + run-length 경계 → 위치 범위 / ReplaySegment ✨ NEW
+    - 증분: 새 포인트만 처리해 구간 경계 + (place, context) 그룹 합 유지 ✨ NEW
+    - Replay watermark: 지난 Replay 이후 포인트만 소비, 열린 구간 이월 ✨ NEW
+    - (place, context) 그룹: 구간마다 딕셔너리 → 모든 구간 한 번에 lexsort + reduceat ✨ NEW
+    - Grid5DEngine Replay: 끝난 구간 + 열린 구간의 지금까지 부분 (pop_finished_segments(include_open=True)) ✨ NEW
+
+테스트 항목:
+    1. 반복/인덱싱/get_arrays가 기록 순서와 같음 (ring 덮어쓰기 포함)
+    2. 안정 구간 추출 / Place별 데이터 / 통계가 포인트 단위 기준값과 같음
+    3. 안정 구간 위치 범위 / 구간 열이 기준값과 같음 (경계, 임계값, 최소 길이)
+    4. 증분 구간 요약 (ring 덮어쓰기, 중간 소비, 열린 구간 이월) == 전체 스트림 기준값
+    5. consume_stable_segments: 각 구간을 정확히 한 번 반환 (열린 구간은 끝난 뒤 전체로)
+    6. group_segments == 구간별 딕셔너리 그룹 (순서, 평균 오차, 첫 위상, 최소 크기)
+    7. summary_groups (증분 요약, Grid5DEngine Replay 경로) == group_segments
+    8. include_open: 꺼낸 조각을 이으면 전체 스트림 구간과 같음, watermark 전진
+    9. Grid5DEngine: 휴지기를 넘어 계속 안정인 스트림도 Replay로 학습 (pending_points 유한)
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (Hippocampus indexing)
+License: MIT License
+"""
+
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.hippocampus.replay_buffer import ReplayBuffer, TrajectoryPoint
+from grid_engine.dimensions.dim5d import Grid5DEngine
+
+
+def make_points(n, seed=0):
+    """안정/불안정 구간이 섞인 포인트 (kwargs 리스트)"""
+    rng = np.random.default_rng(seed)
+    points = []
+    for i in range(n):
+        stable = (i // 7) % 2 == 0 or rng.random() < 0.2
+        scale = 1e-4 if stable else 1.0
+        points.append(dict(
+            timestamp=float(i),
+            phase_vector=rng.uniform(0.0, 6.0, size=5),
+            current_state=rng.normal(size=5),
+            target_state=rng.normal(size=5),
+            error=rng.normal(size=5),
+            velocity=rng.normal(size=5) * scale,
+            acceleration=rng.normal(size=5) * scale * 0.1,
+            place_id=int(rng.integers(0, 4)),
+            context_id=None if rng.random() < 0.3 else int(rng.integers(0, 2)),
+        ))
+    return points
+
+
+def reference_segments(points, min_segment_length=5):
+    """포인트 단위 안정 구간 추출 (기준값)"""
+    segments, current = [], []
+    for point in points:
+        if TrajectoryPoint(**point).is_stable():
+            current.append(point)
+        else:
+            if len(current) >= min_segment_length:
+                segments.append(current)
+            current = []
+    if len(current) >= min_segment_length:
+        segments.append(current)
+    return segments
+
+
+def test_replay_buffer_ring_order_and_views():
+    """반복/인덱싱/get_arrays == 최근 max_size개 기록 순서"""
+    points = make_points(250)
+    buffer = ReplayBuffer(max_size=100)
+    for i, point in enumerate(points):
+        buffer.add_point(**point)
+        if i == 49:
+            arrays = buffer.get_arrays()
+            assert np.shares_memory(arrays['errors'], buffer.errors)  # 한 바퀴 전: view
+            assert len(arrays['errors']) == 50
+
+    kept = points[-100:]
+    assert len(buffer) == 100
+    assert [p.timestamp for p in buffer] == [p['timestamp'] for p in kept]
+    assert buffer[0].timestamp == kept[0]['timestamp']
+    assert buffer[-1].context_id == kept[-1]['context_id']
+
+    arrays = buffer.get_arrays()
+    np.testing.assert_array_equal(arrays['errors'], np.array([p['error'] for p in kept]))
+    np.testing.assert_array_equal(arrays['place_ids'], [p['place_id'] for p in kept])
+    np.testing.assert_array_equal(
+        arrays['context_ids'],
+        [ReplayBuffer.NO_CONTEXT if p['context_id'] is None else p['context_id'] for p in kept]
+    )
+
+
+def test_replay_buffer_matches_point_reference():
+    """안정 구간 / Place별 데이터 / 통계 == 포인트 단위 기준값"""
+    points = make_points(400, seed=1)
+    buffer = ReplayBuffer(max_size=300)
+    for point in points:
+        buffer.add_point(**point)
+    kept = points[-300:]
+
+    segments = buffer.get_stable_segments()
+    expected = reference_segments(kept)
+    assert [[p.timestamp for p in seg] for seg in segments] == \
+        [[p['timestamp'] for p in seg] for seg in expected]
+
+    data = buffer.get_place_bias_data(2, context_id=1)
+    assert [p.timestamp for p in data] == \
+        [p['timestamp'] for p in kept if p['place_id'] == 2 and p['context_id'] == 1]
+
+    stats = buffer.get_statistics()
+    assert stats['total_points'] == 400
+    assert stats['stable_points'] == sum(TrajectoryPoint(**p).is_stable() for p in points)
+
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.get_stable_segments() == []
+
+
+def test_stable_segment_ranges_match_reference():
+    """get_stable_segment_ranges == 포인트 단위 구간 (여러 임계값/최소 길이)"""
+    points = make_points(500, seed=2)
+    buffer = ReplayBuffer(max_size=256)
+    for point in points:
+        buffer.add_point(**point)
+    kept = points[-256:]
+    position = {p['timestamp']: i for i, p in enumerate(kept)}
+
+    for min_length in (1, 3, 5, 9):
+        ranges = buffer.get_stable_segment_ranges(min_segment_length=min_length)
+        expected = reference_segments(kept, min_length)
+        assert ranges.tolist() == [
+            [position[seg[0]['timestamp']], position[seg[-1]['timestamp']] + 1] for seg in expected
+        ]
+
+    segments = buffer.get_stable_segments(min_segment_length=3)
+    for segment in segments:
+        expected = kept[segment.start:segment.end]
+        np.testing.assert_array_equal(segment.errors, [p['error'] for p in expected])
+        np.testing.assert_array_equal(segment.place_ids, [p['place_id'] for p in expected])
+        assert len(segment) == len(expected)
+
+    # 경계: 전부 안정 / 전부 불안정
+    buffer = ReplayBuffer(max_size=10, dim=5)
+    zeros = np.zeros(5)
+    for _ in range(12):
+        buffer.add_point(0.0, zeros, zeros, zeros, zeros, zeros, zeros, 0)
+    assert buffer.get_stable_segment_ranges().tolist() == [[0, 10]]
+    assert buffer.get_stable_segment_ranges(velocity_threshold=0.0).tolist() == []
+
+
+def test_incremental_segments_match_full_stream():
+    """pop_finished_segments + open_segment == 전체 스트림 안정 구간 (그룹 합 포함)"""
+    points = make_points(1500, seed=3)
+    buffer = ReplayBuffer(max_size=64)
+    rng = np.random.default_rng(4)
+    collected = []
+    for point in points:
+        buffer.add_point(**point)
+        if rng.random() < 0.05:
+            collected.extend(buffer.pop_finished_segments())
+    collected.extend(buffer.pop_finished_segments())
+    open_segment = buffer.open_segment
+    if open_segment is not None and open_segment.length >= buffer.min_segment_length:
+        collected.append(open_segment)
+    assert buffer.dropped_segments == 0
+
+    expected = reference_segments(points)
+    assert len(expected) > 10
+    assert [(seg.start, seg.end) for seg in collected] == [
+        (int(seg[0]['timestamp']), int(seg[-1]['timestamp']) + 1) for seg in expected
+    ]
+    for summary, segment in zip(collected, expected):
+        groups = {}
+        for p in segment:
+            key = (p['place_id'], ReplayBuffer.NO_CONTEXT if p['context_id'] is None else p['context_id'])
+            groups.setdefault(key, []).append(p)
+        assert [tuple(key) for key in summary.keys.tolist()] == sorted(groups)
+        for i, key in enumerate(sorted(groups)):
+            group = groups[key]
+            assert summary.counts[i] == len(group)
+            np.testing.assert_allclose(
+                summary.mean_errors[i], np.mean([p['error'] for p in group], axis=0), rtol=1e-12
+            )
+            np.testing.assert_array_equal(summary.first_phases[i], group[0]['phase_vector'])
+
+    assert buffer.stable_points == sum(TrajectoryPoint(**p).is_stable() for p in points)
+    assert buffer.pop_finished_segments() == []
+
+
+def test_consume_stable_segments_watermark():
+    """consume_stable_segments: 구간마다 정확히 한 번, 열린 구간은 이월"""
+    points = make_points(1200, seed=5)
+    buffer = ReplayBuffer(max_size=2000)
+    rng = np.random.default_rng(6)
+    consumed = []
+    for point in points:
+        buffer.add_point(**point)
+        if rng.random() < 0.1:
+            consumed.extend(buffer.consume_stable_segments())
+            assert buffer.consume_stable_segments() == []  # 새 포인트 없음 → 빈 결과
+    consumed.extend(buffer.consume_stable_segments(include_open=True))
+    assert buffer.pending_points == 0
+
+    expected = reference_segments(points)
+    assert [seg.seqs.tolist() for seg in consumed] == \
+        [[int(p['timestamp']) for p in seg] for seg in expected]
+
+    # 열린 구간: 끝나기 전에는 반환하지 않고, 끝난 뒤 전체 구간으로 반환
+    buffer = ReplayBuffer(max_size=100, dim=5)
+    zeros, ones = np.zeros(5), np.ones(5)
+    for _ in range(8):
+        buffer.add_point(0.0, zeros, zeros, zeros, zeros, zeros, zeros, 1)
+    assert buffer.consume_stable_segments() == []
+    for _ in range(4):
+        buffer.add_point(0.0, zeros, zeros, zeros, zeros, zeros, zeros, 1)
+    buffer.add_point(0.0, zeros, zeros, zeros, zeros, ones, zeros, 1)
+    segments = buffer.consume_stable_segments()
+    assert [len(seg) for seg in segments] == [12]
+    assert buffer.replay_watermark == buffer.next_seq == 13
+
+
+def test_group_segments_matches_dict_grouping():
+    """group_segments == 구간마다 딕셔너리로 모은 (place, context) 그룹 (순서, 크기 필터 포함)"""
+    points = make_points(600, seed=7)
+    buffer = ReplayBuffer(max_size=1000)
+    for point in points:
+        buffer.add_point(**point)
+    segments = buffer.get_stable_segments()
+
+    expected = []
+    for index, segment in enumerate(segments):
+        groups = {}
+        for point in segment:
+            groups.setdefault((point.place_id, point.context_id), []).append(point)
+        for (place_id, context_id), group in groups.items():
+            if len(group) >= 3:
+                expected.append((index, place_id, context_id, group))
+
+    groups = buffer.group_segments(segments, min_group_size=3)
+    assert groups['segment_index'].tolist() == [e[0] for e in expected]
+    assert groups['place_ids'].tolist() == [e[1] for e in expected]
+    assert groups['context_ids'].tolist() == [
+        ReplayBuffer.NO_CONTEXT if e[2] is None else e[2] for e in expected
+    ]
+    assert groups['counts'].tolist() == [len(e[3]) for e in expected]
+    np.testing.assert_allclose(
+        groups['mean_errors'], [np.mean([p.error for p in e[3]], axis=0) for e in expected]
+    )
+    np.testing.assert_array_equal(groups['first_phases'], [e[3][0].phase_vector for e in expected])
+
+    empty = buffer.group_segments([])
+    assert empty['mean_errors'].shape == (0, 5) and len(empty['place_ids']) == 0
+
+
+def test_summary_groups_match_group_segments():
+    """summary_groups(증분 요약) == group_segments(버퍼 행) (순서, 평균 오차, 첫 위상, 크기 필터)"""
+    points = make_points(900, seed=8)
+    buffer = ReplayBuffer(max_size=1000)
+    for point in points:
+        buffer.add_point(**point)
+    segments = buffer.get_stable_segments()
+    summaries = buffer.pop_finished_segments()
+    if segments and segments[-1].end == len(buffer):
+        segments = segments[:-1]  # 버퍼 끝까지 이어진 구간은 아직 열린 구간
+    assert len(summaries) == len(segments) > 10
+
+    for min_group_size in (1, 3):
+        expected = buffer.group_segments(segments, min_group_size=min_group_size)
+        groups = buffer.summary_groups(summaries, min_group_size=min_group_size)
+        for name in ('segment_index', 'place_ids', 'context_ids', 'counts', 'first_phases'):
+            np.testing.assert_array_equal(groups[name], expected[name])
+        np.testing.assert_allclose(groups['mean_errors'], expected['mean_errors'], rtol=1e-12)
+
+    empty = buffer.summary_groups([])
+    assert empty['mean_errors'].shape == (0, 5) and len(empty['place_ids']) == 0
+
+
+def test_pop_open_segments_tile_full_stream():
+    """include_open=True: 열린 구간 부분을 꺼내도 조각을 이으면 전체 스트림 구간, watermark 전진"""
+    points = make_points(1500, seed=5)
+    buffer = ReplayBuffer(max_size=64)
+    rng = np.random.default_rng(6)
+    pieces = []
+    for point in points:
+        buffer.add_point(**point)
+        if rng.random() < 0.1:
+            pieces.extend(buffer.pop_finished_segments(include_open=True))
+            open_segment = buffer.open_segment
+            assert buffer.replay_watermark == (open_segment.start if open_segment else buffer.next_seq)
+            assert buffer.pending_points <= buffer.min_segment_length
+    pieces.extend(buffer.pop_finished_segments(include_open=True))
+
+    # 이어지는 조각 (같은 run) 합치기: 서로 다른 구간 사이에는 불안정 포인트가 있음
+    merged = []
+    for piece in pieces:
+        if merged and merged[-1][1] == piece.start:
+            merged[-1][1] = piece.end
+            merged[-1][2] += int(piece.counts.sum())
+        else:
+            merged.append([piece.start, piece.end, int(piece.counts.sum())])
+    expected = reference_segments(points)
+    assert len(pieces) > len(expected) > 10
+    assert merged == [
+        [int(seg[0]['timestamp']), int(seg[-1]['timestamp']) + 1, len(seg)] for seg in expected
+    ]
+
+
+def test_engine_replay_learns_all_stable_stream():
+    """휴지기를 넘어 계속 안정인 스트림: 휴지기마다 Replay가 Place bias를 학습, pending_points 유한"""
+    engine = Grid5DEngine()
+    engine.use_place_cells = True
+    engine.slow_update_threshold = 1
+    engine.set_target(np.zeros(5))
+    t_ms = 0.0
+    pending = []
+    for _ in range(5):
+        for _ in range(20):
+            t_ms += 100.0
+            engine.state.t_ms = t_ms
+            engine.update(np.full(5, 0.02))
+        t_ms += 10000.0  # 휴지기 (불안정 포인트 없이) → Replay
+        engine.state.t_ms = t_ms
+        engine.update(np.full(5, 0.02))
+        pending.append(engine.replay_buffer.get_statistics()['pending_points'])
+
+    biases = [memory.bias_estimate for memory in engine.place_manager.place_memory.values()]
+    assert biases and all(np.linalg.norm(bias) > 0.0 for bias in biases)
+    # provide_reference가 읽는 기억 (Context bias / Place 블렌딩)
+    phase_vector = engine.get_phase_vector()
+    place_id = engine.place_manager.get_place_id(phase_vector)
+    np.testing.assert_allclose(engine.context_binder.get_bias_estimate(place_id, engine.context_id), 0.02)
+    np.testing.assert_allclose(
+        engine.place_manager.get_bias_estimate(phase_vector, use_blending=True, top_k=5, sigma=0.5), 0.02
+    )
+    assert max(pending) == 0 and engine.replay_buffer.replay_watermark == engine.replay_buffer.next_seq
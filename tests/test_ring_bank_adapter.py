@@ -0,0 +1,112 @@
+"""
+Ring Bank Adapter 테스트
+
+Ring 어댑터:
+    - 외부 Ring: RingNDAdapter (ring-attractor-engine)
+    - in-tree Ring: RingBankAdapter ✨ NEW
+
+테스트 항목:
+    1. 인터페이스 (step/reset, Ring ND Adapter와 같음)
+    2. 고정 위상 주입 시 Ring 위상 수렴
+    3. Ring 수에 무관한 행별 결과 (Batch Engine 호환)
+    4. ring_backend="bank"로 Grid 5D Engine 실행
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+import math
+import pytest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.common.adapters.ring_adapter import RingAdapterConfig
+from grid_engine.common.adapters.ring_bank_adapter import RingBankAdapter, RingBankConfig
+from grid_engine.common.adapters.ring_nd_adapter import create_ring_nd_adapter
+from grid_engine.dimensions.dim5d import Grid5DEngine, Grid5DConfig, Grid5DInput
+
+
+def test_ring_bank_adapter_interface():
+    """인터페이스 테스트 (step/reset)"""
+    bank = RingBankAdapter([RingAdapterConfig() for _ in range(5)])
+
+    phases = np.array([0.1, 1.0, 2.0, 4.0, 6.2])
+    stabilized, energies = bank.step(phases, dt_ms=0.1)
+
+    assert stabilized.shape == (5,)
+    assert len(energies) == 5
+    assert bank.activity.shape == (5, 15)
+    assert np.all(bank.activity >= 0.0)
+
+    bank.reset()
+    assert np.all(bank.activity == 0.0)
+
+
+def test_ring_bank_adapter_converges_to_injected_phase():
+    """고정 위상 주입 시 Ring 위상이 주입 인덱스 방향으로 수렴"""
+    bank = RingBankAdapter([RingAdapterConfig(size=15)])
+    idx = 4
+    phase = (idx + 0.5) * 2.0 * math.pi / 15
+
+    for _ in range(500):
+        stabilized, _ = bank.step(np.array([phase]), dt_ms=1.0)
+
+    ring_phi = (stabilized[0] - 0.9 * phase) / 0.1
+    assert ring_phi == pytest.approx(idx * 2.0 * math.pi / 15, abs=1e-9)
+    # 주입이 계속되는 동안 활동은 유한한 값으로 포화
+    assert np.all(np.isfinite(bank.activity))
+
+
+def test_ring_bank_adapter_rows_independent():
+    """각 Ring의 결과가 bank 안의 Ring 수에 무관"""
+    rng = np.random.default_rng(0)
+    phases = rng.uniform(0.0, 2.0 * math.pi, size=(20, 3))
+
+    single = RingBankAdapter([RingAdapterConfig() for _ in range(3)])
+    many = RingBankAdapter([RingAdapterConfig() for _ in range(3 * 50)])
+    for row in phases:
+        out_single, _ = single.step(row, dt_ms=0.1)
+        out_many, _ = many.step(np.tile(row, 50), dt_ms=0.1)
+
+    assert out_many[:3].tolist() == out_single.tolist()
+    assert out_many[-3:].tolist() == out_single.tolist()
+
+
+def test_ring_bank_adapter_per_axis_config():
+    """축별 Ring 설정 (RingBankConfig)이 다른 경우"""
+    bank = RingBankAdapter([
+        RingAdapterConfig(config=RingBankConfig()),
+        RingAdapterConfig(config=RingBankConfig(tau_ms=2.0, excitation=0.5)),
+    ])
+    assert not bank.shared
+
+    stabilized, _ = bank.step(np.array([1.0, 1.0]), dt_ms=0.1)
+    assert bank.activity[0].tolist() != bank.activity[1].tolist()
+    assert stabilized.shape == (2,)
+
+
+def test_grid_5d_engine_ring_bank_backend():
+    """ring_backend="bank"로 Grid 5D Engine 실행"""
+    engine = Grid5DEngine(config=Grid5DConfig(ring_backend="bank"))
+    assert isinstance(engine.ring_adapter, RingBankAdapter)
+
+    inp = Grid5DInput(v_x=0.0, v_y=0.0, v_z=0.0, v_a=10.0, v_b=-5.0)
+    for _ in range(100):
+        output = engine.step(inp)
+
+    assert output.theta_a > 0.0
+    assert 0.0 <= output.phi_b < 2.0 * math.pi
+    assert len(engine.core.last_energies) == 5
+
+
+def test_create_ring_nd_adapter_backend_validation():
+    """알 수 없는 ring_backend는 거부"""
+    with pytest.raises(AssertionError):
+        create_ring_nd_adapter([RingAdapterConfig()], backend="gpu")
@@ -0,0 +1,107 @@
+"""
+Ring 수렴 인식 안정화 테스트 (converge_tol)
+
+테스트 항목:
+    1. Ring Bank: 고정 축은 수렴 후 적분 생략, 움직이는 축은 계속 적분
+    2. Ring ND Adapter: 수렴한 Ring의 run() 생략 및 인덱스 변경 시 재실행
+    3. ring_converge_tol로 Grid 5D Engine 실행 (A/B 고정)
+    4. reset()은 수렴 추적과 생략 카운터를 초기화
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+import math
+import pytest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.common.adapters import ring_nd_adapter
+from grid_engine.common.adapters.ring_adapter import RingAdapterConfig
+from grid_engine.common.adapters.ring_bank_adapter import RingBankAdapter
+from grid_engine.common.adapters.ring_nd_adapter import RingNDAdapter
+from grid_engine.dimensions.dim5d import Grid5DEngine, Grid5DConfig
+
+
+def test_ring_bank_skips_converged_axes():
+    """Ring Bank: 고정 축만 적분 생략"""
+    configs = [RingAdapterConfig() for _ in range(2)]
+    bank = RingBankAdapter(configs, converge_tol=1e-6)
+    live = RingBankAdapter(configs)
+
+    for n in range(1000):
+        # 축 0: 고정, 축 1: 매 step 이동
+        phases = np.array([1.0, (0.05 * n) % (2.0 * math.pi)])
+        stabilized, _ = bank.step(phases, dt_ms=1.0)
+        expected, _ = live.step(phases, dt_ms=1.0)
+        np.testing.assert_allclose(stabilized, expected, atol=1e-5)
+
+    assert bank.step_count == 1000
+    assert bank.skip_counts[0] > 400
+    assert bank.skip_counts[1] == 0
+
+
+class _CountingRing:
+    """run() 호출 수를 세는 테스트용 Ring (중심 = 마지막 주입 인덱스)"""
+
+    def __init__(self, size=15, config=None, seed=None, debug=False):
+        self.center = 0.0
+        self.runs = 0
+
+    def inject(self, direction_idx, strength=0.8):
+        self.center = float(direction_idx)
+
+    def run(self, duration_ms):
+        self.runs += 1
+        return self
+
+
+def test_ring_nd_adapter_skips_converged_rings(monkeypatch):
+    """Ring ND Adapter: 수렴한 Ring의 run() 생략, 인덱스 변경 시 재실행"""
+    monkeypatch.setattr(ring_nd_adapter, "RingAttractorEngine", _CountingRing)
+    adapter = RingNDAdapter([RingAdapterConfig() for _ in range(2)], converge_tol=1e-9)
+
+    phases = np.array([1.0, 3.0])
+    for _ in range(10):
+        adapter.step(phases, dt_ms=0.1)
+    # 첫 step 실행, 두 번째 step에서 수렴 확인, 이후 생략
+    assert [ring.runs for ring in adapter.rings] == [2, 2]
+    assert adapter.skip_counts.tolist() == [8, 8]
+
+    stabilized, _ = adapter.step(np.array([1.0, 5.0]), dt_ms=0.1)
+    assert [ring.runs for ring in adapter.rings] == [2, 3]
+    assert stabilized[1] == pytest.approx(0.9 * 5.0 + 0.1 * (int(5.0 / (2.0 * math.pi) * 15) / 15) * 2.0 * math.pi)
+
+    # 리셋: 수렴 추적/카운터 초기화, 첫 step은 다시 Ring 실행
+    adapter.reset()
+    assert adapter.skip_counts.tolist() == [0, 0] and adapter.step_count == 0
+    assert adapter.last_terms == [0.0, 0.0]
+    adapter.step(phases, dt_ms=0.1)
+    assert [ring.runs for ring in adapter.rings] == [3, 4]
+
+
+def test_grid_5d_engine_ring_converge_tol():
+    """ring_converge_tol로 Grid 5D Engine 실행 (A/B 고정 → 생략)"""
+    config = Grid5DConfig(dt_ms=1.0, tau_ms=100.0, ring_backend="bank", ring_converge_tol=1e-6)
+    engine = Grid5DEngine(config=config, initial_theta_a=30.0, initial_theta_b=60.0)
+
+    inputs = np.zeros((1000, 10))
+    inputs[:, 5] = 0.1  # a_x: X축만 가속
+    engine.run(inputs)
+
+    skips = engine.ring_adapter.skip_counts
+    assert skips[3] > 400 and skips[4] > 400
+    assert engine.ring_adapter.step_count == 1000
+
+    # 엔진 리셋 → Ring Bank 수렴 추적/생략 카운터도 초기화
+    engine.reset(theta_a=30.0, theta_b=60.0)
+    assert engine.ring_adapter.skip_counts.tolist() == [0] * 5
+    assert engine.ring_adapter.step_count == 0
+    assert not engine.ring_adapter.converged.any()
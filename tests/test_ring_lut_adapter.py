@@ -0,0 +1,91 @@
+"""
+Ring LUT Adapter 테스트
+
+Ring 어댑터:
+    - 살아 있는 Ring: RingNDAdapter, RingBankAdapter
+    - LUT: RingLUTAdapter ✨ NEW
+
+테스트 항목:
+    1. LUT 생성 및 살아 있는 Ring과의 검증
+    2. 디스크 캐시 재사용
+    3. 수렴 후 LUT 안정화 = 살아 있는 Ring 안정화
+    4. ring_lut=True로 Grid 5D Engine 실행
+
+Author: GNJz
+Created: 2026-10-17
+Made in GNJz
+Version: v0.5.0-alpha (ND extension)
+License: MIT License
+"""
+
+import math
+import pytest
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine.common.adapters import ring_lut_adapter
+from grid_engine.common.adapters.ring_adapter import RingAdapterConfig
+from grid_engine.common.adapters.ring_bank_adapter import RingBankAdapter
+from grid_engine.common.adapters.ring_lut_adapter import (
+    RingLUTAdapter, build_ring_lut, load_or_build_ring_lut
+)
+from grid_engine.dimensions.dim5d import Grid5DEngine, Grid5DConfig
+
+
+def test_build_ring_lut_validated():
+    """LUT 생성 테스트 (검증 오차 ≤ tolerance)"""
+    lut, error = build_ring_lut(RingAdapterConfig(size=6), "bank", dt_ms=1.0)
+
+    assert lut.shape == (6,)
+    assert error <= 1e-6
+    # 대칭 bump: 수렴 위상 = 주입 인덱스 방향
+    np.testing.assert_allclose(lut, np.arange(6) * 2.0 * math.pi / 6, atol=1e-9)
+
+    with pytest.raises(ValueError):
+        build_ring_lut(RingAdapterConfig(size=6), "bank", dt_ms=1.0, settle_ms=20.0)
+
+
+def test_ring_lut_disk_cache(tmp_path, monkeypatch):
+    """디스크 캐시 재사용 테스트 (두 번째는 생성하지 않음)"""
+    cfg = RingAdapterConfig(size=6)
+    lut = load_or_build_ring_lut(cfg, "bank", 1.0, cache_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("LUT should be loaded from cache")
+
+    monkeypatch.setattr(ring_lut_adapter, "build_ring_lut", fail)
+    cached = load_or_build_ring_lut(cfg, "bank", 1.0, cache_dir=str(tmp_path))
+    assert cached.tolist() == lut.tolist()
+
+
+def test_ring_lut_adapter_matches_settled_ring(tmp_path):
+    """같은 위상을 계속 주입하면 LUT 안정화 = 살아 있는 Ring 안정화"""
+    configs = [RingAdapterConfig(size=6) for _ in range(3)]
+    lut_adapter = RingLUTAdapter(configs, backend="bank", cache_dir=str(tmp_path), dt_ms=1.0)
+    bank = RingBankAdapter(configs)
+
+    phases = np.array([0.3, 2.5, 5.9])
+    for _ in range(2000):
+        live, _ = bank.step(phases, dt_ms=1.0)
+    stabilized, energies = lut_adapter.step(phases, dt_ms=1.0)
+
+    np.testing.assert_allclose(stabilized, live, atol=1e-7)
+    assert energies == [None, None, None]
+    assert list(lut_adapter.tables) == [1.0]
+
+
+def test_grid_5d_engine_ring_lut(tmp_path, monkeypatch):
+    """ring_lut=True로 Grid 5D Engine 실행"""
+    monkeypatch.setenv("GRID_ENGINE_CACHE_DIR", str(tmp_path))
+    config = Grid5DConfig(dt_ms=1.0, tau_ms=100.0, ring_size=6, ring_lut=True, ring_backend="bank")
+    engine = Grid5DEngine(config=config)
+    assert isinstance(engine.ring_adapter, RingLUTAdapter)
+
+    out = engine.run(np.tile([0.0, 0.0, 0.0, 10.0, -5.0], (50, 1)))
+    assert np.all((out[:, 5:] >= 0.0) & (out[:, 5:] < 2.0 * math.pi))
+    assert out[-1, 3] > 0.0